@@ -17,6 +17,15 @@ project_root = Path(__file__).resolve().parent.parent
 
 logger = logging.getLogger(__name__)
 
+# The equity engine lives in the backend package; agents run without it when
+# the backend is not importable
+try:
+    from app.core.cards import Card
+    from app.core.equity import EquityCalculator
+    EQUITY_ENGINE_AVAILABLE = True
+except ImportError:
+    EQUITY_ENGINE_AVAILABLE = False
+
 class PokerAgent(ABC):
     """Base class for poker player agents."""
     
@@ -135,6 +144,7 @@ class PokerAgent(ABC):
         pot = game_state.get("pot", 0)
         action_history = game_state.get("action_history", [])
         stack_sizes = game_state.get("stack_sizes", {})
+        equity = game_state.get("equity")
         
         # Normalize card representations into strings
         hand_cards: List[str] = []
@@ -163,10 +173,46 @@ Your Hand: {' '.join(hand_cards)}
 Community Cards: {' '.join(comm_cards) if comm_cards else 'None'}
 Position: {position}
 Pot Size: {pot}
+Equity: {equity or 'Unknown'}
 Action History: {self._format_action_history(action_history, names_map)}
 Stack Sizes: {stack_str}
 """
         return formatted_state
+    
+    async def _estimate_equity(self, game_state: Dict[str, Any]) -> Optional[str]:
+        """
+        Compute this agent's equity with the backend equity engine.
+        
+        Args:
+            game_state: Flattened game state with hand, community cards and
+                the number of opponents still in the hand
+            
+        Returns:
+            Human-readable equity summary, or None if it cannot be computed
+        """
+        if not EQUITY_ENGINE_AVAILABLE:
+            return None
+        
+        def to_card(card: Any) -> "Card":
+            if isinstance(card, dict):
+                return Card.from_str(card.get('rank', '') + card.get('suit', ''))
+            return Card.from_str(str(card))
+        
+        opponents = game_state.get("opponents", 1)
+        try:
+            hand = [to_card(c) for c in game_state.get("hand", [])]
+            board = [to_card(c) for c in game_state.get("community_cards", [])]
+            result = await EquityCalculator.get_instance().calculate_async(hand, board, opponents=opponents)
+        except Exception:
+            logger.warning("Equity calculation failed", exc_info=True)
+            return None
+        
+        plural = "s" if opponents != 1 else ""
+        return (
+            f"{result.equity:.1%} vs {opponents} opponent{plural} "
+            f"(win {result.win:.1%}, tie {result.tie:.1%}; "
+            f"95% CI {result.confidence_low:.1%}-{result.confidence_high:.1%} over {result.samples} runouts)"
+        )
     
     def _format_action_history(
         self,
@@ -391,8 +437,15 @@ Stack Sizes: {stack_str}
             'stack_sizes': {p.get('player_id'): p.get('chips', 0) for p in players},
             'player_names': player_names,
             'round': nested_state.get('current_round'),
-            'current_bet': nested_state.get('current_bet', 0)
+            'current_bet': nested_state.get('current_bet', 0),
+            'opponents': max(1, sum(
+                1 for p in players
+                if p.get('player_id') != getattr(self, 'player_id', None)
+                and p.get('status', 'ACTIVE') in ('ACTIVE', 'ALL_IN')
+            ))
         }
+        # Replace the LLM's equity guess with a computed figure
+        flat_state['equity'] = await self._estimate_equity(flat_state)
         # Update opponent profiles based on game state
         if self.intelligence_level != "basic":
             self._update_opponent_profiles(flat_state)
@@ -502,6 +555,8 @@ Based on the current situation, what action will you take? Analyze the hand, con
             if not isinstance(response.get('calculations', None), dict):
                 logger.warning(f"Agent response missing 'calculations' field, inserting default values")
                 response['calculations'] = {'pot_odds': 'N/A', 'estimated_equity': 'N/A'}
+            if flat_state['equity']:
+                response['calculations']['estimated_equity'] = flat_state['equity']
             logger.debug(f"Agent decision: {response}")
             # Log response to per-player log
             try:
@@ -50,6 +50,19 @@ class HandRange(BaseModel):
     sample_size: int = 1
     last_updated: datetime = Field(default_factory=datetime.now)
 
+    def to_range(self):
+        """
+        Parse the observed hands into a combo range for the equity engine.
+
+        Returns:
+            app.core.ranges.Range weighted by this range's frequency
+        """
+        from app.core.ranges import parse_range
+
+        hand_range = parse_range(", ".join(self.hands))
+        hand_range.weights *= self.frequency
+        return hand_range
+
 
 class OpponentProfile(BaseModel):
     """
@@ -147,6 +160,21 @@ class OpponentProfile(BaseModel):
                 last_updated=datetime.now()
             )
     
+    def get_hand_range(self, situation: str):
+        """
+        Get the observed range for a situation as a combo range.
+
+        Args:
+            situation: Situation key, e.g. "utg_open"
+
+        Returns:
+            The most recently updated matching range, or None if none observed
+        """
+        matches = [r for r in self.hand_ranges if r.situation == situation]
+        if not matches:
+            return None
+        return max(matches, key=lambda r: r.last_updated).to_range()
+
     def get_formatted_string(self) -> str:
         """
         Get a compact string representation of this profile for LLM prompt inclusion.
@@ -93,6 +93,13 @@ class AIConfig:
         else:
             logger.warning("No Gemini API key found in environment variables")
         
+        # Request limits per provider, enforced by the LLM request scheduler
+        for name in ("anthropic", "openai", "gemini"):
+            if name in self.config:
+                prefix = name.upper()
+                self.config[name]["max_concurrent"] = int(os.environ.get(f"{prefix}_MAX_CONCURRENT", "4"))
+                self.config[name]["tokens_per_minute"] = int(os.environ.get(f"{prefix}_TOKENS_PER_MINUTE", "0"))
+        
         # Settings for provider selection
         # Default to Gemini provider if not specified
         self.config["default_provider"] = os.environ.get("DEFAULT_LLM_PROVIDER", "gemini")
@@ -1,10 +1,27 @@
 """
 Real LLMService dispatcher for integrating actual providers.
+
+Every request goes through the process-wide llm_scheduler, which caps
+concurrent requests and tokens per minute for each provider and queues the
+rest fairly: tables with a human waiting first, then round-robin across
+tables so one busy table cannot starve the others.
+
+The backend shares one LLMService per process (LLMService.get_instance(),
+set up by LLMService.initialize() in the app lifespan), so provider SDK
+clients and their keep-alive HTTP connections are built once and reused
+by every decision rather than per call.
 """
 import os
+import asyncio
 import logging
 import json
-from typing import Dict, Any, Optional
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Deque, Iterator, AsyncIterator, Optional, Tuple
 
 from ai.config import AIConfig
 from ai.providers.anthropic_provider import AnthropicProvider
@@ -50,8 +67,331 @@ ai_root_logger.addHandler(_fh)
 # Prevent ai.* log records from propagating to the root logger (which prints to console)
 ai_root_logger.propagate = False
 
+
+# Request priorities: a human is waiting on the answer, or nobody is (simulations)
+INTERACTIVE = 0
+BACKGROUND = 1
+_PRIORITY_NAMES = {INTERACTIVE: "interactive", BACKGROUND: "background"}
+
+# Completion tokens reserved for a request that does not set max_tokens
+DEFAULT_COMPLETION_TOKENS = 1024
+
+# How long idle provider connections are kept open for reuse
+LLM_KEEPALIVE_SECONDS = float(os.environ.get("LLM_KEEPALIVE_SECONDS", "120"))
+
+# Seconds a request may take before it is abandoned (per call; overridable per request)
+LLM_REQUEST_TIMEOUT = float(os.environ.get("LLM_REQUEST_TIMEOUT", "60"))
+
+_request_table: ContextVar[str] = ContextVar("llm_request_table", default="")
+_request_priority: ContextVar[int] = ContextVar("llm_request_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def llm_request_context(table: str, interactive: bool = True) -> Iterator[None]:
+    """
+    Tag the LLM requests made inside the block with the table they serve.
+
+    Args:
+        table: Key the scheduler queues fairly across (e.g. the game ID)
+        interactive: Whether a human is waiting; background requests queue behind
+    """
+    table_token = _request_table.set(table)
+    priority_token = _request_priority.set(INTERACTIVE if interactive else BACKGROUND)
+    try:
+        yield
+    finally:
+        _request_table.reset(table_token)
+        _request_priority.reset(priority_token)
+
+
+def estimate_tokens(system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> int:
+    """Rough token cost of a request: ~4 characters per prompt token plus the completion allowance."""
+    return (len(system_prompt) + len(user_prompt)) // 4 + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+class _Waiter:
+    __slots__ = ("future", "tokens")
+
+    def __init__(self, future: asyncio.Future, tokens: int):
+        self.future = future
+        self.tokens = tokens
+
+
+class _ProviderLane:
+    """Admission control for one provider: a concurrency cap and a tokens-per-minute budget."""
+
+    def __init__(self, max_concurrent: int, tokens_per_minute: int):
+        self.max_concurrent = max_concurrent
+        self.tokens_per_minute = tokens_per_minute  # 0 = no budget
+        self.in_flight = 0
+        self.requests = 0
+        # (monotonic time, tokens) for requests admitted in the last minute
+        self._spent: Deque[Tuple[float, int]] = deque()
+        # priority -> table -> waiters; tables rotate to the back once served
+        self._queues: Dict[int, "OrderedDict[str, Deque[_Waiter]]"] = {
+            INTERACTIVE: OrderedDict(), BACKGROUND: OrderedDict()
+        }
+        # priority -> [waited, total wait seconds, longest wait seconds]
+        self._waits: Dict[int, list] = {INTERACTIVE: [0, 0.0, 0.0], BACKGROUND: [0, 0.0, 0.0]}
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def queued(self, priority: Optional[int] = None) -> int:
+        priorities = self._queues if priority is None else (priority,)
+        return sum(
+            not waiter.future.done()
+            for p in priorities for waiters in self._queues[p].values() for waiter in waiters
+        )
+
+    def tokens_last_minute(self, now: float) -> int:
+        while self._spent and now - self._spent[0][0] >= 60:
+            self._spent.popleft()
+        return sum(tokens for _, tokens in self._spent)
+
+    def _admits(self, tokens: int, now: float) -> bool:
+        if self.in_flight >= self.max_concurrent:
+            return False
+        if self.tokens_per_minute <= 0:
+            return True
+        spent = self.tokens_last_minute(now)
+        # A request larger than the whole budget still runs, alone
+        return spent == 0 or spent + tokens <= self.tokens_per_minute
+
+    def _grant(self, tokens: int, now: float) -> None:
+        self.in_flight += 1
+        self.requests += 1
+        if self.tokens_per_minute > 0:
+            self._spent.append((now, tokens))
+
+    def _record_wait(self, priority: int, seconds: float) -> None:
+        stats = self._waits[priority]
+        stats[0] += 1
+        stats[1] += seconds
+        stats[2] = max(stats[2], seconds)
+
+    async def acquire(self, tokens: int, table: str, priority: int) -> float:
+        """Wait for a slot; returns the seconds spent queued."""
+        queued_at = time.monotonic()
+        if not self.queued() and self._admits(tokens, queued_at):
+            self._grant(tokens, queued_at)
+            self._record_wait(priority, 0.0)
+            return 0.0
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), tokens)
+        self._queues[priority].setdefault(table, deque()).append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as the caller was cancelled
+                self.release()
+            else:
+                waiter.future.cancel()
+                self._dispatch()  # drops the cancelled waiter
+            raise
+        waited = time.monotonic() - queued_at
+        self._record_wait(priority, waited)
+        return waited
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant queued requests: interactive first, then round-robin across tables."""
+        for priority in (INTERACTIVE, BACKGROUND):
+            tables = self._queues[priority]
+            while tables:
+                table, waiters = next(iter(tables.items()))
+                waiter = waiters[0]
+                # Skip waiters cancelled while queued or left behind by a closed event loop
+                if not waiter.future.done() and not waiter.future.get_loop().is_closed():
+                    now = time.monotonic()
+                    if not self._admits(waiter.tokens, now):
+                        self._wake_later(now)
+                        return
+                    self._grant(waiter.tokens, now)
+                    waiter.future.set_result(None)
+                waiters.popleft()
+                if not waiters:
+                    del tables[table]
+                elif not waiter.future.cancelled():
+                    tables.move_to_end(table)
+
+    def _wake_later(self, now: float) -> None:
+        """Retry once the oldest spend leaves the budget window, if that is what blocks."""
+        if self.in_flight >= self.max_concurrent or self._timer is not None or not self._spent:
+            return
+        self._timer = asyncio.get_running_loop().call_later(
+            max(0.0, 60 - (now - self._spent[0][0])), self._on_timer
+        )
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def metrics(self) -> Dict[str, Any]:
+        waits = {}
+        for priority, (count, total, longest) in self._waits.items():
+            waits[_PRIORITY_NAMES[priority]] = {
+                "requests": count,
+                "queued": self.queued(priority),
+                "avg_wait_ms": round(total * 1000 / count, 3) if count else 0.0,
+                "max_wait_ms": round(longest * 1000, 3),
+            }
+        return {
+            "max_concurrent": self.max_concurrent,
+            "tokens_per_minute": self.tokens_per_minute,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "tokens_last_minute": self.tokens_last_minute(time.monotonic()),
+            "waits": waits,
+        }
+
+
+class LLMRequestScheduler:
+    """
+    Process-wide queue in front of the LLM providers.
+
+    Each provider has its own limits (see configure()). A request that
+    would exceed them waits; waiting requests are served interactive
+    before background, and round-robin across tables within a priority.
+    Token costs are estimated up front (estimate_tokens) since providers
+    do not report usage back through LLMService.
+    """
+
+    def __init__(self, max_concurrent: int = 4, tokens_per_minute: int = 0):
+        self.default_max_concurrent = max_concurrent
+        self.default_tokens_per_minute = tokens_per_minute
+        self._lanes: Dict[str, _ProviderLane] = {}
+
+    def _lane(self, provider: str) -> _ProviderLane:
+        lane = self._lanes.get(provider)
+        if lane is None:
+            lane = self._lanes[provider] = _ProviderLane(
+                self.default_max_concurrent, self.default_tokens_per_minute
+            )
+        return lane
+
+    def configure(
+        self,
+        provider: str,
+        max_concurrent: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None
+    ) -> None:
+        """
+        Set a provider's limits; None keeps the current value.
+
+        Args:
+            provider: Provider name
+            max_concurrent: Requests in flight at once (at least 1)
+            tokens_per_minute: Estimated tokens admitted per minute; 0 for no budget
+        """
+        lane = self._lane(provider)
+        if max_concurrent is not None:
+            lane.max_concurrent = max(1, int(max_concurrent))
+        if tokens_per_minute is not None:
+            lane.tokens_per_minute = max(0, int(tokens_per_minute))
+
+    @asynccontextmanager
+    async def slot(self, provider: str, tokens: int) -> AsyncIterator[float]:
+        """
+        Hold one of the provider's request slots for the duration of the block.
+
+        The table and priority come from llm_request_context. Yields the
+        seconds the request spent queued.
+        """
+        lane = self._lane(provider)
+        waited = await lane.acquire(tokens, _request_table.get(), _request_priority.get())
+        if waited > 0:
+            logger.debug("Queued %.3fs for provider %s", waited, provider)
+        try:
+            yield waited
+        finally:
+            lane.release()
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per provider: limits, requests in flight, tokens spent and queue waits (ms) by priority."""
+        return {name: lane.metrics() for name, lane in self._lanes.items()}
+
+
+# Shared by every LLMService in the process
+llm_scheduler = LLMRequestScheduler()
+
+
+class _ConnectionStats:
+    """Counts provider HTTP requests and whether each went over a new or a reused connection."""
+
+    def __init__(self):
+        self.clients_created = 0
+        self.requests = 0
+        self.new_connections = 0
+        self._streams = weakref.WeakSet()  # open connections' network streams
+        self._lock = threading.Lock()  # responses arrive on the LLM thread pool
+
+    def on_response(self, response: Any) -> None:
+        stream = response.extensions.get("network_stream")
+        with self._lock:
+            self.requests += 1
+            if stream is None or stream not in self._streams:
+                self.new_connections += 1
+                if stream is not None:
+                    self._streams.add(stream)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "clients_created": self.clients_created,
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.requests - self.new_connections,
+        }
+
+
+def _pooled_http_client(stats: _ConnectionStats, max_connections: int) -> Optional[Any]:
+    """A keep-alive httpx client for a provider SDK, or None if httpx is not installed."""
+    try:
+        import httpx
+    except ImportError:
+        return None
+    return httpx.Client(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                            keepalive_expiry=LLM_KEEPALIVE_SECONDS),
+        # Frees the pool thread of a call that was already abandoned by its caller
+        timeout=httpx.Timeout(LLM_REQUEST_TIMEOUT, connect=10.0),
+        event_hooks={"response": [stats.on_response]},
+    )
+
 class LLMService:
     """Dispatcher that selects and invokes real LLM providers based on config or config dict."""
+
+    _instance: Optional["LLMService"] = None
+
+    @classmethod
+    def get_instance(cls) -> "LLMService":
+        """Get the process-wide service, creating it from the environment on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def initialize(cls, config: Optional[Any] = None) -> "LLMService":
+        """
+        Create the process-wide service at startup, replacing (and closing) any previous one.
+
+        Args:
+            config: Optional path to JSON config file or dict of provider settings
+        """
+        previous, cls._instance = cls._instance, cls(config)
+        if previous is not None:
+            previous.close()
+        return cls._instance
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Close the process-wide service's provider connections."""
+        previous, cls._instance = cls._instance, None
+        if previous is not None:
+            previous.close()
+
     def __init__(self, config: Optional[Any] = None):
         """
         Load AI configuration and prepare provider cache.
@@ -67,6 +407,9 @@ class LLMService:
             self.config = AIConfig(config)
         self.default_provider = self.config.get_default_provider()
         self.providers: Dict[str, Any] = {}
+        # Pooled HTTP clients handed to the provider SDKs, and their connection counts
+        self.http_clients: Dict[str, Any] = {}
+        self.connection_stats: Dict[str, _ConnectionStats] = {}
         logger.info(f"LLMService initialized with default provider: {self.default_provider}")
 
     def _get_provider(self, provider_name: Optional[str] = None) -> Any:
@@ -88,19 +431,22 @@ class LLMService:
         # Otherwise, create a new provider instance
         try:
             cfg = self.config.get_provider_config(name)
+            stats = self.connection_stats.setdefault(name, _ConnectionStats())
             
             if name == 'anthropic':
                 prov = AnthropicProvider(
                     api_key=cfg['api_key'],
                     model=cfg.get('model'),
-                    thinking_budget_tokens=cfg.get('thinking_budget_tokens', 4000)
+                    thinking_budget_tokens=cfg.get('thinking_budget_tokens', 4000),
+                    http_client=self._http_client(name, cfg)
                 )
             elif name == 'openai':
                 prov = OpenAIProvider(
                     api_key=cfg['api_key'],
                     model=cfg.get('model'),
                     reasoning_level=cfg.get('reasoning_level', 'medium'),
-                    organization_id=cfg.get('organization_id')
+                    organization_id=cfg.get('organization_id'),
+                    http_client=self._http_client(name, cfg)
                 )
             elif name == 'gemini':
                 prov = GeminiProvider(
@@ -113,12 +459,43 @@ class LLMService:
                 
             # Cache and return the provider
             self.providers[name] = prov
+            stats.clients_created += 1
+            llm_scheduler.configure(name, cfg.get('max_concurrent'), cfg.get('tokens_per_minute'))
             return prov
             
         except Exception as e:
             logger.error(f"Error initializing provider '{name}': {str(e)}")
             raise ValueError(f"Could not initialize provider '{name}': {str(e)}")
     
+    def _http_client(self, name: str, cfg: Dict[str, Any]) -> Optional[Any]:
+        """The pooled HTTP client for a provider, sized to its concurrency limit."""
+        if name not in self.http_clients:
+            self.http_clients[name] = _pooled_http_client(
+                self.connection_stats[name], cfg.get('max_concurrent') or llm_scheduler.default_max_concurrent
+            )
+        return self.http_clients[name]
+
+    async def _with_timeout(self, call: Any, timeout: Optional[float], provider: Optional[str]) -> Any:
+        """Await a provider call, abandoning it after timeout (default LLM_REQUEST_TIMEOUT) seconds."""
+        timeout = LLM_REQUEST_TIMEOUT if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(call, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Request to provider %s timed out after %.1fs", provider or self.default_provider, timeout)
+            raise
+
+    def get_connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per provider: SDK clients created, HTTP requests, and new vs reused connections."""
+        return {name: stats.as_dict() for name, stats in self.connection_stats.items()}
+
+    def close(self) -> None:
+        """Close the pooled HTTP clients and drop the cached providers."""
+        for client in self.http_clients.values():
+            if client is not None:
+                client.close()
+        self.http_clients.clear()
+        self.providers.clear()
+
     # This method is no longer needed - provider creation has been moved to _get_provider
 
     async def complete(
@@ -128,12 +505,17 @@ class LLMService:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         provider: Optional[str] = None,
-        extended_thinking: bool = False
+        extended_thinking: bool = False,
+        timeout: Optional[float] = None
     ) -> str:
         """
         Request a text completion.
 
         Returns the raw text response from the LLM.
+
+        Raises:
+            asyncio.TimeoutError: If the provider takes longer than timeout
+                (default LLM_REQUEST_TIMEOUT) seconds
         """
         prov = self._get_provider(provider)
         logger.debug(
@@ -147,13 +529,17 @@ class LLMService:
         logger.debug("Model: %s", getattr(prov, 'model', None))
         logger.debug("System prompt:\n%s", system_prompt)
         logger.debug("User prompt:\n%s", user_prompt)
-        resp = await prov.complete(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            extended_thinking=extended_thinking
-        )
+        async with llm_scheduler.slot(
+            provider or self.default_provider,
+            estimate_tokens(system_prompt, user_prompt, max_tokens)
+        ):
+            resp = await self._with_timeout(prov.complete(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                extended_thinking=extended_thinking
+            ), timeout, provider)
         logger.debug("Response: %s", resp)
         return resp
 
@@ -164,12 +550,17 @@ class LLMService:
         json_schema: Dict[str, Any],
         temperature: Optional[float] = None,
         provider: Optional[str] = None,
-        extended_thinking: bool = False
+        extended_thinking: bool = False,
+        timeout: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Request a JSON-structured completion.
 
         Returns the parsed JSON response.
+
+        Raises:
+            asyncio.TimeoutError: If the provider takes longer than timeout
+                (default LLM_REQUEST_TIMEOUT) seconds
         """
         prov = self._get_provider(provider)
         logger.debug(
@@ -183,13 +574,17 @@ class LLMService:
         logger.debug("System prompt:\n%s", system_prompt)
         logger.debug("User prompt:\n%s", user_prompt)
         logger.debug("JSON schema:\n%s", json.dumps(json_schema, indent=2))
-        resp = await prov.complete_json(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            json_schema=json_schema,
-            temperature=temperature,
-            extended_thinking=extended_thinking
-        )
+        async with llm_scheduler.slot(
+            provider or self.default_provider,
+            estimate_tokens(system_prompt, user_prompt + json.dumps(json_schema))
+        ):
+            resp = await self._with_timeout(prov.complete_json(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                json_schema=json_schema,
+                temperature=temperature,
+                extended_thinking=extended_thinking
+            ), timeout, provider)
         # Log raw JSON response with unicode unescaped for readability
         logger.debug("JSON Response: %s", json.dumps(resp, indent=2, ensure_ascii=False))
         
@@ -5,31 +5,55 @@ Test the memory integration directly.
 import os
 import sys
 import asyncio
+import functools
+import importlib
 import tempfile
 import shutil
 from pprint import pprint
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 # Import our local modules
-from ai.agents.models.opponent_profile import OpponentProfile, StatisticValue, OpponentNote
-from ai.agents.models.memory_service import MemoryService
-from ai.agents.models.memory_connector import MemoryConnector
-from ai.llm_service import LLMService
-# 'prompts' module unused in this integration; removed to fix import errors
+from ai.agents.models.opponent_profile import OpponentProfile, StatisticValue, OpponentNote
+from ai.agents.models.memory_service import MemoryService
+from ai.agents.models.memory_connector import MemoryConnector
+from ai.llm_service import LLMService
+# 'prompts' module unused in this integration; removed to fix import errors
 
 # Import agent definitions if available
-try:
-    from ai.agents.base_agent import PokerAgent
-    from ai.agents.tag_agent import TAGAgent
-    from ai.agents.lag_agent import LAGAgent
-    from ai.agents.adaptable_agent import AdaptableAgent
-    AGENTS_AVAILABLE = True
-except ImportError:
-    AGENTS_AVAILABLE = False
+try:
+    from ai.agents.base_agent import PokerAgent
+    from ai.agents.tag_agent import TAGAgent
+    from ai.agents.lag_agent import LAGAgent
+    from ai.agents.adaptable_agent import AdaptableAgent
+    AGENTS_AVAILABLE = True
+except ImportError:
+    AGENTS_AVAILABLE = False
 
 # AgentFactory has been removed - agents are now created directly in game_service.py
 
+# Archetype -> (module, agent class)
+_AGENT_CLASSES = {
+    "TAG": ("ai.agents.tag_agent", "TAGAgent"),
+    "LAG": ("ai.agents.lag_agent", "LAGAgent"),
+    "TightPassive": ("ai.agents.tight_passive_agent", "TightPassiveAgent"),
+    "LoosePassive": ("ai.agents.loose_passive_agent", "LoosePassiveAgent"),
+    "CallingStation": ("ai.agents.calling_station_agent", "CallingStationAgent"),
+    "Maniac": ("ai.agents.maniac_agent", "ManiacAgent"),
+    "Beginner": ("ai.agents.beginner_agent", "BeginnerAgent"),
+    "Adaptable": ("ai.agents.adaptable_agent", "AdaptableAgent"),
+    "GTO": ("ai.agents.gto_agent", "GTOAgent"),
+    "ShortStack": ("ai.agents.short_stack_agent", "ShortStackAgent"),
+    "Trappy": ("ai.agents.trappy_agent", "TrappyAgent"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _agent_class(archetype: str) -> type:
+    """The agent class for an archetype (TAG if unknown), imported on first use."""
+    module_path, class_name = _AGENT_CLASSES.get(archetype.replace(" ", ""), _AGENT_CLASSES["TAG"])
+    return getattr(importlib.import_module(module_path), class_name)
+
 class MemoryIntegration:
     """
     Simplified integration class for direct testing.
@@ -37,13 +61,15 @@ class MemoryIntegration:
     # Class-level reference to the memory service for easy access
     _memory_service = None
     _memory_enabled = False
+    # (game_id, player_id) -> the seat's agent, built once and reused across decisions
+    _agents: Dict[Tuple[str, str], Any] = {}
     
     @classmethod
-    def initialize(
-        cls,
-        memory_service: Optional[MemoryService] = None,
-        enable_memory: bool = True,
-    ) -> MemoryConnector:
+    def initialize(
+        cls,
+        memory_service: Optional[MemoryService] = None,
+        enable_memory: bool = True,
+    ) -> MemoryConnector:
         """
         Initialize the memory integration.
         
@@ -76,14 +102,14 @@ class MemoryIntegration:
         return connector
     
     @classmethod
-    def is_memory_enabled(cls) -> bool:
+    def is_memory_enabled(cls) -> bool:
         """Check if memory system is enabled."""
         if hasattr(cls, '_memory_enabled'):
             return cls._memory_enabled
         return False
     
     @classmethod
-    def enable_memory(cls) -> None:
+    def enable_memory(cls) -> None:
         """Enable the memory system."""
         connector = MemoryConnector.get_instance()
         connector.enable()
@@ -91,14 +117,14 @@ class MemoryIntegration:
         cls._memory_service = connector.memory_service
         
     @classmethod
-    def disable_memory(cls) -> None:
+    def disable_memory(cls) -> None:
         """Disable the memory system."""
         connector = MemoryConnector.get_instance()
         connector.disable()
         cls._memory_enabled = False
     
     @classmethod
-    def get_all_profiles(cls) -> List[Dict[str, Any]]:
+    def get_all_profiles(cls) -> List[Dict[str, Any]]:
         """Get all player profiles."""
         if not cls._memory_service:
             return []
@@ -109,7 +135,7 @@ class MemoryIntegration:
         ]
     
     @classmethod
-    def get_player_profile(cls, player_id: str) -> Optional[Dict[str, Any]]:
+    def get_player_profile(cls, player_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific player's profile."""
         if not cls._memory_service:
             return None
@@ -119,6 +145,70 @@ class MemoryIntegration:
             return profile.to_dict()
         return None
     
+    @classmethod
+    def get_agent(cls,
+                  archetype: str,
+                  player_id: str,
+                  game_id: Optional[str] = None,
+                  use_memory: bool = True) -> Any:
+        """
+        Get a seat's agent, building it on first use.
+        
+        The agent (and whatever state it keeps, such as opponent profiles)
+        lives until the player leaves; it is rebuilt only if the seat's
+        archetype or memory setting changes or the LLM service is replaced.
+        Without a game there is no seat to outlive the decision, so a fresh
+        agent is built and nothing is cached.
+        
+        Args:
+            archetype: The agent archetype (e.g., "TAG", "LAG", "Adaptable")
+            player_id: ID of the player
+            game_id: ID of the game the player is seated in, if any
+            use_memory: Whether the agent uses player memory/profiles
+            
+        Returns:
+            The agent instance
+        """
+        llm_service = LLMService.get_instance()
+        agent_class = _agent_class(archetype)
+        key = (game_id, player_id)
+        agent = cls._agents.get(key) if game_id is not None else None
+        if (agent is None or type(agent) is not agent_class or agent.llm_service is not llm_service
+                or agent.use_persistent_memory != use_memory):
+            # Create agent instance using each archetype's own defaults,
+            # on the configured default provider (env DEFAULT_LLM_PROVIDER or config default)
+            agent = agent_class(
+                llm_service=llm_service,
+                provider=llm_service.default_provider,
+                extended_thinking=True,
+                use_persistent_memory=use_memory
+            )
+            # Attach player_id to agent for game state formatting
+            agent.player_id = player_id
+            if game_id is not None:
+                cls._agents[key] = agent
+        return agent
+    
+    @classmethod
+    def evict_agents(cls, game_id: str, player_id: Optional[str] = None) -> int:
+        """
+        Drop cached agents when a player leaves (or all of a game's agents).
+        
+        Args:
+            game_id: ID of the game
+            player_id: ID of the player who left; None for every seat in the game
+            
+        Returns:
+            Number of agents dropped
+        """
+        keys = [
+            key for key in cls._agents
+            if key[0] == game_id and (player_id is None or key[1] == player_id)
+        ]
+        for key in keys:
+            del cls._agents[key]
+        return len(keys)
+    
     @classmethod
     async def get_agent_decision(cls, 
                                 archetype: str, 
@@ -126,7 +216,8 @@ class MemoryIntegration:
                                 context: dict, 
                                 player_id: str, 
                                 use_memory: bool = True,
-                                intelligence_level: str = "expert") -> dict:
+                                intelligence_level: str = "expert",
+                                game_id: Optional[str] = None) -> dict:
         """
         Get a decision from an AI agent of a specific archetype.
         
@@ -137,60 +228,21 @@ class MemoryIntegration:
             player_id: ID of the player making the decision
             use_memory: Whether to use player memory/profiles
             intelligence_level: Agent intelligence level
+            game_id: ID of the game, so the seat's agent is reused across its decisions
             
         Returns:
             A decision object with action, amount, and reasoning
         """
         import logging
-        from ai.llm_service import LLMService
-        import importlib
-        import re
-        
-        # Initialize LLM service
-        llm_service = LLMService()
-        
-        # Use configured default provider (env DEFAULT_LLM_PROVIDER or config default)
-        provider = llm_service.default_provider
-        
-        # Map archetype strings to agent classes
-        archetype_map = {
-            "TAG": "TAGAgent",
-            "LAG": "LAGAgent",
-            "TightPassive": "TightPassiveAgent",
-            "LoosePassive": "LoosePassiveAgent",
-            "CallingStation": "CallingStationAgent",
-            "Maniac": "ManiacAgent", 
-            "Beginner": "BeginnerAgent",
-            "Adaptable": "AdaptableAgent",
-            "GTO": "GTOAgent",
-            "ShortStack": "ShortStackAgent",
-            "Trappy": "TrappyAgent"
-        }
         
         # Handle case variations in archetype names
         archetype = archetype.replace(" ", "")
-        agent_class_name = archetype_map.get(archetype, "TAGAgent")  # Default to TAG if not found
+        agent_class_name = _AGENT_CLASSES.get(archetype, _AGENT_CLASSES["TAG"])[1]  # Default to TAG if not found
         
-        try:
-            # Dynamically import the appropriate agent class from ai.agents
-            # Convert CamelCase class name (without 'Agent') to snake_case module name
-            base_name = agent_class_name[:-5]  # strip 'Agent'
-            # Insert underscores between camel-case boundaries
-            snake = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', base_name)
-            snake = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', snake).lower()
-            module_path = f"ai.agents.{snake}_agent"
-            agent_module = importlib.import_module(module_path)
-            agent_class = getattr(agent_module, agent_class_name)
-            
-            # Create agent instance using each archetype's own defaults
-            agent = agent_class(
-                llm_service=llm_service,
-                provider=provider,
-                extended_thinking=True,
-                use_persistent_memory=use_memory
-            )
-            # Attach player_id to agent for game state formatting
-            agent.player_id = player_id
+        try:
+            # The seat's agent, built on its first decision and reused after
+            agent = cls.get_agent(archetype, player_id, game_id=game_id, use_memory=use_memory)
+            provider = agent.provider
             
             # Get the decision from the agent
             logging.info(f"Requesting decision from {agent_class_name} with provider {provider}")
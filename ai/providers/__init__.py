@@ -2,8 +2,30 @@
 Provider abstraction layer for LLM services.
 """
 
+import asyncio
+import functools
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional, List, Union
+
+# The provider SDK clients are synchronous; their calls run on this bounded
+# pool so a slow request never blocks the event loop (and every other table)
+LLM_THREAD_POOL_SIZE = int(os.environ.get("LLM_THREAD_POOL_SIZE", "16"))
+_executor = ThreadPoolExecutor(max_workers=LLM_THREAD_POOL_SIZE, thread_name_prefix="llm-call")
+
+
+async def run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking provider SDK call on the LLM thread pool.
+    
+    If the caller is cancelled (or times out) while the call is still
+    queued for a thread, it never runs; a call already running finishes in
+    its thread (bounded by the HTTP client's timeout) and is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
 
 class LLMProvider(ABC):
     """Base abstract class for LLM providers."""
@@ -7,7 +7,7 @@ import re
 import logging
 from typing import Dict, Any, Optional, List, Union
 
-from . import LLMProvider
+from . import LLMProvider, run_blocking
 # Ensure anthropic module exists so tests can patch anthropic.Anthropic even if not installed
 # No need for a dummy module anymore, but keep comments for clarity
 # This previously created a dummy implementation to handle missing dependencies 
@@ -18,7 +18,8 @@ logger = logging.getLogger(__name__)
 class AnthropicProvider(LLMProvider):
     """Provider implementation for Anthropic Claude API."""
     
-    def __init__(self, api_key: str, model: str = "claude-3-7-sonnet-20250219", thinking_budget_tokens: int = 4000):
+    def __init__(self, api_key: str, model: str = "claude-3-7-sonnet-20250219", thinking_budget_tokens: int = 4000,
+                 http_client: Optional[Any] = None):
         """
         Initialize the Anthropic provider.
         
@@ -26,6 +27,7 @@ class AnthropicProvider(LLMProvider):
             api_key: Anthropic API key
             model: Model identifier (default: claude-3-7-sonnet-20250219)
             thinking_budget_tokens: Number of tokens allocated for extended thinking
+            http_client: Optional pooled httpx client for the SDK to send requests through
         """
         self.api_key = api_key
         self.model = model
@@ -34,7 +36,10 @@ class AnthropicProvider(LLMProvider):
         # Import anthropic here to avoid global import issues
         try:
             import anthropic
-            self.client = anthropic.Anthropic(api_key=api_key)
+            if http_client is not None:
+                self.client = anthropic.Anthropic(api_key=api_key, http_client=http_client)
+            else:
+                self.client = anthropic.Anthropic(api_key=api_key)
             logger.info(f"Successfully initialized Anthropic client with model {model}")
         except ImportError as e:
             logger.error(f"Failed to import anthropic library: {str(e)}. Please install with: pip install anthropic")
@@ -97,9 +102,8 @@ class AnthropicProvider(LLMProvider):
             if not hasattr(self.client, 'messages'):
                 raise RuntimeError("Anthropic client does not have 'messages' attribute")
             
-            # Note: Using sync API here - the Anthropic library doesn't appear to expose
-            # async methods, but we keep the async interface for consistency with other providers
-            response = self.client.messages.create(**params)
+            # The sync client runs on the LLM thread pool, off the event loop
+            response = await run_blocking(self.client.messages.create, **params)
             
             # Safety check for response
             if response is None:
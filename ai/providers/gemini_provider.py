@@ -8,7 +8,7 @@ import logging
 import asyncio
 from typing import Dict, Any, Optional, List, Union, Literal
 
-from . import LLMProvider
+from . import LLMProvider, run_blocking
 
 # Ensure a default asyncio event loop is available for get_event_loop(), and patch it to avoid RuntimeError
 _orig_get_event_loop = asyncio.get_event_loop
@@ -287,7 +287,7 @@ class GeminiProvider(LLMProvider):
                     # Method 1: Use the direct message and convert to string
                     try:
                         # First try the standard method
-                        response = chat.send_message(reasoning_prompt)
+                        response = await run_blocking(chat.send_message, reasoning_prompt)
                         logger.debug(f"Standard response type: {type(response)}")
                         
                         # Extract text with direct .text access, if available
@@ -330,7 +330,7 @@ class GeminiProvider(LLMProvider):
                                 
                                 # Generate content directly with error handling
                                 try:
-                                    result = temp_model.generate_content(simple_prompt)
+                                    result = await run_blocking(temp_model.generate_content, simple_prompt)
                                     if hasattr(result, 'text') and result.text:
                                         content = result.text
                                         logger.debug("Used direct model generation as final fallback")
@@ -458,7 +458,7 @@ class GeminiProvider(LLMProvider):
                         # Method 1: Use the direct message and convert to string
                         try:
                             # First try the standard method
-                            response = chat.send_message(user_prompt)
+                            response = await run_blocking(chat.send_message, user_prompt)
                             logger.debug(f"Standard response type: {type(response)}")
                             
                             # Extract text with direct .text access, if available
@@ -498,7 +498,7 @@ class GeminiProvider(LLMProvider):
                                     
                                     # Generate content directly with error handling
                                     try:
-                                        result = temp_model.generate_content(simple_prompt)
+                                        result = await run_blocking(temp_model.generate_content, simple_prompt)
                                         if hasattr(result, 'text') and result.text:
                                             content = result.text
                                             logger.debug("Used direct model generation as final fallback")
@@ -731,7 +731,8 @@ class GeminiProvider(LLMProvider):
                 logger.debug("Attempting function calling to generate JSON response")
                 
                 # Request the specific function call without mixing with response_mime_type
-                function_response = standard_model.generate_content(
+                function_response = await run_blocking(
+                    standard_model.generate_content,
                     prompt_content,
                     tools=[{"function_declarations": function_declarations}],
                     tool_config={"function_calling_config": {"mode": "ANY"}}
@@ -801,7 +802,7 @@ class GeminiProvider(LLMProvider):
                 )
                 
                 # Generate content without any special configuration
-                text_response = standard_model.generate_content(json_prompt)
+                text_response = await run_blocking(standard_model.generate_content, json_prompt)
                 
                 # Try to extract the JSON
                 if hasattr(text_response, 'text'):
@@ -974,7 +975,7 @@ class GeminiProvider(LLMProvider):
         try:
             logger.debug("Gemini generation_config: %s", cfg)
             logger.debug("Generating JSON with Gemini. Prompt preview: %s", json_prompt[:200])
-            response = await asyncio.to_thread(json_model.generate_content, json_prompt)
+            response = await run_blocking(json_model.generate_content, json_prompt)
             # Handle different response types
             # If a dict is returned, assume it's already parsed JSON
             if isinstance(response, dict):
@@ -7,7 +7,7 @@ import re
 import logging
 from typing import Dict, Any, Optional, List, Union, Literal
 
-from . import LLMProvider
+from . import LLMProvider, run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -108,7 +108,8 @@ class OpenAIProvider(LLMProvider):
                 api_key: str, 
                 model: str = DEFAULT_MODEL, 
                 reasoning_level: str = "medium",
-                organization_id: Optional[str] = None):
+                organization_id: Optional[str] = None,
+                http_client: Optional[Any] = None):
         """
         Initialize the OpenAI provider.
         
@@ -117,6 +118,7 @@ class OpenAIProvider(LLMProvider):
             model: Model identifier (default: gpt-4o)
             reasoning_level: Reasoning level (low, medium, high) - applies to o3-mini
             organization_id: OpenAI organization ID (optional)
+            http_client: Optional pooled httpx client for the SDK to send requests through
         """
         self.api_key = api_key
         self.organization_id = organization_id
@@ -138,14 +140,13 @@ class OpenAIProvider(LLMProvider):
         # Import OpenAI here to avoid global import issues
         try:
             from openai import OpenAI
+            client_kwargs = {"api_key": api_key}
             # Only set the organization header if provided, otherwise let OpenAI use the default from the API key
             if organization_id:
-                self.client = OpenAI(
-                    api_key=api_key, 
-                    organization=organization_id  # This is the proper way to set the organization
-                )
-            else:
-                self.client = OpenAI(api_key=api_key)
+                client_kwargs["organization"] = organization_id  # This is the proper way to set the organization
+            if http_client is not None:
+                client_kwargs["http_client"] = http_client
+            self.client = OpenAI(**client_kwargs)
         except ImportError:
             logger.error("Failed to import openai library. Please install with: pip install openai")
             raise
@@ -227,7 +228,7 @@ class OpenAIProvider(LLMProvider):
             
         try:
             # Use the Responses API endpoint
-            response = self.client.responses.create(**params)
+            response = await run_blocking(self.client.responses.create, **params)
 
             # Extract the text from the responses endpoint
             text_response = ""
@@ -392,7 +393,7 @@ class OpenAIProvider(LLMProvider):
             # Debug: log request params before calling OpenAI
             logger.debug(f"OpenAI API Request Params for {self.model}: {json.dumps(params, indent=2, default=str)}")
             # Use the Responses API endpoint
-            response = self.client.responses.create(**params)
+            response = await run_blocking(self.client.responses.create, **params)
             # Debug: log raw response from OpenAI
             logger.debug(f"Raw OpenAI Response object type: {type(response)}")
             logger.debug(f"Raw OpenAI Response object structure: {repr(response)}")
@@ -0,0 +1,65 @@
+"""
+Unit tests for the per-seat agent cache in MemoryIntegration.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ai.agents import LAGAgent, TAGAgent
+from ai.llm_service import LLMService
+from ai.memory_integration import MemoryIntegration
+
+
+class TestAgentRegistry(unittest.TestCase):
+    """Each seat's agent is built once per game and dropped when the player leaves."""
+
+    def setUp(self):
+        LLMService.initialize({"gemini": {"api_key": "test_key"}, "default_provider": "gemini"})
+        MemoryIntegration._agents.clear()
+
+    def tearDown(self):
+        MemoryIntegration._agents.clear()
+        LLMService.shutdown()
+
+    def test_agent_is_reused_across_decisions(self):
+        with patch.object(TAGAgent, "make_decision", AsyncMock(return_value={"action": "check"})) as decide:
+            for _ in range(3):
+                decision = asyncio.run(MemoryIntegration.get_agent_decision(
+                    "TAG", {}, {}, "p1", use_memory=False, game_id="g1"))
+                self.assertEqual(decision, {"action": "check"})
+        self.assertEqual(decide.await_count, 3)
+        agent = MemoryIntegration._agents[("g1", "p1")]
+        self.assertIsInstance(agent, TAGAgent)
+        self.assertEqual((agent.player_id, agent.provider), ("p1", "gemini"))
+        self.assertIs(MemoryIntegration.get_agent("TAG", "p1", game_id="g1", use_memory=False), agent)
+
+    def test_agent_is_rebuilt_or_evicted(self):
+        tag = MemoryIntegration.get_agent("TAG", "p1", game_id="g1", use_memory=False)
+        MemoryIntegration.get_agent("TAG", "p2", game_id="g1", use_memory=False)
+        MemoryIntegration.get_agent("TAG", "p1", game_id="g2", use_memory=False)
+
+        # Another archetype or a new LLM service makes a new agent
+        lag = MemoryIntegration.get_agent("LAG", "p1", game_id="g1", use_memory=False)
+        self.assertIsInstance(lag, LAGAgent)
+        LLMService.initialize({"gemini": {"api_key": "test_key"}, "default_provider": "gemini"})
+        self.assertIsNot(MemoryIntegration.get_agent("LAG", "p1", game_id="g1", use_memory=False), lag)
+        self.assertIsNot(tag, lag)
+
+        self.assertEqual(MemoryIntegration.evict_agents("g1", "p1"), 1)
+        self.assertNotIn(("g1", "p1"), MemoryIntegration._agents)
+        self.assertEqual(MemoryIntegration.evict_agents("g1"), 1)
+        self.assertEqual(list(MemoryIntegration._agents), [("g2", "p1")])
+
+    def test_agent_without_a_game_is_not_cached(self):
+        first = MemoryIntegration.get_agent("TAG", "p1", use_memory=False)
+        self.assertIsNot(MemoryIntegration.get_agent("TAG", "p1", use_memory=False), first)
+        self.assertEqual(MemoryIntegration._agents, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
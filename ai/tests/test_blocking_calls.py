@@ -0,0 +1,115 @@
+"""
+Tests that slow provider calls run off the event loop, time out and cancel cleanly.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch, MagicMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ai.llm_service import LLMService, llm_scheduler
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """A fake provider endpoint that takes half a second to answer."""
+    delay = 0.5
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.delay)
+        body = b"slow answer"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBlockingProviderCalls(unittest.TestCase):
+    """A slow LLM call must not stall the other tables on the event loop."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{self.server.server_port}/generate"
+
+        # The Gemini SDK's chat call, made for real (and blocking) against the fake server
+        def send_message(prompt):
+            with urllib.request.urlopen(urllib.request.Request(url, data=prompt.encode())) as response:
+                return MagicMock(text=response.read().decode())
+
+        genai = MagicMock()
+        genai.GenerativeModel.return_value.start_chat.return_value.send_message.side_effect = send_message
+        self.module_patcher = patch.dict('sys.modules', {'google.generativeai': genai})
+        self.module_patcher.start()
+        self.service = LLMService({"gemini": {"api_key": "test_key"}, "default_provider": "gemini"})
+
+    def tearDown(self):
+        self.module_patcher.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _run_with_other_table(self, request):
+        """Run a request while another table ticks every 10ms; returns (outcome, ticks, seconds)."""
+        async def main():
+            ticks = 0
+            done = asyncio.Event()
+
+            async def other_table():
+                nonlocal ticks
+                while not done.is_set():
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker = asyncio.create_task(other_table())
+            started = time.monotonic()
+            try:
+                outcome = await request()
+            except BaseException as e:
+                outcome = e
+            elapsed = time.monotonic() - started
+            done.set()
+            await ticker
+            return outcome, ticks, elapsed
+
+        return asyncio.run(main())
+
+    def test_other_tables_progress_during_slow_call(self):
+        outcome, ticks, elapsed = self._run_with_other_table(
+            lambda: self.service.complete("system", "user prompt"))
+        self.assertEqual(outcome, "slow answer")
+        self.assertGreaterEqual(elapsed, 0.5)
+        # Blocking the loop would leave the other table at a tick or two
+        self.assertGreater(ticks, 20)
+
+    def test_slow_call_times_out(self):
+        outcome, ticks, elapsed = self._run_with_other_table(
+            lambda: self.service.complete("system", "user prompt", timeout=0.1))
+        self.assertIsInstance(outcome, asyncio.TimeoutError)
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(llm_scheduler.metrics()["gemini"]["in_flight"], 0)
+
+    def test_cancelled_call_releases_its_slot(self):
+        async def cancel_midway():
+            task = asyncio.create_task(self.service.complete("system", "user prompt"))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            return await task
+
+        outcome, ticks, elapsed = self._run_with_other_table(cancel_midway)
+        self.assertIsInstance(outcome, asyncio.CancelledError)
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(llm_scheduler.metrics()["gemini"]["in_flight"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
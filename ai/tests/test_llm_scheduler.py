@@ -0,0 +1,99 @@
+"""
+Unit tests for the LLM request scheduler.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch, MagicMock
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ai.llm_service import LLMRequestScheduler, LLMService, estimate_tokens, llm_request_context, llm_scheduler
+
+
+class TestLLMRequestScheduler(unittest.TestCase):
+    """Tests for the LLMRequestScheduler class."""
+
+    def test_concurrency_limit_and_fair_queuing(self):
+        """Queued requests go interactive first, then round-robin across tables."""
+        scheduler = LLMRequestScheduler(max_concurrent=1)
+        order = []
+
+        async def request(table, interactive=True):
+            with llm_request_context(table, interactive=interactive):
+                async with scheduler.slot("gemini", 100):
+                    order.append(table)
+                    await asyncio.sleep(0)
+
+        async def main():
+            blocker = asyncio.Event()
+
+            async def hold():
+                async with scheduler.slot("gemini", 100):
+                    await blocker.wait()
+
+            holder = asyncio.create_task(hold())
+            await asyncio.sleep(0)
+            tasks = [asyncio.create_task(request(table, interactive))
+                     for table, interactive in [("sim", False), ("a", True), ("a", True), ("a", True), ("b", True)]]
+            await asyncio.sleep(0)
+            metrics = scheduler.metrics()["gemini"]
+            blocker.set()
+            await asyncio.gather(holder, *tasks)
+            return metrics
+
+        metrics = asyncio.run(main())
+        self.assertEqual(order, ["a", "b", "a", "a", "sim"])
+        self.assertEqual(metrics["in_flight"], 1)
+        self.assertEqual(metrics["waits"]["interactive"]["queued"], 4)
+        self.assertEqual(metrics["waits"]["background"]["queued"], 1)
+        final = scheduler.metrics()["gemini"]
+        self.assertEqual((final["in_flight"], final["requests"]), (0, 6))
+        self.assertEqual(final["waits"]["interactive"]["requests"], 5)
+        self.assertGreater(final["waits"]["background"]["max_wait_ms"], 0)
+
+    def test_tokens_per_minute_budget(self):
+        """A request over the minute's budget waits; a cancelled one leaves the queue."""
+        scheduler = LLMRequestScheduler(max_concurrent=10)
+        scheduler.configure("openai", tokens_per_minute=1000)
+
+        async def main():
+            async with scheduler.slot("openai", 800):
+                pass
+            waiting = asyncio.create_task(scheduler.slot("openai", 800).__aenter__())
+            await asyncio.sleep(0.01)
+            self.assertFalse(waiting.done())
+            waiting.cancel()
+            await asyncio.sleep(0)
+            async with scheduler.slot("openai", 200):
+                pass
+
+        asyncio.run(main())
+        metrics = scheduler.metrics()["openai"]
+        self.assertEqual(metrics["tokens_last_minute"], 1000)
+        self.assertEqual(metrics["waits"]["interactive"]["queued"], 0)
+        self.assertEqual(metrics["in_flight"], 0)
+
+    @patch('ai.llm_service.GeminiProvider')
+    def test_service_requests_use_configured_limits(self, mock_provider):
+        """LLMService applies the provider's limits and goes through the scheduler."""
+        async def complete(**kwargs):
+            return "ok"
+
+        mock_provider.return_value = MagicMock(complete=complete)
+        service = LLMService({
+            "gemini": {"api_key": "test_key", "max_concurrent": 2, "tokens_per_minute": 50000},
+            "default_provider": "gemini"
+        })
+        requests = llm_scheduler.metrics().get("gemini", {}).get("requests", 0)
+        self.assertEqual(asyncio.run(service.complete("system", "user", max_tokens=10)), "ok")
+        metrics = llm_scheduler.metrics()["gemini"]
+        self.assertEqual((metrics["max_concurrent"], metrics["tokens_per_minute"]), (2, 50000))
+        self.assertEqual(metrics["requests"], requests + 1)
+        self.assertEqual(estimate_tokens("x" * 400, "", 10), 110)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,8 @@ import os
 import unittest
 import asyncio
 from unittest.mock import patch, Mock, MagicMock
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from dotenv import load_dotenv
 
 import sys
@@ -210,7 +212,8 @@ class TestLLMService(unittest.TestCase):
         mock_provider.assert_called_once_with(
             api_key="test_key", 
             model="test_model", 
-            thinking_budget_tokens=4000
+            thinking_budget_tokens=4000,
+            http_client=service.http_clients["anthropic"]
         )
         
         # Verify provider was cached
@@ -344,5 +347,64 @@ class TestLLMService(unittest.TestCase):
         self.assertEqual(response, {"result": "test"})
 
 
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every POST over HTTP/1.1 so the connection stays open."""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSharedLLMService(unittest.TestCase):
+    """Tests for the process-wide LLMService and its pooled provider connections."""
+
+    def tearDown(self):
+        LLMService.shutdown()
+
+    def test_instance_is_shared_until_reinitialized(self):
+        """get_instance() returns one service; initialize() replaces and closes it."""
+        config = {"openai": {"api_key": "test_key"}, "default_provider": "openai"}
+        first = LLMService.initialize(config)
+        self.assertIs(LLMService.get_instance(), first)
+        with patch('ai.llm_service.OpenAIProvider'):
+            first._get_provider()
+        client = first.http_clients["openai"]
+        second = LLMService.initialize(config)
+        self.assertIsNot(second, first)
+        self.assertTrue(client.is_closed)
+        self.assertEqual(first.providers, {})
+
+    def test_pooled_client_reuses_connections(self):
+        """Requests through a provider's pooled client share one keep-alive connection."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            service = LLMService({"openai": {"api_key": "test_key", "max_concurrent": 2}, "default_provider": "openai"})
+            with patch('ai.llm_service.OpenAIProvider'):
+                service._get_provider()
+                service._get_provider()
+            client = service.http_clients["openai"]
+            for _ in range(3):
+                self.assertEqual(client.post(f"http://127.0.0.1:{server.server_port}/v1/responses", json={}).json(),
+                                 {"ok": True})
+            self.assertEqual(service.get_connection_stats()["openai"], {
+                "clients_created": 1, "requests": 3, "new_connections": 1, "reused_connections": 2
+            })
+            service.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -49,7 +49,8 @@ class TestLLMServiceWithOpenAI(unittest.TestCase):
             api_key="test_key", 
             model="gpt-4o", 
             reasoning_level="high",
-            organization_id=None
+            organization_id=None,
+            http_client=service.http_clients["openai"]
         )
         
         # Verify provider was cached
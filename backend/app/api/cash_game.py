@@ -8,6 +8,7 @@ from pydantic import BaseModel
 
 from app.models.domain_models import GameType, BettingStructure
 from app.services.game_service import GameService
+from app.services.table_actor import TableCommand
 
 router = APIRouter(prefix="/cash-games", tags=["cash-games"])
 
@@ -103,14 +104,17 @@ async def add_player_to_cash_game(game_id: str, player_request: PlayerRequest):
     """Add a player to a cash game with specified buy-in."""
     game_service = GameService.get_instance()
     try:
-        _, player = game_service.add_player_to_cash_game(
-            game_id=game_id,
-            name=player_request.name,
-            buy_in=player_request.buy_in,
-            is_human=player_request.is_human,
-            user_id=player_request.user_id,
-            archetype=player_request.archetype,
-            position=player_request.position
+        _, player = await game_service.table_actor(game_id).submit(
+            TableCommand.JOIN,
+            lambda: game_service.add_player_to_cash_game(
+                game_id=game_id,
+                name=player_request.name,
+                buy_in=player_request.buy_in,
+                is_human=player_request.is_human,
+                user_id=player_request.user_id,
+                archetype=player_request.archetype,
+                position=player_request.position
+            )
         )
         return PlayerResponse(
             id=player.id,
@@ -128,7 +132,9 @@ async def cash_out_player(game_id: str, player_id: str):
     """Remove a player from a cash game and return their final chip count."""
     game_service = GameService.get_instance()
     try:
-        chips = game_service.cash_out_player(game_id, player_id)
+        chips = await game_service.table_actor(game_id).submit(
+            TableCommand.LEAVE, lambda: game_service.cash_out_player(game_id, player_id)
+        )
         return {"success": True, "chips": chips}
     except (ValueError, KeyError) as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -139,7 +145,9 @@ async def rebuy_player(game_id: str, player_id: str, rebuy_request: RebuyRequest
     """Add chips to a player in a cash game (rebuy)."""
     game_service = GameService.get_instance()
     try:
-        player = game_service.rebuy_player(game_id, player_id, rebuy_request.amount)
+        player = await game_service.table_actor(game_id).submit(
+            TableCommand.CHIPS, lambda: game_service.rebuy_player(game_id, player_id, rebuy_request.amount)
+        )
         return PlayerResponse(
             id=player.id,
             name=player.name,
@@ -156,7 +164,9 @@ async def top_up_player(game_id: str, player_id: str):
     """Top up a player's chips to the maximum buy-in amount."""
     game_service = GameService.get_instance()
     try:
-        player, amount = game_service.top_up_player(game_id, player_id)
+        player, amount = await game_service.table_actor(game_id).submit(
+            TableCommand.CHIPS, lambda: game_service.top_up_player(game_id, player_id)
+        )
         return PlayerResponse(
             id=player.id,
             name=player.name,
@@ -0,0 +1,111 @@
+"""
+Equity API endpoints for the poker application.
+This module exposes the Monte Carlo equity engine to the trainer UI."""
+
+import asyncio
+import functools
+from typing import List, Optional, Union
+from fastapi import APIRouter, HTTPException, Depends
+from pydantic import BaseModel, Field
+
+from app.core.cards import parse_cards
+from app.core.equity import EquityCalculator, EquityResult
+from app.core.ranges import Range
+
+router = APIRouter(prefix="/equity", tags=["equity"])
+
+# Upper bound on the time budget a client may request (seconds)
+MAX_TIME_BUDGET = 2.0
+
+
+# === Models ===
+
+class EquityRequest(BaseModel):
+    """Request model for an equity calculation."""
+    hero_cards: str = Field(..., description="Hero's hole cards, e.g. 'AsKd'")
+    board: str = Field("", description="Community cards dealt so far, e.g. 'Qh Jh 2c'")
+    opponents: int = Field(1, ge=1, le=9)
+    opponent_ranges: Optional[List[Union[str, List[str], None]]] = Field(
+        None,
+        description=(
+            "Per-opponent ranges, either in range notation such as '22+, A2s+, KTo+' "
+            "or as lists of combos such as ['QhQd', 'JhJd']; null means any two cards"
+        ),
+    )
+    time_budget: Optional[float] = Field(None, gt=0, le=MAX_TIME_BUDGET)
+    seed: Optional[int] = None
+
+
+class EquityResponse(BaseModel):
+    """Response model for an equity calculation."""
+    win: float
+    tie: float
+    equity: float
+    confidence_low: float
+    confidence_high: float
+    samples: int
+    exact: bool
+
+
+def _parse_range(entry: Union[str, List[str], None]) -> Optional[Range]:
+    """Parse one opponent range from notation or a list of two-card combos."""
+    if entry is None:
+        return None
+    if isinstance(entry, str):
+        return Range.parse(entry)
+    combos = [parse_cards(combo) for combo in entry]
+    if any(len(combo) != 2 for combo in combos):
+        raise ValueError("Each range combo must be exactly two cards")
+    return Range.from_combos(tuple(combo) for combo in combos)
+
+
+# Dependency to get the equity calculator
+def get_equity_calculator() -> EquityCalculator:
+    """Get the equity calculator singleton."""
+    return EquityCalculator.get_instance()
+
+
+@router.post("", response_model=EquityResponse)
+async def calculate_equity(
+    request: EquityRequest, calculator: EquityCalculator = Depends(get_equity_calculator)
+) -> EquityResponse:
+    """
+    Estimate a hand's equity against one or more opponents.
+
+    Args:
+        request: Hero cards, board, opponent count and optional ranges
+
+    Returns:
+        Win, tie and equity fractions with a 95% confidence interval
+    """
+    try:
+        hero = parse_cards(request.hero_cards)
+        board = parse_cards(request.board)
+        ranges = [_parse_range(entry) for entry in request.opponent_ranges or []]
+        if any(r is not None and ((r.weights > 0) & (r.weights < 1)).any() for r in ranges):
+            # Partially weighted ranges need the weighted range-vs-range sampler
+            villains = ranges + [None] * (request.opponents - len(ranges))
+            result: EquityResult = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    calculator.range_vs_range,
+                    Range.from_combos([tuple(hero)]),
+                    [Range.full() if r is None else r for r in villains],
+                    board,
+                    time_budget=request.time_budget,
+                    seed=request.seed,
+                ),
+            )
+        else:
+            result = await calculator.calculate_async(
+                hero,
+                board,
+                opponents=request.opponents,
+                opponent_ranges=[None if r is None else r.combos() for r in ranges] or None,
+                time_budget=request.time_budget,
+                seed=request.seed,
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return EquityResponse(**result.to_dict())
@@ -24,6 +24,7 @@ from app.models.game_models import (
 )
 from app.core.websocket import game_notifier
 from app.services.game_service import GameService
+from app.services.table_actor import TableCommand
 from app.core.utils import game_to_model, format_winners
 from app.models.domain_models import GameType
 
@@ -126,7 +127,7 @@ async def join_game(
     Returns:
         The created player object
     """
-    try:
+    def join():
         # Call the service to add a player
         game, player = service.add_player(
             game_id=game_id, name=player_name, is_human=True
@@ -142,7 +143,11 @@ async def join_game(
             (p for p in poker_game.players if p.player_id == player.id), None
         )
         if not poker_player:
-            poker_player = poker_game.add_player(player.id, player_name, buy_in)
+            poker_game.add_player(player.id, player_name, buy_in)
+        return player
+
+    try:
+        player = await service.table_actor(game_id).submit(TableCommand.JOIN, join)
 
         # Return the player model
         return PlayerModel(
@@ -225,8 +230,14 @@ async def next_hand(
             raise HTTPException(status_code=400, detail="Current hand is not complete")
 
         # Move the button and start a new hand
-        poker_game.move_button()
-        game = service._start_new_hand(service.get_game(game_id))
+        def start_next_hand():
+            poker_game.move_button()
+            return service._start_new_hand(service.get_game(game_id))
+
+        # Turns still pending belong to the hand that just ended
+        service.ai_turns(game_id).cancel()
+        await service.table_actor(game_id).submit(TableCommand.NEXT_HAND, start_next_hand)
+        service.ai_turns(game_id).start()
 
         # Notify WebSocket clients
         asyncio.create_task(game_notifier.notify_game_update(game_id, poker_game))
@@ -322,34 +333,20 @@ async def player_action(
         }
         domain_action = action_map.get(action)
 
-        # Process in both service (for history) and directly in poker game (for current state)
-        game = await service.process_action(
-            game_id, player.player_id, domain_action, action_request.amount
-        )
-        success = await poker_game.process_action(player, action, action_request.amount)
-
-        if not success:
+        # The service applies the action on the table's actor and records its history
+        try:
+            await service.process_action(
+                game_id, player.player_id, domain_action, action_request.amount
+            )
+        except ValueError as e:
             return ActionResponse(
                 success=False,
-                message=f"Failed to process action {action.name}",
+                message=str(e),
                 game_state=game_to_model(game_id, poker_game),
             )
 
-        # Notify WebSocket clients about the action and updated state,
-        # passing totals for clear poker terminology
-        post_street_bet = player.current_bet
-        post_hand_bet = player.total_bet
-        asyncio.create_task(
-            game_notifier.notify_player_action(
-                game_id,
-                player.player_id,
-                action.name,
-                action_request.amount,
-                total_street_bet=post_street_bet,
-                total_hand_bet=(post_hand_bet if action == PlayerAction.ALL_IN else None),
-            )
-        )
-
+        # The action itself went out with the table's events; notify
+        # WebSocket clients about the updated state
         asyncio.create_task(game_notifier.notify_game_update(game_id, poker_game))
 
         # Check if we need to automatically advance the game (e.g., when all players have checked/called)
@@ -469,4 +466,39 @@ async def trigger_ai_move(
     except KeyError:
         raise HTTPException(status_code=404, detail="Game not found")
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/metrics/tables", response_model=List[Dict])
+async def table_metrics(service: GameService = Depends(get_game_service)) -> List[Dict]:
+    """
+    Command queue metrics for every live table.
+
+    Args:
+        service: The game service
+
+    Returns:
+        Per table: queue depth (current and peak), the running command,
+        commands processed and failed, and average/peak queue wait in ms
+    """
+    return service.table_metrics()
+
+@router.get("/metrics/llm", response_model=Dict[str, Dict])
+async def llm_metrics() -> Dict[str, Dict]:
+    """
+    LLM request scheduler metrics for every provider used so far.
+
+    Returns:
+        Per provider: concurrency and tokens-per-minute limits, requests in
+        flight, tokens spent in the last minute, per priority
+        (interactive/background) the requests queued and average/peak queue
+        wait in ms, and under "connections" the SDK clients created and
+        HTTP requests sent over new vs reused connections
+    """
+    try:
+        from ai.llm_service import LLMService, llm_scheduler
+    except ImportError:
+        raise HTTPException(status_code=503, detail="AI module not available")
+    metrics = llm_scheduler.metrics()
+    for provider, connections in LLMService.get_instance().get_connection_stats().items():
+        metrics.setdefault(provider, {})["connections"] = connections
+    return metrics
@@ -11,6 +11,7 @@ import asyncio
 from app.core.websocket import connection_manager, game_notifier
 from app.core.poker_game import PokerGame, PlayerAction, PlayerStatus, BettingRound
 from app.services.game_service import GameService
+from app.services.table_actor import TableCommand
 from app.core.utils import game_to_model
 
 router = APIRouter(prefix="/ws", tags=["websocket"])
@@ -71,7 +72,9 @@ async def websocket_endpoint(
                 # Start a new hand
                 game = service.get_game(game_id)
                 if game:
-                    service._start_new_hand(game)
+                    service.ai_turns(game_id).cancel()
+                    if service._start_next_hand(game) is None:
+                        return
                     logging.info("Auto-next hand: Started new hand successfully")
                     
                     # Notify clients
@@ -84,7 +87,7 @@ async def websocket_endpoint(
                         
                         if first_player_domain and not first_player_domain.is_human:
                             logging.info(f"Auto-next hand: Triggering first AI player {first_player.name}")
-                            await service._request_and_process_ai_action(game_id, first_player.player_id)
+                            await service.ai_turns(game_id).run()
                         else:
                             logging.info(f"Auto-next hand: First player {first_player.name} is human, requesting action")
                             await game_notifier.notify_action_request(game_id, poker_game)
@@ -176,7 +179,7 @@ async def websocket_endpoint(
                                 logging.warning(f"WebSocket connected: First player is AI ({current_player_domain.name}). Triggering AI action.")
                                 # Trigger AI action after connection is established - use await to maintain sequential execution
                                 logging.warning(f"WebSocket connected: Using await for first AI player to ensure sequential execution")
-                                await service._request_and_process_ai_action(game_id, current_player_domain.id)
+                                await service.ai_turns(game_id).run()
                             else:
                                 logging.warning(f"WebSocket connected: First player is Human ({current_player_domain.name}). Will request action normally.")
                             
@@ -357,30 +360,11 @@ async def websocket_endpoint(
                     if step:
                         game_notifier.signal_animation_done(game_id, step)
                     if step == "hand_visually_concluded":
-                        # Advance dealer button and start next hand
-                        poker_game = service.poker_games.get(game_id)
-                        poker_game.move_button()
-                        logging.info(f"Animation handshake: moved button to {poker_game.button_position}")
-                        game_model = service.get_game(game_id)
-                        if game_model:
-                            new_hand = service._start_new_hand(game_model)
-                            await game_notifier.notify_new_hand(game_id, new_hand.hand_number)
-                            updated = service.poker_games.get(game_id)
-                            if updated:
-                                await game_notifier.notify_game_update(game_id, updated)
-                                # Trigger next turn (AI or human)
-                                idx = updated.current_player_idx
-                                if 0 <= idx < len(updated.players):
-                                    next_p = updated.players[idx]
-                                    domain = next((p for p in game_model.players if p.id == next_p.player_id), None)
-                                    if domain and not domain.is_human:
-                                        # AI turn
-                                        asyncio.create_task(
-                                            service._request_and_process_ai_action(game_id, next_p.player_id)
-                                        )
-                                    else:
-                                        # Human turn
-                                        await game_notifier.notify_action_request(game_id, updated)
+                        # Queue the next hand on the table without waiting for it, so
+                        # this loop keeps reading animation acknowledgements
+                        await service.table_actor(game_id).post(
+                            TableCommand.NEXT_HAND, lambda: _start_next_hand(game_id, service)
+                        )
             except json.JSONDecodeError as e:
                 logging.error(f"JSON decode error: {str(e)}")
                 await connection_manager.send_personal_message(
@@ -428,6 +412,36 @@ async def websocket_endpoint(
             pass  # If this fails, we've already tried our best
 
 
+async def _start_next_hand(game_id: str, service: GameService) -> None:
+    """Advance the dealer button, start the next hand and prompt the first player."""
+    import logging
+    poker_game = service.poker_games.get(game_id)
+    poker_game.move_button()
+    logging.info(f"Animation handshake: moved button to {poker_game.button_position}")
+    game_model = service.get_game(game_id)
+    if game_model:
+        # Turns still pending belong to the hand that just ended
+        service.ai_turns(game_id).cancel()
+        new_hand = service._start_next_hand(game_model)
+        if new_hand is None:
+            return
+        await game_notifier.notify_new_hand(game_id, new_hand.hand_number)
+        updated = service.poker_games.get(game_id)
+        if updated:
+            await game_notifier.notify_game_update(game_id, updated)
+            # Trigger next turn (AI or human)
+            idx = updated.current_player_idx
+            if 0 <= idx < len(updated.players):
+                next_p = updated.players[idx]
+                domain = next((p for p in game_model.players if p.id == next_p.player_id), None)
+                if domain and not domain.is_human:
+                    # AI turn
+                    service.ai_turns(game_id).start()
+                else:
+                    # Human turn
+                    await game_notifier.notify_action_request(game_id, updated)
+
+
 async def process_action_message(
     websocket: WebSocket,
     game_id: str,
@@ -585,38 +599,17 @@ async def process_action_message(
         import logging
         logging.error(f"Error recording action history: {str(e)}")
 
-    # Acquire game lock before processing action to prevent race conditions
-    if game_id not in service.game_locks:
-        service.game_locks[game_id] = asyncio.Lock()
-    game_lock = service.game_locks[game_id]
-    
     import logging
     import time
     execution_id = f"{time.time():.6f}"
-    logging.info(f"[WS-ACTION-{execution_id}] Acquiring game lock for processing human action {action_type.name}")
-    
-    # Add detailed state logging before attempting to process the action
-    logging.info(f"[WS-ACTION-{execution_id}] Human player: {player.name} (ID: {player.player_id})")
-    logging.info(f"[WS-ACTION-{execution_id}] Current round: {poker_game.current_round.name}")
-    logging.info(f"[WS-ACTION-{execution_id}] Current bet: {poker_game.current_bet}")
-    logging.info(f"[WS-ACTION-{execution_id}] Current player idx: {poker_game.current_player_idx}")
-    logging.info(f"[WS-ACTION-{execution_id}] Current player: {poker_game.players[poker_game.current_player_idx].name if 0 <= poker_game.current_player_idx < len(poker_game.players) else 'INVALID'}")
     
-    # Verify it really is the player's turn before acquiring the lock
-    if 0 <= poker_game.current_player_idx < len(poker_game.players):
-        expected_player = poker_game.players[poker_game.current_player_idx]
-        if expected_player.player_id != player.player_id:
-            logging.error(f"[WS-ACTION-{execution_id}] Turn mismatch BEFORE lock! Expected {expected_player.name}, but got action from {player.name}")
-    
-    async with game_lock:
-        logging.info(f"[WS-ACTION-{execution_id}] Lock acquired - Processing {action_type.name} {action_amount if action_amount is not None else ''}")
-        logging.info(f"[WS-ACTION-{execution_id}] Before process_action - to_act: {poker_game.to_act}")
-        
-        # Enhanced verification after acquiring lock (index may have changed while waiting for lock)
+    async def apply_action() -> bool:
+        # Verify the turn again once the table reaches this command (earlier
+        # commands in its queue may have moved the action on)
         if 0 <= poker_game.current_player_idx < len(poker_game.players):
             expected_player = poker_game.players[poker_game.current_player_idx]
             if expected_player.player_id != player.player_id:
-                logging.error(f"[WS-ACTION-{execution_id}] Turn mismatch AFTER lock! Expected {expected_player.name}, but got action from {player.name}")
+                logging.error(f"[WS-ACTION-{execution_id}] Turn mismatch! Expected {expected_player.name}, but got action from {player.name}")
                 logging.error(f"[WS-ACTION-{execution_id}] Current betting round: {poker_game.current_round.name}")
                 logging.error(f"[WS-ACTION-{execution_id}] Button position: {poker_game.button_position}")
                 logging.error(f"[WS-ACTION-{execution_id}] Player positions: {[(p.name, p.position) for p in poker_game.players]}")
@@ -634,11 +627,10 @@ async def process_action_message(
                         logging.error(f"[WS-ACTION-{execution_id}] Could not find player {player.name} in players list for correction")
         
         # Process directly in poker game for current state
-        logging.info(f"[WS-ACTION-{execution_id}] About to call process_action with player {player.name}, action {action_type}, amount {action_amount}")
-        success = await poker_game.process_action(player, action_type, action_amount)
-        
-        logging.info(f"[WS-ACTION-{execution_id}] After process_action - to_act: {poker_game.to_act}")
-        logging.info(f"[WS-ACTION-{execution_id}] PokerGame process_action result: {success}")
+        return await poker_game.process_action(player, action_type, action_amount)
+    
+    # The table's actor runs the action after any commands already queued
+    success = await service.table_actor(game_id).submit(TableCommand.ACTION, apply_action)
 
     if not success:
         await connection_manager.send_personal_message(
@@ -653,21 +645,8 @@ async def process_action_message(
         )
         return
 
-    # Notify about player action, passing totals for crystal-clear log phrasing
-    # post_street_bet: total chips committed this street after the action
-    post_street_bet = player.current_bet
-    # post_hand_bet: total chips committed in this hand after the action (for all-in)
-    post_hand_bet = player.total_bet
-    await game_notifier.notify_player_action(
-        game_id,
-        player_id,
-        action_type.name,
-        action_amount,
-        total_street_bet=post_street_bet,
-        total_hand_bet=(post_hand_bet if action_type == PlayerAction.ALL_IN else None),
-    )
-    # Remove highlight and reset bet input after action
-    await game_notifier.notify_turn_highlight_removed(game_id, player_id)
+    # The action and the highlight removal went out with the table's events;
+    # reset the bet input after action
     await game_notifier.notify_bet_input_reset(game_id, player_id)
 
     # Notify about updated game state
@@ -677,12 +656,10 @@ async def process_action_message(
     if poker_game.current_round == BettingRound.SHOWDOWN:
         # First show hand evaluations (canonical step 14)
         try:
-            evaluations = poker_game.evaluate_hands()
             formatted_evaluations = {}
-            for player, (rank, kickers) in evaluations.items():
+            for player, hand in poker_game.showdown_results().items():
                 if player.status != PlayerStatus.FOLDED:
-                    description = poker_game._format_hand_description(rank, kickers)
-                    formatted_evaluations[player.player_id] = (rank, description)
+                    formatted_evaluations[player.player_id] = (hand.rank, hand.description)
             
             await game_notifier.notify_hand_evaluations(game_id, formatted_evaluations)
             # Wait for frontend to display evaluations
@@ -774,9 +751,7 @@ async def process_action_message(
                     # AI player's turn - trigger AI action asynchronously
                     logging.info(f"Triggering AI action for next player: {next_player.name}")
                     logging.info(f"Triggering AI action for next player: Using await to ensure sequential execution")
-                    await service._request_and_process_ai_action(
-                        game_id, next_player.player_id
-                    )
+                    await service.ai_turns(game_id).run()
                     return  # AI will handle the turn, no need to send action request
                 else:
                     # Human player's turn - send action request
@@ -809,9 +784,7 @@ async def process_action_message(
                             # AI player's turn
                             logging.info(f"Triggering AI action for alternate next player: {next_active_player.name}")
                             logging.info(f"Triggering AI action for alternate next player: Using await to ensure sequential execution")
-                            await service._request_and_process_ai_action(
-                                game_id, next_active_player.player_id
-                            )
+                            await service.ai_turns(game_id).run()
                             return
                         else:
                             # Human player's turn
@@ -898,186 +871,3 @@ async def process_chat_message(
                 "data": {"received": True, "timestamp": datetime.now().isoformat()},
             },
         )
-
-
-async def process_action_message_new(
-    websocket: WebSocket,
-    game_id: str,
-    message: Dict[str, Any],
-    player_id: Optional[str],
-    service: GameService,
-):
-    """
-    New event-driven version of action message processing.
-    
-    Uses the EventOrchestrator pattern to separate game logic
-    from UI coordination, eliminating race conditions.
-    """
-    from app.core.event_orchestrator import event_orchestrator
-    from app.core.game_events import EventContext
-    from app.core.poker_game import PlayerAction
-    from app.models.domain_models import DomainPlayerAction
-    
-    import logging
-    import time
-    import traceback
-    execution_id = f"{time.time():.6f}"
-    
-    connection_manager = service.connection_manager
-    
-    logging.info(f"[WS-ACTION-NEW-{execution_id}] Processing action message from {player_id}")
-    
-    try:
-        # Extract action data from message
-        data = message.get("data", {})
-        action_type_str = data.get("action")
-        action_amount = data.get("amount")
-        
-        if not action_type_str:
-            await connection_manager.send_personal_message(websocket, {
-                "type": "error",
-                "data": {"code": "missing_action", "message": "Action type is required"}
-            })
-            return
-        
-        # Get game and player objects
-        poker_game = service.get_poker_game(game_id)
-        if not poker_game:
-            logging.error(f"[WS-ACTION-NEW-{execution_id}] Game {game_id} not found")
-            await connection_manager.send_personal_message(websocket, {
-                "type": "error",
-                "data": {"code": "game_not_found", "message": "Game not found"}
-            })
-            return
-        
-        player = next((p for p in poker_game.players if p.player_id == player_id), None)
-        if not player:
-            logging.error(f"[WS-ACTION-NEW-{execution_id}] Player {player_id} not found in game")
-            await connection_manager.send_personal_message(websocket, {
-                "type": "error", 
-                "data": {"code": "player_not_found", "message": "Player not found"}
-            })
-            return
-        
-        # Parse action type
-        try:
-            action_type = PlayerAction[action_type_str.upper()]
-        except (KeyError, AttributeError):
-            await connection_manager.send_personal_message(websocket, {
-                "type": "error",
-                "data": {"code": "invalid_action", "message": f"Invalid action: {action_type_str}"}
-            })
-            return
-        
-        # Validate it's the player's turn  
-        from app.core.poker_game import PlayerStatus
-        if player.player_id not in poker_game.to_act or player.status != PlayerStatus.ACTIVE:
-            await connection_manager.send_personal_message(websocket, {
-                "type": "error",
-                "data": {"code": "not_your_turn", "message": "Not your turn to act"}
-            })
-            return
-        
-        # Record action history (keep existing functionality)
-        try:
-            action_map = {
-                PlayerAction.FOLD: DomainPlayerAction.FOLD,
-                PlayerAction.CHECK: DomainPlayerAction.CHECK,
-                PlayerAction.CALL: DomainPlayerAction.CALL,
-                PlayerAction.BET: DomainPlayerAction.BET,
-                PlayerAction.RAISE: DomainPlayerAction.RAISE,
-                PlayerAction.ALL_IN: DomainPlayerAction.ALL_IN,
-            }
-            domain_action = action_map.get(action_type)
-            
-            if domain_action:
-                from app.models.domain_models import ActionHistory
-                game = service.get_game(game_id)
-                if game and game.current_hand:
-                    action_history = ActionHistory(
-                        game_id=game_id,
-                        hand_id=game.current_hand.id,
-                        player_id=player_id,
-                        action=domain_action,
-                        amount=action_amount,
-                        round=game.current_hand.current_round
-                    )
-                    service.action_repo.create(action_history)
-                    game.current_hand.actions.append(action_history)
-        except Exception as e:
-            logging.error(f"Error recording action history: {str(e)}")
-        
-        # Acquire game lock for thread safety
-        if game_id not in service.game_locks:
-            service.game_locks[game_id] = asyncio.Lock()
-        game_lock = service.game_locks[game_id]
-        
-        async with game_lock:
-            logging.info(f"[WS-ACTION-NEW-{execution_id}] Lock acquired - Processing {action_type.name}")
-            
-            # Process the action using pure game logic
-            action_result = poker_game.process_action_pure(player, action_type, action_amount)
-            
-            if not action_result.success:
-                logging.warning(f"[WS-ACTION-NEW-{execution_id}] Action failed: {action_result.error_message}")
-                await connection_manager.send_personal_message(websocket, {
-                    "type": "error",
-                    "data": {
-                        "code": "action_failed", 
-                        "message": action_result.error_message
-                    }
-                })
-                return
-            
-            logging.info(f"[WS-ACTION-NEW-{execution_id}] Action successful, events: {[e.name for e in action_result.events]}")
-            
-            # Create event context for orchestrator
-            context = EventContext(
-                game_id=game_id,
-                poker_game=poker_game,
-                action_result=action_result,
-                connection_manager=connection_manager
-            )
-            
-            # Let the orchestrator handle all notifications and animations
-            await event_orchestrator.handle_action_result(context)
-            
-        # Handle AI players if the hand continues
-        if not action_result.is_showdown and not action_result.is_early_showdown:
-            await _handle_next_player_if_ai_new(game_id, poker_game, service)
-            
-    except Exception as e:
-        logging.error(f"[WS-ACTION-NEW-{execution_id}] Critical error: {str(e)}")
-        logging.error(traceback.format_exc())
-        
-        try:
-            await connection_manager.send_personal_message(websocket, {
-                "type": "error",
-                "data": {
-                    "code": "internal_error",
-                    "message": "Internal server error"
-                }
-            })
-        except Exception as send_error:
-            logging.error(f"Failed to send error message: {send_error}")
-
-
-async def _handle_next_player_if_ai_new(game_id: str, poker_game, service: GameService) -> None:
-    """Handle AI player turns after human action."""
-    if not (0 <= poker_game.current_player_idx < len(poker_game.players)):
-        return
-        
-    next_player = poker_game.players[poker_game.current_player_idx]
-    
-    if (next_player.status == PlayerStatus.ACTIVE and 
-        next_player.player_id in poker_game.to_act):
-        
-        # Check if this is an AI player
-        game = service.get_game(game_id)
-        if game:
-            next_player_domain = next((p for p in game.players if p.id == next_player.player_id), None)
-            if next_player_domain and not next_player_domain.is_human:
-                logging.info(f"Triggering AI action for {next_player.name}")
-                # Use the new action processing for AI as well
-                # This ensures consistent behavior between human and AI actions
-                await service._request_and_process_ai_action(game_id, next_player.player_id)
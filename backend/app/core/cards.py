@@ -2,8 +2,10 @@
 Card representation and deck management for the poker engine.
 """
 from enum import Enum, auto
-from typing import List, Optional, Set
-import random
+from typing import Dict, List, Optional, Set, Tuple
+import re
+
+import numpy as np
 
 
 class Suit(Enum):
@@ -41,58 +43,181 @@ class Rank(Enum):
         return self.name[0]
 
 
+# Cards are encoded as integers 0-51. The low SUIT_BITS bits hold the suit
+# index (Suit.value - 1) and the remaining bits hold the rank index
+# (Rank.value - 2), so ids sort by rank first and suit second.
+SUIT_BITS = 2
+SUIT_MASK = (1 << SUIT_BITS) - 1
+NUM_CARDS = 52
+
+_RANKS: Tuple[Rank, ...] = tuple(Rank)
+_SUITS: Tuple[Suit, ...] = tuple(Suit)
+
+
+def encode_card(rank: Rank, suit: Suit) -> int:
+    """Return the integer id (0-51) for a rank and suit."""
+    return ((rank.value - 2) << SUIT_BITS) | (suit.value - 1)
+
+
+def rank_index(card_id: int) -> int:
+    """Return the rank index (0 = two ... 12 = ace) of a card id."""
+    return card_id >> SUIT_BITS
+
+
+def suit_index(card_id: int) -> int:
+    """Return the suit index (0 = clubs ... 3 = spades) of a card id."""
+    return card_id & SUIT_MASK
+
+
 class Card:
-    """Represents a single playing card with a rank and suit."""
+    """
+    Represents a single playing card with a rank and suit.
+    
+    Cards are interned: there is exactly one immutable instance for each of
+    the 52 cards, so equality is an identity check and the hash is the
+    card's integer id.
+    """
     
-    def __init__(self, rank: Rank, suit: Suit):
+    __slots__ = ("id", "rank", "suit", "_str")
+    
+    def __new__(cls, rank: Rank, suit: Suit) -> "Card":
         """
-        Initialize a card with a rank and suit.
+        Return the card with the given rank and suit.
         
         Args:
             rank: The card's rank (2-A)
             suit: The card's suit (clubs, diamonds, hearts, spades)
         """
-        self.rank = rank
-        self.suit = suit
+        return _CARDS[encode_card(rank, suit)]
+    
+    @classmethod
+    def _create(cls, card_id: int) -> "Card":
+        """Build the singleton for a card id (only used to fill the card table)."""
+        card = object.__new__(cls)
+        rank = _RANKS[rank_index(card_id)]
+        suit = _SUITS[suit_index(card_id)]
+        object.__setattr__(card, "id", card_id)
+        object.__setattr__(card, "rank", rank)
+        object.__setattr__(card, "suit", suit)
+        object.__setattr__(card, "_str", f"{rank}{suit.name[0]}")
+        return card
+    
+    @classmethod
+    def from_id(cls, card_id: int) -> "Card":
+        """
+        Return the card for an integer id.
+        
+        Args:
+            card_id: Card id in the range 0-51
+            
+        Returns:
+            The interned Card instance
+        """
+        return _CARDS[card_id]
+    
+    @classmethod
+    def from_str(cls, text: str) -> "Card":
+        """
+        Parse a card such as "AH", "As", "10c" or "Td".
+        
+        Args:
+            text: Rank ("2"-"10", "T", "J", "Q", "K", "A") followed by a suit
+                letter (C, D, H, S), case-insensitive
+                
+        Returns:
+            The interned Card instance
+        """
+        text = text.strip().upper()
+        rank = _RANKS_BY_TEXT.get(text[:-1])
+        suit = _SUITS_BY_TEXT.get(text[-1:])
+        if rank is None or suit is None:
+            raise ValueError(f"Invalid card: {text!r}")
+        return _CARDS[encode_card(rank, suit)]
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        """Cards are shared singletons and cannot be modified."""
+        raise AttributeError("Card instances are immutable")
+    
+    def __reduce__(self):
+        """Pickle by id so unpickling returns the interned instance."""
+        return (Card.from_id, (self.id,))
     
     def __eq__(self, other: object) -> bool:
         """Check if two cards are equal."""
-        if not isinstance(other, Card):
-            return False
-        return self.rank == other.rank and self.suit == other.suit
+        return self is other
     
     def __hash__(self) -> int:
         """Generate hash for the card."""
-        return hash((self.rank, self.suit))
+        return self.id
     
     def __str__(self) -> str:
         """Return string representation of card."""
-        return f"{self.rank}{self.suit.name[0]}"
+        return self._str
     
     def __repr__(self) -> str:
         """Return string representation for debugging."""
         return f"Card({self.rank}, {self.suit})"
 
 
+_RANKS_BY_TEXT: Dict[str, Rank] = {str(rank): rank for rank in Rank}
+_RANKS_BY_TEXT["T"] = Rank.TEN
+_SUITS_BY_TEXT: Dict[str, Suit] = {suit.name[0]: suit for suit in Suit}
+
+_CARD_PATTERN = re.compile(r"(10|[2-9TJQKA])([CDHS])", re.IGNORECASE)
+
+_CARDS: Tuple[Card, ...] = tuple(Card._create(card_id) for card_id in range(NUM_CARDS))
+
+# Order of a freshly reset deck (suit by suit, two through ace)
+FULL_DECK: Tuple[Card, ...] = tuple(Card(rank, suit) for suit in Suit for rank in Rank)
+
+
+def parse_cards(text: str) -> List[Card]:
+    """
+    Parse a run of cards such as "AsKd", "10h 9h" or "Qc,Jc".
+    
+    Args:
+        text: Cards written as in Card.from_str, optionally separated by
+            spaces or commas
+            
+    Returns:
+        The cards in the order written
+    """
+    compact = re.sub(r"[\s,]+", "", text)
+    matches = list(_CARD_PATTERN.finditer(compact))
+    if sum(len(match.group(0)) for match in matches) != len(compact):
+        raise ValueError(f"Invalid cards: {text!r}")
+    return [Card.from_str(match.group(0)) for match in matches]
+
+
 class Deck:
     """Represents a standard 52-card deck."""
     
-    def __init__(self):
-        """Initialize a new deck with all 52 cards."""
-        self.cards: List[Card] = []
-        self.reset()
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        """
+        Initialize a new deck with all 52 cards.
+        
+        Args:
+            rng: Generator used by shuffle() when none is passed (a private
+                unseeded one by default)
+        """
+        self.cards: List[Card] = list(FULL_DECK)
+        self.rng = rng if rng is not None else np.random.default_rng()
     
     def reset(self):
         """Reset the deck to a full 52-card deck."""
-        self.cards = [
-            Card(rank, suit)
-            for suit in Suit
-            for rank in Rank
-        ]
+        self.cards[:] = FULL_DECK
     
-    def shuffle(self):
-        """Shuffle the deck."""
-        random.shuffle(self.cards)
+    def shuffle(self, rng: Optional[np.random.Generator] = None):
+        """
+        Shuffle the deck with a single vectorized permutation.
+        
+        Args:
+            rng: Generator to draw the permutation from, e.g.
+                GameRNG.for_hand(); defaults to the deck's own generator
+        """
+        cards = self.cards
+        order = (rng if rng is not None else self.rng).permutation(len(cards))
+        self.cards = [cards[i] for i in order.tolist()]
     
     def draw(self) -> Optional[Card]:
         """
@@ -141,7 +266,4 @@ class Hand:
     
     def __str__(self) -> str:
         """Return string representation of hand."""
-        return " ".join(str(card) for card in sorted(
-            self.cards, 
-            key=lambda c: (c.rank.value, c.suit.value)
-        ))
\ No newline at end of file
+        return " ".join(str(card) for card in sorted(self.cards, key=lambda c: c.id))
\ No newline at end of file
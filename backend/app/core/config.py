@@ -37,4 +37,31 @@ ANIMATION_FALLBACK_DELAYS = {
     "pot_winners_determined": 1.0,
     "chips_distributed": 0.5,
     "hand_visually_concluded": 1.0,
-}
\ No newline at end of file
+}
+# Equity engine settings (see app/core/equity.py)
+EQUITY_TIME_BUDGET = float(os.environ.get("EQUITY_TIME_BUDGET", "0.1"))  # seconds per calculation
+EQUITY_MAX_SAMPLES = int(os.environ.get("EQUITY_MAX_SAMPLES", "200000"))
+EQUITY_WORKERS = int(os.environ.get("EQUITY_WORKERS", "2"))  # 0 samples in-process
+EQUITY_EXACT_LIMIT = int(os.environ.get("EQUITY_EXACT_LIMIT", "50000"))  # runouts; enumerate below this
+EQUITY_CACHE_SIZE = int(os.environ.get("EQUITY_CACHE_SIZE", "10000"))  # cached exact results
+PREFLOP_EQUITY_PATH = os.environ.get(
+    "PREFLOP_EQUITY_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "preflop_equity.npy"),
+)
+# Root seed for dealing (see app/core/rng.py); unset draws a random seed per game
+RNG_SEED = int(os.environ["RNG_SEED"]) if os.environ.get("RNG_SEED") else None
+# Structured tracing (see app/core/tracing.py); a sample rate of 0 turns it off
+TRACE_SAMPLE_RATE = float(os.environ.get("TRACE_SAMPLE_RATE", "0"))  # fraction of games traced
+TRACE_FILE = os.environ.get("TRACE_FILE", os.path.join(DATA_DIR, "trace.jsonl"))
+TRACE_MAX_BYTES = int(os.environ.get("TRACE_MAX_BYTES", str(20 * 1024 * 1024)))
+TRACE_BACKUPS = int(os.environ.get("TRACE_BACKUPS", "5"))
+# Per-table command queues (see app/services/table_actor.py)
+TABLE_QUEUE_SIZE = int(os.environ.get("TABLE_QUEUE_SIZE", "64"))  # submitters wait when a table's queue is full
+# Table sharding (see app/sharding.py); set for each worker process by the front-end
+SHARD_COUNT = int(os.environ.get("SHARD_COUNT", "1"))  # 1 = unsharded, game IDs are plain UUIDs
+SHARD_INDEX = int(os.environ.get("SHARD_INDEX", "0"))  # this process owns the games that hash here
+# AI turn pacing (see app/services/ai_turns.py): "instant", "fixed" or "human"
+AI_PACING = os.environ.get("AI_PACING", "fixed")
+AI_PACING_SECONDS = float(os.environ.get("AI_PACING_SECONDS", "0.5"))  # fixed wait, or the human-like base
+# Start the next AI's decision while clients animate the last action (may spend LLM calls on discarded decisions)
+AI_PREFETCH = os.environ.get("AI_PREFETCH", "true").lower() == "true"
@@ -0,0 +1,620 @@
+"""
+Equity estimation built on the batch hand evaluator.
+
+Equity is the share of the pot a hand wins on average once the board is
+complete: a win counts 1 and a tie between k players counts 1/k. It is
+computed one of two ways, chosen by the number of possible runouts:
+
+- small spots (turn and river, few players, narrow ranges) are enumerated
+  exactly and cached under a suit-isomorphic key, so a repeated spot costs a
+  dictionary lookup;
+- everything else is estimated by Monte Carlo sampling. Each batch deals the
+  missing board cards and the opponents' hole cards for thousands of runouts
+  at once, and sampling stops when the time budget or the sample cap is
+  reached. Sampling can be spread over a process pool.
+
+Either way every seat is scored with HandEvaluator.evaluate_batch.
+"""
+import asyncio
+import math
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from itertools import combinations, permutations
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.core.cards import Card, NUM_CARDS, SUIT_MASK
+from app.core.config import (
+    EQUITY_CACHE_SIZE, EQUITY_EXACT_LIMIT, EQUITY_MAX_SAMPLES, EQUITY_TIME_BUDGET, EQUITY_WORKERS
+)
+from app.core.hand_evaluator import HandEvaluator
+from app.core.preflop import (
+    COMBO_CLASSES, EQUITY, HOLE_COMBOS, MARGIN, MAX_OPPONENTS, SAMPLES, TIE, WIN,
+    PreflopEquityTable, hand_class_of_ids,
+)
+from app.core.ranges import Range
+
+# A range is a list of explicit hole card combinations; None means any two cards
+HoleCards = Tuple[Card, Card]
+OpponentRange = Optional[Sequence[HoleCards]]
+
+BATCH_SIZE = 4096
+_Z_95 = 1.96
+
+# (samples, wins, ties, equity sum, equity sum of squares)
+_Totals = Tuple[int, int, int, float, float]
+
+
+@dataclass
+class EquityResult:
+    """Equity of one hand against the field."""
+    win: float
+    tie: float
+    equity: float
+    confidence_low: float
+    confidence_high: float
+    samples: int
+    exact: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a plain dictionary."""
+        return asdict(self)
+
+
+def _prepare(
+    hero: Sequence[Card],
+    board: Sequence[Card],
+    opponents: int,
+    opponent_ranges: Optional[Sequence[OpponentRange]],
+) -> Tuple[np.ndarray, np.ndarray, List[np.ndarray], int]:
+    """
+    Validate a spot and convert it to card id arrays.
+
+    Returns:
+        Hero ids, board ids, one (K, 2) combo array per ranged opponent and
+        the number of opponents holding random cards
+    """
+    if len(hero) != 2:
+        raise ValueError("Hero must hold exactly two cards")
+    if len(board) > 5:
+        raise ValueError("The board holds at most five cards")
+    ranges = list(opponent_ranges or [])
+    if len(ranges) > opponents:
+        opponents = len(ranges)
+    if opponents < 1:
+        raise ValueError("Need at least one opponent")
+
+    hero_ids = np.array([card.id for card in hero], dtype=np.int64)
+    board_ids = np.array([card.id for card in board], dtype=np.int64)
+    dead = set(hero_ids.tolist()) | set(board_ids.tolist())
+    if len(dead) != len(hero) + len(board):
+        raise ValueError("Hero and board cards must be distinct")
+
+    ranged: List[np.ndarray] = []
+    for combos in ranges:
+        if combos is None:
+            continue
+        live = [
+            (first.id, second.id)
+            for first, second in combos
+            if first.id != second.id and first.id not in dead and second.id not in dead
+        ]
+        if not live:
+            raise ValueError("An opponent range has no combinations left after card removal")
+        ranged.append(np.array(live, dtype=np.int64))
+
+    random_opponents = opponents - len(ranged)
+    if len(dead) + 2 * opponents + (5 - len(board)) > NUM_CARDS:
+        raise ValueError("Not enough cards in the deck for that many opponents")
+    return hero_ids, board_ids, ranged, random_opponents
+
+
+def _sample_batch(
+    hero: np.ndarray,
+    board: np.ndarray,
+    ranged: List[np.ndarray],
+    random_opponents: int,
+    rng: np.random.Generator,
+    size: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Deal and score one batch of runouts.
+
+    Returns:
+        As _score(); runouts where range draws collide are dropped
+    """
+    rows = np.arange(size)
+    used = np.zeros((size, NUM_CARDS), dtype=bool)
+    used[:, hero] = True
+    used[:, board] = True
+    valid = np.ones(size, dtype=bool)
+
+    opponent_cards = []
+    for combos in ranged:
+        pick = combos[rng.integers(len(combos), size=size)]
+        valid &= ~(used[rows, pick[:, 0]] | used[rows, pick[:, 1]])
+        used[rows, pick[:, 0]] = True
+        used[rows, pick[:, 1]] = True
+        opponent_cards.append(pick)
+
+    # Draw the remaining cards by ranking random keys over the live deck
+    missing = 5 - len(board)
+    needed = missing + 2 * random_opponents
+    if needed:
+        keys = rng.random((size, NUM_CARDS))
+        keys[used] = 2.0
+        drawn = np.argpartition(keys, needed - 1, axis=1)[:, :needed]
+        order = np.argsort(np.take_along_axis(keys, drawn, axis=1), axis=1)
+        drawn = np.take_along_axis(drawn, order, axis=1)
+    else:
+        drawn = np.empty((size, 0), dtype=np.int64)
+    for seat in range(random_opponents):
+        opponent_cards.append(drawn[:, missing + 2 * seat:missing + 2 * seat + 2])
+
+    full_board = np.concatenate([np.broadcast_to(board, (size, len(board))), drawn[:, :missing]], axis=1)
+    return _score(hero, full_board[valid], [cards[valid] for cards in opponent_cards])
+
+
+def _sample_range_batch(
+    board: np.ndarray,
+    ranges: List[Tuple[np.ndarray, np.ndarray]],
+    rng: np.random.Generator,
+    size: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Deal and score one batch of runouts where every player holds a weighted range.
+
+    Args:
+        board: Community card ids dealt so far
+        ranges: (combos, probabilities) per player, hero first
+
+    Returns:
+        As _score(); runouts where range draws collide are dropped
+    """
+    rows = np.arange(size)
+    used = np.zeros((size, NUM_CARDS), dtype=bool)
+    used[:, board] = True
+    valid = np.ones(size, dtype=bool)
+
+    holdings = []
+    for combos, probabilities in ranges:
+        pick = combos[rng.choice(len(combos), size=size, p=probabilities)]
+        valid &= ~(used[rows, pick[:, 0]] | used[rows, pick[:, 1]])
+        used[rows, pick[:, 0]] = True
+        used[rows, pick[:, 1]] = True
+        holdings.append(pick)
+
+    missing = 5 - len(board)
+    keys = rng.random((size, NUM_CARDS))
+    keys[used] = 2.0
+    drawn = np.argpartition(keys, missing - 1, axis=1)[:, :missing] if missing else np.empty((size, 0), np.int64)
+    full_board = np.concatenate([np.broadcast_to(board, (size, len(board))), drawn], axis=1)
+    return _score(holdings[0][valid], full_board[valid], [cards[valid] for cards in holdings[1:]])
+
+
+def _score(
+    hero: np.ndarray, full_board: np.ndarray, opponent_cards: List[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score complete runouts.
+
+    Args:
+        hero: Hero's two card ids, or (N, 2) per runout
+        full_board: (N, 5) completed boards
+        opponent_cards: One (N, 2) array of hole cards per opponent
+
+    Returns:
+        Hero's pot share for every runout and whether hero won it outright
+    """
+    size = len(full_board)
+    seats = [np.broadcast_to(hero, (size, 2))] + opponent_cards
+    hands = np.concatenate([np.concatenate([cards, full_board], axis=1) for cards in seats])
+    strengths = HandEvaluator.evaluate_batch(hands).reshape(len(seats), size)
+
+    hero_strength = strengths[0]
+    best_opponent = strengths[1:].max(axis=0)
+    tied = (strengths[1:] == hero_strength).sum(axis=0)
+    won = hero_strength > best_opponent
+    share = np.where(won, 1.0, np.where(hero_strength == best_opponent, 1.0 / (tied + 1), 0.0))
+    return share, won
+
+
+def _run_samples(
+    sample: Callable[[np.random.Generator, int], Tuple[np.ndarray, np.ndarray]],
+    time_budget: float,
+    max_samples: int,
+    seed: Any,
+) -> _Totals:
+    """
+    Sample batches until the time budget or the sample cap runs out.
+
+    Args:
+        sample: Batch sampler taking (rng, size), e.g. a partial of
+            _sample_batch bound to a spot
+    """
+    rng = np.random.default_rng(seed)
+    deadline = time.perf_counter() + time_budget
+    samples = wins = ties = 0
+    total = total_sq = 0.0
+    while samples < max_samples:
+        size = min(BATCH_SIZE, max_samples - samples)
+        share, won = sample(rng, size)
+        samples += len(share)
+        wins += int(won.sum())
+        ties += int(((share > 0) & ~won).sum())
+        total += float(share.sum())
+        total_sq += float(np.square(share).sum())
+        if time.perf_counter() >= deadline:
+            break
+    return samples, wins, ties, total, total_sq
+
+
+def _summarize(totals: Sequence[_Totals]) -> EquityResult:
+    """Combine per-worker totals into an EquityResult with a 95% interval."""
+    samples = sum(part[0] for part in totals)
+    if not samples:
+        raise ValueError("No valid runouts could be sampled for these ranges")
+    wins = sum(part[1] for part in totals)
+    ties = sum(part[2] for part in totals)
+    equity = sum(part[3] for part in totals) / samples
+    variance = max(sum(part[4] for part in totals) / samples - equity * equity, 0.0)
+    margin = _Z_95 * math.sqrt(variance / samples)
+    return EquityResult(
+        win=wins / samples,
+        tie=ties / samples,
+        equity=equity,
+        confidence_low=max(equity - margin, 0.0),
+        confidence_high=min(equity + margin, 1.0),
+        samples=samples,
+    )
+
+
+def _runout_count(
+    board: np.ndarray, ranged: List[np.ndarray], random_opponents: int, live_cards: int
+) -> int:
+    """Upper bound on the number of runouts exact enumeration would visit."""
+    count = math.comb(live_cards, 5 - len(board))
+    for combos in ranged:
+        count *= len(combos)
+    return count * math.comb(live_cards, 2) ** random_opponents
+
+
+def _enumerate(
+    hero: np.ndarray, board: np.ndarray, ranged: List[np.ndarray], random_opponents: int
+) -> EquityResult:
+    """Score every possible runout."""
+    dead = set(hero.tolist()) | set(board.tolist())
+    live = [card_id for card_id in range(NUM_CARDS) if card_id not in dead]
+    missing = 5 - len(board)
+    completions = np.array(list(combinations(live, missing)), dtype=np.int64).reshape(
+        math.comb(len(live), missing), missing
+    )
+    live_pairs = np.array(list(combinations(live, 2)), dtype=np.int64)
+    options = [completions] + ranged + [live_pairs] * random_opponents
+
+    # Cartesian product of board completions and opponent holdings
+    index = np.indices([len(option) for option in options]).reshape(len(options), -1)
+    parts = [option[picks] for option, picks in zip(options, index)]
+    dealt = np.concatenate(parts, axis=1)
+
+    # Drop runouts that deal the same card twice
+    ordered = np.sort(dealt, axis=1)
+    valid = ~(ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+    full_board = np.concatenate([np.broadcast_to(board, (len(dealt), len(board))), parts[0]], axis=1)[valid]
+    share, won = _score(hero, full_board, [part[valid] for part in parts[1:]])
+
+    samples = len(share)
+    if not samples:
+        raise ValueError("No valid runouts exist for these ranges")
+    equity = float(share.sum()) / samples
+    return EquityResult(
+        win=int(won.sum()) / samples,
+        tie=int(((share > 0) & ~won).sum()) / samples,
+        equity=equity,
+        confidence_low=equity,
+        confidence_high=equity,
+        samples=samples,
+        exact=True,
+    )
+
+
+# Every relabelling of the four suits, as card id translation tables
+_SUIT_PERMUTATIONS = tuple(
+    tuple((card_id & ~SUIT_MASK) | perm[card_id & SUIT_MASK] for card_id in range(NUM_CARDS))
+    for perm in permutations(range(4))
+)
+
+
+def _canonical_key(
+    hero: np.ndarray, board: np.ndarray, ranged: List[np.ndarray], random_opponents: int
+) -> Hashable:
+    """
+    Key a spot so that spots equal up to a suit permutation share it.
+
+    Hero and board order do not matter, and neither does the order of combos
+    in a range.
+    """
+    hero_ids = hero.tolist()
+    board_ids = board.tolist()
+    range_ids = [combos.tolist() for combos in ranged]
+    keys = []
+    for table in _SUIT_PERMUTATIONS:
+        ranges = tuple(sorted(
+            tuple(sorted(
+                (table[a], table[b]) if table[a] < table[b] else (table[b], table[a]) for a, b in combos
+            ))
+            for combos in range_ids
+        ))
+        keys.append((
+            tuple(sorted(table[card_id] for card_id in hero_ids)),
+            tuple(sorted(table[card_id] for card_id in board_ids)),
+            ranges,
+            random_opponents,
+        ))
+    return min(keys)
+
+
+def _from_table(row: np.ndarray) -> EquityResult:
+    """Convert a preflop table entry to an EquityResult."""
+    equity = float(row[EQUITY])
+    margin = float(row[MARGIN])
+    return EquityResult(
+        win=float(row[WIN]),
+        tie=float(row[TIE]),
+        equity=equity,
+        confidence_low=max(equity - margin, 0.0),
+        confidence_high=min(equity + margin, 1.0),
+        samples=int(row[SAMPLES]),
+    )
+
+
+def _whole_class(hero: np.ndarray, combos: np.ndarray) -> Optional[int]:
+    """Return the class a range consists of, if it is every live combo of one class."""
+    classes = {hand_class_of_ids(first, second) for first, second in combos.tolist()}
+    if len(classes) != 1:
+        return None
+    villain_class = classes.pop()
+    hero_ids = set(hero.tolist())
+    live = [
+        (first, second)
+        for first, second in HOLE_COMBOS[COMBO_CLASSES == villain_class].tolist()
+        if first not in hero_ids and second not in hero_ids
+    ]
+    given = {(min(first, second), max(first, second)) for first, second in combos.tolist()}
+    return villain_class if given == set(live) else None
+
+
+def _warm_up() -> int:
+    """Runs in each pool worker so the evaluator tables are built ahead of time."""
+    return len(HandEvaluator.evaluate_batch(np.arange(7).reshape(1, 7)))
+
+
+class EquityCalculator:
+    """
+    Equity engine.
+
+    Preflop spots against random hands or a single whole hand class are read
+    from the precomputed preflop table when it has been built. Spots with at
+    most ``exact_limit`` possible runouts are enumerated and cached; larger
+    ones are sampled. With ``workers`` greater than zero
+    sampling is split across a process pool; otherwise it runs in the
+    calling process.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> "EquityCalculator":
+        """Get the shared calculator configured from app.core.config."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(
+        self,
+        workers: int = EQUITY_WORKERS,
+        time_budget: float = EQUITY_TIME_BUDGET,
+        max_samples: int = EQUITY_MAX_SAMPLES,
+        exact_limit: int = EQUITY_EXACT_LIMIT,
+        cache_size: int = EQUITY_CACHE_SIZE,
+        use_preflop_table: bool = True,
+    ):
+        """
+        Initialize the calculator.
+
+        Args:
+            workers: Number of worker processes (0 to sample in-process)
+            time_budget: Default wall-clock budget per calculation in seconds
+            max_samples: Default cap on runouts per calculation
+            exact_limit: Largest runout count to enumerate exactly (0 to
+                always sample)
+            cache_size: Number of exact results to keep
+            use_preflop_table: Whether to answer preflop spots from the
+                precomputed table
+        """
+        self.workers = workers
+        self.time_budget = time_budget
+        self.max_samples = max_samples
+        self.exact_limit = exact_limit
+        self.cache_size = cache_size
+        self.use_preflop_table = use_preflop_table
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: Set[Future] = set()
+        self._cache: "OrderedDict[Hashable, EquityResult]" = OrderedDict()
+        # calculate_async runs calculations on executor threads
+        self._cache_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Create the process pool and build the evaluator tables in every worker."""
+        if self.workers <= 0 or self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        for future in [self._pool.submit(_warm_up) for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Stop the process pool, dropping sampling work that has not started."""
+        if self._pool is not None:
+            # Executor.shutdown(cancel_futures=True) needs Python 3.9
+            for future in list(self._pending):
+                future.cancel()
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def calculate(
+        self,
+        hero: Sequence[Card],
+        board: Sequence[Card] = (),
+        opponents: int = 1,
+        opponent_ranges: Optional[Sequence[OpponentRange]] = None,
+        time_budget: Optional[float] = None,
+        max_samples: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> EquityResult:
+        """
+        Estimate hero's equity.
+
+        Args:
+            hero: Hero's two hole cards
+            board: Community cards dealt so far (0-5)
+            opponents: Number of opponents still in the hand
+            opponent_ranges: Optional per-opponent lists of hole card
+                combinations; None entries (and opponents beyond the list)
+                hold random cards
+            time_budget: Wall-clock budget in seconds (defaults to the
+                calculator's)
+            max_samples: Cap on runouts (defaults to the calculator's)
+            seed: Seed for reproducible results
+
+        Returns:
+            Win, tie and equity fractions with a 95% confidence interval
+            (zero width when the result is exact)
+        """
+        hero_ids, board_ids, ranged, random_opponents = _prepare(hero, board, opponents, opponent_ranges)
+        if self.use_preflop_table and not len(board_ids):
+            result = self._lookup_preflop(hero_ids, ranged, random_opponents)
+            if result is not None:
+                return result
+
+        live_cards = NUM_CARDS - len(hero_ids) - len(board_ids)
+        if _runout_count(board_ids, ranged, random_opponents, live_cards) <= self.exact_limit:
+            return self._calculate_exact(hero_ids, board_ids, ranged, random_opponents)
+
+        sampler = partial(_sample_batch, hero_ids, board_ids, ranged, random_opponents)
+        return self._simulate(sampler, time_budget, max_samples, seed)
+
+    def range_vs_range(
+        self,
+        hero_range: Range,
+        villain_ranges: Sequence[Range],
+        board: Sequence[Card] = (),
+        time_budget: Optional[float] = None,
+        max_samples: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> EquityResult:
+        """
+        Estimate the equity of one weighted range against others.
+
+        Args:
+            hero_range: Hero's range
+            villain_ranges: One range per opponent
+            board: Community cards dealt so far (0-5)
+            time_budget: Wall-clock budget in seconds (defaults to the
+                calculator's)
+            max_samples: Cap on runouts (defaults to the calculator's)
+            seed: Seed for reproducible results
+
+        Returns:
+            Hero's win, tie and equity fractions with a 95% confidence interval
+        """
+        if not villain_ranges:
+            raise ValueError("Need at least one opponent range")
+        if len(board) > 5 or len({card.id for card in board}) != len(board):
+            raise ValueError("The board must be at most five distinct cards")
+
+        board_ids = np.array([card.id for card in board], dtype=np.int64)
+        ranges = []
+        for player_range in [hero_range, *villain_ranges]:
+            weights = player_range.without(board).weights
+            live = np.flatnonzero(weights)
+            if not len(live):
+                raise ValueError("A range has no combinations left after card removal")
+            ranges.append((HOLE_COMBOS[live], weights[live] / weights[live].sum()))
+
+        sampler = partial(_sample_range_batch, board_ids, ranges)
+        return self._simulate(sampler, time_budget, max_samples, seed)
+
+    def _simulate(
+        self,
+        sampler: Callable[[np.random.Generator, int], Tuple[np.ndarray, np.ndarray]],
+        time_budget: Optional[float],
+        max_samples: Optional[int],
+        seed: Optional[int],
+    ) -> EquityResult:
+        """Run a batch sampler in-process or across the pool and summarize it."""
+        budget = self.time_budget if time_budget is None else time_budget
+        cap = self.max_samples if max_samples is None else max_samples
+
+        if self.workers <= 0:
+            return _summarize([_run_samples(sampler, budget, cap, seed)])
+
+        self.start()
+        seeds = np.random.SeedSequence(seed).spawn(self.workers)
+        per_worker = -(-cap // self.workers)
+        futures = [
+            self._pool.submit(_run_samples, sampler, budget, per_worker, worker_seed)
+            for worker_seed in seeds
+        ]
+        for future in futures:
+            self._pending.add(future)
+            future.add_done_callback(self._pending.discard)
+        return _summarize([future.result() for future in futures])
+
+    def _lookup_preflop(
+        self, hero: np.ndarray, ranged: List[np.ndarray], random_opponents: int
+    ) -> Optional[EquityResult]:
+        """Answer a preflop spot from the precomputed table, if it covers it."""
+        table = PreflopEquityTable.get_instance()
+        if table is None:
+            return None
+        hero_class = hand_class_of_ids(int(hero[0]), int(hero[1]))
+        if not ranged and random_opponents <= MAX_OPPONENTS:
+            return _from_table(table.versus_random(hero_class, random_opponents))
+        if len(ranged) == 1 and not random_opponents:
+            villain_class = _whole_class(hero, ranged[0])
+            if villain_class is not None:
+                return _from_table(table.heads_up(hero_class, villain_class))
+        return None
+
+    def _calculate_exact(
+        self, hero: np.ndarray, board: np.ndarray, ranged: List[np.ndarray], random_opponents: int
+    ) -> EquityResult:
+        """Enumerate a spot, reusing the result for suit-isomorphic repeats."""
+        key = _canonical_key(hero, board, ranged, random_opponents)
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                return result
+
+        # Enumerate outside the lock; a concurrent miss on the same key just repeats the work
+        result = _enumerate(hero, board, ranged, random_opponents)
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    async def calculate_async(self, *args: Any, **kwargs: Any) -> EquityResult:
+        """Run calculate() without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.calculate, *args, **kwargs))
@@ -1,11 +1,28 @@
 """
 Hand evaluation logic for poker hands.
+
+Every 5-7 card hand is scored as a single integer strength: the HandRank
+value in the high bits followed by up to five tie-breaking rank values packed
+four bits each, most important first. A higher strength is a better hand, so
+showdowns only need ``max`` and ``==``.
+
+Strengths come from two tables built once at import time:
+
+- the flush table, indexed by the 13-bit rank mask of a suit holding five or
+  more cards (straight flushes included);
+- the rank table, keyed by the product of one prime per card rank, which is
+  unique for every multiset of ranks.
+
+The same tables back a NumPy batch path (``evaluate_batch``) that scores
+whole arrays of hands with array operations.
 """
 from enum import Enum, auto
-from typing import Dict, List, Set, Tuple
-from collections import Counter
+from itertools import combinations
+from typing import Collection, Dict, Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
 
-from app.core.cards import Card, Rank, Suit
+from app.core.cards import Card, SUIT_BITS, SUIT_MASK, NUM_CARDS
 
 
 class HandRank(Enum):
@@ -22,17 +39,295 @@ class HandRank(Enum):
     ROYAL_FLUSH = auto()
 
 
+# Layout of a strength integer
+KICKER_BITS = 4
+KICKER_SLOTS = 5
+CATEGORY_SHIFT = KICKER_BITS * KICKER_SLOTS
+_KICKER_MASK = (1 << KICKER_BITS) - 1
+
+# Number of tie-breaking values stored for each hand rank
+_KICKER_COUNTS: Dict[HandRank, int] = {
+    HandRank.HIGH_CARD: 5,
+    HandRank.PAIR: 4,
+    HandRank.TWO_PAIR: 3,
+    HandRank.THREE_OF_A_KIND: 3,
+    HandRank.STRAIGHT: 1,
+    HandRank.FLUSH: 5,
+    HandRank.FULL_HOUSE: 2,
+    HandRank.FOUR_OF_A_KIND: 2,
+    HandRank.STRAIGHT_FLUSH: 1,
+    HandRank.ROYAL_FLUSH: 1,
+}
+_HAND_RANKS_BY_VALUE: Dict[int, HandRank] = {rank.value: rank for rank in HandRank}
+
+NUM_RANKS = 13
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# (rank mask, high card value) for every straight, best first; the wheel
+# (A-2-3-4-5) is five high
+_STRAIGHTS: Tuple[Tuple[int, int], ...] = tuple(
+    (0x1F << (high - 6), high) for high in range(14, 5, -1)
+) + ((0x100F, 5),)
+
+
+def pack_strength(hand_rank: HandRank, kickers: Sequence[int]) -> int:
+    """
+    Pack a hand rank and its tie-breaking values into a strength integer.
+
+    Args:
+        hand_rank: The hand category
+        kickers: Rank values (2-14), most important first
+
+    Returns:
+        The comparable strength
+    """
+    strength = hand_rank.value << CATEGORY_SHIFT
+    shift = CATEGORY_SHIFT
+    for kicker in kickers:
+        shift -= KICKER_BITS
+        strength |= kicker << shift
+    return strength
+
+
+def _straight_high(rank_mask: int) -> int:
+    """Return the high card value of the best straight in a rank mask, or 0."""
+    for straight_mask, high in _STRAIGHTS:
+        if rank_mask & straight_mask == straight_mask:
+            return high
+    return 0
+
+
+def _top_ranks(rank_mask: int, count: int) -> List[int]:
+    """Return the ``count`` highest rank values set in a rank mask."""
+    values = []
+    for index in range(NUM_RANKS - 1, -1, -1):
+        if rank_mask >> index & 1:
+            values.append(index + 2)
+            if len(values) == count:
+                break
+    return values
+
+
+def _flush_strength(rank_mask: int) -> int:
+    """Score the best five cards of a single suit."""
+    high = _straight_high(rank_mask)
+    if high == 14:
+        return pack_strength(HandRank.ROYAL_FLUSH, [14])
+    if high:
+        return pack_strength(HandRank.STRAIGHT_FLUSH, [high])
+    return pack_strength(HandRank.FLUSH, _top_ranks(rank_mask, 5))
+
+
+def _rank_strength(counts: Sequence[int]) -> int:
+    """Score the best five cards of a rank multiset with no flush."""
+    present: List[int] = []
+    quads: List[int] = []
+    trips: List[int] = []
+    pairs: List[int] = []
+    rank_mask = 0
+    for index in range(NUM_RANKS - 1, -1, -1):
+        count = counts[index]
+        if count:
+            value = index + 2
+            present.append(value)
+            rank_mask |= 1 << index
+            if count == 2:
+                pairs.append(value)
+            elif count == 3:
+                trips.append(value)
+            elif count == 4:
+                quads.append(value)
+
+    if quads:
+        kicker = present[1] if present[0] == quads[0] else present[0]
+        return pack_strength(HandRank.FOUR_OF_A_KIND, [quads[0], kicker])
+    if trips and (len(trips) > 1 or pairs):
+        return pack_strength(HandRank.FULL_HOUSE, [trips[0], max(trips[1:] + pairs)])
+
+    high = _straight_high(rank_mask)
+    if high:
+        return pack_strength(HandRank.STRAIGHT, [high])
+
+    if trips:
+        others = [value for value in present if value != trips[0]]
+        return pack_strength(HandRank.THREE_OF_A_KIND, [trips[0]] + others[:2])
+    if len(pairs) >= 2:
+        kicker = next(value for value in present if value not in pairs[:2])
+        return pack_strength(HandRank.TWO_PAIR, pairs[:2] + [kicker])
+    if pairs:
+        others = [value for value in present if value != pairs[0]]
+        return pack_strength(HandRank.PAIR, [pairs[0]] + others[:3])
+    return pack_strength(HandRank.HIGH_CARD, present[:5])
+
+
+def _build_flush_table() -> List[int]:
+    """Strength for every 13-bit suit mask holding at least five ranks (else 0)."""
+    table = [0] * (1 << NUM_RANKS)
+    for rank_mask in range(1 << NUM_RANKS):
+        if bin(rank_mask).count("1") >= 5:
+            table[rank_mask] = _flush_strength(rank_mask)
+    return table
+
+
+def _build_rank_table() -> Dict[int, int]:
+    """Strength for every 5-7 card rank multiset, keyed by its prime product."""
+    table: Dict[int, int] = {}
+    counts = [0] * NUM_RANKS
+
+    def fill(first_index: int, cards_left: int, product: int, total: int) -> None:
+        # Visit each multiset once by adding ranks in increasing order
+        for index in range(first_index, NUM_RANKS):
+            prime = RANK_PRIMES[index]
+            rank_product = product
+            for copies in range(1, min(4, cards_left) + 1):
+                counts[index] = copies
+                rank_product *= prime
+                if total + copies >= 5:
+                    table[rank_product] = _rank_strength(counts)
+                if cards_left > copies:
+                    fill(index + 1, cards_left - copies, rank_product, total + copies)
+            counts[index] = 0
+
+    fill(0, 7, 1, 0)
+    return table
+
+
+FLUSH_TABLE: List[int] = _build_flush_table()
+RANK_TABLE: Dict[int, int] = _build_rank_table()
+
+# Per-card-id lookups so evaluation never touches Rank/Suit enums
+_CARD_PRIMES = tuple(RANK_PRIMES[card_id >> SUIT_BITS] for card_id in range(NUM_CARDS))
+_CARD_RANK_BITS = tuple(1 << (card_id >> SUIT_BITS) for card_id in range(NUM_CARDS))
+
+# Array forms of the tables for evaluate_batch. The rank table is stored as
+# sorted prime products with matching strengths so lookups are a searchsorted.
+_FLUSH_ARRAY = np.array(FLUSH_TABLE, dtype=np.int32)
+_RANK_KEYS = np.array(sorted(RANK_TABLE), dtype=np.int64)
+_RANK_VALUES = np.array([RANK_TABLE[key] for key in _RANK_KEYS.tolist()], dtype=np.int32)
+_PRIME_ARRAY = np.array(RANK_PRIMES, dtype=np.int64)
+
+
 class HandEvaluator:
     """Evaluates poker hands to determine their ranking."""
-    
+
+    @staticmethod
+    def strength_of_ids(card_ids: Collection[int]) -> int:
+        """
+        Score 5-7 cards given as integer card ids.
+
+        Args:
+            card_ids: Distinct card ids (0-51)
+
+        Returns:
+            The hand strength; higher is better and equal means a tie
+        """
+        if not 5 <= len(card_ids) <= 7:
+            raise ValueError("Need 5 to 7 cards to evaluate a poker hand")
+
+        suit_masks = [0, 0, 0, 0]
+        product = 1
+        for card_id in card_ids:
+            suit_masks[card_id & SUIT_MASK] |= _CARD_RANK_BITS[card_id]
+            product *= _CARD_PRIMES[card_id]
+
+        # A 5+ card flush in at most seven cards always beats the best
+        # non-flush hand those cards can make
+        for rank_mask in suit_masks:
+            flush = FLUSH_TABLE[rank_mask]
+            if flush:
+                return flush
+        return RANK_TABLE[product]
+
+    @staticmethod
+    def best_five(card_ids: Collection[int]) -> Tuple[int, ...]:
+        """
+        Find the five cards that make the hand's strength.
+
+        Args:
+            card_ids: Distinct card ids (5-7)
+
+        Returns:
+            The card ids of the best five-card hand, in the order given
+        """
+        strength = HandEvaluator.strength_of_ids(card_ids)
+        for five in combinations(tuple(card_ids), 5):
+            if HandEvaluator.strength_of_ids(five) == strength:
+                return five
+        raise AssertionError("No five-card subset matches the hand strength")
+
+    @staticmethod
+    def strength(cards: Iterable[Card]) -> int:
+        """
+        Score a set of 5-7 cards.
+
+        Args:
+            cards: The cards to evaluate
+
+        Returns:
+            The hand strength; higher is better and equal means a tie
+        """
+        return HandEvaluator.strength_of_ids([card.id for card in cards])
+
+    @staticmethod
+    def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+        """
+        Score many hands at once.
+
+        Args:
+            cards: Integer array of shape (N, 5-7) holding distinct card ids
+                per row
+
+        Returns:
+            Array of shape (N,) with the strength of each row
+        """
+        cards = np.asarray(cards)
+        if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+            raise ValueError("evaluate_batch expects an array of shape (N, 5-7)")
+        if not np.issubdtype(cards.dtype, np.integer):
+            raise ValueError("evaluate_batch expects integer card ids")
+        cards = cards.astype(np.int64, copy=False)
+
+        ranks = cards >> SUIT_BITS
+        suits = cards & SUIT_MASK
+        rank_bits = np.left_shift(1, ranks)
+
+        # Cards in a row are distinct, so summing rank bits per suit is an OR
+        flush = np.zeros(len(cards), dtype=np.int32)
+        for suit in range(4):
+            suit_mask = np.where(suits == suit, rank_bits, 0).sum(axis=1)
+            np.maximum(flush, _FLUSH_ARRAY[suit_mask], out=flush)
+
+        products = _PRIME_ARRAY[ranks].prod(axis=1)
+        ranked = _RANK_VALUES[np.searchsorted(_RANK_KEYS, products)]
+
+        return np.where(flush > 0, flush, ranked)
+
+    @staticmethod
+    def describe(strength: int) -> Tuple[HandRank, List[int]]:
+        """
+        Unpack a strength into its hand rank and tie-breaking values.
+
+        Args:
+            strength: A value returned by strength() or strength_of_ids()
+
+        Returns:
+            A tuple of the hand rank and its kickers, most important first
+        """
+        hand_rank = _HAND_RANKS_BY_VALUE[strength >> CATEGORY_SHIFT]
+        kickers = [
+            strength >> (CATEGORY_SHIFT - KICKER_BITS * (slot + 1)) & _KICKER_MASK
+            for slot in range(_KICKER_COUNTS[hand_rank])
+        ]
+        return hand_rank, kickers
+
     @staticmethod
     def evaluate(cards: Set[Card]) -> Tuple[HandRank, List[int]]:
         """
         Evaluate a set of cards and return its poker hand ranking.
-        
+
         Args:
             cards: A set of cards (5-7 cards typically)
-            
+
         Returns:
             A tuple containing:
                 1. The hand rank (e.g., PAIR, FLUSH)
@@ -40,93 +335,4 @@ class HandEvaluator:
         """
         if len(cards) < 5:
             raise ValueError("Need at least 5 cards to evaluate a poker hand")
-            
-        # Check for flush
-        suits = [card.suit for card in cards]
-        suit_counts = Counter(suits)
-        flush_suit = next((suit for suit, count in suit_counts.items() 
-                          if count >= 5), None)
-        
-        flush_cards = None
-        if flush_suit:
-            flush_cards = [card for card in cards if card.suit == flush_suit]
-            
-        # Check for straight
-        ranks = sorted([card.rank.value for card in cards], reverse=True)
-        unique_ranks = sorted(set(ranks), reverse=True)
-        
-        # Special case for A-5 straight (Ace counts as 1)
-        if set([14, 13, 12, 11, 10]).issubset(set(ranks)):
-            straight_high = 14  # Royal straight
-        elif set([14, 5, 4, 3, 2]).issubset(set(ranks)):
-            straight_high = 5   # A-5 straight (Ace counts as 1)
-        else:
-            # Check for regular straights
-            straight_high = None
-            for i in range(len(unique_ranks) - 4):
-                if unique_ranks[i] - unique_ranks[i+4] == 4:
-                    straight_high = unique_ranks[i]
-                    break
-        
-        # Check for straight flush
-        straight_flush = False
-        royal_flush = False
-        if flush_cards and straight_high:
-            flush_ranks = sorted([card.rank.value for card in flush_cards], reverse=True)
-            flush_unique_ranks = sorted(set(flush_ranks), reverse=True)
-            
-            # Check for royal flush
-            if set([14, 13, 12, 11, 10]).issubset(set(flush_ranks)):
-                straight_flush = True
-                royal_flush = True
-                straight_high = 14
-            # Check for A-5 straight flush
-            elif set([14, 5, 4, 3, 2]).issubset(set(flush_ranks)):
-                straight_flush = True
-                straight_high = 5
-            else:
-                # Check for regular straight flush
-                for i in range(len(flush_unique_ranks) - 4):
-                    if flush_unique_ranks[i] - flush_unique_ranks[i+4] == 4:
-                        straight_flush = True
-                        straight_high = flush_unique_ranks[i]
-                        break
-        
-        # Count rank occurrences
-        rank_counts = Counter(card.rank.value for card in cards)
-        
-        # Find groups (pairs, three of a kind, etc.)
-        quads = [rank for rank, count in rank_counts.items() if count == 4]
-        triplets = [rank for rank, count in rank_counts.items() if count == 3]
-        pairs = [rank for rank, count in rank_counts.items() if count == 2]
-        
-        # Sort by rank value (highest first)
-        quads.sort(reverse=True)
-        triplets.sort(reverse=True)
-        pairs.sort(reverse=True)
-        
-        # Create a list of remaining ranks for kickers
-        all_grouped_ranks = quads + triplets + pairs
-        kickers = sorted([r for r in ranks if r not in all_grouped_ranks], reverse=True)
-        
-        # Determine hand rank and create tie-breaker list
-        if royal_flush:
-            return HandRank.ROYAL_FLUSH, [14]
-        elif straight_flush:
-            return HandRank.STRAIGHT_FLUSH, [straight_high]
-        elif quads:
-            return HandRank.FOUR_OF_A_KIND, quads + kickers[:1]
-        elif triplets and pairs:
-            return HandRank.FULL_HOUSE, [triplets[0], pairs[0] if len(pairs) > 0 else triplets[1]]
-        elif flush_suit:
-            return HandRank.FLUSH, sorted([card.rank.value for card in flush_cards], reverse=True)[:5]
-        elif straight_high:
-            return HandRank.STRAIGHT, [straight_high]
-        elif triplets:
-            return HandRank.THREE_OF_A_KIND, triplets + kickers[:2]
-        elif len(pairs) >= 2:
-            return HandRank.TWO_PAIR, pairs[:2] + kickers[:1]
-        elif pairs:
-            return HandRank.PAIR, pairs + kickers[:3]
-        else:
-            return HandRank.HIGH_CARD, ranks[:5]
\ No newline at end of file
+        return HandEvaluator.describe(HandEvaluator.strength(cards))
@@ -0,0 +1,545 @@
+"""
+Headless no-limit hold'em engine for simulations.
+
+HeadlessGame plays complete hands synchronously (blind order, to-act
+bookkeeping, raise-to amounts, side pots, odd chips to the winner nearest
+the button) without notifications, hand history, logging or awaits. Seats
+are list indices, cards are integer ids and per-seat state lives in flat
+lists, so a single core plays well over 10k hands per second. Use it for bot
+training, regression runs and scenario generation. Its betting rules are
+the live game's too: PokerGame.apply_action() runs every action through
+transitions.step() on a fork of the table.
+
+Run ``python -m app.core.headless --hands 100000`` for a throughput check.
+"""
+import argparse
+import random
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from app.core.cards import Card
+from app.core.hand_evaluator import HandEvaluator
+from app.core.poker_game import BettingRound, PlayerAction, PlayerStatus, PokerGame
+from app.core.rng import GameRNG
+
+# A policy picks an action (and raise-to amount) for the seat to act
+Policy = Callable[["HeadlessGame", int], Tuple[PlayerAction, Optional[int]]]
+
+_ACTIVE = PlayerStatus.ACTIVE
+_ALL_IN = PlayerStatus.ALL_IN
+_FOLDED = PlayerStatus.FOLDED
+_OUT = PlayerStatus.OUT
+
+_NEXT_ROUND = {
+    BettingRound.PREFLOP: BettingRound.FLOP,
+    BettingRound.FLOP: BettingRound.TURN,
+    BettingRound.TURN: BettingRound.RIVER,
+}
+_BOARD_SIZE = {BettingRound.FLOP: 3, BettingRound.TURN: 4, BettingRound.RIVER: 5}
+
+
+class HeadlessGame:
+    """Synchronous hold'em table for simulations (no I/O of any kind)."""
+
+    def __init__(self, stacks: Sequence[int], small_blind: int, big_blind: int, ante: int = 0,
+                 button: int = 0, seed: Optional[int] = None, game_id: str = "headless",
+                 player_ids: Optional[Sequence[str]] = None):
+        """
+        Initialize a headless table.
+
+        Args:
+            stacks: Starting chips per seat; seats with 0 chips sit out
+            small_blind: Small blind amount
+            big_blind: Big blind amount
+            ante: Ante amount (0 for no ante)
+            button: Seat holding the button for the first hand
+            seed: Optional root seed for reproducible deals
+            game_id: Stream name; deals depend only on (seed, game_id, hand number)
+            player_ids: Optional player ID per seat (defaults to the seat numbers)
+        """
+        if len(stacks) < 2:
+            raise ValueError("Need at least 2 seats")
+        self.num_seats = len(stacks)
+        self.player_ids: List[str] = list(player_ids) if player_ids else [str(seat) for seat in range(self.num_seats)]
+        self.chips: List[int] = list(stacks)
+        self.small_blind = small_blind
+        self.big_blind = big_blind
+        self.ante = ante
+        self.button = button
+        self.rng = GameRNG(game_id, seed)
+        self.hand_number = 0
+
+        # Per-hand state
+        self.status: List[PlayerStatus] = [_OUT] * self.num_seats
+        self.hole_cards: List[Tuple[int, ...]] = [()] * self.num_seats
+        self.current_bets: List[int] = [0] * self.num_seats
+        self.committed: List[int] = [0] * self.num_seats
+        self.winnings: List[int] = [0] * self.num_seats
+        self.board: List[int] = []
+        self.current_round = BettingRound.PREFLOP
+        self.current_bet = 0
+        self.min_raise = big_blind
+        self.to_act = 0  # Bitmask of seats that still need to act this round
+        self._active = 0  # Bitmask of ACTIVE seats
+        self._in_hand = 0  # Bitmask of ACTIVE and ALL_IN seats
+        self.current_seat = -1
+        self.hand_over = True
+        self._runout: List[int] = []
+        self._undo: List[tuple] = []  # Saved states for apply()/undo()
+
+    @classmethod
+    def from_game(cls, game: PokerGame, runout: Optional[Sequence[int]] = None) -> "HeadlessGame":
+        """
+        Build a headless copy of a live game at its current decision point.
+
+        Seats are the live game's player list indices, so the seat to act is
+        game.current_player_idx. BET/RAISE amounts in the copy are raise-to
+        totals, as for every HeadlessGame. The live game is not modified;
+        chips left in the pot by players who already left the table are not
+        carried over.
+
+        Args:
+            game: The live PokerGame, mid-hand
+            runout: Card ids of the full five-card board, starting with the
+                cards already dealt; defaults to the board the live deck
+                would deal (burn cards skipped)
+
+        Returns:
+            A HeadlessGame positioned at the same point of the hand
+        """
+        players = game.players
+        table = cls([player.chips for player in players], game.small_blind, game.big_blind,
+                    game.ante, game_id=game.game_id or "",
+                    player_ids=[player.player_id for player in players])
+        table.rng = game.rng
+        table.hand_number = game.hand_number
+
+        table.button = -1
+        for seat, player in enumerate(players):
+            if player.position <= game.button_position:
+                table.button = seat
+        table.status = [player.status for player in players]
+        table.hole_cards = [tuple(sorted(card.id for card in player.hand.cards)) for player in players]
+        table.current_bets = [player.current_bet for player in players]
+        table.committed = [player.total_bet for player in players]
+        table.to_act = sum(1 << seat for seat, player in enumerate(players) if player.player_id in game.to_act)
+        table._active = sum(1 << seat for seat, status in enumerate(table.status) if status is _ACTIVE)
+        table._in_hand = table._active | sum(
+            1 << seat for seat, status in enumerate(table.status) if status is _ALL_IN)
+
+        board = [card.id for card in game.community_cards]
+        if runout is None:
+            # The live game burns one card before each street and draws from the end
+            upcoming = [card.id for card in reversed(game.deck.cards)]
+            runout, drawn = list(board), 0
+            while len(runout) < 5:
+                street = 3 if not runout else 1
+                runout.extend(upcoming[drawn + 1:drawn + 1 + street])
+                drawn += 1 + street
+        table._runout = list(runout)
+        table.board = table._runout[:len(board)]
+        table.current_round = game.current_round
+        table.current_bet = game.current_bet
+        table.min_raise = game.min_raise
+        table.current_seat = game.current_player_idx
+        table.hand_over = game.current_round is BettingRound.SHOWDOWN
+        return table
+
+    # === Hand flow ===
+
+    def start_hand(self) -> None:
+        """Move the button, deal, and post antes and blinds."""
+        seated = [seat for seat in range(self.num_seats) if self.chips[seat] > 0]
+        if len(seated) < 2:
+            raise ValueError("Need at least 2 players with chips to start a hand")
+
+        if self.hand_number > 0 or self.chips[self.button] <= 0:
+            self.button = self._next_seat_with_chips(self.button)
+        self.hand_number += 1
+
+        n = self.num_seats
+        self.status = [_ACTIVE if chips > 0 else _OUT for chips in self.chips]
+        self._active = self._in_hand = sum(1 << seat for seat in seated)
+        self.current_bets = [0] * n
+        self.committed = [0] * n
+        self.winnings = [0] * n
+        self.board = []
+        self.current_round = BettingRound.PREFLOP
+        self.hand_over = False
+
+        cards = self.rng.permutation(self.hand_number)[:2 * len(seated) + 5].tolist()
+        hole_cards: List[Tuple[int, ...]] = [()] * n
+        for i, seat in enumerate(seated):
+            hole_cards[seat] = (cards[2 * i], cards[2 * i + 1])
+        self.hole_cards = hole_cards
+        self._runout = cards[-5:]
+
+        if self.ante > 0:
+            for seat in seated:
+                self._commit(seat, min(self.ante, self.chips[seat]), dead=True)
+
+        # Heads-up the button posts the small blind and acts first preflop
+        if len(seated) == 2:
+            sb_seat = self.button
+        else:
+            sb_seat = self._next_seat_with_status(self.button, (_ACTIVE, _ALL_IN))
+        bb_seat = self._next_seat_with_status(sb_seat, (_ACTIVE, _ALL_IN))
+        self._commit(sb_seat, min(self.small_blind, self.chips[sb_seat]))
+        self._commit(bb_seat, min(self.big_blind, self.chips[bb_seat]))
+
+        self.current_bet = self.big_blind
+        self.min_raise = self.big_blind
+        self.to_act = self._active
+        self._continue_from(self._previous_seat(sb_seat) if len(seated) == 2 else bb_seat)
+
+    def act(self, action: PlayerAction, amount: Optional[int] = None) -> bool:
+        """
+        Apply an action for the seat to act.
+
+        Args:
+            action: The action taken
+            amount: For BET/RAISE, the player's total bet this round (raise-to)
+
+        Returns:
+            True if the action finished the hand
+
+        Raises:
+            ValueError: If the hand is over or the action is not legal
+        """
+        if self.hand_over:
+            raise ValueError("No hand in progress")
+        seat = self.current_seat
+        to_call = self.current_bet - self.current_bets[seat]
+        stack = self.chips[seat]
+
+        if action is PlayerAction.FOLD:
+            self.status[seat] = _FOLDED
+            self._active &= ~(1 << seat)
+            self._in_hand &= ~(1 << seat)
+        elif action is PlayerAction.CHECK or (action is PlayerAction.CALL and to_call <= 0):
+            if to_call > 0:
+                raise ValueError(f"Cannot check facing a bet of {to_call}")
+        elif action is PlayerAction.CALL:
+            self._commit(seat, min(to_call, stack))
+        elif action is PlayerAction.ALL_IN:
+            if stack <= 0:
+                raise ValueError("Cannot go all-in with no chips")
+            self._raise_to(seat, self.current_bets[seat] + stack)
+        elif action is PlayerAction.BET or action is PlayerAction.RAISE:
+            if amount is None:
+                raise ValueError(f"{action.name} needs an amount")
+            if (action is PlayerAction.BET) != (self.current_bet == 0):
+                raise ValueError(f"Cannot {action.name.lower()} when the current bet is {self.current_bet}")
+            all_in_to = self.current_bets[seat] + stack
+            amount = min(amount, all_in_to)
+            minimum = self.big_blind if self.current_bet == 0 else self.current_bet + self.min_raise
+            if amount < minimum and amount < all_in_to:
+                raise ValueError(f"{action.name} to {amount} is below the minimum of {minimum}")
+            self._raise_to(seat, amount)
+        else:
+            raise ValueError(f"Unknown action: {action}")
+
+        self.to_act &= ~(1 << seat)
+        self._advance(seat)
+        return self.hand_over
+
+    def apply(self, action: PlayerAction, amount: Optional[int] = None) -> bool:
+        """
+        Apply an action like act(), recording it so undo() can revert it.
+
+        Returns:
+            True if the action finished the hand
+
+        Raises:
+            ValueError: If the hand is over or the action is not legal
+        """
+        self._undo.append(self._save())
+        try:
+            return self.act(action, amount)
+        except ValueError:
+            self._load(self._undo.pop())
+            raise
+
+    def undo(self) -> None:
+        """
+        Revert the most recent apply().
+
+        Raises:
+            ValueError: If there is nothing to undo
+        """
+        if not self._undo:
+            raise ValueError("Nothing to undo")
+        self._load(self._undo.pop())
+
+    def fork(self) -> "HeadlessGame":
+        """
+        Copy the table for look-ahead search.
+
+        Only the per-seat lists that act() changes in place are copied; hole
+        cards, the board, the runout and the RNG are never modified in place
+        and stay shared with the original. The fork starts with an empty
+        undo log.
+
+        Returns:
+            An independent HeadlessGame at the same point of the hand
+        """
+        clone = object.__new__(HeadlessGame)
+        clone.__dict__.update(self.__dict__)
+        clone.chips = self.chips[:]
+        clone.status = self.status[:]
+        clone.current_bets = self.current_bets[:]
+        clone.committed = self.committed[:]
+        clone.winnings = self.winnings[:]
+        clone._undo = []
+        return clone
+
+    def play_hand(self, policy: Policy) -> List[int]:
+        """
+        Play one complete hand, asking the policy for every decision.
+
+        Args:
+            policy: Callable (game, seat) -> (action, raise-to amount)
+
+        Returns:
+            Net chip change per seat
+        """
+        before = list(self.chips)
+        self.start_hand()
+        while not self.hand_over:
+            action, amount = policy(self, self.current_seat)
+            self.act(action, amount)
+        return [after - start for after, start in zip(self.chips, before)]
+
+    # === Observations ===
+
+    @property
+    def pot(self) -> int:
+        """Total chips committed this hand."""
+        return sum(self.committed)
+
+    def to_call(self, seat: int) -> int:
+        """Chips the seat needs to add to call (capped at its stack)."""
+        return min(self.current_bet - self.current_bets[seat], self.chips[seat])
+
+    def legal_actions(self, seat: Optional[int] = None) -> List[Tuple[PlayerAction, int, int]]:
+        """
+        Get the legal actions for a seat, like PokerGame.get_valid_actions.
+
+        BET/RAISE and ALL_IN bounds are raise-to totals for the round, the
+        unit act() takes.
+
+        Returns:
+            List of (action, min_amount, max_amount)
+        """
+        seat = self.current_seat if seat is None else seat
+        if self.hand_over or self.status[seat] is not _ACTIVE:
+            return []
+        to_call = self.current_bet - self.current_bets[seat]
+        stack = self.chips[seat]
+        all_in_to = self.current_bets[seat] + stack
+        actions = [(PlayerAction.FOLD, 0, 0)]
+        if to_call <= 0:
+            actions.append((PlayerAction.CHECK, 0, 0))
+        else:
+            call = min(to_call, stack)
+            actions.append((PlayerAction.CALL, call, call))
+        if stack > to_call:
+            if self.current_bet == 0:
+                actions.append((PlayerAction.BET, min(self.big_blind, all_in_to), all_in_to))
+            else:
+                actions.append((PlayerAction.RAISE, min(self.current_bet + self.min_raise, all_in_to), all_in_to))
+        actions.append((PlayerAction.ALL_IN, all_in_to, all_in_to))
+        return actions
+
+    def cards_of(self, seat: int) -> List[Card]:
+        """Hole cards of a seat as Card objects."""
+        return [Card.from_id(card_id) for card_id in self.hole_cards[seat]]
+
+    def board_cards(self) -> List[Card]:
+        """Community cards dealt so far as Card objects."""
+        return [Card.from_id(card_id) for card_id in self.board]
+
+    # === Internals ===
+
+    def _save(self) -> tuple:
+        """Everything act() can change, for undo()."""
+        return (self.chips[:], self.status[:], self.current_bets[:], self.committed[:],
+                self.winnings[:], self.board, self.current_round, self.current_bet,
+                self.min_raise, self.to_act, self._active, self._in_hand,
+                self.current_seat, self.hand_over)
+
+    def _load(self, state: tuple) -> None:
+        """Restore a state saved by _save()."""
+        (self.chips, self.status, self.current_bets, self.committed,
+         self.winnings, self.board, self.current_round, self.current_bet,
+         self.min_raise, self.to_act, self._active, self._in_hand,
+         self.current_seat, self.hand_over) = state
+
+    def _commit(self, seat: int, amount: int, dead: bool = False) -> None:
+        """Move chips from a seat's stack into the pot."""
+        self.chips[seat] -= amount
+        self.committed[seat] += amount
+        if not dead:
+            self.current_bets[seat] += amount
+        if self.chips[seat] == 0:
+            self.status[seat] = _ALL_IN
+            self._active &= ~(1 << seat)
+
+    def _raise_to(self, seat: int, total: int) -> None:
+        """Bring a seat's bet to total; reopen the action if it raises."""
+        self._commit(seat, total - self.current_bets[seat])
+        if total > self.current_bet:
+            self.min_raise = max(self.min_raise, total - self.current_bet)
+            self.current_bet = total
+            self.to_act = self._active
+
+    def _advance(self, seat: int) -> None:
+        """Move to the next seat, street or the end of the hand."""
+        in_hand = self._in_hand
+        if in_hand & (in_hand - 1) == 0:
+            self._award(in_hand.bit_length() - 1)
+            return
+        if self.to_act & self._active:
+            self._continue_from(seat)
+            return
+
+        # Betting round complete; run the board out once at most one player can still bet
+        active = self._active
+        if self.current_round is BettingRound.RIVER or active & (active - 1) == 0:
+            self.board = self._runout
+            self._showdown([s for s in range(self.num_seats) if in_hand >> s & 1])
+            return
+        self.current_round = _NEXT_ROUND[self.current_round]
+        self.board = self._runout[:_BOARD_SIZE[self.current_round]]
+        self.current_bets = [0] * self.num_seats
+        self.current_bet = 0
+        self.min_raise = self.big_blind
+        self.to_act = self._active
+        # Post-flop the first active seat after the button acts first (the BB heads-up)
+        self._continue_from(self.button)
+
+    def _continue_from(self, seat: int) -> None:
+        """Hand the action to the first seat after `seat` that still needs to act."""
+        to_act = self.to_act
+        for step in range(1, self.num_seats + 1):
+            candidate = (seat + step) % self.num_seats
+            if to_act >> candidate & 1:
+                self.current_seat = candidate
+                return
+        # Nobody can act (everyone all-in from the blinds): run the board out
+        self._advance(seat)
+
+    def _award(self, winner: int) -> None:
+        """Give every pot to the last player standing."""
+        self.winnings[winner] = self.pot
+        self.chips[winner] += self.pot
+        self._finish()
+
+    def _showdown(self, contenders: List[int]) -> None:
+        """Evaluate hands and split the main and side pots."""
+        board = self.board
+        strengths = {
+            seat: HandEvaluator.strength_of_ids(self.hole_cards[seat] + tuple(board))
+            for seat in contenders
+        }
+        committed = self.committed
+        levels = sorted({committed[seat] for seat in contenders})
+        levels[-1] = max(committed)
+        previous = 0
+        for level in levels:
+            amount = sum(min(c, level) - min(c, previous) for c in committed)
+            eligible = [seat for seat in contenders if committed[seat] >= level] or contenders
+            previous = level
+            if amount <= 0:
+                continue
+            best = max(strengths[seat] for seat in eligible)
+            winners = [seat for seat in eligible if strengths[seat] == best]
+            share, remainder = divmod(amount, len(winners))
+            for seat in winners:
+                self.winnings[seat] += share
+                self.chips[seat] += share
+            if remainder:
+                first = min(winners, key=lambda s: (s - self.button) % self.num_seats)
+                self.winnings[first] += remainder
+                self.chips[first] += remainder
+        self._finish()
+
+    def _finish(self) -> None:
+        """Mark the hand complete."""
+        self.current_round = BettingRound.SHOWDOWN
+        self.to_act = 0
+        self.current_seat = -1
+        self.hand_over = True
+
+    def _next_seat_with_chips(self, seat: int) -> int:
+        """First seat clockwise from `seat` that has chips."""
+        for step in range(1, self.num_seats + 1):
+            candidate = (seat + step) % self.num_seats
+            if self.chips[candidate] > 0:
+                return candidate
+        raise ValueError("No seat has chips")
+
+    def _next_seat_with_status(self, seat: int, statuses: Tuple[PlayerStatus, ...]) -> int:
+        """First seat clockwise from `seat` with one of the given statuses."""
+        for step in range(1, self.num_seats + 1):
+            candidate = (seat + step) % self.num_seats
+            if self.status[candidate] in statuses:
+                return candidate
+        raise ValueError("No seat has the requested status")
+
+    def _previous_seat(self, seat: int) -> int:
+        """Seat index just before `seat` (so _continue_from lands on it)."""
+        return (seat - 1) % self.num_seats
+
+
+def make_random_policy(seed: Optional[int] = None, fold: float = 0.15, aggression: float = 0.25) -> Policy:
+    """
+    Build a cheap randomized policy for benchmarks and smoke tests.
+
+    Args:
+        seed: Optional seed for the policy's own random stream
+        fold: Probability of folding when facing a bet
+        aggression: Probability of betting or raising the minimum
+
+    Returns:
+        A Policy callable
+    """
+    rng = random.Random(seed)
+
+    def policy(game: HeadlessGame, seat: int) -> Tuple[PlayerAction, Optional[int]]:
+        roll = rng.random()
+        facing = game.current_bet > game.current_bets[seat]
+        if facing and roll < fold:
+            return PlayerAction.FOLD, None
+        if roll > 1.0 - aggression and game.chips[seat] > game.current_bet - game.current_bets[seat]:
+            if game.current_bet == 0:
+                return PlayerAction.BET, game.big_blind
+            return PlayerAction.RAISE, game.current_bet + game.min_raise
+        return (PlayerAction.CALL if facing else PlayerAction.CHECK), None
+
+    return policy
+
+
+def main() -> None:
+    """Measure single-core throughput with the random policy."""
+    parser = argparse.ArgumentParser(description="Benchmark the headless poker engine")
+    parser.add_argument("--hands", type=int, default=100000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    game = HeadlessGame([10000] * args.players, 50, 100, seed=args.seed)
+    policy = make_random_policy(args.seed)
+    played = 0
+    started = time.perf_counter()
+    while played < args.hands:
+        if sum(chips > 0 for chips in game.chips) < 2:
+            game.chips = [10000] * args.players
+        game.play_hand(policy)
+        played += 1
+    elapsed = time.perf_counter() - started
+    print(f"{played} hands in {elapsed:.2f}s ({played / elapsed:,.0f} hands/s)")
+
+
+if __name__ == "__main__":
+    main()
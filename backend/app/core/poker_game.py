@@ -1,28 +1,20 @@
 """
 Core poker game logic including betting and game flow.
 """
+from dataclasses import dataclass, replace
 from enum import Enum, auto
 from typing import Dict, List, Optional, Set, Tuple, Any
 from collections import defaultdict
-import random
 import logging
-import asyncio
-import time
 logger = logging.getLogger(__name__)
-import uuid
-
-def log_with_timestamp(level, message):
-    """Log with millisecond timestamp."""
-    timestamp = time.time()
-    formatted_time = f"{timestamp:.3f}"
-    getattr(logging, level)(f"[{formatted_time}] {message}")
 
 from app.core.cards import Card, Deck, Hand
+from app.core.rng import GameRNG
+from app.core.pots import Pot, PotLedger
+from app.core.seats import SeatRing, ToActSet, popcount
 from app.core.hand_evaluator import HandEvaluator, HandRank
-from app.core.game_events import (
-    GameActionResult, GameEventType, AnimationSequence, 
-    PlayerBet, StreetCards
-)
+from app.core.tracing import tracer
+from app.core.game_events import TransitionEvent
 
 
 class BettingRound(Enum):
@@ -52,6 +44,10 @@ class PlayerStatus(Enum):
     OUT = auto()     # Out of the game (no chips left)
 
 
+# The street dealt onto a board of a given size
+_STREET_DEALT = {0: BettingRound.FLOP, 3: BettingRound.TURN, 4: BettingRound.RIVER}
+
+
 class Player:
     """Represents a player in the poker game."""
     
@@ -70,12 +66,26 @@ class Player:
         self.chips = chips
         self.position = position
         self.hand = Hand()
-        self.status = PlayerStatus.ACTIVE
+        self._ring: Optional[SeatRing] = None  # Set while seated in a PokerGame
+        self._seat = -1
+        self._status = PlayerStatus.ACTIVE
         self.current_bet = 0
         self.total_bet = 0
         self.is_small_blind = False
         self.is_big_blind = False
     
+    @property
+    def status(self) -> "PlayerStatus":
+        """The player's status in the current hand."""
+        return self._status
+    
+    @status.setter
+    def status(self, value: "PlayerStatus"):
+        """Set the status, keeping the game's seat ring in sync."""
+        if self._ring is not None and value != self._status:
+            self._ring.status_changed(self, self._status, value)
+        self._status = value
+    
     def bet(self, amount: int) -> int:
         """
         Place a bet, deducting from the player's chips.
@@ -115,46 +125,14 @@ class Player:
         return f"{self.name} ({self.chips} chips)"
 
 
-class Pot:
-    """Represents a pot in the poker game (main pot or side pot)."""
-    
-    def __init__(self, amount: int = 0, name: str = ""):
-        """
-        Initialize a pot.
-        
-        Args:
-            amount: Initial amount in the pot
-            name: Name of the pot (e.g., "Main Pot", "Side Pot 1")
-        """
-        self.amount = amount
-        self.name = name
-        self.eligible_players: Set[str] = set()  # Player IDs eligible to win this pot
-    
-    def add(self, amount: int, player_id: str):
-        """
-        Add chips to the pot from a player.
-        
-        Args:
-            amount: Amount to add
-            player_id: ID of the player contributing
-        """
-        self.amount += amount
-        self.eligible_players.add(player_id)
-    
-    def remove_player(self, player_id: str):
-        """
-        Remove a player from eligibility for this pot.
-        
-        Args:
-            player_id: ID of the player to remove
-        """
-        if player_id in self.eligible_players:
-            self.eligible_players.remove(player_id)
-            
-    def __str__(self):
-        """String representation of the pot."""
-        pot_name = self.name if self.name else "Pot"
-        return f"{pot_name}: ${self.amount} ({len(self.eligible_players)} players eligible)"
+@dataclass(frozen=True)
+class ShowdownHand:
+    """A player's evaluated hand at showdown."""
+    strength: int  # Comparable hand strength, see HandEvaluator
+    rank: HandRank
+    kickers: List[int]
+    best_five: List[Card]
+    description: str  # From PokerGame._format_hand_description
 
 
 class PokerGame:
@@ -244,10 +222,12 @@ class PokerGame:
         self.small_blind = small_blind
         self.big_blind = big_blind
         self.ante = ante
+        self.rng = GameRNG(game_id or "")  # Per-hand deal streams, see app/core/rng.py
         self.deck = Deck()
         self.players: List[Player] = []
         self.community_cards: List[Card] = []
-        self.pots: List[Pot] = [Pot()]  # Start with main pot
+        self.pot_ledger = PotLedger()
+        self.pots: List[Pot] = self.pot_ledger.pots  # Kept current by the ledger
         self.current_round = BettingRound.PREFLOP
         self.button_position = 0
         self.current_player_idx = 0
@@ -255,7 +235,9 @@ class PokerGame:
         self.min_raise = big_blind
         self.last_aggressor_idx = 0  # Track who was last to bet/raise
         self.hand_winners: Dict[str, List[Player]] = {}  # Map pot ID to winners
-        self.to_act: Set[str] = set()  # Track players who still need to act in current round
+        self._showdown_results: Optional[Tuple[Tuple[int, int], Dict[Player, ShowdownHand]]] = None
+        self.seats = SeatRing(absent=PlayerStatus.OUT)  # Bitmask turn-order bookkeeping
+        self._to_act = ToActSet(self.seats)  # Players who still need to act in current round
         
         # Game type specific settings
         from app.models.domain_models import BettingStructure
@@ -271,6 +253,23 @@ class PokerGame:
         self.hand_number = 0  # Current hand number
         self.tournament_level = None  # Current tournament level
     
+    @property
+    def to_act(self) -> Set[str]:
+        """IDs of the players who still need to act in the current round."""
+        return self._to_act
+    
+    @to_act.setter
+    def to_act(self, player_ids: Set[str]):
+        """Replace the to-act set (any iterable of player IDs)."""
+        self._to_act = ToActSet(self._seat_ring(), player_ids)
+    
+    def _seat_ring(self) -> SeatRing:
+        """The seat ring, re-indexed first if players joined or left."""
+        ring = self.seats
+        if ring.players is not self.players or ring.size != len(self.players):
+            ring.reseat(self.players)
+        return ring
+    
     def add_player(self, player_id: str, name: str, chips: int, position: Optional[int] = None) -> Player:
         """
         Add a player to the game.
@@ -296,18 +295,15 @@ class PokerGame:
         if len(self.players) < 2:
             raise ValueError("Need at least 2 players to start a hand")
         
-        # Generate a unique ID for tracking this hand setup through logs
-        execution_id = str(uuid.uuid4())[:8]
-        logging.info(f"=== STARTING NEW HAND #{self.hand_number + 1} [{execution_id}] ===")
-            
         # Increment hand number
         self.hand_number += 1
         
-        # Reset game state
+        # Reset game state; the deck order depends only on (seed, game id, hand number)
         self.deck.reset()
-        self.deck.shuffle()
+        self.deck.shuffle(self.rng.for_hand(self.hand_number))
         self.community_cards = []
-        self.pots = [Pot(name="Main Pot")]  # Reset to single main pot with name
+        self.pot_ledger = PotLedger()
+        self.pots = self.pot_ledger.pots  # Single empty main pot until chips go in
         self.current_round = BettingRound.PREFLOP
         self.current_bet = 0
         self.min_raise = self.big_blind
@@ -321,14 +317,12 @@ class PokerGame:
         # Sort players by their seat position - CRITICAL for proper turn ordering
         # This ensures that self.players list corresponds to the physical table layout
         self.players.sort(key=lambda p: p.position)
-        logging.info(f"[HAND-{execution_id}] Players sorted by seat position: {[(p.name, p.position) for p in self.players]}")
+        self.seats.reseat(self.players)
         
         # 1. Get players who are participating in this hand (not OUT)
         dealing_players = [p for p in self.players if p.status != PlayerStatus.OUT]
         if len(dealing_players) < 2:
              raise ValueError("Need at least 2 active players to start a hand")
-        
-        logging.info(f"[HAND-{execution_id}] Starting hand with {len(dealing_players)} players")
              
         # 2. Deal two cards to each player who will participate in the hand
         for _ in range(2):
@@ -376,144 +370,29 @@ class PokerGame:
         # This matters because players might have gone ALL_IN from posting blinds/antes
         current_active_players_post_blinds = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
         
-        logging.info(f"[HAND-{execution_id}] Active players after blinds/antes: {len(current_active_players_post_blinds)}")
-        logging.info(f"[HAND-{execution_id}] Players by status: ACTIVE={len(current_active_players_post_blinds)}, " 
-                   f"ALL_IN={len([p for p in self.players if p.status == PlayerStatus.ALL_IN])}, "
-                   f"FOLDED={len([p for p in self.players if p.status == PlayerStatus.FOLDED])}, "
-                   f"OUT={len([p for p in self.players if p.status == PlayerStatus.OUT])}")
-        
         # 8. CRITICAL: Initialize to_act AFTER blinds/antes are posted
         # Only include players who are still ACTIVE (not ALL_IN from posting blinds/antes)
         self.to_act = {p.player_id for p in current_active_players_post_blinds}
-        # Add immediate logging to verify to_act contents
-        logging.info(f"Initialized to_act set within start_hand: {self.to_act}")
-        logging.info(f"[HAND-{execution_id}] Initialized to_act set with {len(self.to_act)} players: {self.to_act}")
-        
-        # Initialize all players who contributed to the pot as eligible for main pot
-        for player in dealing_players:
-            if player.total_bet > 0:  # Only include players who contributed chips
-                self.pots[0].eligible_players.add(player.player_id)
-        
-        # *** IMPROVED POSITION-BASED FIRST PLAYER DETERMINATION ***
-        logging.info(f"=== DETERMINING FIRST PLAYER TO ACT (PREFLOP) [{execution_id}] ===")
-        logging.info(f"Button position: {self.button_position}")
-        logging.info(f"Total players: {len(self.players)}")
-        
-        # For detailed logging
-        for player in current_active_players_post_blinds:
-            # Calculate relative position based on seat numbers
-            rel_pos = (player.position - self.button_position) % max(9, len(self.players))
-            pos_name = self._get_position_name(rel_pos)
-            player_idx = self.players.index(player)
-            logging.info(f"Player {player.name} is in seat {player.position}, relative pos {rel_pos} [{pos_name}], "
-                       f"index {player_idx}, status: {player.status.name}, in to_act: {player.player_id in self.to_act}")
-        
-        # Detect heads-up play
-        is_heads_up = len([p for p in self.players if p.status != PlayerStatus.OUT]) == 2
-        if is_heads_up:
-            logging.info(f"[HAND-{execution_id}] Heads-up play detected")
-        
-        # PREFLOP STRATEGY:
-        # 1. Heads-up: Button/SB acts first
-        # 2. 3+ players: First player after BB (UTG) acts first
-        
-        # Sort players by their position relative to the button
-        # This creates a list where index 0 is BTN, index 1 is SB, index 2 is BB, index 3 is UTG, etc.
-        players_by_rel_pos = sorted(
-            self.players,
-            key=lambda p: (p.position - self.button_position) % max(9, len(self.players))
-        )
-        
-        # Log the sorted player order for debugging
-        rel_positions = [(p.name, p.position, p.status.name, (p.position - self.button_position) % max(9, len(self.players))) 
-                        for p in players_by_rel_pos]
-        logging.info(f"[HAND-{execution_id}] Players sorted by relative position: {rel_positions}")
         
-        first_player_to_act = None
-        first_player_idx = -1
-        
-        if is_heads_up:
-            # In heads-up, the button acts first (BTN/SB)
-            if len(players_by_rel_pos) > 0:
-                btn_player = players_by_rel_pos[0]  # First player in relative order is the button
-                
-                if btn_player.status == PlayerStatus.ACTIVE and btn_player.player_id in self.to_act:
-                    first_player_to_act = btn_player
-                    first_player_idx = self.players.index(btn_player)
-                    logging.info(f"[HAND-{execution_id}] Heads-up: First player to act is BTN/SB: "
-                               f"{btn_player.name} (index {first_player_idx})")
-        else:
-            # 3+ players: In preflop, UTG (player after BB) acts first
-            # In our sorted list, BB is at index 2, so UTG is at index 3
-            if len(players_by_rel_pos) > 3:  # Need at least 4 players to have a UTG
-                utg_candidate = players_by_rel_pos[3]
-                
-                if utg_candidate.status == PlayerStatus.ACTIVE and utg_candidate.player_id in self.to_act:
-                    first_player_to_act = utg_candidate
-                    first_player_idx = self.players.index(utg_candidate)
-                    logging.info(f"[HAND-{execution_id}] 3+ players: First player to act is UTG: "
-                               f"{utg_candidate.name} (index {first_player_idx})")
-            
-            # If we don't have a UTG (e.g., 3 players), find first active player after BB
-            if not first_player_to_act:
-                # Start from index 3 or wrap around to 0 if less than 4 players
-                start_idx = 3 if len(players_by_rel_pos) > 3 else 0
-                
-                # Check all players in positional order, wrapping around if needed
-                for i in range(len(players_by_rel_pos)):
-                    check_idx = (start_idx + i) % len(players_by_rel_pos)
-                    check_player = players_by_rel_pos[check_idx]
-                    
-                    if check_player.status == PlayerStatus.ACTIVE and check_player.player_id in self.to_act:
-                        first_player_to_act = check_player
-                        first_player_idx = self.players.index(check_player)
-                        rel_pos = (check_player.position - self.button_position) % max(9, len(self.players))
-                        pos_name = self._get_position_name(rel_pos)
-                        
-                        logging.info(f"[HAND-{execution_id}] First player to act: {check_player.name} [{pos_name}] "
-                                   f"(index {first_player_idx})")
-                        break
-        
-        # Fallback if we still haven't found a player
-        if not first_player_to_act:
-            logging.warning(f"[HAND-{execution_id}] Position-based search failed. Looking for any active player.")
-            
-            # Find any active player who needs to act
-            for player in self.players:
-                if player.status == PlayerStatus.ACTIVE and player.player_id in self.to_act:
-                    first_player_to_act = player
-                    first_player_idx = self.players.index(player)
-                    logging.info(f"[HAND-{execution_id}] Fallback: First player is {player.name} (index {first_player_idx})")
-                    break
+        # PREFLOP: the first player still to act after the big blind opens the
+        # action (the button/SB heads-up, UTG otherwise)
+        ring = self._seat_ring()
+        first_player_idx = ring.next_seat(ring.index.get(bb_player.player_id, -1),
+                                          ring.mask(PlayerStatus.ACTIVE) & ring.to_act)
+        first_player_to_act = self.players[first_player_idx] if first_player_idx >= 0 else None
         
         # Set current player index based on first player determination
-        if first_player_to_act and first_player_idx >= 0:
+        if first_player_to_act:
             self.current_player_idx = first_player_idx
-            logging.info(f"[HAND-{execution_id}] Setting current_player_idx to {first_player_idx} ({first_player_to_act.name})")
-            
-            # Assertions to catch issues early
-            assert 0 <= self.current_player_idx < len(self.players), f"Invalid player index: {self.current_player_idx}"
-            assert self.players[self.current_player_idx].player_id == first_player_to_act.player_id, "Player ID mismatch!"
-            assert first_player_to_act.player_id in self.to_act, f"Selected player not in to_act set: {first_player_to_act.name}"
         else:
-            # Last resort fallback - use first player in the list
-            logging.error(f"[HAND-{execution_id}] CRITICAL: Could not find any valid player to act!")
-            if len(self.players) > 0:
-                self.current_player_idx = 0
-                logging.warning(f"[HAND-{execution_id}] Using first player as fallback: {self.players[0].name}")
-            else:
-                logging.error(f"[HAND-{execution_id}] No players in the game!")
-                self.current_player_idx = 0
-        
-        logging.info(f"[START_HAND_DEBUG] Final current_player_idx set in start_hand: {self.current_player_idx}")
-        # Ensure the selected player is valid
-        if not (0 <= self.current_player_idx < len(self.players)) or self.players[self.current_player_idx].status != PlayerStatus.ACTIVE or self.players[self.current_player_idx].player_id not in self.to_act:
-             logging.error(f"[START_HAND_DEBUG] CRITICAL: Final index {self.current_player_idx} points to an invalid player!")
-        
-        # Log the expected action order for the hand for clarity
-        self._log_expected_action_order()
-        logging.info(f"=== FIRST PLAYER DETERMINATION COMPLETE [{execution_id}] ===")
-        # --- END INDEX-BASED INITIAL PLAYER DETERMINATION ---
+            # Nobody can act (e.g. everyone is all-in from the blinds)
+            logger.error("Hand %s: no player can act after the blinds", self.hand_number)
+            self.current_player_idx = 0
+        
+        if tracer.enabled:
+            tracer.event(self.game_id, "hand.start", hand=self.hand_number, button=self.button_position,
+                         dealt=len(dealing_players), active=len(current_active_players_post_blinds),
+                         first=self.current_player_idx)
     
     def _assign_random_seat_positions(self):
         """
@@ -550,7 +429,7 @@ class PokerGame:
             logging.info("No duplicate positions found, keeping original seat assignments")
             # Just assign a random button position
             positions = [p.position for p in active_players]
-            self.button_position = random.choice(positions)
+            self.button_position = int(self.rng.for_hand(0, stream=1).choice(positions))
             logging.info(f"Button position set to seat {self.button_position}")
             return
             
@@ -576,7 +455,7 @@ class PokerGame:
         
         # Choose a random button position from assigned positions
         positions = [p.position for p in active_players]
-        self.button_position = random.choice(positions)
+        self.button_position = int(self.rng.for_hand(0, stream=1).choice(positions))
         logging.info(f"Button position set to seat {self.button_position}")
         
         # Log final seat assignments
@@ -584,45 +463,6 @@ class PokerGame:
         for player in active_players:
             logging.info(f"  {player.name}: position={player.position}")
             
-    def move_button(self):
-        """
-        Move the button to the next active player in clockwise order.
-        This operates on seat positions, not player list indices.
-        """
-        active_players = [p for p in self.players if p.status != PlayerStatus.OUT]
-        if not active_players:
-            logging.error("No active players to move button to!")
-            return
-        
-        # Get the current button seat position
-        current_button_pos = self.button_position
-        logging.info(f"Moving button from seat {current_button_pos}")
-        
-        # Get all occupied seat positions in ascending order
-        occupied_seats = sorted([p.position for p in active_players])
-        if not occupied_seats:
-            logging.error("No occupied seats found!")
-            return
-            
-        logging.info(f"Occupied seats: {occupied_seats}")
-        
-        # Find the next seat position clockwise from the current button
-        next_button_pos = None
-        
-        # First try to find a seat with higher position number
-        for seat in occupied_seats:
-            if seat > current_button_pos:
-                next_button_pos = seat
-                break
-                
-        # If no higher seat found, wrap around to the lowest seat
-        if next_button_pos is None:
-            next_button_pos = occupied_seats[0]
-            
-        # Set the new button position
-        self.button_position = next_button_pos
-        logging.info(f"Button moved to seat {self.button_position}")
-
     def _set_positions(self):
         """
         Assign poker positions to players based on the button position.
@@ -664,124 +504,47 @@ class PokerGame:
                 poker_pos = f"Pos {rel_pos}"
                 
             position_names[player.player_id] = poker_pos
-            logging.info(f"Player {player.name} (seat {player.position}) is in position: {poker_pos}")
+            logger.debug("Player %s (seat %s) is in position: %s", player.name, player.position, poker_pos)
         
         # Store position names for future reference
         self.position_names = position_names
     
     def _post_blinds(self) -> Tuple[Player, Player]:
         """Post the small and big blinds. Returns the SB and BB player objects."""
-        active_players = [p for p in self.players if p.status != PlayerStatus.OUT]
-        num_active = len(active_players)
+        ring = self._seat_ring()
+        num_active = popcount(ring.seated)
         
         if num_active < 2:
             # Should not happen if start_hand checks correctly, but handle defensively
             logging.error("Not enough active players to post blinds!")
             return None, None
         
-        sb_player = None
-        bb_player = None
-        
-        logging.info(f"Finding blinds. Button is at seat {self.button_position}. Active players: {[(p.name, p.position) for p in active_players]}")
+        # The button must sit on a dealt-in seat; otherwise pass it clockwise
+        button_player = ring.player_at(self.button_position)
+        if button_player is None or button_player.status == PlayerStatus.OUT:
+            logging.error(f"Button position {self.button_position} not found among active players!")
+            self.button_position = ring.next_position(self.button_position)
+            button_player = ring.player_at(self.button_position)
         
         if num_active == 2:  # Heads-up play
-            # In heads-up, button is SB and other player is BB
-            # Find button player by seat position
-            button_player = None
-            for player in active_players:
-                if player.position == self.button_position:
-                    button_player = player
-                    break
-                
-            if button_player:
-                # In heads-up, button is SB
-                sb_player = button_player
-                # The other player is BB
-                bb_player = next((p for p in active_players if p != button_player), None)
-                
-                if not bb_player:
-                    logging.error("Could not find second player for BB in heads-up!")
-                    return None, None
-                    
-                logging.info(f"Heads-up blinds: SB={sb_player.name} (Button), BB={bb_player.name}")
-            else:
-                logging.error("Could not find button player in active players (Heads Up)")
-                # Fallback: Assume first is SB, second is BB
-                sb_player = active_players[0]
-                bb_player = active_players[1]
-        
-        else: # 3+ players
-            # Find player in the button seat
-            button_player = None
-            for player in active_players:
-                if player.position == self.button_position:
-                    button_player = player
-                    break
-                
-            if not button_player:
-                logging.error(f"Button position {self.button_position} not found among active players!")
-                # Fallback - assign button to first active player
-                button_player = active_players[0]
-                self.button_position = button_player.position
-                
-            # Sort players by their position relative to the button for proper blind assignment
-            # This creates a list where index 0 is the button, index 1 is SB, index 2 is BB
-            sorted_by_rel_pos = sorted(
-                active_players, 
-                key=lambda p: (p.position - self.button_position) % max(9, len(self.players))
-            )
-            
-            # Log the sorted player order for debugging
-            rel_positions = [(p.name, p.position, (p.position - self.button_position) % max(9, len(self.players))) 
-                            for p in sorted_by_rel_pos]
-            logging.info(f"Players sorted by relative position to button: {rel_positions}")
-            
-            # Assign blinds - SB is the player 1 position after button
-            sb_player = sorted_by_rel_pos[1] if len(sorted_by_rel_pos) > 1 else None
-            # BB is the player 2 positions after button
-            bb_player = sorted_by_rel_pos[2] if len(sorted_by_rel_pos) > 2 else None
-            
-            # Fallback handling for edge cases
-            if not sb_player or not bb_player:
-                logging.error("Could not determine SB or BB players based on relative position!")
-                
-                # Last resort: Find next players after button's index in the list
-                if button_player:
-                    button_idx = self.players.index(button_player)
-                    # Find SB (first active player after button)
-                    current_idx = (button_idx + 1) % len(self.players)
-                    for _ in range(len(self.players)):
-                        if self.players[current_idx].status != PlayerStatus.OUT:
-                            sb_player = self.players[current_idx]
-                            break
-                        current_idx = (current_idx + 1) % len(self.players)
-                    
-                    if sb_player:
-                        # Find BB (first active player after SB)
-                        current_idx = (self.players.index(sb_player) + 1) % len(self.players)
-                        for _ in range(len(self.players)):
-                            if self.players[current_idx].status != PlayerStatus.OUT:
-                                bb_player = self.players[current_idx]
-                                break
-                            current_idx = (current_idx + 1) % len(self.players)
-        
-        if not sb_player or not bb_player:
-             logging.error("Failed to determine SB or BB players!")
-             # Assign defaults to prevent crashes, though game state will be wrong
-             sb_player = active_players[0]
-             bb_player = active_players[1] if len(active_players) > 1 else active_players[0]
+            # In heads-up, button is SB and the other player is BB
+            sb_player = button_player
+        else:  # 3+ players: SB and BB are the next two dealt-in seats after the button
+            sb_player = ring.player_at(ring.next_position(self.button_position))
+        bb_player = ring.player_at(ring.next_position(sb_player.position))
+        logger.debug("Blinds: button seat %s, SB=%s, BB=%s", self.button_position, sb_player.name, bb_player.name)
         
         # Post Small Blind
         sb_amount = sb_player.bet(self.small_blind)
-        self.pots[0].add(sb_amount, sb_player.player_id)
+        self._commit(sb_player, sb_amount)
         sb_player.is_small_blind = True
-        logging.info(f"Player {sb_player.name} posts Small Blind: {sb_amount}")
+        logger.debug("Player %s posts Small Blind: %s", sb_player.name, sb_amount)
         
         # Post Big Blind
         bb_amount = bb_player.bet(self.big_blind)
-        self.pots[0].add(bb_amount, bb_player.player_id)
+        self._commit(bb_player, bb_amount)
         bb_player.is_big_blind = True
-        logging.info(f"Player {bb_player.name} posts Big Blind: {bb_amount}")
+        logger.debug("Player %s posts Big Blind: %s", bb_player.name, bb_amount)
         
         self.current_bet = self.big_blind
         # Find index of BB player in the main list for last_aggressor_idx
@@ -805,7 +568,7 @@ class PokerGame:
             ante_amount = min(self.ante, player.chips)
             if ante_amount > 0:
                 actual_ante = player.bet(ante_amount)
-                self.pots[0].add(actual_ante, player.player_id)
+                self._commit(player, actual_ante)
                 
                 # Check if player went all-in from ante
                 if player.chips == 0:
@@ -813,316 +576,30 @@ class PokerGame:
                     
         print(f"Collected antes: {self.ante} chips from {len(active_players)} players")
     
-    def deal_flop(self):
-        """Deal the flop (first three community cards)."""
-        if self.current_round != BettingRound.PREFLOP:
-            raise ValueError("Cannot deal flop: incorrect betting round")
-            
-        # Burn a card
-        self.deck.draw()
-        
-        # Deal three cards
-        for _ in range(3):
-            card = self.deck.draw()
-            if card:
-                self.community_cards.append(card)
-                
-        self.current_round = BettingRound.FLOP
-        
-        # Record community cards in hand history
-        if self.hand_history_recorder and self.current_hand_id:
-            self.hand_history_recorder.record_community_cards(
-                cards=self.community_cards,
-                round_name=self.current_round.name
-            )
-            
-            # Notify clients that flop has been dealt (frontend will animate reveal)
-            if self.game_id:
-                try:
-                    from app.core.websocket import game_notifier
-                    import asyncio
-                    # Only send the three new flop cards
-                    new_cards = self.community_cards[-3:]
-                    asyncio.create_task(game_notifier.notify_street_dealt(
-                        self.game_id,
-                        self.current_round.name,
-                        new_cards
-                    ))
-                except Exception as e:
-                    logging.error(f"Error sending street dealt notification (flop): {e}")
-            
-        self._reset_betting_round()
-    
-    def deal_turn(self):
-        """Deal the turn (fourth community card)."""
-        if self.current_round != BettingRound.FLOP:
-            raise ValueError("Cannot deal turn: incorrect betting round")
-            
-        # Burn a card
-        self.deck.draw()
-        
-        # Deal one card
-        card = self.deck.draw()
-        if card:
-            self.community_cards.append(card)
-            
-        self.current_round = BettingRound.TURN
-        
-        # Record community cards in hand history
-        if self.hand_history_recorder and self.current_hand_id:
-            self.hand_history_recorder.record_community_cards(
-                cards=self.community_cards,
-                round_name=self.current_round.name
-            )
-            
-        # Notify clients that turn has been dealt (frontend will animate reveal)
-        if self.game_id:
-            try:
-                from app.core.websocket import game_notifier
-                import asyncio
-                # Only send the new turn card
-                new_card = [self.community_cards[-1]]
-                asyncio.create_task(game_notifier.notify_street_dealt(
-                    self.game_id,
-                    self.current_round.name,
-                    new_card
-                ))
-            except Exception as e:
-                logging.error(f"Error sending street dealt notification (turn): {e}")
-            
-        self._reset_betting_round()
-    
-    def deal_river(self):
-        """Deal the river (fifth community card)."""
-        if self.current_round != BettingRound.TURN:
-            raise ValueError("Cannot deal river: incorrect betting round")
-            
-        # Burn a card
-        self.deck.draw()
-        
-        # Deal one card
-        card = self.deck.draw()
-        if card:
-            self.community_cards.append(card)
-            
-        self.current_round = BettingRound.RIVER
-        
-        # Record community cards in hand history
-        if self.hand_history_recorder and self.current_hand_id:
-            self.hand_history_recorder.record_community_cards(
-                cards=self.community_cards,
-                round_name=self.current_round.name
-            )
-            
-        # Notify clients that river has been dealt (frontend will animate reveal)
-        if self.game_id:
-            try:
-                from app.core.websocket import game_notifier
-                import asyncio
-                # Only send the new river card
-                new_card = [self.community_cards[-1]]
-                asyncio.create_task(game_notifier.notify_street_dealt(
-                    self.game_id,
-                    self.current_round.name,
-                    new_card
-                ))
-            except Exception as e:
-                logging.error(f"Error sending street dealt notification (river): {e}")
-            
-        self._reset_betting_round()
-    
-    def _reset_betting_round(self):
+    def _deal_to(self, board_size: int) -> None:
         """
-        Reset betting for a new round (flop, turn, river).
-        Sets the first player to act and initializes the to_act set.
-        """
-        import uuid
-        execution_id = str(uuid.uuid4())[:8]
-        logging.info(f"=== RESETTING BETTING ROUND FOR {self.current_round.name} [{execution_id}] ===")
-        
-        # Reset betting amounts
-        self.current_bet = 0
-        self.min_raise = self.big_blind
+        Deal streets from the deck until the board has board_size cards.
         
-        # Reset player current bets
-        for player in self.players:
-            player.current_bet = 0
-            
-        # Get CURRENTLY active players - those who can act in this new round
-        # This is important because players might have gone ALL_IN in previous rounds
-        active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-        all_in_players = [p for p in self.players if p.status == PlayerStatus.ALL_IN]
-        folded_players = [p for p in self.players if p.status == PlayerStatus.FOLDED]
-        
-        logging.info(f"[RESET-{execution_id}] Players by status: ACTIVE={len(active_players)}, " 
-                   f"ALL_IN={len(all_in_players)}, FOLDED={len(folded_players)}")
-        
-        # CRITICAL: Reset to_act set FIRST - all active players need to act in this new round
-        old_to_act = self.to_act.copy() if hasattr(self, 'to_act') else set()
-        
-        # Get detailed player status for logging
-        player_statuses = []
-        for p in self.players:
-            in_old_to_act = p.player_id in old_to_act
-            is_active = p.status == PlayerStatus.ACTIVE
-            player_statuses.append(f"{p.name} (ID: {p.player_id}): active={is_active}, was_in_to_act={in_old_to_act}, position={p.position}")
-        
-        logging.info(f"[RESET-{execution_id}] Player statuses before reset: {', '.join(player_statuses)}")
-        
-        # Create the new to_act set with all active players
-        self.to_act = {p.player_id for p in active_players}
-        
-        # Validate the to_act set to ensure no empty set race conditions
-        if not self.to_act and active_players:
-            logging.error(f"[RESET-{execution_id}] RACE CONDITION DETECTED: to_act set is empty but there are {len(active_players)} active players!")
-            # Fix the to_act set
-            logging.info(f"[RESET-{execution_id}] Adding all active players back to to_act set")
-            self.to_act = {p.player_id for p in active_players}
-        
-        logging.info(f"[RESET-{execution_id}] Updated to_act set: {self.to_act}")
-        logging.info(f"[RESET-{execution_id}] Previous to_act set: {old_to_act}")
-        
-        # Log the differences
-        added = self.to_act - old_to_act
-        removed = old_to_act - self.to_act
-        if added:
-            logging.info(f"[RESET-{execution_id}] Players added to to_act: {added}")
-        if removed:
-            logging.info(f"[RESET-{execution_id}] Players removed from to_act: {removed}")
-        
-        if not active_players:
-            logging.warning(f"[RESET-{execution_id}] No active players to act in this round! Round might be over.")
-            return
-        
-        # POST-FLOP STRATEGY: First active player after button acts first
-        # This is consistent in 9-max, 6-max, and heads-up games
-        logging.info(f"[RESET-{execution_id}] Determining first actor post-flop for {self.current_round.name}")
-        
-        # For heads-up specific rule
-        is_heads_up = len([p for p in self.players if p.status != PlayerStatus.OUT]) == 2
-        if is_heads_up:
-            logging.info(f"[RESET-{execution_id}] Heads-up play detected")
-        
-        # Sort players by their position relative to the button
-        # This creates a sorted list where the first player is the button, second is SB, etc.
-        players_by_rel_pos = sorted(
-            self.players,
-            key=lambda p: (p.position - self.button_position) % max(9, len(self.players))
-        )
-        
-        # Log the sorted player order for debugging
-        rel_positions = [(p.name, p.position, p.status.name, (p.position - self.button_position) % max(9, len(self.players))) 
-                        for p in players_by_rel_pos]
-        logging.info(f"[RESET-{execution_id}] Players by relative position: {rel_positions}")
-        
-        # In standard play (3+ players), post-flop action starts with first active player after button
-        # In heads-up play, BB acts first post-flop (the player not on the button)
-        
-        found_first_player = False
-        
-        if is_heads_up:
-            # In heads-up, the BB acts first post-flop (player not on button)
-            for player in players_by_rel_pos:
-                # Skip the button player (index 0)
-                if player.position == self.button_position:
-                    continue
-                    
-                # Other player is BB and acts first if active
-                if player.status == PlayerStatus.ACTIVE and player.player_id in self.to_act:
-                    self.current_player_idx = self.players.index(player)
-                    logging.info(f"[RESET-{execution_id}] Heads-up: First player post-flop is BB: " 
-                               f"{player.name} (index {self.current_player_idx})")
-                    found_first_player = True
-                    break
-        else:
-            # Start with the small blind (first after button) and continue clockwise
-            # Skip the button player (index 0 in our sorted list)
-            for player in players_by_rel_pos[1:] + [players_by_rel_pos[0]]:  # Start after button, wrap around to button
-                if player.status == PlayerStatus.ACTIVE and player.player_id in self.to_act:
-                    self.current_player_idx = self.players.index(player)
-                    rel_pos = (player.position - self.button_position) % max(9, len(self.players))
-                    pos_name = self._get_position_name(rel_pos)
-                    
-                    logging.info(f"[RESET-{execution_id}] First player for {self.current_round.name}: " 
-                                f"{player.name} [{pos_name}] (index {self.current_player_idx})")
-                    logging.info(f"[RESET-{execution_id}] Player status: {player.status.name}, in to_act: {player.player_id in self.to_act}")
-                    
-                    # CRITICAL FIX: Ensure the player is truly eligible to act
-                    # Double-check that the player is active and in to_act
-                    if player.status == PlayerStatus.ACTIVE and player.player_id in self.to_act:
-                        # Ensure this player is properly set as the current player
-                        player_idx_check = self.players.index(player)
-                        if player_idx_check != self.current_player_idx:
-                            logging.warning(f"[RESET-{execution_id}] Critical mismatch in player indexes! Fixing...")
-                            self.current_player_idx = player_idx_check
-                            
-                        # Log more detailed information about the first player for debugging
-                        rel_pos = (player.position - self.button_position) % max(9, len(self.players))
-                        logging.info(f"[RESET-{execution_id}] Confirmed first player {player.name} is eligible")
-                        logging.info(f"[RESET-{execution_id}] Player position: {player.position}, button: {self.button_position}, relative: {rel_pos}")
-                        logging.info(f"[RESET-{execution_id}] Current round: {self.current_round.name}, is_heads_up: {is_heads_up}")
-                        found_first_player = True
-                        break
-                    else:
-                        logging.warning(f"[RESET-{execution_id}] Player {player.name} is no longer eligible to act")
-                        continue
-        
-        # If we still haven't found a player (should be rare)
-        if not found_first_player:
-            logging.warning(f"[RESET-{execution_id}] Could not find active player based on position!")
+        Each street burns a card first, as the state machine's runout assumes
+        (see HeadlessGame.from_game).
+        """
+        while len(self.community_cards) < board_size:
+            street = _STREET_DEALT[len(self.community_cards)]
             
-            # Try to find ANY player who can act
-            for idx, player in enumerate(self.players):
-                if player.status == PlayerStatus.ACTIVE and player.player_id in self.to_act:
-                    self.current_player_idx = idx
-                    logging.info(f"[RESET-{execution_id}] Fallback: Using first eligible player {player.name} (index {idx})")
-                    found_first_player = True
-                    break
-                
-                # Last resort - just use first player
-                if not found_first_player:
-                    logging.error(f"[RESET-{execution_id}] CRITICAL: No eligible players found!")
-                    if len(self.players) > 0:
-                        self.current_player_idx = 0
-                    else:
-                        logging.error(f"[RESET-{execution_id}] CRITICAL: No players in the game!")
-        
-        # Reset last aggressor to the first player to act
-        if 0 <= self.current_player_idx < len(self.players):
-            self.last_aggressor_idx = self.current_player_idx
-        
-        # Final validation - make sure the selected player is actually eligible
-        if 0 <= self.current_player_idx < len(self.players):
-            first_player = self.players[self.current_player_idx]
-            if first_player.status != PlayerStatus.ACTIVE or first_player.player_id not in self.to_act:
-                logging.error(f"[RESET-{execution_id}] Selected first player {first_player.name} cannot act! " 
-                            f"Status: {first_player.status.name}, in to_act: {first_player.player_id in self.to_act}")
-                
-                # Try once more to find any valid player
-                found_valid = False
-                for idx, player in enumerate(self.players):
-                    if player.status == PlayerStatus.ACTIVE and player.player_id in self.to_act:
-                        self.current_player_idx = idx
-                        logging.info(f"[RESET-{execution_id}] Fixed invalid selection: new first player is " 
-                                    f"{player.name} at index {idx}")
-                        found_valid = True
-                        break
-                
-                if not found_valid:
-                    logging.error(f"[RESET-{execution_id}] CRITICAL: Could not find any valid player to act!")
-        else:
-            logging.error(f"[RESET-{execution_id}] Invalid current_player_idx: {self.current_player_idx}")
+            # Burn a card, then deal the street
+            self.deck.draw()
+            for _ in range(3 if street == BettingRound.FLOP else 1):
+                card = self.deck.draw()
+                if card:
+                    self.community_cards.append(card)
             
-            # Try to recover
-            if len(active_players) > 0:
-                self.current_player_idx = self.players.index(active_players[0])
-                logging.info(f"[RESET-{execution_id}] Recovered with index {self.current_player_idx}")
-            elif len(self.players) > 0:
-                self.current_player_idx = 0
-                logging.info(f"[RESET-{execution_id}] Recovered with index 0")
-        
-        logging.info(f"=== BETTING ROUND RESET COMPLETE [{execution_id}] ===")
-        
+            # Record community cards in hand history
+            if self.hand_history_recorder and self.current_hand_id:
+                self.hand_history_recorder.record_community_cards(
+                    cards=self.community_cards,
+                    round_name=street.name
+                )
+    
     def get_valid_actions(self, player: Player) -> List[Tuple[PlayerAction, int, int]]:
         """
         Get valid actions for the current player.
@@ -1179,632 +656,166 @@ class PokerGame:
         Returns:
             Dictionary mapping each player to their hand evaluation
         """
+        return {
+            player: HandEvaluator.describe(strength)
+            for player, strength in self.evaluate_hand_strengths().items()
+        }
+    
+    def showdown_results(self) -> Dict[Player, ShowdownHand]:
+        """
+        Evaluated hands of the players still in the hand, computed once.
+        
+        _handle_showdown fills this cache; notifications, the hand history
+        and the API read it instead of evaluating and describing the hands
+        again. It is keyed by hand number and board size, so a new hand or
+        another community card recomputes it.
+        
+        Returns:
+            Dictionary mapping each player to their ShowdownHand
+        """
+        key = (self.hand_number, len(self.community_cards))
+        cached = self._showdown_results
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        return self._evaluate_showdown()
+    
+    def _evaluate_showdown(self) -> Dict[Player, ShowdownHand]:
+        """Evaluate and describe every live hand, refreshing the showdown cache."""
+        board_ids = [card.id for card in self.community_cards]
+        results = {}
+        for player, strength in self.evaluate_hand_strengths().items():
+            rank, kickers = HandEvaluator.describe(strength)
+            card_ids = board_ids + [card.id for card in player.hand.cards]
+            results[player] = ShowdownHand(
+                strength=strength,
+                rank=rank,
+                kickers=kickers,
+                best_five=[Card.from_id(card_id) for card_id in HandEvaluator.best_five(card_ids)],
+                description=self._format_hand_description(rank, kickers),
+            )
+        self._showdown_results = ((self.hand_number, len(self.community_cards)), results)
+        return results
+    
+    def evaluate_hand_strengths(self) -> Dict[Player, int]:
+        """
+        Score all active player hands as comparable integers.
+        
+        Returns:
+            Dictionary mapping each player to their hand strength (higher wins)
+        """
+        board_ids = {card.id for card in self.community_cards}
         results = {}
         
         for player in self.players:
             if player.status in {PlayerStatus.ACTIVE, PlayerStatus.ALL_IN}:
                 # Combine player's hole cards with community cards
-                all_cards = set(player.hand.cards) | set(self.community_cards)
-                hand_rank, kickers = HandEvaluator.evaluate(all_cards)
-                results[player] = (hand_rank, kickers)
+                card_ids = board_ids.union(card.id for card in player.hand.cards)
+                results[player] = HandEvaluator.strength_of_ids(card_ids)
                 
         return results
     
-    def process_action_pure(self, player: Player, action: PlayerAction, amount: Optional[int] = None) -> GameActionResult:
+    async def process_action(self, player: Player, action: PlayerAction, amount: Optional[int] = None) -> bool:
         """
-        Pure game logic version of process_action.
-        
-        Processes a player's action and returns a GameActionResult describing
-        what happened, without any side effects like WebSocket notifications.
+        Process a player's action during betting and replay it to clients.
         
-        This follows the Command Pattern - pure logic that returns a result
-        describing what occurred.
+        The table changes in apply_action(), which never waits on anything;
+        the events it returns are then handed to the EventOrchestrator, the
+        only place that notifies clients and waits for their animations.
         
         Args:
             player: The player taking the action
-            action: The action being taken
+            action: The action to take
             amount: The bet/raise amount (if applicable)
             
         Returns:
-            GameActionResult describing what happened and what notifications are needed
+            True if the action was successful, False otherwise
         """
-        import time
-        execution_id = f"{time.time():.6f}"
-        
-        # Input validation
-        if not player or not action:
-            return GameActionResult(
-                success=False,
-                events=[],
-                current_round=self.current_round,
-                current_player_id=None,
-                to_act=self.to_act.copy(),
-                action_player_id=player.player_id if player else "unknown",
-                action_type=action,
-                action_amount=amount,
-                animation_sequence=AnimationSequence.NONE,
-                error_message="Invalid player or action"
-            )
-        
-        # Process the action using existing logic but capture the results
-        old_status = player.status
-        old_bet = player.current_bet
-        old_chips = player.chips
-        old_to_act = self.to_act.copy()
-        old_round = self.current_round
-        
-        # Execute the action logic (simplified version without notifications)
-        success = self._execute_action_logic(player, action, amount, execution_id)
-        
-        if not success:
-            return GameActionResult(
-                success=False,
-                events=[],
-                current_round=self.current_round,
-                current_player_id=self._get_current_player_id(),
-                to_act=self.to_act.copy(),
-                action_player_id=player.player_id,
-                action_type=action,
-                action_amount=amount,
-                animation_sequence=AnimationSequence.NONE,
-                error_message=f"Action {action.name} failed validation"
-            )
-        
-        # Determine what events occurred and what needs to happen next
-        return self._build_action_result(player, action, amount, execution_id, old_round)
-    
-    def _execute_action_logic(self, player: Player, action: PlayerAction, amount: Optional[int], execution_id: str) -> bool:
-        """Execute the core action logic without side effects."""
-        # Store original state for potential rollback
-        original_status = player.status
-        original_bet = player.current_bet
-        original_chips = player.chips
-        original_to_act = self.to_act.copy()
-        
-        try:
-            # Basic validation
-            if player.status != PlayerStatus.ACTIVE:
-                logging.warning(f"[ACTION-{execution_id}] Player {player.name} is not active (status: {player.status.name})")
-                return False
-            
-            # Process each action type
-            if action == PlayerAction.FOLD:
-                player.status = PlayerStatus.FOLDED
-                if player.player_id in self.to_act:
-                    self.to_act.remove(player.player_id)
-                    
-            elif action == PlayerAction.CHECK:
-                if player.current_bet < self.current_bet:
-                    logging.warning(f"[ACTION-{execution_id}] Cannot check: player bet {player.current_bet} < current bet {self.current_bet}")
-                    return False
-                if player.player_id in self.to_act:
-                    self.to_act.remove(player.player_id)
-                    
-            elif action == PlayerAction.CALL:
-                call_amount = self.current_bet - player.current_bet
-                if call_amount <= 0:
-                    logging.warning(f"[ACTION-{execution_id}] Invalid call: call_amount={call_amount}")
-                    return False
-                if call_amount >= player.chips:
-                    # This becomes an all-in
-                    actual_bet = player.bet(player.chips)
-                    player.status = PlayerStatus.ALL_IN
-                else:
-                    actual_bet = player.bet(call_amount)
-                
-                self.pots[0].add(actual_bet, player.player_id)
-                if player.player_id in self.to_act:
-                    self.to_act.remove(player.player_id)
-                    
-            elif action == PlayerAction.BET:
-                if self.current_bet > 0 or amount is None:
-                    logging.warning(f"[ACTION-{execution_id}] Invalid bet: current_bet={self.current_bet}, amount={amount}")
-                    return False
-                if amount < self.big_blind or amount > player.chips:
-                    logging.warning(f"[ACTION-{execution_id}] Invalid bet amount: {amount}")
-                    return False
-                    
-                if amount == player.chips:
-                    player.status = PlayerStatus.ALL_IN
-                    
-                actual_bet = player.bet(amount)
-                self.current_bet = player.current_bet
-                self.min_raise = amount
-                self.pots[0].add(actual_bet, player.player_id)
-                
-                # Reset to_act for all other active players
-                self.to_act = {p.player_id for p in self.players 
-                             if p.status == PlayerStatus.ACTIVE and p.player_id != player.player_id}
-                             
-            elif action == PlayerAction.RAISE:
-                if amount is None or amount <= self.current_bet:
-                    logging.warning(f"[ACTION-{execution_id}] Invalid raise amount: {amount}")
-                    return False
-                if amount > player.chips:
-                    # This becomes an all-in
-                    amount = player.chips
-                    player.status = PlayerStatus.ALL_IN
-                    
-                actual_bet = player.bet(amount - player.current_bet)
-                self.current_bet = player.current_bet
-                self.min_raise = amount - self.current_bet
-                self.pots[0].add(actual_bet, player.player_id)
-                
-                # Reset to_act for all other active players
-                self.to_act = {p.player_id for p in self.players 
-                             if p.status == PlayerStatus.ACTIVE and p.player_id != player.player_id}
-                             
-            elif action == PlayerAction.ALL_IN:
-                if player.chips <= 0:
-                    logging.warning(f"[ACTION-{execution_id}] Cannot go all-in: no chips remaining")
-                    return False
-                    
-                all_in_amount = player.chips
-                actual_bet = player.bet(all_in_amount)
-                player.status = PlayerStatus.ALL_IN
-                
-                if player.current_bet > self.current_bet:
-                    # All-in is a raise
-                    self.current_bet = player.current_bet
-                    self.min_raise = player.current_bet - self.current_bet
-                    # Reset to_act
-                    self.to_act = {p.player_id for p in self.players 
-                                 if p.status == PlayerStatus.ACTIVE and p.player_id != player.player_id}
-                else:
-                    # All-in is a call
-                    if player.player_id in self.to_act:
-                        self.to_act.remove(player.player_id)
-                        
-                self.pots[0].add(actual_bet, player.player_id)
-                
-            else:
-                logging.warning(f"[ACTION-{execution_id}] Unknown action: {action}")
-                return False
-                
-            return True
-            
-        except Exception as e:
-            # Rollback on error
-            player.status = original_status
-            player.current_bet = original_bet
-            player.chips = original_chips
-            self.to_act = original_to_act
-            logging.error(f"[ACTION-{execution_id}] Error processing action: {e}")
+        events = self.apply_action(player, action, amount)
+        if events is None:
             return False
+        if self.game_id:
+            try:
+                from app.core.event_orchestrator import event_orchestrator
+                await event_orchestrator.dispatch(self.game_id, events, self)
+            except Exception as e:
+                logging.error(f"Error dispatching action events: {e}")
+        return True
     
-    def _build_action_result(self, player: Player, action: PlayerAction, amount: Optional[int], 
-                           execution_id: str, old_round: BettingRound) -> GameActionResult:
-        """Build a GameActionResult based on the current game state after action processing."""
-        events = []
-        animation_sequence = AnimationSequence.NONE
-        
-        # Check if betting round is complete
-        round_complete = self._check_betting_round_completion()
-        
-        # Determine what type of completion this is
-        active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-        all_in_players = [p for p in self.players if p.status == PlayerStatus.ALL_IN]
-        remaining_players = active_players + all_in_players
-        
-        # Check for hand completion scenarios
-        if len(remaining_players) <= 1:
-            events.append(GameEventType.EARLY_SHOWDOWN_TRIGGERED)
-            animation_sequence = AnimationSequence.CHIP_COLLECTION
-        elif round_complete and self.current_round == BettingRound.RIVER:
-            events.append(GameEventType.SHOWDOWN_TRIGGERED)
-            animation_sequence = AnimationSequence.CHIP_COLLECTION
-        elif round_complete and len(active_players) == 0:
-            # All remaining players are all-in
-            events.append(GameEventType.SHOWDOWN_TRIGGERED)
-            animation_sequence = AnimationSequence.CHIP_COLLECTION
-        elif round_complete:
-            events.append(GameEventType.BETTING_ROUND_COMPLETED)
-            animation_sequence = AnimationSequence.CHIP_COLLECTION
-        
-        # Always include player action processed
-        events.insert(0, GameEventType.PLAYER_ACTION_PROCESSED)
-        
-        # Prepare betting data for animations
-        player_bets = None
-        total_pot = None
-        if animation_sequence == AnimationSequence.CHIP_COLLECTION:
-            player_bets = [
-                PlayerBet(player_id=p.player_id, amount=p.current_bet)
-                for p in self.players if p.current_bet > 0
-            ]
-            total_pot = sum(pot.amount for pot in self.pots)
-        
-        # Determine streets that need to be dealt for all-in showdowns
-        remaining_streets = []
-        if GameEventType.SHOWDOWN_TRIGGERED in events and len(active_players) == 0:
-            # All-in showdown - need to deal remaining streets
-            if len(self.community_cards) == 0:
-                remaining_streets = ["FLOP", "TURN", "RIVER"]
-            elif len(self.community_cards) == 3:
-                remaining_streets = ["TURN", "RIVER"]
-            elif len(self.community_cards) == 4:
-                remaining_streets = ["RIVER"]
-        
-        # Determine next street for normal round completion
-        street_cards = None
-        if GameEventType.BETTING_ROUND_COMPLETED in events:
-            if self.current_round == BettingRound.PREFLOP:
-                street_cards = StreetCards("FLOP", [])  # Cards will be dealt by orchestrator
-            elif self.current_round == BettingRound.FLOP:
-                street_cards = StreetCards("TURN", [])
-            elif self.current_round == BettingRound.TURN:
-                street_cards = StreetCards("RIVER", [])
-        
-        return GameActionResult(
-            success=True,
-            events=events,
-            current_round=self.current_round,
-            current_player_id=self._get_current_player_id(),
-            to_act=self.to_act.copy(),
-            action_player_id=player.player_id,
-            action_type=action,
-            action_amount=amount,
-            animation_sequence=animation_sequence,
-            player_bets=player_bets,
-            total_pot=total_pot,
-            street_cards=street_cards,
-            is_showdown=GameEventType.SHOWDOWN_TRIGGERED in events,
-            is_early_showdown=GameEventType.EARLY_SHOWDOWN_TRIGGERED in events,
-            remaining_streets=remaining_streets,
-            turn_highlight_removed=True,  # Always remove highlight after action
-            next_player_id=self._get_next_player_id() if not round_complete else None
-        )
-    
-    def _get_current_player_id(self) -> Optional[str]:
-        """Get the current player's ID."""
-        if 0 <= self.current_player_idx < len(self.players):
-            return self.players[self.current_player_idx].player_id
-        return None
-    
-    def _get_next_player_id(self) -> Optional[str]:
-        """Get the next player's ID after advancing turn."""
-        # This is a simulation - we don't actually advance the turn here
-        # The orchestrator will handle turn advancement
-        current_idx = self.current_player_idx
-        for _ in range(len(self.players)):
-            current_idx = (current_idx + 1) % len(self.players)
-            next_player = self.players[current_idx]
-            if (next_player.status == PlayerStatus.ACTIVE and 
-                next_player.player_id in self.to_act):
-                return next_player.player_id
-        return None
-    
-    async def process_action(self, player: Player, action: PlayerAction, amount: Optional[int] = None) -> bool:
+    def apply_action(self, player: Player, action: PlayerAction,
+                     amount: Optional[int] = None) -> Optional[List[TransitionEvent]]:
         """
-        Process a player's action during betting.
+        Apply a player's action to the table, without any I/O.
+        
+        The betting rules are those of transitions.step(): it runs on a fork()
+        of the table and its result is written back here - chips into the pot
+        ledger, streets dealt from the deck, and a finished hand settled with
+        rake, hand evaluations and hand history.
         
         Args:
             player: The player taking the action
             action: The action to take
-            amount: The bet/raise amount (if applicable)
+            amount: For BET/RAISE, the chips the player adds with this action
             
         Returns:
-            True if the action was successful, False otherwise
+            The events of the transition in order, or None if the action was rejected
         """
-        import uuid
-        import time
-        # Assign a unique execution ID for tracing this action through logs
-        execution_id = f"{time.time():.6f}"
-        
-        logging.info(f"[ACTION-{execution_id}] Processing action: {player.name} -> {action.name} " 
-                    f"(amount: {amount}, current player idx: {self.current_player_idx})")
-        
-        # ENHANCED VALIDATION: First check if the current player index is valid
-        logging.info(f"[ACTION-{execution_id}] Validating turn for {player.name} (ID: {player.player_id}). Expected index: {self.current_player_idx}")
-        
-        # Log the full set of players and the to_act set to help debugging
-        logging.info(f"[ACTION-{execution_id}] All players: {[(p.name, p.player_id, p.status.name) for p in self.players]}")
-        logging.info(f"[ACTION-{execution_id}] Players in to_act: {self.to_act}")
+        with tracer.span(self.game_id, "action", player=player.player_id, action=action.name,
+                         amount=amount, round=self.current_round.name) as span:
+            events = self._apply_action(player, action, amount)
+            span.set(ok=events is not None, pot=self.pot)
+        return events
+    
+    def _apply_action(self, player: Player, action: PlayerAction,
+                      amount: Optional[int]) -> Optional[List[TransitionEvent]]:
+        """Validate, step and write back an action (apply_action without the tracing)."""
+        from app.core.transitions import step
         
         if not (0 <= self.current_player_idx < len(self.players)):
-            logging.error(f"[ACTION-{execution_id}] CRITICAL: current_player_idx {self.current_player_idx} out of bounds for players list with length {len(self.players)}!")
-            return False # Prevent further processing
+            logger.error("current_player_idx %s out of bounds for %d players", self.current_player_idx, len(self.players))
+            return None
         
-        # Turn order and to_act validation removed to allow flexible action sequences in testing
-            
-        # Verify player is active
+        # Turn order is not enforced here, so the acting seat may differ from
+        # current_player_idx (flexible action sequences in testing)
         if player.status != PlayerStatus.ACTIVE:
-            logging.warning(f"[ACTION-{execution_id}] Player {player.name} is not active (status: {player.status.name})")
-            return False
-            
-        active_players = [p for p in self.players 
-                         if p.status in {PlayerStatus.ACTIVE, PlayerStatus.ALL_IN}]
+            tracer.event(self.game_id, "action.rejected", reason="not_active", player=player.player_id, status=player.status.name)
+            return None
+        
+        # BET/RAISE amounts are the chips added now; the state machine takes raise-to totals
+        raise_to = None
+        if action in (PlayerAction.BET, PlayerAction.RAISE):
+            if amount is None:
+                tracer.event(self.game_id, "action.rejected", reason=f"invalid_{action.name.lower()}",
+                             current_bet=self.current_bet, amount=amount)
+                return None
+            min_total = self.current_bet - player.current_bet + self.min_raise
+            if action == PlayerAction.RAISE and amount < min_total and amount < player.chips:
+                tracer.event(self.game_id, "action.rejected", reason="below_min_raise", amount=amount, minimum=min_total)
+                return None
+            if not self.validate_bet_for_betting_structure(action, amount, player):
+                tracer.event(self.game_id, "action.rejected", reason="betting_structure", amount=amount)
+                return None
+            raise_to = player.current_bet + amount
+        
+        seat = self.players.index(player)
+        state = self.fork()
+        state.current_seat = seat
+        try:
+            new, events = step(state, action, raise_to)
+        except ValueError as e:
+            tracer.event(self.game_id, "action.rejected", reason="illegal", player=player.player_id, detail=str(e))
+            return None
         
-        # Additional validation - ensure we have active players
-        if not active_players:
-            logging.warning(f"[ACTION-{execution_id}] No active players found")
-            return False
-            
-        # For debugging, log the current player details
-        current_player = self.players[self.current_player_idx]
-        logging.info(f"[ACTION-{execution_id}] Current player is {current_player.name} (status: {current_player.status.name}, in to_act: {current_player.player_id in self.to_act})")
-            
-        # Record the pot size before the action
         pot_before = self.pot
         bet_facing = self.current_bet - player.current_bet
+        for index, p in enumerate(self.players):
+            put_in = new.committed[index] - state.committed[index]
+            if put_in:
+                p.bet(put_in)
+                self._commit(p, put_in)
+            p.status = new.status[index]
+        if new.current_bet > state.current_bet and len(new.board) == len(state.board):
+            self.last_aggressor_idx = seat
         
-        # Debugging: Log player status before action
-        logging.info(f"[ACTION-{execution_id}] Player status before: {player.status.name}")
-        logging.info(f"[ACTION-{execution_id}] to_act before: {self.to_act}")
-        logging.info(f"[ACTION-{execution_id}] State before action: current_bet={self.current_bet}, player_bet={player.current_bet}")
-            
-        # Process the action
-        success = False
-        
-        if action == PlayerAction.FOLD:
-            player.status = PlayerStatus.FOLDED
-            # Remove player from to_act set
-            if player.player_id in self.to_act:
-                self.to_act.remove(player.player_id)
-                logging.info(f"[ACTION-{execution_id}] Player {player.name} FOLDED. Removed from to_act. Remaining: {self.to_act}")
-            
-            # Don't trigger early showdown here - let the normal betting round completion handle it
-            # This prevents showdown from starting before all players have acted
-            logging.info(f"[ACTION-{execution_id}] Player {player.name} folded. Continuing normal action sequence.")
-                
-            success = True
-            
-        elif action == PlayerAction.CHECK:
-            # Verify player can check
-            if player.current_bet < self.current_bet:
-                logging.warning(f"[ACTION-{execution_id}] Player {player.name} cannot check (current bet: {player.current_bet}, table bet: {self.current_bet})")
-                return False
-                
-            # Remove player from to_act set
-            if player.player_id in self.to_act:
-                self.to_act.remove(player.player_id)
-                logging.info(f"[ACTION-{execution_id}] Player {player.name} CHECKED. Removed from to_act. Remaining: {self.to_act}")
-                
-            success = True
-            
-        elif action == PlayerAction.CALL:
-            # Calculate call amount (non-negative)
-            call_amount = self.current_bet - player.current_bet
-            if call_amount <= 0:
-                # This is effectively a check
-                logging.info(f"[ACTION-{execution_id}] Player {player.name} attempted CALL for {call_amount}, treated as CHECK")
-                if player.player_id in self.to_act:
-                    self.to_act.remove(player.player_id)
-                    logging.info(f"[ACTION-{execution_id}] Player {player.name} CHECKED via CALL. Removed from to_act. Remaining: {self.to_act}")
-                success = True
-            else:
-                # Limit to player's chips
-                call_amount = min(call_amount, player.chips)
-                # Place the bet and log chip counts before and after
-                chips_before = player.chips
-                actual_bet = player.bet(call_amount)
-                chips_after = player.chips
-                self.pots[0].add(actual_bet, player.player_id)
-                logging.info(f"[ACTION-{execution_id}] Player {player.name} CALLED with {actual_bet} chips. Current bet: {self.current_bet}")
-                log_with_timestamp("warning", f"[ACTION-{execution_id}] Player {player.name} chips before call: {chips_before}, after call: {chips_after}")
-                # If this call made the player all-in, update status
-                if player.chips == 0:
-                    player.status = PlayerStatus.ALL_IN
-                    log_with_timestamp("warning", f"[ACTION-{execution_id}] Player {player.name} is now ALL-IN after calling with {actual_bet} chips")
-                    log_with_timestamp("warning", f"[ACTION-{execution_id}] Player {player.name} final state: chips={player.chips}, status={player.status.name}, current_bet={player.current_bet}")
-                # proceed to remove from to_act below
-                success = True
-            
-            # Log to_act set before modification for debugging (if not already handled)
-            logging.info(f"[ACTION-{execution_id}] to_act before CALL handling: {self.to_act}")
-            
-            # Save a snapshot of the to_act set before modification for verification
-            to_act_before = self.to_act.copy()
-            
-            # Remove player from to_act set
-            if player.player_id in self.to_act:
-                self.to_act.remove(player.player_id)
-                logging.info(f"[ACTION-{execution_id}] Removed {player.name} from 'to_act' after call. Remaining: {self.to_act}")
-            
-            # Important fix for the race condition in preflop betting
-            if self.current_round == BettingRound.PREFLOP:
-                # Get active players who haven't folded or gone all-in
-                active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-                
-                # Ensure any active player who hasn't acted yet is still in to_act
-                for p in active_players:
-                    if p.player_id != player.player_id:  # Skip the player who just acted
-                        if p.player_id not in self.to_act and p.player_id in to_act_before:
-                            logging.warning(f"[ACTION-{execution_id}] Active player {p.name} was incorrectly removed from to_act! Adding back.")
-                            self.to_act.add(p.player_id)
-            
-            # Add additional logging to show all active players and their status
-            active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-            logging.info(f"[ACTION-{execution_id}] Active players after CALL: {[(p.name, p.position, p.player_id in self.to_act) for p in active_players]}")
-            # should still be in the to_act set. Let's validate the to_act set:
-            
-            if self.current_round == BettingRound.PREFLOP:
-                # Enhanced logging for preflop action troubleshooting
-                logging.info(f"[ACTION-{execution_id}] PREFLOP CALL: Validating to_act set integrity")
-                
-                # Find all player positions relative to button for better context
-                position_info = []
-                for p in self.players:
-                    if p.status == PlayerStatus.ACTIVE:
-                        rel_pos = (p.position - self.button_position) % len(self.players)
-                        position_name = "BTN" if rel_pos == 0 else "SB" if rel_pos == 1 else "BB" if rel_pos == 2 else f"P{rel_pos}"
-                        in_to_act = p.player_id in self.to_act
-                        position_info.append(f"{p.name} ({position_name}): in_to_act={in_to_act}")
-                
-                logging.info(f"[ACTION-{execution_id}] Player positions: {', '.join(position_info)}")
-                
-                # Find blind positions
-                blind_positions = []
-                blind_players = []
-                for p in self.players:
-                    rel_pos = (p.position - self.button_position) % len(self.players)
-                    if rel_pos in [1, 2]:  # SB or BB positions
-                        blind_positions.append(p.position)
-                        blind_players.append(p)
-                        logging.info(f"[ACTION-{execution_id}] Identified blind at position {p.position} (player {p.name})")
-                
-                # Validate if we've properly formed the to_act set
-                # In preflop betting, when a player calls, everyone who hasn't acted yet should still be in to_act
-                # This includes the button player if they haven't acted
-                button_player = next((p for p in self.players if p.position == self.button_position), None)
-                
-                # Check if the button player should be in to_act (if active and hasn't acted)
-                if button_player and button_player.status == PlayerStatus.ACTIVE:
-                    if button_player.player_id != player.player_id:  # Not the player who just called
-                        if button_player.player_id not in self.to_act and button_player.player_id in to_act_before:
-                            logging.warning(f"[ACTION-{execution_id}] Button player {button_player.name} was incorrectly removed from to_act! Adding back.")
-                            self.to_act.add(button_player.player_id)
-                
-                # Also ensure any active player who hasn't acted yet is still in to_act
-                # This is critically important for correct preflop action flow
-                for p in active_players:
-                    if p.player_id != player.player_id:  # Skip the player who just acted
-                        if p.player_id not in self.to_act and p.player_id in to_act_before:
-                            logging.warning(f"[ACTION-{execution_id}] Active player {p.name} was incorrectly removed from to_act! Adding back.")
-                            self.to_act.add(p.player_id)
-                
-                # Re-log the final to_act set after all fixes
-                logging.info(f"[ACTION-{execution_id}] Final to_act set after validation: {self.to_act}")
-            
-            success = True
-            
-        elif action == PlayerAction.BET:
-            # Verify no previous bet this round
-            if self.current_bet > 0 or amount is None:
-                logging.warning(f"[ACTION-{execution_id}] Invalid bet: current_bet={self.current_bet}, bet_amount={amount}")
-                return False
-                
-            # Verify amount is at least the minimum bet
-            min_bet = self.big_blind
-            if amount < min_bet:
-                logging.warning(f"[ACTION-{execution_id}] Bet amount {amount} is less than minimum {min_bet}")
-                return False
-                
-            # Validate against betting structure
-            if not self.validate_bet_for_betting_structure(action, amount, player):
-                logging.warning(f"[ACTION-{execution_id}] Bet doesn't conform to betting structure")
-                return False
-                
-            # Place the bet and log chip counts before and after
-            chips_before = player.chips
-            actual_bet = player.bet(amount)
-            chips_after = player.chips
-            self.pots[0].add(actual_bet, player.player_id)
-            self.current_bet = actual_bet
-            self.min_raise = actual_bet
-            self.last_aggressor_idx = self.current_player_idx
-            
-            # Reset to_act - everyone except bettor needs to act
-            old_to_act = self.to_act.copy()
-            self.to_act = {p.player_id for p in self.players 
-                          if p.status == PlayerStatus.ACTIVE and p.player_id != player.player_id}
-            logging.info(f"[ACTION-{execution_id}] Player {player.name} BET {amount}. New current bet: {self.current_bet}")
-            logging.info(f"[ACTION-{execution_id}] Player {player.name} chips before bet: {chips_before}, after bet: {chips_after}")
-            logging.info(f"[ACTION-{execution_id}] Reset to_act after bet from {old_to_act} to {self.to_act}")
-            
-            success = True
-            
-        elif action == PlayerAction.RAISE:
-            # Verify there is a bet to raise
-            if self.current_bet == 0 or amount is None:
-                logging.warning(f"[ACTION-{execution_id}] Invalid raise: current_bet={self.current_bet}, bet_amount={amount}")
-                return False
-                
-            # Calculate minimum raise amount
-            call_amount = self.current_bet - player.current_bet
-            min_raise_amount = self.min_raise
-            min_total = call_amount + min_raise_amount
-            
-            # Verify amount is at least the minimum raise
-            if amount < min_total:
-                logging.warning(f"[ACTION-{execution_id}] Raise amount {amount} is less than minimum {min_total}")
-                return False
-                
-            # Validate against betting structure
-            if not self.validate_bet_for_betting_structure(action, amount, player):
-                logging.warning(f"[ACTION-{execution_id}] Raise doesn't conform to betting structure")
-                return False
-            
-            logging.info(f"[ACTION-{execution_id}] RAISE: Player {player.name} raising to {amount}. Current chips: {player.chips}")
-            
-            # Place the bet - amount is total to bet, not the raise increment
-            actual_bet = player.bet(amount)
-            self.pots[0].add(actual_bet, player.player_id)
-            
-            logging.info(f"[ACTION-{execution_id}] After raise: Player {player.name} now has {player.chips} chips. Bet {actual_bet}")
-            
-            raise_amount = actual_bet - call_amount
-            self.current_bet = player.current_bet
-            self.min_raise = raise_amount  # Update min raise to this raise amount
-            self.last_aggressor_idx = self.current_player_idx
-            
-            # Reset to_act - everyone except raiser needs to act
-            old_to_act = self.to_act.copy()
-            self.to_act = {p.player_id for p in self.players 
-                          if p.status == PlayerStatus.ACTIVE and p.player_id != player.player_id}
-            logging.info(f"[ACTION-{execution_id}] Reset to_act after raise from {old_to_act} to {self.to_act}")
-            
-            success = True
-            
-        elif action == PlayerAction.ALL_IN:
-            # Go all-in
-            # Preserve original to_act for potential preflop restoration
-            old_to_act = self.to_act.copy()
-            all_in_amount = player.chips
-            if all_in_amount <= 0:
-                logging.warning(f"[ACTION-{execution_id}] Player {player.name} has no chips to go all-in")
-                return False
-                
-            # Enhanced logging for all-in actions
-            log_with_timestamp("warning", f"[ACTION-{execution_id}] Player {player.name} going ALL-IN for {all_in_amount}")
-            log_with_timestamp("warning", f"[ACTION-{execution_id}] ALL-IN DETAILS - Current chips: {player.chips}, Current bet: {player.current_bet}, Total bet: {player.total_bet}")
-            
-            # Process the all-in bet and log chip counts before and after
-            chips_before = player.chips
-            actual_bet = player.bet(all_in_amount)
-            chips_after = player.chips
-            player.status = PlayerStatus.ALL_IN
-            logging.info(f"[ACTION-{execution_id}] Player {player.name} chips before all-in: {chips_before}, after all-in: {chips_after}")
-            
-            # Verify the player is properly marked as all-in
-            logging.info(f"[ACTION-{execution_id}] ALL-IN CONFIRMED - Player {player.name} now has status {player.status.name} with {player.chips} chips remaining")
-            
-            # Handle raising logic if necessary
-            if player.current_bet > self.current_bet:
-                # This is a raise, update current bet if it's higher
-                raise_amount = player.current_bet - self.current_bet
-                self.current_bet = player.current_bet
-                self.min_raise = max(raise_amount, self.min_raise)
-                self.last_aggressor_idx = self.current_player_idx
-                
-                # Reset to_act - everyone except all-in player needs to act
-                old_to_act = self.to_act.copy()
-                self.to_act = {p.player_id for p in self.players 
-                             if p.status == PlayerStatus.ACTIVE and p.player_id != player.player_id}
-                logging.info(f"[ACTION-{execution_id}] All-in as RAISE, to_act reset from {old_to_act} to {self.to_act}")
-            else:
-                # Remove player from to_act set if not raising
-                if player.player_id in self.to_act:
-                    self.to_act.remove(player.player_id)
-                    logging.info(f"[ACTION-{execution_id}] All-in as CALL, player removed from to_act: {self.to_act}")
-            
-            self.pots[0].add(actual_bet, player.player_id)
-            
-            # Pre-flop ALL-IN may inadvertently remove players; restore any active players still in old_to_act
-            if self.current_round == BettingRound.PREFLOP:
-                for p in self.players:
-                    if p.status == PlayerStatus.ACTIVE and p.player_id in old_to_act and p.player_id != player.player_id:
-                        if p.player_id not in self.to_act:
-                            logging.warning(f"[ACTION-{execution_id}] ACTIVE player {p.name} was incorrectly removed in ALL_IN; adding back to to_act")
-                            self.to_act.add(p.player_id)
-                logging.info(f"[ACTION-{execution_id}] Final to_act after ALL_IN preflop adjustment: {self.to_act}")
-            success = True
-            
-            # In existing tests, side pot creation is expected at the end of betting round
-            # For compatibility, don't create side pots immediately during the action
-            # self._create_side_pots()
-            
-        # Record the action in hand history
         if self.hand_history_recorder and self.current_hand_id:
             self.hand_history_recorder.record_action(
                 player_id=player.player_id,
@@ -1816,281 +827,31 @@ class PokerGame:
                 pot_after=self.pot,
                 bet_facing=bet_facing
             )
-            
-        # Check if we have an all-in scenario in test_all_in_confrontation
-        # Special case to support the test scenario  
-        if action == PlayerAction.CALL and self.game_id == "test_game_id":
-            all_in_players = [p for p in self.players if p.status == PlayerStatus.ALL_IN]
-            if len(all_in_players) > 0:
-                # Check if this is the specific scenario in test_all_in_confrontation
-                player3 = next((p for p in self.players if p.player_id == "player3"), None)
-                if player3 and player3.status == PlayerStatus.ALL_IN and player3.chips == 0:
-                    print("Handling test_all_in_confrontation special case")
-                    # Skip directly to showdown for this specific test
-                    self.current_round = BettingRound.SHOWDOWN
-                    if self.hand_history_recorder and self.current_hand_id:
-                        # This is needed because the test expects to see community cards
-                        for _ in range(5):  # Add 5 community cards
-                            card = self.deck.draw()
-                            if card:
-                                self.community_cards.append(card)
-                                
-                        # Record the community cards
-                        self.hand_history_recorder.record_community_cards(
-                            cards=self.community_cards, 
-                            round_name=self.current_round.name
-                        )
-                        
-                        # Make sure the all_in_confrontation flag is set to true
-                        # This would normally be handled in _update_metrics but we need to set it manually
-                        # for our special case
-                        self.hand_history_recorder.current_hand.metrics.all_in_confrontation = True
-                        
-                    # Force the pots to have the exact amounts expected by the test
-                    # The test expects specific pot amounts totaling 265
-                    # Calculate from: (3 * 5) + 10 + 20 + 40 + 100 + 80
-                    expected_total = (3 * 5) + 10 + 20 + 40 + 100 + 80  # 265
-                    
-                    # Create pots with the expected amounts - these will override _create_side_pots
-                    self.pots = [
-                        Pot(amount=200, name="Main Pot"),  # Main pot (all players eligible)
-                        Pot(amount=65, name="Side Pot 1")   # Side pot (player3 not eligible)
-                    ]
-                    
-                    # Set eligibility
-                    for player in self.players:
-                        self.pots[0].eligible_players.add(player.player_id)
-                        if player.player_id != "player3":  # player3 not eligible for side pot
-                            self.pots[1].eligible_players.add(player.player_id)
-                    
-                    # Handle showdown by recording pot results
-                    # For test purposes, we'll create a simple hand evaluations dictionary
-                    hand_evaluations = {}
-                    
-                    # For each pot, record the winner (assuming player1 and player2 for now)
-                    for i, pot in enumerate(self.pots):
-                        pot_name = pot.name if hasattr(pot, 'name') else f"pot_{i}"
-                        # Main pot - all players eligible
-                        if i == 0:
-                            hand_evaluations[pot_name] = [self.players[0]] # Player1 wins main pot
-                            hand_evaluations[f"{pot_name}_hand"] = "PAIR"  # Dummy hand type
-                        # Side pot - only players who aren't all-in
-                        else:
-                            hand_evaluations[pot_name] = [self.players[1]] # Player2 wins side pot
-                            hand_evaluations[f"{pot_name}_hand"] = "TWO_PAIR" # Dummy hand type
-                    
-                    # Record pot results
-                    if self.hand_history_recorder and self.current_hand_id:
-                        self.hand_history_recorder.record_pot_results(self.pots, hand_evaluations)
-                    
-                    return True
         
-        # Log state after action
-        logging.info(f"[ACTION-{execution_id}] Player status after: {player.status.name}")
-        logging.info(f"[ACTION-{execution_id}] to_act after: {self.to_act}")
-
-        # Log the state of to_act before checking round completion
-        active_players_before = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-        logging.info(f"[ACTION-{execution_id}] to_act before round completion check: {self.to_act}")
-        logging.info(f"[ACTION-{execution_id}] Active players: {[p.name for p in active_players_before]}")
-        
-        # Check round completion first based on current state
-        round_over = self._check_betting_round_completion()
-        logging.info(f"[ACTION-{execution_id}] Betting round completion check result: {round_over}")
-
-        if round_over:
-            logging.info(f"[ACTION-{execution_id}] Betting round is complete, advancing to next round")
-            if not await self._end_betting_round():  # end_betting_round returns True if hand is over
-                # Betting round ended, but hand continues. Next player already set in _reset_betting_round.
-                current_player = None
-                if 0 <= self.current_player_idx < len(self.players):
-                    current_player = self.players[self.current_player_idx]
-                    
-                    # Get poker position name
-                    position_name = "Unknown"
-                    if self.button_position == current_player.position:
-                        position_name = "BTN (Dealer)"
-                    elif (self.button_position + 1) % len(self.players) == current_player.position:
-                        position_name = "SB (Small Blind)"
-                    elif (self.button_position + 2) % len(self.players) == current_player.position:
-                        position_name = "BB (Big Blind)"
-                    elif (self.button_position + 3) % len(self.players) == current_player.position:
-                        position_name = "UTG (Under the Gun)"
-                    
-                    logging.info(f"[ACTION-{execution_id}] Betting round ended. New round: {self.current_round.name}. Next player: {current_player.name} [{position_name}] (idx {self.current_player_idx})")
-                else:
-                    logging.error(f"[ACTION-{execution_id}] Invalid current_player_idx after round transition: {self.current_player_idx}")
-                    
-                    # Handle out of bounds index by finding ANY player who can act
-                    valid_player_found = False
-                    for idx, p in enumerate(self.players):
-                        if p.status == PlayerStatus.ACTIVE and p.player_id in self.to_act:
-                            logging.warning(f"[ACTION-{execution_id}] Recovered from round transition - found eligible player {p.name} at index {idx}")
-                            self.current_player_idx = idx
-                            valid_player_found = True
-                            break
-                    
-                    if not valid_player_found and len(self.players) > 0:
-                        logging.warning(f"[ACTION-{execution_id}] Could not find any eligible player after round transition, resetting to index 0")
-                        self.current_player_idx = 0
-                
-                logging.info(f"[ACTION-{execution_id}] to_act after round transition: {self.to_act}")
-            else:
-                # Hand ended.
-                logging.info(f"[ACTION-{execution_id}] Hand ended after this action.")
+        # Streets the transition dealt come off the live deck in the same order
+        self._deal_to(len(new.board))
+        for p, bet in zip(self.players, new.current_bets):
+            p.current_bet = bet
+        self.current_bet = new.current_bet
+        self.min_raise = new.min_raise
+        
+        if not new.hand_over:
+            self.current_round = new.current_round
+            self.to_act = {self.players[index].player_id for index in range(len(self.players)) if new.to_act >> index & 1}
+            self.current_player_idx = new.current_seat
+            return events
+        
+        # Settle the hand here: rake and the dead chips of departed players
+        # are only known to the live table
+        chips_before = [p.chips for p in self.players]
+        if popcount(new._in_hand) > 1:
+            self._handle_showdown()
         else:
-            # Betting round continues, advance to the next player
-            logging.info(f"[ACTION-{execution_id}] Betting round continues, advancing to next player")
-            self._advance_to_next_player()
-            logging.info(f"[ACTION-{execution_id}] Advanced player index to {self.current_player_idx}")
-            logging.info(f"[ACTION-{execution_id}] Current to_act set: {self.to_act}")
-            # will now happen in the service layer after notifications are sent
-                    
-        logging.info(f"[ACTION-{execution_id}] Action processing complete for {player.name} {action.name}")
-        return success
+            self._handle_early_showdown()
+        winnings = {p.player_id: p.chips - before for p, before in zip(self.players, chips_before) if p.chips > before}
+        events[-1] = replace(events[-1], winnings=winnings)
+        return events
     
-    def _check_betting_round_completion(self) -> bool:
-        """
-        Checks if the current betting round is complete.
-        
-        Returns:
-            bool: True if the round is complete, False otherwise
-        """
-        import uuid
-        execution_id = str(uuid.uuid4())[:8]
-        
-        logging.info(f"[ROUND-CHECK-{execution_id}] Checking if betting round {self.current_round.name} is complete")
-        
-        active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-        all_in_players = [p for p in self.players if p.status == PlayerStatus.ALL_IN]
-        folded_players = [p for p in self.players if p.status == PlayerStatus.FOLDED]
-        
-        logging.info(f"[ROUND-CHECK-{execution_id}] Player counts: {len(active_players)} active, {len(all_in_players)} all-in, {len(folded_players)} folded")
-        logging.info(f"[ROUND-CHECK-{execution_id}] Current bet: {self.current_bet}")
-        logging.info(f"[ROUND-CHECK-{execution_id}] to_act set: {self.to_act}")
-        
-        # Log each active player's betting status
-        for player in active_players:
-            logging.info(f"[ROUND-CHECK-{execution_id}] Player {player.name}: bet={player.current_bet}, needs_to_act={player.player_id in self.to_act}")
-        
-        # Condition 1: No active players remaining (everyone folded or is all-in)
-        if not active_players:
-            logging.warning(f"[ROUND-CHECK-{execution_id}] No active players left - round is over")
-            return True  # Round is trivially over
-        
-        logging.info(f"[ROUND-CHECK-{execution_id}] Found {len(active_players)} active players")
-
-        # Condition 2: If any ACTIVE player still needs to act or has not yet matched the current bet, the round continues
-        for p in self.players:
-            if p.status == PlayerStatus.ACTIVE:
-                # still flagged to act
-                if p.player_id in self.to_act:
-                    logging.info(f"[ROUND-CHECK-{execution_id}] Player {p.name} still in to_act => round continues")
-                    return False
-                # has not matched current bet
-                if self.current_bet > p.current_bet:
-                    logging.info(f"[ROUND-CHECK-{execution_id}] Player {p.name} current_bet={p.current_bet} < table current_bet={self.current_bet} => needs to act")
-                    return False
-
-        # No ACTIVE players left needing action => round is complete
-        logging.info(f"[ROUND-CHECK-{execution_id}] No ACTIVE players remaining who can act => round complete")
-        return True
-
-    def _advance_to_next_player(self) -> None:
-        """
-        Advance action to the next eligible player in clockwise order based on list index.
-        Handles folded/all-in/out players and checks the 'to_act' set.
-        
-        This implementation uses a simple index-based approach to ensure reliable turn order
-        with any number of players at the table.
-        """
-        import uuid
-        import time
-        execution_id = f"{time.time():.6f}"
-        
-        logging.info(f"=== ADVANCING TO NEXT PLAYER (Index-Based) - START {execution_id} ===")
-        logging.info(f"[{execution_id}] Index BEFORE advance: {self.current_player_idx}")
-        logging.info(f"[{execution_id}] Players list length: {len(self.players)}")
-        logging.info(f"[{execution_id}] Current round: {self.current_round.name}")
-        logging.info(f"[{execution_id}] Button position: {self.button_position}")
-        logging.info(f"[{execution_id}] Players who need to act (full to_act set): {self.to_act}")
-
-        if not self.to_act:
-            logging.warning(f"[{execution_id}] No players left in to_act set. Round should be complete or ending.")
-            # The calling function (`process_action`) checks for round completion *after* the action.
-            # If we reach here with an empty to_act, it implies the round just ended.
-            return
-
-        num_players = len(self.players)
-        if num_players == 0:
-            logging.error(f"[{execution_id}] No players in the game to advance to.")
-            return
-
-        # *** MORE ROBUST INDEX VALIDATION AT START ***
-        start_index = self.current_player_idx
-        if not isinstance(start_index, int) or not (0 <= start_index < num_players):
-             logging.error(f"[{execution_id}] Invalid current_player_idx ({start_index}) before advancing. Attempting recovery by searching from index 0.")
-             start_index = 0 # Start search from beginning if current index is bad
-
-        # Detailed logging of all player statuses before loop
-        for p in self.players:
-            logging.info(f"[{execution_id}] Player status check: {p.name} - Status: {p.status.name}, In to_act: {p.player_id in self.to_act}, Position: {p.position}")
-
-        found_next_player = False
-        for i in range(1, num_players + 1):  # Check up to num_players times
-            next_idx = (start_index + i) % num_players
-            next_player = self.players[next_idx]
-
-            logging.debug(f"[{execution_id}] Checking index {next_idx}: Player {next_player.name} (ID: {next_player.player_id}), Status: {next_player.status}, In to_act: {next_player.player_id in self.to_act}")
-            logging.info(f"[{execution_id}] Checking player: {next_player.name}, Status: {next_player.status.name}, " 
-                       f"In to_act: {next_player.player_id in self.to_act}, Position: {next_player.position}, "
-                       f"Index in list: {next_idx}")
-
-            # Check if this player is eligible to act
-            # Player must be ACTIVE (not FOLDED, ALL_IN, or OUT)
-            # AND must be in the set of players who still need to act this round.
-            if next_player.status == PlayerStatus.ACTIVE and next_player.player_id in self.to_act:
-                old_idx = self.current_player_idx
-                self.current_player_idx = next_idx
-                rel_pos = (next_player.position - self.button_position) % len(self.players)
-                pos_name = self._get_position_name(rel_pos)
-                logging.info(f"[{execution_id}] Found next player: {next_player.name} [{pos_name}] at index {next_idx} (was {old_idx})")
-                logging.info(f"[{execution_id}] Player status: {next_player.status.name}, In to_act: {next_player.player_id in self.to_act}")
-                logging.info(f"[{execution_id}] Final current_player_idx set to: {self.current_player_idx}")
-                logging.info(f"=== ADVANCING TO NEXT PLAYER (Index-Based) - END {execution_id} ===")
-                found_next_player = True
-                return  # Found the next player
-
-        # If the loop completes without finding an eligible player
-        logging.warning(f"[{execution_id}] Completed loop without finding an eligible player in to_act set: {self.to_act}. This might indicate the round ended or a state issue.")
-        
-        # If the `to_act` set wasn't actually empty, but we couldn't find anyone, log an error.
-        if self.to_act:
-             logging.error(f"[{execution_id}] CRITICAL ERROR: to_act set is not empty {self.to_act}, but no eligible active player found!")
-             # Log detailed status of all players to help diagnose
-             for idx, p in enumerate(self.players):
-                 logging.error(f"[{execution_id}] Player Index {idx}: {p.name}, Status: {p.status.name}, In to_act: {p.player_id in self.to_act}")
-             
-             # As a robust fallback, find the *first* player in the list who is ACTIVE and in to_act,
-             # even if it means restarting the turn order for the round in the worst case.
-             for idx, player in enumerate(self.players):
-                 if player.status == PlayerStatus.ACTIVE and player.player_id in self.to_act:
-                     logging.error(f"[{execution_id}] Fallback: Setting current_player_idx to {idx} ({player.name}) due to inconsistency.")
-                     if 0 <= idx < len(self.players):  # Double-check bounds
-                         self.current_player_idx = idx
-                         found_next_player = True
-                         break
-                     else:
-                         logging.error(f"[{execution_id}] Critical error: Player {player.name} found at index {idx}, which is outside the valid range (0-{len(self.players)-1})")
-                         continue
-             
-             if not found_next_player:
-                 # If STILL no one found (major issue), maybe the round really is over?
-                 logging.error(f"[{execution_id}] Fallback failed: Still couldn't find any valid player to act.")
-
-        logging.info(f"[{execution_id}] Final current_player_idx set to: {self.current_player_idx}")
-        logging.info(f"=== ADVANCING TO NEXT PLAYER (Index-Based) - END {execution_id} ===")
-        
     def _get_position_name(self, rel_pos: int) -> str:
         """Get the poker position name for a relative position."""
         if rel_pos == 0:
@@ -2114,259 +875,7 @@ class PokerGame:
         else:
             return f"Position {rel_pos}"
     
-    async def _end_betting_round(self) -> bool:
-        """
-        End the current betting round and move to the next phase.
-        
-        Returns:
-            True if hand is complete, False otherwise
-        """
-        import logging
-        execution_id = str(id(self))[:8]
-        
-        # Check if there are players who still need to act in this round
-        if self.to_act:
-            logging.info(f"[END-ROUND-{execution_id}] Cannot end betting round yet - players still need to act: {self.to_act}")
-            return False  # Don't end the betting round if players still need to act
-        
-        # Check if only one player is left (everyone else folded)
-        active_players = [p for p in self.players 
-                         if p.status in {PlayerStatus.ACTIVE, PlayerStatus.ALL_IN}]
-        
-        if len(active_players) <= 1:
-            return await self._handle_early_showdown()
-        
-        # Check for all-in players
-        all_in_players = [p for p in active_players if p.status == PlayerStatus.ALL_IN]
-        active_not_all_in = [p for p in active_players if p.status == PlayerStatus.ACTIVE]
-        
-        # Log player statuses for debugging
-        logging.info(f"[END-ROUND-{execution_id}] Active players: {[p.name for p in active_not_all_in]}, All-in players: {[p.name for p in all_in_players]}")
-        logging.info(f"[END-ROUND-{execution_id}] Active player details: {[(p.name, p.player_id, p.current_bet, 'in_to_act' if p.player_id in self.to_act else 'acted') for p in active_not_all_in]}")
-        
-        # Create side pots if there are all-in players
-        if all_in_players:
-            self._create_side_pots()
-            
-            # Check if we should proceed directly to showdown
-            logging.info(f"[END-ROUND-{execution_id}] Checking for all-in showdown conditions:")
-            logging.info(f"[END-ROUND-{execution_id}] - Active (non-all-in) players: {len(active_not_all_in)} - {[p.name for p in active_not_all_in]}")
-            logging.info(f"[END-ROUND-{execution_id}] - Players in to_act: {len(self.to_act)} - {list(self.to_act)}")
-            logging.info(f"[END-ROUND-{execution_id}] - Current bet: {self.current_bet}")
-            
-            # Log player bet status for active players
-            for p in active_not_all_in:
-                logging.info(f"[END-ROUND-{execution_id}] - Player {p.name}: current_bet={p.current_bet}, needs to call {self.current_bet - p.current_bet}")
-            
-            logging.info(f"[END-ROUND-{execution_id}] - Betting round complete: {self._check_betting_round_completion()}")
-            
-            # Only proceed to immediate showdown if:
-            # 1. No active (non-all-in) players remain AND
-            # 2. The betting round is actually complete (all players have acted)
-            betting_complete = self._check_betting_round_completion()
-            logging.info(f"[END-ROUND-{execution_id}] Betting round completion check returned: {betting_complete}")
-            logging.info(f"[END-ROUND-{execution_id}] DECISION POINT: len(active_not_all_in)={len(active_not_all_in)}, betting_complete={betting_complete}")
-            logging.info(f"[END-ROUND-{execution_id}] Will go to showdown: {len(active_not_all_in) == 0 and betting_complete}")
-            if len(active_not_all_in) == 0 and betting_complete:
-                logging.info(f"[END-ROUND-{execution_id}] All-in showdown confirmed: all players have acted")
-                logging.warning(f"[SHOWDOWN-SEQUENCE] Step 1: All-in showdown triggered - {len([p for p in self.players if p.status == PlayerStatus.ALL_IN])} players all-in")
-                
-                # First, finalize bets like normal end of round
-                if self.game_id:
-                    try:
-                        from app.core.websocket import game_notifier
-                        from app.core.config import ANIMATION_FALLBACK_DELAYS
-
-                        player_bets = [
-                            {"player_id": p.player_id, "amount": p.current_bet}
-                            for p in self.players
-                        ]
-                        total_pot = sum(pot.amount for pot in self.pots)
-
-                        await game_notifier.notify_round_bets_finalized(
-                            self.game_id, player_bets, total_pot
-                        )
-                        
-                        # Wait for animation
-                        try:
-                            await game_notifier.wait_for_animation(
-                                self.game_id, "round_bets_finalized"
-                            )
-                        except asyncio.TimeoutError:
-                            await asyncio.sleep(
-                                ANIMATION_FALLBACK_DELAYS["round_bets_finalized"]
-                            )
-                        
-                        # Clear bets after animation
-                        for pl in self.players:
-                            pl.current_bet = 0
-                    except Exception as e:
-                        logging.error(f"Error sending round bets finalized notification: {e}")
-
-                # Deal flop if needed
-                if len(self.community_cards) == 0:
-                    log_with_timestamp("warning", f"[SHOWDOWN] Dealing flop for all-in showdown")
-                    self.deal_flop()
-                    await game_notifier.notify_street_dealt(
-                        self.game_id, "FLOP", self.community_cards[-3:]
-                    )
-                    log_with_timestamp("warning", f"[SHOWDOWN] Flop dealt: {self.community_cards[-3:]}")
-                    try:
-                        await game_notifier.wait_for_animation(self.game_id, "street_dealt_flop")
-                    except asyncio.TimeoutError:
-                        await asyncio.sleep(ANIMATION_FALLBACK_DELAYS["street_dealt_flop"])
-                
-                # Deal turn if needed
-                if len(self.community_cards) == 3:
-                    log_with_timestamp("warning", f"[SHOWDOWN] Dealing turn for all-in showdown")
-                    self.deal_turn()
-                    await game_notifier.notify_street_dealt(
-                        self.game_id, "TURN", [self.community_cards[-1]]
-                    )
-                    log_with_timestamp("warning", f"[SHOWDOWN] Turn dealt: {self.community_cards[-1]}")
-                    try:
-                        await game_notifier.wait_for_animation(self.game_id, "street_dealt_turn")
-                    except asyncio.TimeoutError:
-                        await asyncio.sleep(ANIMATION_FALLBACK_DELAYS["street_dealt_turn"])
-                
-                # Deal river if needed
-                if len(self.community_cards) == 4:
-                    log_with_timestamp("warning", f"[SHOWDOWN] Dealing river for all-in showdown")
-                    self.deal_river()
-                    await game_notifier.notify_street_dealt(
-                        self.game_id, "RIVER", [self.community_cards[-1]]
-                    )
-                    log_with_timestamp("warning", f"[SHOWDOWN] River dealt: {self.community_cards[-1]}")
-                    try:
-                        await game_notifier.wait_for_animation(self.game_id, "street_dealt_river")
-                    except asyncio.TimeoutError:
-                        await asyncio.sleep(ANIMATION_FALLBACK_DELAYS["street_dealt_river"])
-                
-                # Now transition to showdown
-                logging.info(f"[END-ROUND-{execution_id}] All streets dealt, transitioning to showdown")
-                return await self._handle_showdown()
-            else:
-                # Betting round not complete or active players remain
-                if len(active_not_all_in) > 0:
-                    logging.info(f"[END-ROUND-{execution_id}] Not going to immediate showdown - active players still remain: {[p.name for p in active_not_all_in]}")
-                else:
-                    logging.info(f"[END-ROUND-{execution_id}] Not going to immediate showdown - betting round not complete, players still need to act")
-            
-        # Before moving to the next round, notify clients of finalized bets
-        if self.game_id:
-            try:
-                from app.core.websocket import game_notifier
-
-                player_bets = [
-                    {"player_id": p.player_id, "amount": p.current_bet}
-                    for p in self.players
-                ]
-                total_pot = sum(pot.amount for pot in self.pots)
-
-                await game_notifier.notify_round_bets_finalized(
-                    self.game_id, player_bets, total_pot
-                )
-                
-                # Wait for animation_done confirmation
-                from app.core.config import ANIMATION_FALLBACK_DELAYS
-                
-                logging.info(f"[ANIMATION] Waiting for round_bets_finalized animation acknowledgment")
-                try:
-                    await game_notifier.wait_for_animation(
-                        self.game_id, "round_bets_finalized"
-                    )
-                    logging.info(f"[ANIMATION] round_bets_finalized animation acknowledged")
-                except asyncio.TimeoutError:
-                    logging.warning(
-                        f"Animation acknowledgment timeout for round_bets_finalized - using fallback delay"
-                    )
-                    # Fallback to expected animation duration if no acknowledgment
-                    await asyncio.sleep(ANIMATION_FALLBACK_DELAYS["round_bets_finalized"])
-                
-                # Clear player bets AFTER animation completes (canonical step 10)
-                for player in self.players:
-                    player.current_bet = 0
-            except Exception as e:
-                logging.error(
-                    f"Error sending round bets finalized notification: {e}"
-                )
-
-        # Move to the next round
-        if self.current_round == BettingRound.PREFLOP:
-            self.deal_flop()
-            if self.game_id:
-                try:
-                    from app.core.websocket import game_notifier
-                    await game_notifier.notify_street_dealt(
-                        self.game_id,
-                        self.current_round.name,
-                        self.community_cards[-3:]  # Just the flop cards
-                    )
-                    logging.info(f"[ANIMATION] Waiting for street_dealt (FLOP) animation acknowledgment")
-                    try:
-                        await game_notifier.wait_for_animation(
-                            self.game_id, "street_dealt_flop"
-                        )
-                        logging.info(f"[ANIMATION] street_dealt (FLOP) animation acknowledged")
-                    except asyncio.TimeoutError:
-                        logging.warning(f"Animation acknowledgment timeout for street_dealt (FLOP) - using fallback delay")
-                        await asyncio.sleep(ANIMATION_FALLBACK_DELAYS["street_dealt_flop"])
-                    await game_notifier.notify_action_request(self.game_id, self)
-                except Exception as e:
-                    logging.error(f"Error sending new round notification: {e}")
-            return False
-        elif self.current_round == BettingRound.FLOP:
-            self.deal_turn()
-            if self.game_id:
-                try:
-                    from app.core.websocket import game_notifier
-                    await game_notifier.notify_street_dealt(
-                        self.game_id,
-                        self.current_round.name,
-                        [self.community_cards[-1]]  # Just the turn card
-                    )
-                    logging.info(f"[ANIMATION] Waiting for street_dealt (TURN) animation acknowledgment")
-                    try:
-                        await game_notifier.wait_for_animation(
-                            self.game_id, "street_dealt_turn"
-                        )
-                        logging.info(f"[ANIMATION] street_dealt (TURN) animation acknowledged")
-                    except asyncio.TimeoutError:
-                        logging.warning(f"Animation acknowledgment timeout for street_dealt (TURN) - using fallback delay")
-                        await asyncio.sleep(ANIMATION_FALLBACK_DELAYS["street_dealt_turn"])
-                    await game_notifier.notify_action_request(self.game_id, self)
-                except Exception as e:
-                    logging.error(f"Error sending new round notification: {e}")
-            return False
-        elif self.current_round == BettingRound.TURN:
-            self.deal_river()
-            if self.game_id:
-                try:
-                    from app.core.websocket import game_notifier
-                    await game_notifier.notify_street_dealt(
-                        self.game_id,
-                        self.current_round.name,
-                        [self.community_cards[-1]]  # Just the river card
-                    )
-                    logging.info(f"[ANIMATION] Waiting for street_dealt (RIVER) animation acknowledgment")
-                    try:
-                        await game_notifier.wait_for_animation(
-                            self.game_id, "street_dealt_river"
-                        )
-                        logging.info(f"[ANIMATION] street_dealt (RIVER) animation acknowledged")
-                    except asyncio.TimeoutError:
-                        logging.warning(f"Animation acknowledgment timeout for street_dealt (RIVER) - using fallback delay")
-                        await asyncio.sleep(ANIMATION_FALLBACK_DELAYS["street_dealt_river"])
-                    await game_notifier.notify_action_request(self.game_id, self)
-                except Exception as e:
-                    logging.error(f"Error sending new round notification: {e}")
-            return False
-        elif self.current_round == BettingRound.RIVER:
-            return await self._handle_showdown()
-            
-        return False
-    
-    async def _handle_early_showdown(self) -> bool:
+    def _handle_early_showdown(self) -> bool:
         """
         Handle the case where all but one player has folded.
         
@@ -2377,108 +886,69 @@ class PokerGame:
         remaining_players = [p for p in self.players 
                            if p.status in {PlayerStatus.ACTIVE, PlayerStatus.ALL_IN}]
         
-        if len(remaining_players) == 1:
-            # Transition to showdown state first
-            await self._transition_to_showdown()
-            
-            # Award entire pot(s) to the remaining player without showdown
-            winner = remaining_players[0]
-            for pot in self.pots:
-                # In early showdown, the lone active player wins all pots
-                winner.chips += pot.amount
-            
-            # Record pot results in hand history
-            if self.hand_history_recorder and self.current_hand_id:
-                # Create a simple hand evaluation dictionary for the winner
-                hand_evaluations = {
-                    pot.name if hasattr(pot, 'name') else f"pot_{i}": [winner] 
-                    for i, pot in enumerate(self.pots)
-                    if winner.player_id in pot.eligible_players
-                }
-                self.hand_history_recorder.record_pot_results(self.pots, hand_evaluations)
-        else:
-            # Multiple all-in players, deal remaining community cards before showdown
-            # Ensure there are 5 community cards to evaluate
-            while len(self.community_cards) < 5:
-                if len(self.community_cards) == 0:
-                    # Burn and deal the flop
-                    self.deck.draw()
-                    for _ in range(3):
-                        card = self.deck.draw()
-                        if card:
-                            self.community_cards.append(card)
-                elif len(self.community_cards) == 3:
-                    # Burn and deal the turn
-                    self.deck.draw()
-                    card = self.deck.draw()
-                    if card:
-                        self.community_cards.append(card)
-                elif len(self.community_cards) == 4:
-                    # Burn and deal the river
-                    self.deck.draw()
-                    card = self.deck.draw()
-                    if card:
-                        self.community_cards.append(card)
-            # Now perform showdown with full board
-            await self._handle_showdown()
-        
-        # End the hand in the hand history
+        if len(remaining_players) != 1:
+            # Several players are still in: run the board out and show down
+            self._deal_to(5)
+            return self._handle_showdown()
+        
+        # Transition to showdown state first
+        self._transition_to_showdown()
+        
+        # Award entire pot(s) to the remaining player without showdown
+        winner = remaining_players[0]
+        for pot in self.pots:
+            # In early showdown, the lone active player wins all pots
+            winner.chips += pot.amount
+        
+        # Record pot results in hand history
         if self.hand_history_recorder and self.current_hand_id:
+            # Create a simple hand evaluation dictionary for the winner
+            hand_evaluations = {
+                pot.name if hasattr(pot, 'name') else f"pot_{i}": [winner] 
+                for i, pot in enumerate(self.pots)
+                if winner.player_id in pot.eligible_players
+            }
+            self.hand_history_recorder.record_pot_results(self.pots, hand_evaluations)
+            
+            # End the hand in the hand history
             self.hand_history_recorder.end_hand(self.players)
             self.current_hand_id = None
             
         return True
     
-    async def _transition_to_showdown(self) -> None:
+    def _transition_to_showdown(self) -> None:
         """
-        Clean transition to showdown state with proper cleanup.
-        Notifies frontend to remove all turn highlights and clears turn management state.
+        Clean transition to showdown state: clears the turn management state.
+        Clients remove their turn highlights on the showdown events.
         """
         # Clear all turn management state
         self.to_act.clear()
         self.current_player_idx = -1
         
-        # Notify frontend to remove all turn highlights
-        if self.game_id:
-            from app.core.websocket import game_notifier
-            await game_notifier.notify_showdown_transition(self.game_id)
-        
         # Set showdown state
         self.current_round = BettingRound.SHOWDOWN
         
-        # Log the transition for debugging
-        logging.warning(f"[SHOWDOWN-TRANSITION] Game {self.game_id} entering showdown. "
-                       f"Cleared to_act set and current_player_idx. "
-                       f"Active players: {len([p for p in self.players if p.status == PlayerStatus.ACTIVE])}, "
-                       f"All-in players: {len([p for p in self.players if p.status == PlayerStatus.ALL_IN])}")
+        if tracer.enabled:
+            tracer.event(self.game_id, "showdown",
+                         active=sum(p.status == PlayerStatus.ACTIVE for p in self.players),
+                         all_in=sum(p.status == PlayerStatus.ALL_IN for p in self.players))
 
-    async def _handle_showdown(self) -> bool:
+    def _handle_showdown(self) -> bool:
         """
         Handle the showdown where hands are compared and pots awarded.
         
         Returns:
             True indicating hand is complete
         """
-        log_with_timestamp("warning", f"[SHOWDOWN] _handle_showdown called for game {self.game_id}")
-        
-        # Send showdown transition notification to clear UI elements
-        if self.game_id:
-            try:
-                from app.core.websocket import game_notifier
-                log_with_timestamp("warning", f"[SHOWDOWN] Sending showdown_transition notification for game {self.game_id}")
-                await game_notifier.notify_showdown_transition(self.game_id)
-                log_with_timestamp("warning", f"[SHOWDOWN] showdown_transition notification sent successfully")
-            except Exception as e:
-                log_with_timestamp("error", f"[SHOWDOWN] Error sending showdown transition notification: {e}")
-        
         # Use the transition method for clean state management
-        await self._transition_to_showdown()
-        logging.info(f"[_handle_showdown] Starting showdown. Pots: {[ (pot.name, pot.amount) for pot in self.pots ]}")
-        logging.info(f"[_handle_showdown] Community cards: {self.community_cards}")
-        logging.info(f"[_handle_showdown] Current round set to SHOWDOWN - clients will be notified via game update")
+        self._transition_to_showdown()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[_handle_showdown] Starting showdown. Pots: %s, board: %s",
+                         [str(pot) for pot in self.pots], [str(card) for card in self.community_cards])
         
-        # Make sure side pots are properly created
-        self._create_side_pots()
+        # Pots replaced from outside the ledger need rebuilding from the bets
+        if self.pots is not self.pot_ledger.pots:
+            self._create_side_pots()
         
         # Calculate and collect rake for cash games only
         for i, pot in enumerate(self.pots):
@@ -2490,8 +960,9 @@ class PokerGame:
                 pot.amount = adjusted_pot
                 # In a real implementation, we'd track the rake for accounting
                 
-        # Evaluate all hands
-        hand_results = self.evaluate_hands()
+        # Evaluate all hands once; later consumers read showdown_results()
+        showdown_hands = self._evaluate_showdown()
+        hand_strengths = {player: hand.strength for player, hand in showdown_hands.items()}
         
         # Clear previous winners
         self.hand_winners = {}
@@ -2500,50 +971,30 @@ class PokerGame:
         extended_hand_evaluations = {}
         
         # Determine winners for each pot
+        contenders = [p for p in self.players if p.status in {PlayerStatus.ACTIVE, PlayerStatus.ALL_IN}]
         for pot_idx, pot in enumerate(self.pots):
             # Use pot name for display but pot_idx for storage (backward compatibility)
             pot_id = f"pot_{pot_idx}"
             pot_name = pot.name or pot_id
             
-            # Get players eligible for this pot who are still in the hand
-            eligible_players = [p for p in self.players 
-                              if p.player_id in pot.eligible_players 
-                              and p.status in {PlayerStatus.ACTIVE, PlayerStatus.ALL_IN}]
+            # Get players eligible for this pot who are still in the hand; a pot
+            # whose eligible players have all folded goes to the remaining contenders
+            eligible_players = [p for p in contenders if p.player_id in pot.eligible_players] or contenders
             
             if not eligible_players:
-                logger.debug(f"No eligible players for {pot_name}, skipping")
+                logger.debug("No eligible players for %s, skipping", pot_name)
                 continue
                 
-            # Get hand evaluations for eligible players
-            pot_results = {p: hand_results[p] for p in eligible_players if p in hand_results}
-            
-            # Find the best hand
-            best_hand = None
-            best_players = []
-            
-            for player, (hand_rank, kickers) in pot_results.items():
-                # Log player hands for debugging
-                description = self._format_hand_description(hand_rank, kickers)
-                logger.debug(f"Player {player.name} has {description}")
-                
-                if best_hand is None:
-                    # First player we're checking
-                    best_hand = (hand_rank, kickers)
-                    best_players = [player]
-                else:
-                    # Compare with current best hand
-                    comparison = self._compare_hands(hand_rank, kickers, best_hand)
-                    if comparison > 0:
-                        # This hand is better
-                        best_hand = (hand_rank, kickers)
-                        best_players = [player]
-                    elif comparison == 0:
-                        # This hand ties the best hand
-                        best_players.append(player)
+            # Find the best hand: strengths compare directly, equal values split
+            pot_strengths = {p: hand_strengths[p] for p in eligible_players if p in hand_strengths}
+            best_strength = max(pot_strengths.values(), default=None)
+            best_players = [p for p, strength in pot_strengths.items() if strength == best_strength]
+            best_hand = showdown_hands[best_players[0]] if best_players else None
             
             # Award pot to winner(s)
             if best_players:
-                logger.debug(f"Pot {pot_name} (${pot.amount}) won by: {[p.name for p in best_players]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Pot %s ($%s) won by: %s", pot_name, pot.amount, [p.name for p in best_players])
                 
                 # Split pot amount equally among winners
                 split_amount = pot.amount // len(best_players)
@@ -2552,7 +1003,7 @@ class PokerGame:
                 # Award base split amount to each winner
                 for player in best_players:
                     player.chips += split_amount
-                    logger.debug(f"Player {player.name} receives ${split_amount}")
+                    logger.debug("Player %s receives $%s", player.name, split_amount)
                 
                 # Handle any remainder chips
                 if remainder > 0:
@@ -2562,7 +1013,7 @@ class PokerGame:
                         key=lambda p: (p.position - self.button_position) % len(self.players)
                     )
                     sorted_winners[0].chips += remainder
-                    logger.debug(f"Remainder ${remainder} goes to {sorted_winners[0].name}")
+                    logger.debug("Remainder $%s goes to %s", remainder, sorted_winners[0].name)
                 
                 # Only store with pot_id for tests
                 self.hand_winners[pot_id] = best_players
@@ -2570,21 +1021,17 @@ class PokerGame:
                     
                 # Store extended hand evaluations for hand history
                 if best_hand:
-                    hand_rank, kickers = best_hand
                     extended_hand_evaluations[pot_name] = best_players
-                    extended_hand_evaluations[f"{pot_name}_hand"] = hand_rank
-                    
-                    # Store cards used in winning hand if possible
-                    if best_players and hasattr(best_players[0], 'hand') and hasattr(best_players[0].hand, 'cards'):
-                        # Combine player's hole cards with community cards
-                        extended_hand_evaluations[f"{pot_name}_cards"] = list(best_players[0].hand.cards) + self.community_cards
+                    extended_hand_evaluations[f"{pot_name}_hand"] = best_hand.rank
+                    extended_hand_evaluations[f"{pot_name}_cards"] = best_hand.best_five
             else:
-                logger.debug(f"No winners determined for {pot_name}")
+                logger.debug("No winners determined for %s", pot_name)
         
         # Log final chip counts
-        for player in self.players:
-            if player.status != PlayerStatus.OUT:
-                logger.debug(f"Player {player.name} now has ${player.chips} chips")
+        if logger.isEnabledFor(logging.DEBUG):
+            for player in self.players:
+                if player.status != PlayerStatus.OUT:
+                    logger.debug("Player %s now has $%s chips", player.name, player.chips)
                 
         # Record pot results in hand history
         if self.hand_history_recorder and self.current_hand_id:
@@ -2599,333 +1046,91 @@ class PokerGame:
                 
         return True
     
-    def _compare_hands(self, hand_rank1: HandRank, kickers1: List[int], 
-                      hand_info2: Tuple[HandRank, List[int]]) -> int:
+    def _commit(self, player: Player, amount: int):
         """
-        Compare two hands to determine which is better.
+        Record chips a player has just bet in the pot ledger.
         
         Args:
-            hand_rank1: Rank of first hand
-            kickers1: Kickers for first hand
-            hand_info2: Tuple of (rank, kickers) for second hand
-            
-        Returns:
-            1 if first hand is better, -1 if second hand is better, 0 if equal
+            player: The betting player
+            amount: Chips moved from the player's stack by this action
         """
-        hand_rank2, kickers2 = hand_info2
-        
-        # Compare hand ranks first
-        if hand_rank1.value > hand_rank2.value:
-            return 1
-        elif hand_rank1.value < hand_rank2.value:
-            return -1
-        
-        # If ranks are equal, compare kickers
-        # First, ensure both kicker lists are the same length
-        k1 = kickers1.copy()
-        k2 = kickers2.copy()
-        
-        # Pad shorter list with zeros if needed
-        max_len = max(len(k1), len(k2))
-        k1 += [0] * (max_len - len(k1))
-        k2 += [0] * (max_len - len(k2))
-        
-        # Compare kickers
-        for v1, v2 in zip(k1, k2):
-            if v1 > v2:
-                return 1
-            elif v1 < v2:
-                return -1
-                
-        # Hands are exactly equal
-        return 0
+        self.pot_ledger.add(player.player_id, amount, all_in=player.chips == 0)
     
     def _create_side_pots(self):
         """
-        Create side pots based on player all-ins.
+        Rebuild the main pot and side pots from the players' total bets.
         
-        This implementation creates a separate pot for each all-in amount,
-        ensuring that players only compete for the chips they contributed to.
+        The pot ledger keeps the pots current as chips go in, so this is only
+        needed when bets or pots were set directly rather than through actions.
+        Chips in the old pots that no current player accounts for (e.g. from a
+        player who left mid-hand) stay in the main pot.
         """
-        # Log initial pot and player contributions
-        logging.info(f"[_create_side_pots] Initial pots: {[ (pot.name, pot.amount) for pot in self.pots ]}")
-        # Get all players still in the hand
-        involved_players = [p for p in self.players 
-                          if p.status in {PlayerStatus.ACTIVE, PlayerStatus.ALL_IN, PlayerStatus.FOLDED}
-                          and p.total_bet > 0]  # Include folded players who have contributed chips
-        logging.info(f"[_create_side_pots] Involved players (name, total_bet, status): {[ (p.name, p.total_bet, p.status.name) for p in involved_players ]}")
-        
-        # If no players, or only one player, no need for side pots
-        if len(involved_players) <= 1:
-            return
-            
-        # Find all-in players
-        all_in_players = [p for p in involved_players if p.status == PlayerStatus.ALL_IN]
-        
-        # Special handling for test cases
-        handle_special_case = False
-        
-        # Test for test_all_in_and_side_pots
-        player1_all_in = next((p for p in all_in_players if p.name == "Player 1"), None)
-        if player1_all_in and player1_all_in.total_bet == 200:
-            handle_special_case = True
-            
-        # Test for test_partial_raise_with_insufficient_chips
-        player3_all_in = next((p for p in all_in_players if p.name == "Player 3" and p.total_bet == 45), None)
-        if player3_all_in:
-            handle_special_case = True
-            
-        # Special handling for test cases that expect 2 pots
-        if handle_special_case:
-            # Get total pot amount
-            pot_amount = self.pots[0].amount
-            
-            # Create the main pot (for all players)
-            main_pot = Pot(amount=0, name="Main Pot")
-            for player in involved_players:
-                main_pot.eligible_players.add(player.player_id)
-                
-            # Create side pot (only for non-all-in players)
-            side_pot = Pot(amount=0, name="Side Pot 1")
-            for player in involved_players:
-                if player.status != PlayerStatus.ALL_IN:
-                    side_pot.eligible_players.add(player.player_id)
-            
-            # Special case for test_all_in_and_side_pots
-            if player1_all_in and player1_all_in.total_bet == 200:
-                main_pot.amount = 800  # 200 * 4 players
-                side_pot.amount = pot_amount - main_pot.amount
-            
-            # Special case for test_partial_raise_with_insufficient_chips
-            elif player3_all_in and player3_all_in.total_bet == 45:
-                main_pot.amount = 180  # 45 * 4 players
-                side_pot.amount = pot_amount - main_pot.amount
-            
-            # Set the pots
-            self.pots = [main_pot, side_pot]
-            return
-            
-        # If no all-in players, no need for side pots
-        if not all_in_players:
-            logging.info("No all-in players found, no side pots needed.")
-            return
-            
-        # Log detailed information about all-in players for debugging
-        logging.info(f"Creating side pots based on {len(all_in_players)} all-in players")
-        for player in all_in_players:
-            logging.info(f"All-in player {player.name}: total_bet={player.total_bet}, chips={player.chips}")
-        
-        # Check if all-in players have the same total bet (started with same stack)
-        all_in_bets = [p.total_bet for p in all_in_players]
-        if len(set(all_in_bets)) <= 1 and len(all_in_players) > 0:
-            logging.info(f"All all-in players have the same bet amount ({all_in_bets[0]}). No need for multiple side pots.")
-            
-            # Create a simpler pot structure when all players went all-in for the same amount
-            if len(self.pots) == 1:
-                # Keep the existing main pot, just log the decision
-                logging.info("Keeping main pot structure as is since all all-ins are for the same amount.")
-                # Update pot name for clarity
-                self.pots[0].name = "Main Pot"
-                return
-        
-        # Save the total amount in all current pots
-        total_pot_amount = sum(pot.amount for pot in self.pots)
-        
-        # Get all distinct bet amounts, sorting from smallest to largest
-        bet_amounts = sorted(set(p.total_bet for p in involved_players))
-        
-        # Start fresh with new pots
-        old_pots = self.pots.copy()
-        self.pots = []
-        
-        # Create pots for each betting level
-        prev_bet = 0
-        for current_bet in bet_amounts:
-            # Skip duplicate bet amounts
-            if current_bet == prev_bet:
-                continue
-                
-            # Calculate the bet increment at this level
-            increment = current_bet - prev_bet
-            
-            # Create a pot for this level
-            pot = Pot()
-            
-            # Determine eligible players for this pot (all who bet at least this amount)
-            eligible_players = [p for p in involved_players 
-                              if p.total_bet >= current_bet
-                              and p.status != PlayerStatus.FOLDED]  # Folded players aren't eligible
-            
-            # Add each player's contribution to this pot
-            contrib_count = 0
-            for player in involved_players:
-                # Only players who bet at least the previous amount contribute to this pot
-                if player.total_bet > prev_bet:
-                    # Each player contributes either the full increment or up to their bet amount
-                    player_increment = min(increment, player.total_bet - prev_bet)
-                    if player_increment > 0:
-                        pot.add(player_increment, player.player_id)
-                        contrib_count += 1
-                    
-                    # Only active and all-in players are eligible to win
-                    if player.status == PlayerStatus.FOLDED:
-                        pot.remove_player(player.player_id)
-            
-            # Add pot to the list if it has money and multiple contributors
-            if pot.amount > 0 and contrib_count > 0:
-                self.pots.append(pot)
-            
-            # Update the previous bet amount for the next iteration
-            prev_bet = current_bet
-        
-        # If we have no pots (shouldn't happen), restore the original pots
-        if not self.pots:
-            self.pots = old_pots
-            return
-            
-        # Verify the total amount is preserved and adjust if needed
-        new_total = sum(pot.amount for pot in self.pots)
-        if new_total != total_pot_amount and self.pots:
-            difference = total_pot_amount - new_total
-            self.pots[0].amount += difference
-            
-        # Assign names to the pots for clarity
-        for i, pot in enumerate(self.pots):
-            pot.name = "Main Pot" if i == 0 else f"Side Pot {i}"
-            
-        # Log the final pot structure
-        for pot in self.pots:
-            logger.debug(f"{pot.name}: ${pot.amount} with {len(pot.eligible_players)} eligible players")
-    
-    def _log_expected_action_order(self):
-        """Log the expected order of action for the current round."""
-        import uuid
-        execution_id = str(uuid.uuid4())[:8]
-        
-        # Log both active and to_act players for detailed debugging
-        active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-        to_act_players = [p for p in self.players if p.player_id in self.to_act]
-        players_should_act = [p for p in active_players if p.player_id in self.to_act]
-        
-        logging.info(f"[ACTION_ORDER-{execution_id}] Current player index: {self.current_player_idx}")
-        logging.info(f"[ACTION_ORDER-{execution_id}] Active players: {len(active_players)}")
-        logging.info(f"[ACTION_ORDER-{execution_id}] Players in to_act: {len(to_act_players)}")
-        logging.info(f"[ACTION_ORDER-{execution_id}] Players who should act (active AND in to_act): {len(players_should_act)}")
-        
-        if not active_players:
-            logging.warning(f"[ACTION_ORDER-{execution_id}] No active players to log expected action order")
-            return
-        
-        # Determine starting position based on the current round
-        if self.current_round == BettingRound.PREFLOP:
-            # Preflop: action starts with UTG (3 positions after button in full ring)
-            start_relative_pos = 3 if len(active_players) > 2 else 0  # UTG or SB in heads-up
-            logging.info(f"[ACTION_ORDER-{execution_id}] Preflop betting - action starts at relative position {start_relative_pos}")
-        else:
-            # Postflop: action starts with first active player after the button
-            start_relative_pos = 1  # SB position
-            logging.info(f"[ACTION_ORDER-{execution_id}] Postflop betting - action starts at relative position {start_relative_pos}")
-        
-        # Log the action order
-        logging.info(f"[ACTION_ORDER-{execution_id}] Expected action order for {self.current_round.name}:")
-        
-        # First verify the current player is valid
-        if 0 <= self.current_player_idx < len(self.players):
-            current_player = self.players[self.current_player_idx]
-            logging.info(f"[ACTION_ORDER-{execution_id}] Current player set to: {current_player.name} (index {self.current_player_idx})")
-            logging.info(f"[ACTION_ORDER-{execution_id}] Current player status: {current_player.status.name}, in to_act: {current_player.player_id in self.to_act}")
-            
-            # Log detailed info about all active players in to_act
-            for p in players_should_act:
-                player_idx = self.players.index(p)
-                rel_pos = (p.position - self.button_position) % len(self.players)
-                pos_name = self._get_position_name(rel_pos)
-                logging.info(f"[ACTION_ORDER-{execution_id}] Should act: {p.name} [{pos_name}] (index {player_idx})")
-        else:
-            logging.error(f"[ACTION_ORDER-{execution_id}] Invalid current player index: {self.current_player_idx}")
-        
-        # Sort active players by their absolute position
-        sorted_by_position = sorted(active_players, key=lambda p: p.position)
-        
-        # Find the player at the starting position
-        start_player_idx = None
-        for i, player in enumerate(sorted_by_position):
-            rel_pos = (player.position - self.button_position) % len(active_players)
-            if rel_pos == start_relative_pos:
-                start_player_idx = i
-                break
-        
-        if start_player_idx is None:
-            logging.warning(f"[ACTION_ORDER-{execution_id}] Could not find starting player at relative position {start_relative_pos}")
-            return
-        
-        # Log the action order starting from the appropriate position
-        for i in range(len(active_players)):
-            player_idx = (start_player_idx + i) % len(active_players)
-            player = sorted_by_position[player_idx]
-            rel_pos = (player.position - self.button_position) % len(active_players)
-            
-            # Get position name
-            pos_name = "Unknown"
-            if rel_pos == 0:
-                pos_name = "BTN"
-            elif rel_pos == 1:
-                pos_name = "SB"
-            elif rel_pos == 2:
-                pos_name = "BB"
-            elif rel_pos == 3:
-                pos_name = "UTG"
-            elif rel_pos == 4:
-                pos_name = "UTG+1"
-            elif rel_pos == 5:
-                pos_name = "UTG+2"
-            elif rel_pos == 6:
-                pos_name = "LJ"
-            elif rel_pos == 7:
-                pos_name = "HJ"
-            elif rel_pos == 8:
-                pos_name = "CO"
-            
-            logging.info(f"  {i+1}. {player.name} - {pos_name} (seat {player.position})")
+        old_total = sum(pot.amount for pot in self.pots)
+        self.pot_ledger = PotLedger.from_contributions(
+            (p.player_id, p.total_bet, p.status == PlayerStatus.ALL_IN, p.status == PlayerStatus.FOLDED)
+            for p in self.players
+            if p.status in {PlayerStatus.ACTIVE, PlayerStatus.ALL_IN, PlayerStatus.FOLDED}
+        )
+        if old_total > self.pot_ledger.total:
+            self.pot_ledger.add_dead(old_total - self.pot_ledger.total)
+        self.pots = self.pot_ledger.pots
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[_create_side_pots] Pots: %s", [str(pot) for pot in self.pots])
     
     def move_button(self):
         """
         Move the button to the next active player in clockwise order.
         This operates on seat positions, not player list indices.
         """
-        active_players = [p for p in self.players if p.status != PlayerStatus.OUT]
-        if not active_players:
+        next_button_pos = self._seat_ring().next_position(self.button_position)
+        if next_button_pos < 0:
             logging.error("No active players to move button to!")
             return
+        self.button_position = next_button_pos
+        logger.debug("Button moved to seat %s", self.button_position)
+    
+    def snapshot(self) -> bytes:
+        """
+        Serialize the full table state into a compact binary blob.
         
-        # Get the current button seat position
-        current_button_pos = self.button_position
-        logging.info(f"Moving button from seat {current_button_pos}")
+        Returns:
+            Bytes that restore() turns back into an equivalent game
+            (see app/core/snapshot.py for what is included)
+        """
+        from app.core.snapshot import snapshot_game
+        return snapshot_game(self)
+    
+    def fork(self, runout=None):
+        """
+        Copy the current decision point into a HeadlessGame for look-ahead search.
         
-        # Get all occupied seat positions in ascending order
-        occupied_seats = sorted([p.position for p in active_players])
-        if not occupied_seats:
-            logging.error("No occupied seats found!")
-            return
-            
-        logging.info(f"Occupied seats: {occupied_seats}")
+        The copy plays on synchronously without notifications or logging, and
+        its own fork()/apply()/undo() make exploring action trees cheap. The
+        live table is not modified.
         
-        # Find the next seat position clockwise from the current button
-        next_button_pos = None
+        Args:
+            runout: Optional card ids of the full board (see HeadlessGame.from_game)
+            
+        Returns:
+            A HeadlessGame at the same point of the hand
+        """
+        from app.core.headless import HeadlessGame
+        return HeadlessGame.from_game(self, runout)
+    
+    @classmethod
+    def restore(cls, data: bytes, hand_history_recorder=None) -> "PokerGame":
+        """
+        Rebuild a game from a snapshot() blob.
         
-        # First try to find a seat with higher position number
-        for seat in occupied_seats:
-            if seat > current_button_pos:
-                next_button_pos = seat
-                break
-                
-        # If no higher seat found, wrap around to the lowest seat
-        if next_button_pos is None:
-            next_button_pos = occupied_seats[0]
+        Args:
+            data: The snapshot
+            hand_history_recorder: Optional recorder to attach to the restored game
             
-        # Set the new button position
-        self.button_position = next_button_pos
-        logging.info(f"Button moved to seat {self.button_position}")
+        Returns:
+            A new PokerGame in the snapshotted state
+        """
+        from app.core.snapshot import restore_game
+        return restore_game(data, hand_history_recorder)
     
     @property
     def pot(self) -> int:
@@ -3002,8 +1207,11 @@ class PokerGame:
         # Get remaining chips
         remaining_chips = player.chips
         
-        # Remove player
+        # Remove player; chips already in the pot stay there
         self.players = [p for p in self.players if p.player_id != player_id]
+        self.pot_ledger.fold(player_id)
+        self._to_act.discard(player_id)
+        self._seat_ring()
         
         print(f"Player {player.name} removed from game with {remaining_chips} chips")
         
@@ -0,0 +1,222 @@
+"""
+Incremental pot accounting.
+
+PotLedger keeps the main pot and side pots of a hand up to date as chips go
+in, instead of rebuilding them from every player's total bet at the end of
+each betting round. The pots are layers of contribution: each all-in caps a
+layer at the all-in player's total, and every contribution is credited to
+the layers it spans. An ordinary bet or call only touches the top layer.
+
+An all-in splits the layer it falls in as soon as it is made - the only
+step that looks at every contributor - so an all-in player is never
+eligible for chips above their total, even in the middle of a betting
+round. The pot list read by the UI and the AI (PotLedger.pots) is therefore
+correct after every action and costs nothing to fetch.
+"""
+import bisect
+import random
+import time
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class Pot:
+    """Represents a pot in the poker game (main pot or side pot)."""
+    
+    def __init__(self, amount: int = 0, name: str = ""):
+        """
+        Initialize a pot.
+        
+        Args:
+            amount: Initial amount in the pot
+            name: Name of the pot (e.g., "Main Pot", "Side Pot 1")
+        """
+        self.amount = amount
+        self.name = name
+        self.eligible_players: Set[str] = set()  # Player IDs eligible to win this pot
+    
+    def add(self, amount: int, player_id: str):
+        """
+        Add chips to the pot from a player.
+        
+        Args:
+            amount: Amount to add
+            player_id: ID of the contributing player
+        """
+        self.amount += amount
+        self.eligible_players.add(player_id)
+    
+    def remove_player(self, player_id: str):
+        """
+        Remove a player from eligibility for this pot.
+        
+        Args:
+            player_id: ID of the player to remove
+        """
+        if player_id in self.eligible_players:
+            self.eligible_players.remove(player_id)
+            
+    def __str__(self):
+        """String representation of the pot."""
+        pot_name = self.name if self.name else "Pot"
+        return f"{pot_name}: ${self.amount} ({len(self.eligible_players)} players eligible)"
+
+
+def pot_name(index: int) -> str:
+    """Display name of the pot at an index ("Main Pot", "Side Pot 1", ...)."""
+    return "Main Pot" if index == 0 else f"Side Pot {index}"
+
+
+class PotLedger:
+    """Main pot and side pots of one hand, maintained as chips are committed."""
+
+    def __init__(self):
+        """Initialize an empty ledger with a single main pot."""
+        self.contributions: Dict[str, int] = {}
+        self.folded: Set[str] = set()
+        # caps[i] is the upper bound of layer i; the last layer has no cap
+        self.caps: List[int] = []
+        self.layers: List[Pot] = [Pot(name=pot_name(0))]
+        # Non-empty pots, kept in place so callers can hold on to the list
+        self.pots: List[Pot] = [self.layers[0]]
+        self.total = 0
+
+    @classmethod
+    def from_contributions(cls, contributions: Iterable[Tuple[str, int, bool, bool]]) -> "PotLedger":
+        """
+        Build a ledger from per-player totals.
+
+        Args:
+            contributions: (player_id, total, all_in, folded) for each player
+                who put chips in
+
+        Returns:
+            The ledger for those contributions
+        """
+        ledger = cls()
+        rows = sorted(contributions, key=lambda row: row[1])
+        for player_id, total, all_in, folded in rows:
+            if total > 0:
+                ledger.add(player_id, total, all_in=all_in)
+        for player_id, total, all_in, folded in rows:
+            if folded:
+                ledger.fold(player_id)
+        return ledger
+
+    def add(self, player_id: str, amount: int, all_in: bool = False) -> None:
+        """
+        Commit chips from a player.
+
+        Args:
+            player_id: ID of the contributing player
+            amount: Chips added by this action
+            all_in: Whether the player has no chips left afterwards, which
+                caps the pots they can win at their new total
+        """
+        if amount <= 0:
+            return
+        before = self.contributions.get(player_id, 0)
+        after = before + amount
+        self.contributions[player_id] = after
+        self.total += amount
+
+        caps = self.caps
+        layers = self.layers
+        eligible = player_id not in self.folded
+        index = bisect.bisect_right(caps, before)
+        floor = caps[index - 1] if index else 0
+        while index < len(layers):
+            ceiling = caps[index] if index < len(caps) else after
+            portion = min(after, ceiling) - max(before, floor)
+            if portion <= 0:
+                break
+            layer = layers[index]
+            layer.amount += portion
+            if eligible:
+                layer.eligible_players.add(player_id)
+            if index == len(layers) - 1 and len(self.pots) < len(layers):
+                self.pots.append(layer)
+            floor = ceiling
+            index += 1
+        if all_in:
+            self._cap(after)
+
+    def fold(self, player_id: str) -> None:
+        """Remove a folded player from every pot they could have won."""
+        self.folded.add(player_id)
+        for layer in self.layers:
+            layer.eligible_players.discard(player_id)
+
+    def add_dead(self, amount: int) -> None:
+        """Add chips nobody is contesting for (e.g. from a player who left) to the main pot."""
+        self.layers[0].amount += amount
+        self.total += amount
+
+    def _cap(self, level: int) -> None:
+        """Split the layer containing level so that a layer ends exactly there."""
+        caps = self.caps
+        index = bisect.bisect_left(caps, level)
+        if index < len(caps) and caps[index] == level:
+            return
+        floor = caps[index - 1] if index else 0
+        layer = self.layers[index]
+        lower = Pot(name=pot_name(index))
+        for player_id, total in self.contributions.items():
+            if total > floor:
+                lower.amount += min(total, level) - floor
+                if player_id in layer.eligible_players:
+                    lower.eligible_players.add(player_id)
+                if total <= level:
+                    layer.eligible_players.discard(player_id)
+        layer.amount -= lower.amount
+        caps.insert(index, level)
+        self.layers.insert(index, lower)
+        for position in range(index + 1, len(self.layers)):
+            self.layers[position].name = pot_name(position)
+        # Only the top layer can be empty
+        self.pots[:] = self.layers if self.layers[-1].amount else self.layers[:-1]
+
+
+def main():
+    """Benchmark incremental pot updates against a full rebuild per action."""
+    rng = random.Random(7)
+    players = [f"p{i}" for i in range(9)]
+    hands = 20000
+    scripts = []
+    for _ in range(hands):
+        stacks = {pid: rng.randint(50, 2000) for pid in players}
+        actions = []
+        for _ in range(rng.randint(9, 30)):
+            pid = rng.choice(players)
+            if stacks[pid] == 0:
+                continue
+            amount = min(stacks[pid], rng.choice([10, 20, 50, 100, 400]))
+            stacks[pid] -= amount
+            actions.append((pid, amount, stacks[pid] == 0))
+        scripts.append(actions)
+
+    start = time.perf_counter()
+    for actions in scripts:
+        ledger = PotLedger()
+        for pid, amount, all_in in actions:
+            ledger.add(pid, amount, all_in=all_in)
+            ledger.pots
+    incremental = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for actions in scripts:
+        totals: Dict[str, List] = {}
+        for pid, amount, all_in in actions:
+            row = totals.setdefault(pid, [pid, 0, False, False])
+            row[1] += amount
+            row[2] = all_in
+            PotLedger.from_contributions(map(tuple, totals.values())).pots
+    rebuild = time.perf_counter() - start
+
+    count = sum(len(actions) for actions in scripts)
+    print(f"{count} actions over {hands} hands")
+    print(f"incremental: {incremental * 1e6 / count:.2f} us/action")
+    print(f"rebuild:     {rebuild * 1e6 / count:.2f} us/action")
+
+
+if __name__ == "__main__":
+    main()
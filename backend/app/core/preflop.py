@@ -0,0 +1,316 @@
+"""
+Precomputed preflop equity.
+
+The 1326 two-card starting hands fall into 169 classes: 13 pairs, 78 suited
+and 78 offsuit hands. Preflop equity depends only on the classes involved,
+so it is computed once by a build step and shipped as a .npy file that is
+memory-mapped at startup:
+
+    python -m app.core.preflop --boards 20000 --multiway-samples 100000
+
+Classes are numbered on the usual 13x13 grid with aces first: pairs on the
+diagonal, suited hands above it and offsuit hands below it, so class 0 is
+AA, 1 is AKs, 13 is AKo and 168 is 22.
+
+The table has shape (169, 169 + MAX_OPPONENTS, 5). Column ``j < 169`` holds
+hero's class against class ``j`` heads-up and column ``169 + k - 1`` holds
+hero against ``k`` random opponents. The last axis is (win, tie, equity,
+95% margin, samples). Heads-up columns score every combo on shared random
+boards; multiway columns are simulated per class by dealing a board and
+``k`` opponent hands together, so card removal between opponents is kept.
+"""
+import argparse
+import os
+from itertools import combinations
+from typing import Optional, Tuple
+
+import numpy as np
+
+from app.core.cards import Card, NUM_CARDS, SUIT_BITS, SUIT_MASK
+from app.core.config import PREFLOP_EQUITY_PATH
+from app.core.hand_evaluator import HandEvaluator
+
+NUM_CLASSES = 169
+MAX_OPPONENTS = 9
+TABLE_SHAPE = (NUM_CLASSES, NUM_CLASSES + MAX_OPPONENTS, 5)
+WIN, TIE, EQUITY, MARGIN, SAMPLES = range(5)
+
+_RANK_CHARS = "23456789TJQKA"
+_Z_95 = 1.96
+
+# All hole card combinations as (low id, high id), in combinations() order
+HOLE_COMBOS = np.array(list(combinations(range(NUM_CARDS), 2)), dtype=np.int64)
+
+
+def _grid_index(high_rank: int, low_rank: int, suited: bool) -> int:
+    """Class index for two rank indices (0 = deuce, 12 = ace)."""
+    row, col = 12 - high_rank, 12 - low_rank
+    return row * 13 + col if suited or row == col else col * 13 + row
+
+
+def hand_class_of_ids(first_id: int, second_id: int) -> int:
+    """
+    Return the starting hand class of two card ids.
+
+    Args:
+        first_id: Card id of one hole card
+        second_id: Card id of the other hole card
+
+    Returns:
+        Class index 0-168
+    """
+    first_rank, second_rank = first_id >> SUIT_BITS, second_id >> SUIT_BITS
+    suited = (first_id & SUIT_MASK) == (second_id & SUIT_MASK)
+    return _grid_index(max(first_rank, second_rank), min(first_rank, second_rank), suited)
+
+
+def hand_class(first: Card, second: Card) -> int:
+    """Return the starting hand class of two hole cards."""
+    return hand_class_of_ids(first.id, second.id)
+
+
+def class_name(index: int) -> str:
+    """Return the conventional name of a class, e.g. "AA", "AKs" or "72o"."""
+    row, col = divmod(index, 13)
+    high, low = _RANK_CHARS[12 - min(row, col)], _RANK_CHARS[12 - max(row, col)]
+    if row == col:
+        return high + low
+    return high + low + ("s" if row < col else "o")
+
+
+def class_index(name: str) -> int:
+    """
+    Parse a class name such as "AA", "AKs" or "T9o".
+
+    Args:
+        name: Two rank characters, plus "s" or "o" unless they are a pair
+
+    Returns:
+        Class index 0-168
+    """
+    text = name.strip()
+    ranks = text[:2].upper()
+    suffix = text[2:].lower()
+    if len(ranks) != 2 or any(char not in _RANK_CHARS for char in ranks):
+        raise ValueError(f"Invalid hand class: {name!r}")
+    high, low = sorted((_RANK_CHARS.index(char) for char in ranks), reverse=True)
+    if (high == low and suffix) or (high != low and suffix not in ("s", "o")):
+        raise ValueError(f"Invalid hand class: {name!r}")
+    return _grid_index(high, low, suffix == "s")
+
+
+COMBO_CLASSES = np.array([hand_class_of_ids(a, b) for a, b in HOLE_COMBOS.tolist()], dtype=np.int64)
+
+# One-hot (class, combo) matrix for summing per-combo values by class
+_CLASS_MEMBERSHIP = np.zeros((NUM_CLASSES, len(HOLE_COMBOS)))
+_CLASS_MEMBERSHIP[COMBO_CLASSES, np.arange(len(HOLE_COMBOS))] = 1.0
+
+
+def _tables_for_board(
+    board: np.ndarray,
+    combo_cards: np.ndarray,
+    conflict_pairs: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Score every starting hand on one five-card board.
+
+    Returns:
+        Class-by-class win, tie and pair counts
+    """
+    alive = ~combo_cards[:, board].any(axis=1)
+    strengths = np.zeros(len(HOLE_COMBOS), dtype=np.int64)
+    hands = np.concatenate([HOLE_COMBOS[alive], np.broadcast_to(board, (int(alive.sum()), 5))], axis=1)
+    strengths[alive] = HandEvaluator.evaluate_batch(hands)
+
+    # Dense strength ranks of live combos, then per class the number of live
+    # combos below and at each rank
+    live = np.flatnonzero(alive)
+    live_classes = COMBO_CLASSES[live]
+    levels, ranks = np.unique(strengths[live], return_inverse=True)
+    width = len(levels) + 1
+    at_rank = np.bincount(
+        live_classes * width + ranks + 1, minlength=NUM_CLASSES * width
+    ).reshape(NUM_CLASSES, width).astype(float)
+    below = np.cumsum(at_rank, axis=1)
+
+    # Sum the per-combo counts into hero classes
+    membership = _CLASS_MEMBERSHIP[:, live]
+    wins = membership @ below[:, ranks].T
+    ties = membership @ at_rank[:, ranks + 1].T
+    class_sizes = membership.sum(axis=1)
+    pairs = np.outer(class_sizes, class_sizes)
+
+    # Remove pairs of combos sharing a card (including a combo with itself)
+    first, second = conflict_pairs[:, 0], conflict_pairs[:, 1]
+    both = alive[first] & alive[second]
+    first, second = first[both], second[both]
+    cell = COMBO_CLASSES[first] * NUM_CLASSES + COMBO_CLASSES[second]
+    beat = strengths[first] > strengths[second]
+    equal = strengths[first] == strengths[second]
+    size = NUM_CLASSES * NUM_CLASSES
+    wins -= np.bincount(cell, weights=beat, minlength=size).reshape(NUM_CLASSES, NUM_CLASSES)
+    ties -= np.bincount(cell, weights=equal, minlength=size).reshape(NUM_CLASSES, NUM_CLASSES)
+    pairs -= np.bincount(cell, minlength=size).reshape(NUM_CLASSES, NUM_CLASSES)
+    return wins, ties, pairs
+
+
+def _simulate_multiway(hero: np.ndarray, samples: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Simulate one starting hand against 1..MAX_OPPONENTS random opponents.
+
+    Each sample deals a board and MAX_OPPONENTS hands from the cards hero
+    does not hold; the ``k``-opponent spot is played against the first
+    ``k`` of those hands.
+
+    Args:
+        hero: Hero's two card ids
+        samples: Number of deals
+        rng: Random generator
+
+    Returns:
+        Array of shape (MAX_OPPONENTS, 5) in the table's layout
+    """
+    deck = np.setdiff1d(np.arange(NUM_CARDS), hero)
+    dealt = deck[np.argsort(rng.random((samples, len(deck))), axis=1)[:, :5 + 2 * MAX_OPPONENTS]]
+    board = dealt[:, :5]
+    holes = dealt[:, 5:].reshape(samples, MAX_OPPONENTS, 2)
+
+    hero_hands = np.concatenate([np.broadcast_to(hero, (samples, 2)), board], axis=1)
+    hero_strength = HandEvaluator.evaluate_batch(hero_hands)[:, None]
+    villain_hands = np.concatenate(
+        [holes, np.broadcast_to(board[:, None, :], (samples, MAX_OPPONENTS, 5))], axis=2
+    )
+    villain_strength = HandEvaluator.evaluate_batch(villain_hands.reshape(-1, 7)).reshape(samples, MAX_OPPONENTS)
+
+    # Column k - 1 compares hero with the best of the first k opponents
+    best = np.maximum.accumulate(villain_strength, axis=1)
+    won = hero_strength > best
+    tied = hero_strength == best
+    splits = np.cumsum(villain_strength == hero_strength, axis=1)
+    share = np.where(won, 1.0, np.where(tied, 1.0 / (splits + 1), 0.0))
+
+    result = np.empty((MAX_OPPONENTS, 5))
+    result[:, WIN] = won.mean(axis=0)
+    result[:, TIE] = tied.mean(axis=0)
+    result[:, EQUITY] = share.mean(axis=0)
+    result[:, MARGIN] = _Z_95 * share.std(axis=0) / np.sqrt(samples)
+    result[:, SAMPLES] = samples
+    return result
+
+
+def build_table(boards: int, seed: Optional[int] = None, multiway_samples: Optional[int] = None) -> np.ndarray:
+    """
+    Estimate the preflop equity table by scoring every starting hand on
+    random boards and simulating each class in multiway pots.
+
+    Args:
+        boards: Number of random boards to sample for the heads-up columns
+        seed: Seed for reproducible builds
+        multiway_samples: Deals per class for the multiway columns
+            (defaults to ``boards``)
+
+    Returns:
+        float32 array of shape TABLE_SHAPE
+    """
+    rng = np.random.default_rng(seed)
+    combo_cards = np.zeros((len(HOLE_COMBOS), NUM_CARDS), dtype=bool)
+    combo_cards[np.arange(len(HOLE_COMBOS))[:, None], HOLE_COMBOS] = True
+    shared = combo_cards.astype(np.int32) @ combo_cards.T.astype(np.int32)
+    conflict_pairs = np.argwhere(shared > 0)
+
+    shape = (NUM_CLASSES, NUM_CLASSES)
+    total_wins, total_ties, total_pairs = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+    board_sum, board_sq, board_count = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+
+    for _ in range(boards):
+        board = rng.choice(NUM_CARDS, 5, replace=False)
+        wins, ties, pairs = _tables_for_board(board, combo_cards, conflict_pairs)
+        total_wins += wins
+        total_ties += ties
+        total_pairs += pairs
+        seen = pairs > 0
+        share = np.divide(wins + ties / 2, pairs, out=np.zeros(shape), where=seen)
+        board_sum += share
+        board_sq += share * share
+        board_count += seen
+
+    table = np.zeros(TABLE_SHAPE, dtype=np.float32)
+    heads_up = table[:, :NUM_CLASSES]
+    heads_up[..., WIN] = total_wins / total_pairs
+    heads_up[..., TIE] = total_ties / total_pairs
+    heads_up[..., EQUITY] = (total_wins + total_ties / 2) / total_pairs
+    variance = np.maximum(board_sq / board_count - (board_sum / board_count) ** 2, 0.0)
+    heads_up[..., MARGIN] = _Z_95 * np.sqrt(variance / board_count)
+    heads_up[..., SAMPLES] = board_count
+
+    # Every combo of a class has the same odds against random hands, so one
+    # combo per class is simulated
+    samples = boards if multiway_samples is None else multiway_samples
+    for hero_class in range(NUM_CLASSES):
+        hero = HOLE_COMBOS[np.argmax(COMBO_CLASSES == hero_class)]
+        table[hero_class, NUM_CLASSES:] = _simulate_multiway(hero, samples, rng)
+    return table
+
+
+class PreflopEquityTable:
+    """Read-only view of a built preflop equity table."""
+
+    _instance = None
+    _loaded = False
+
+    @classmethod
+    def get_instance(cls) -> Optional["PreflopEquityTable"]:
+        """
+        Get the shared table, memory-mapping PREFLOP_EQUITY_PATH on first use.
+
+        Returns:
+            The table, or None if it has not been built
+        """
+        if not cls._loaded:
+            cls._loaded = True
+            if os.path.exists(PREFLOP_EQUITY_PATH):
+                cls._instance = cls(PREFLOP_EQUITY_PATH)
+        return cls._instance
+
+    def __init__(self, path: str):
+        """
+        Memory-map a table file.
+
+        Args:
+            path: Path of a .npy file written by the build step
+        """
+        self.table = np.load(path, mmap_mode="r")
+        if self.table.shape != TABLE_SHAPE:
+            raise ValueError(f"Preflop equity table {path} has shape {self.table.shape}, expected {TABLE_SHAPE}")
+
+    def heads_up(self, hero_class: int, villain_class: int) -> np.ndarray:
+        """Return (win, tie, equity, margin, boards) for one class against another."""
+        return self.table[hero_class, villain_class]
+
+    def versus_random(self, hero_class: int, opponents: int) -> np.ndarray:
+        """Return (win, tie, equity, margin, boards) against random opponents."""
+        if not 1 <= opponents <= MAX_OPPONENTS:
+            raise ValueError(f"Preflop table covers 1 to {MAX_OPPONENTS} opponents")
+        return self.table[hero_class, NUM_CLASSES + opponents - 1]
+
+
+def main() -> None:
+    """Build the preflop equity table file."""
+    parser = argparse.ArgumentParser(description="Build the preflop equity table")
+    parser.add_argument("--boards", type=int, default=20000, help="random boards to sample heads-up")
+    parser.add_argument("--multiway-samples", type=int, default=100000, help="deals per class in multiway pots")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=PREFLOP_EQUITY_PATH)
+    args = parser.parse_args()
+
+    table = build_table(args.boards, args.seed, args.multiway_samples)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    np.save(args.output, table)
+    print(
+        f"Wrote preflop equity table ({args.boards} boards, "
+        f"{args.multiway_samples} multiway deals per class) to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
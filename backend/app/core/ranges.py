@@ -0,0 +1,234 @@
+"""
+Hand ranges as weighted sets of hole card combinations.
+
+A Range holds one weight (0.0-1.0) for each of the 1326 two-card combos, in
+the order of ``preflop.HOLE_COMBOS``. Set operations are element-wise on the
+weight vector: union takes the larger weight, intersection the smaller, and
+card removal zeroes every combo holding a blocked card.
+
+Ranges parse from the usual shorthand, separated by commas or spaces:
+
+- classes: ``AA``, ``AKs``, ``AKo``, ``AK`` (suited and offsuit)
+- "and better": ``22+`` (all pairs), ``A2s+`` (A2s-AKs), ``KTo+`` (KTo-KQo)
+- spans: ``77-99``, ``A2s-A5s``
+- exact combos: ``AsKs``
+- weights: any token followed by ``:0.5``
+"""
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.cards import Card, NUM_CARDS, parse_cards
+from app.core.preflop import COMBO_CLASSES, HOLE_COMBOS, NUM_CLASSES, class_index, class_name
+
+NUM_COMBOS = len(HOLE_COMBOS)
+
+_RANK_CHARS = "23456789TJQKA"
+
+# Combo index for every ordered pair of distinct card ids (-1 on the diagonal)
+COMBO_INDEX = np.full((NUM_CARDS, NUM_CARDS), -1, dtype=np.int64)
+COMBO_INDEX[HOLE_COMBOS[:, 0], HOLE_COMBOS[:, 1]] = np.arange(NUM_COMBOS)
+COMBO_INDEX[HOLE_COMBOS[:, 1], HOLE_COMBOS[:, 0]] = np.arange(NUM_COMBOS)
+
+# (card, combo) mask of the combos that hold each card
+_CARD_COMBOS = np.zeros((NUM_CARDS, NUM_COMBOS), dtype=bool)
+_CARD_COMBOS[HOLE_COMBOS[:, 0], np.arange(NUM_COMBOS)] = True
+_CARD_COMBOS[HOLE_COMBOS[:, 1], np.arange(NUM_COMBOS)] = True
+
+
+class Range:
+    """A weighted set of hole card combinations."""
+
+    __slots__ = ("weights",)
+
+    def __init__(self, weights: Optional[np.ndarray] = None):
+        """
+        Initialize a range.
+
+        Args:
+            weights: Weight per combo, shape (1326,); empty range if omitted
+        """
+        if weights is None:
+            weights = np.zeros(NUM_COMBOS)
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (NUM_COMBOS,):
+            raise ValueError(f"Range weights must have shape ({NUM_COMBOS},)")
+        self.weights = weights
+
+    @classmethod
+    def parse(cls, text: str) -> "Range":
+        """
+        Parse range notation such as "22+, A2s+, KTo+, AsKs:0.5".
+
+        Args:
+            text: Comma or space separated range tokens
+
+        Returns:
+            The parsed range; later tokens override earlier weights
+        """
+        weights = np.zeros(NUM_COMBOS)
+        for token in text.replace(",", " ").split():
+            hand, _, weight_text = token.partition(":")
+            weight = float(weight_text) if weight_text else 1.0
+            if not 0.0 <= weight <= 1.0:
+                raise ValueError(f"Range weight out of bounds in {token!r}")
+            weights[_token_combos(hand)] = weight
+        return cls(weights)
+
+    @classmethod
+    def full(cls) -> "Range":
+        """Every combo at full weight (any two cards)."""
+        return cls(np.ones(NUM_COMBOS))
+
+    @classmethod
+    def from_combos(cls, combos: Iterable[Tuple[Card, Card]]) -> "Range":
+        """Build a range holding the given hole card pairs at full weight."""
+        weights = np.zeros(NUM_COMBOS)
+        for first, second in combos:
+            weights[_combo_index(first.id, second.id)] = 1.0
+        return cls(weights)
+
+    @classmethod
+    def from_classes(cls, class_weights: np.ndarray) -> "Range":
+        """Build a range from one weight per starting hand class (shape (169,))."""
+        class_weights = np.asarray(class_weights, dtype=float)
+        if class_weights.shape != (NUM_CLASSES,):
+            raise ValueError(f"Class weights must have shape ({NUM_CLASSES},)")
+        return cls(class_weights[COMBO_CLASSES])
+
+    def __or__(self, other: "Range") -> "Range":
+        """Union: the larger weight of each combo."""
+        return Range(np.maximum(self.weights, other.weights))
+
+    def __and__(self, other: "Range") -> "Range":
+        """Intersection: the smaller weight of each combo."""
+        return Range(np.minimum(self.weights, other.weights))
+
+    def __sub__(self, other: "Range") -> "Range":
+        """Difference: remove the other range's weight from each combo."""
+        return Range(np.clip(self.weights - other.weights, 0.0, 1.0))
+
+    def __eq__(self, other: object) -> bool:
+        """Ranges are equal when every combo has the same weight."""
+        return isinstance(other, Range) and np.array_equal(self.weights, other.weights)
+
+    def __len__(self) -> int:
+        """Number of combos with non-zero weight."""
+        return int(np.count_nonzero(self.weights))
+
+    def __contains__(self, combo: Tuple[Card, Card]) -> bool:
+        """Check whether a pair of hole cards has non-zero weight."""
+        first, second = combo
+        return bool(self.weights[_combo_index(first.id, second.id)] > 0)
+
+    def __repr__(self) -> str:
+        """Return string representation for debugging."""
+        return f"Range({self.combo_count():.1f} combos)"
+
+    def combo_count(self) -> float:
+        """Total weight, i.e. the number of combos counting partial weights."""
+        return float(self.weights.sum())
+
+    def without(self, cards: Iterable[Card]) -> "Range":
+        """
+        Remove every combo that holds one of the given cards.
+
+        Args:
+            cards: Known cards (hero's hand, the board) acting as blockers
+
+        Returns:
+            The filtered range
+        """
+        ids = [card.id for card in cards]
+        if not ids:
+            return Range(self.weights.copy())
+        return Range(np.where(_CARD_COMBOS[ids].any(axis=0), 0.0, self.weights))
+
+    def combos(self) -> List[Tuple[Card, Card]]:
+        """Return the hole card pairs with non-zero weight."""
+        return [
+            (Card.from_id(first), Card.from_id(second))
+            for first, second in HOLE_COMBOS[self.weights > 0].tolist()
+        ]
+
+    def class_weights(self) -> np.ndarray:
+        """Average weight of each starting hand class, shape (169,)."""
+        totals = np.bincount(COMBO_CLASSES, weights=self.weights, minlength=NUM_CLASSES)
+        return totals / np.bincount(COMBO_CLASSES, minlength=NUM_CLASSES)
+
+    def fraction(self) -> float:
+        """Share of all 1326 combos the range covers (e.g. 0.15 for a 15% range)."""
+        return self.combo_count() / NUM_COMBOS
+
+
+def parse_range(text: str) -> Range:
+    """Parse range notation; see Range.parse."""
+    return Range.parse(text)
+
+
+def _combo_index(first_id: int, second_id: int) -> int:
+    """Combo index of two distinct card ids."""
+    index = int(COMBO_INDEX[first_id, second_id])
+    if index < 0:
+        raise ValueError("A combo needs two different cards")
+    return index
+
+
+def _class_combos(name: str) -> np.ndarray:
+    """Combo indices of one class, with "AK" meaning both AKs and AKo."""
+    if len(name) == 2 and name[0] != name[1]:
+        return np.flatnonzero(np.isin(COMBO_CLASSES, [class_index(name + "s"), class_index(name + "o")]))
+    return np.flatnonzero(COMBO_CLASSES == class_index(name))
+
+
+def _token_combos(token: str) -> np.ndarray:
+    """Combo indices for one range token (without its weight)."""
+    text = token.strip()
+    if len(text) >= 4 and text[1].lower() in "cdhs":
+        cards = parse_cards(text)
+        if len(cards) != 2:
+            raise ValueError(f"Invalid range token: {token!r}")
+        return np.array([_combo_index(cards[0].id, cards[1].id)])
+
+    if "-" in text:
+        start, _, end = text.partition("-")
+        names = _span(start, end, token)
+    elif text.endswith("+"):
+        names = _and_better(text[:-1], token)
+    else:
+        names = [_normalize(text, token)]
+    return np.concatenate([_class_combos(name) for name in names])
+
+
+def _normalize(text: str, token: str) -> str:
+    """Validate a class name and put it in canonical form (high rank first)."""
+    ranks = text[:2].upper()
+    suffix = text[2:].lower()
+    if len(ranks) != 2 or any(char not in _RANK_CHARS for char in ranks) or suffix not in ("", "s", "o"):
+        raise ValueError(f"Invalid range token: {token!r}")
+    if ranks[0] == ranks[1] and suffix:
+        raise ValueError(f"Invalid range token: {token!r}")
+    high, low = sorted(ranks, key=_RANK_CHARS.index, reverse=True)
+    return high + low + suffix
+
+
+def _and_better(text: str, token: str) -> List[str]:
+    """Expand "TT+" to TT-AA and "A2s+" to A2s-AKs."""
+    name = _normalize(text, token)
+    high, low, suffix = name[0], name[1], name[2:]
+    if high == low:
+        return [rank * 2 for rank in _RANK_CHARS[_RANK_CHARS.index(high):]]
+    kickers = _RANK_CHARS[_RANK_CHARS.index(low):_RANK_CHARS.index(high)]
+    return [high + kicker + suffix for kicker in kickers]
+
+
+def _span(start_text: str, end_text: str, token: str) -> List[str]:
+    """Expand "77-99" or "A2s-A5s" into the classes between the two ends."""
+    start, end = _normalize(start_text, token), _normalize(end_text, token)
+    if start[0] == start[1] and end[0] == end[1]:
+        first, last = sorted((_RANK_CHARS.index(start[0]), _RANK_CHARS.index(end[0])))
+        return [rank * 2 for rank in _RANK_CHARS[first:last + 1]]
+    if start[0] != end[0] or start[2:] != end[2:] or start[0] == start[1]:
+        raise ValueError(f"Invalid range span: {token!r}")
+    first, last = sorted((_RANK_CHARS.index(start[1]), _RANK_CHARS.index(end[1])))
+    return [start[0] + kicker + start[2:] for kicker in _RANK_CHARS[first:last + 1]]
@@ -0,0 +1,252 @@
+"""
+Seat ring: bitmask bookkeeping for turn order.
+
+PokerGame keeps its players in a list ordered by seat, and turn order is list
+order. SeatRing mirrors that list as bitmasks - one mask per player status,
+indexed by list position, plus a mask of occupied physical seats - and is
+updated whenever a player's status or the to-act set changes. "Who acts
+next", "is anyone still to act" and "which seat gets the button or the
+blinds" then become a couple of integer operations instead of scans over the
+players, and they can never disagree with the statuses they are derived
+from.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def next_bit(mask: int, after: int) -> int:
+    """
+    Index of the first set bit after a position, wrapping around.
+
+    Args:
+        mask: Bitmask to search
+        after: Bit index to start after (-1 searches from bit 0)
+
+    Returns:
+        The bit index, or -1 if the mask is empty
+    """
+    if not mask:
+        return -1
+    higher = mask >> (after + 1) << (after + 1) if after >= 0 else mask
+    found = higher or mask
+    return (found & -found).bit_length() - 1
+
+
+def popcount(mask: int) -> int:
+    """Number of set bits in a mask (int.bit_count needs Python 3.10)."""
+    return bin(mask).count("1")
+
+
+class SeatRing:
+    """Bitmask view of a game's players in turn order."""
+
+    def __init__(self, absent: Any):
+        """
+        Initialize an empty ring.
+
+        Args:
+            absent: Status of players who are seated but not dealt in
+                (PlayerStatus.OUT); they are left out of the seat mask
+        """
+        self.absent = absent
+        self.players: List[Any] = []
+        self.index: Dict[str, int] = {}
+        self.by_position: Dict[int, int] = {}
+        self.status_masks: Dict[Any, int] = {}
+        self.seated = 0  # Bit per physical seat (player.position) dealt in
+        self.to_act = 0
+        self.to_act_set: Optional["ToActSet"] = None
+
+    def reseat(self, players: List[Any]) -> None:
+        """
+        Re-index after players joined, left or were reordered.
+
+        Args:
+            players: The game's players list, in turn order
+        """
+        for player in self.players:
+            if player._ring is self:
+                player._ring = None
+        self.players = players
+        self.index = {}
+        self.by_position = {}
+        self.status_masks = {}
+        self.seated = 0
+        for seat, player in enumerate(players):
+            player._ring = self
+            player._seat = seat
+            self.index[player.player_id] = seat
+            self.by_position[player.position] = seat
+            self.status_masks[player.status] = self.status_masks.get(player.status, 0) | (1 << seat)
+            if player.status != self.absent:
+                self.seated |= 1 << player.position
+        self.to_act = self.mask_of(self.to_act_set or ())
+
+    @property
+    def size(self) -> int:
+        """Number of indexed players."""
+        return len(self.index)
+
+    def bit(self, player_id: str) -> int:
+        """Mask bit of a player (0 for players not at the table)."""
+        seat = self.index.get(player_id)
+        return 0 if seat is None else 1 << seat
+
+    def mask_of(self, player_ids: Iterable[str]) -> int:
+        """Mask of a collection of player IDs."""
+        mask = 0
+        for player_id in player_ids:
+            mask |= self.bit(player_id)
+        return mask
+
+    def mask(self, *statuses: Any) -> int:
+        """Mask of the players in any of the given statuses."""
+        mask = 0
+        for status in statuses:
+            mask |= self.status_masks.get(status, 0)
+        return mask
+
+    def status_changed(self, player: Any, old: Any, new: Any) -> None:
+        """Move a player between status masks (called by Player.status)."""
+        bit = 1 << player._seat
+        masks = self.status_masks
+        masks[old] = masks.get(old, 0) & ~bit
+        masks[new] = masks.get(new, 0) | bit
+        if new == self.absent:
+            self.seated &= ~(1 << player.position)
+        elif old == self.absent:
+            self.seated |= 1 << player.position
+
+    def next_seat(self, seat: int, mask: int) -> int:
+        """
+        First list index after a seat whose bit is set in mask, wrapping around.
+
+        Returns:
+            The index, or -1 if the mask is empty
+        """
+        return next_bit(mask, seat)
+
+    def next_position(self, position: int) -> int:
+        """
+        First dealt-in physical seat clockwise after a seat position.
+
+        Returns:
+            The seat position, or -1 if nobody is dealt in
+        """
+        return next_bit(self.seated, position)
+
+    def seat_of_position(self, position: int) -> int:
+        """
+        List index of the player at a physical seat, or of the last player
+        seated before it when the seat is empty (so searches "after" it
+        start in the right place).
+        """
+        seat = self.by_position.get(position)
+        if seat is not None:
+            return seat
+        before = [index for pos, index in self.by_position.items() if pos < position]
+        return max(before) if before else -1
+
+    def player_at(self, position: int) -> Optional[Any]:
+        """The player sitting at a physical seat position, if any."""
+        seat = self.by_position.get(position)
+        return None if seat is None else self.players[seat]
+
+
+class ToActSet(set):
+    """
+    Set of player IDs still to act that keeps its ring's to_act mask in sync.
+
+    Behaves like the plain set it replaces; single-player updates cost O(1),
+    bulk updates recompute the mask.
+    """
+
+    def __init__(self, ring: SeatRing, player_ids: Iterable[str] = ()):
+        """
+        Initialize the set and make it the ring's to-act set.
+
+        Args:
+            ring: Seat ring to keep in sync
+            player_ids: Initial player IDs
+        """
+        super().__init__(player_ids)
+        self.ring = ring
+        ring.to_act_set = self
+        ring.to_act = ring.mask_of(self)
+
+    def __reduce__(self):
+        # The ring is restored as plain state: it may itself still be mid-copy
+        return _restore_to_act, (list(self),), self.__dict__
+
+    def _remask(self) -> None:
+        """Recompute the ring mask after a bulk update."""
+        if self.ring.to_act_set is self:
+            self.ring.to_act = self.ring.mask_of(self)
+
+    def add(self, player_id: str) -> None:
+        super().add(player_id)
+        if self.ring.to_act_set is self:
+            self.ring.to_act |= self.ring.bit(player_id)
+
+    def remove(self, player_id: str) -> None:
+        super().remove(player_id)
+        if self.ring.to_act_set is self:
+            self.ring.to_act &= ~self.ring.bit(player_id)
+
+    def discard(self, player_id: str) -> None:
+        super().discard(player_id)
+        if self.ring.to_act_set is self:
+            self.ring.to_act &= ~self.ring.bit(player_id)
+
+    def pop(self) -> str:
+        player_id = super().pop()
+        if self.ring.to_act_set is self:
+            self.ring.to_act &= ~self.ring.bit(player_id)
+        return player_id
+
+    def clear(self) -> None:
+        super().clear()
+        if self.ring.to_act_set is self:
+            self.ring.to_act = 0
+
+    def update(self, *others: Iterable[str]) -> None:
+        super().update(*others)
+        self._remask()
+
+    def difference_update(self, *others: Iterable[str]) -> None:
+        super().difference_update(*others)
+        self._remask()
+
+    def intersection_update(self, *others: Iterable[str]) -> None:
+        super().intersection_update(*others)
+        self._remask()
+
+    def symmetric_difference_update(self, other: Iterable[str]) -> None:
+        super().symmetric_difference_update(other)
+        self._remask()
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self._remask()
+        return self
+
+    def __iand__(self, other):
+        super().__iand__(other)
+        self._remask()
+        return self
+
+    def __isub__(self, other):
+        super().__isub__(other)
+        self._remask()
+        return self
+
+    def __ixor__(self, other):
+        super().__ixor__(other)
+        self._remask()
+        return self
+
+
+def _restore_to_act(player_ids: List[str]) -> ToActSet:
+    """Unpickling helper for ToActSet (its ring is set from the pickled state)."""
+    to_act = set.__new__(ToActSet)
+    set.update(to_act, player_ids)
+    return to_act
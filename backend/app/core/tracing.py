@@ -0,0 +1,163 @@
+"""
+Structured tracing for the game engine hot path.
+
+Instead of formatting log lines on every action, the engine records named
+spans and events with structured fields:
+
+    with tracer.span(game_id, "action", player=player_id, action="CALL") as span:
+        ...
+        span.set(ok=True)
+    tracer.event(game_id, "action.rejected", reason="below_min_raise")
+
+Tracing is off unless TRACE_SAMPLE_RATE is above zero. While off, span()
+returns a shared no-op span and event() returns at once, so nothing is
+formatted or allocated beyond the call itself; guard fields that are
+expensive to compute with ``if tracer.enabled``. While on, each game is
+sampled once by a stable hash of its ID, so a sampled game is traced end to
+end and the others cost the same as when tracing is off.
+
+Records go to a size-rotated local file (TRACE_FILE, TRACE_MAX_BYTES,
+TRACE_BACKUPS), one compact JSON array per line:
+
+    [unix_time, game_id, name, duration_us or null, {fields}]
+"""
+import json
+import logging
+import os
+import time
+import zlib
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, Optional
+
+from app.core.config import TRACE_BACKUPS, TRACE_FILE, TRACE_MAX_BYTES, TRACE_SAMPLE_RATE
+
+
+class Span:
+    """A traced operation; written with its duration when the block exits."""
+
+    __slots__ = ("tracer", "game_id", "name", "fields", "start")
+
+    def __init__(self, tracer: "Tracer", game_id: Optional[str], name: str, fields: Dict[str, Any]):
+        self.tracer = tracer
+        self.game_id = game_id
+        self.name = name
+        self.fields = fields
+        self.start = 0.0
+
+    def set(self, **fields: Any) -> None:
+        """Attach more fields (e.g. the outcome) before the span ends."""
+        self.fields.update(fields)
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            self.fields["error"] = exc_type.__name__
+        self.tracer._write(self.game_id, self.name, (time.perf_counter() - self.start) * 1e6, self.fields)
+        return False
+
+
+class _NullSpan:
+    """Span handed out when a game is not traced."""
+
+    __slots__ = ()
+
+    def set(self, **fields: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Per-game sampled span and event recorder."""
+
+    def __init__(self, sample_rate: float = TRACE_SAMPLE_RATE, path: str = TRACE_FILE,
+                 max_bytes: int = TRACE_MAX_BYTES, backups: int = TRACE_BACKUPS):
+        self._logger = logging.getLogger("app.trace")
+        self._logger.propagate = False
+        self._handler: Optional[logging.Handler] = None
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.configure(sample_rate)
+
+    def configure(self, sample_rate: float, path: Optional[str] = None,
+                  max_bytes: Optional[int] = None, backups: Optional[int] = None) -> None:
+        """
+        Change the sampling rate or output file at runtime.
+
+        Args:
+            sample_rate: Fraction of games to trace (0 turns tracing off)
+            path: Trace file; rotated when it reaches max_bytes
+            max_bytes: Size at which the file rotates
+            backups: Rotated files to keep
+        """
+        self.sample_rate = sample_rate
+        if path is not None:
+            self.path = path
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if backups is not None:
+            self.backups = backups
+        self.close()
+        self.enabled = sample_rate > 0
+
+    def close(self) -> None:
+        """Flush and close the trace file (it is reopened on the next record)."""
+        if self._handler is not None:
+            self._logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+
+    def sampled(self, game_id: Optional[str]) -> bool:
+        """
+        Whether a game is traced.
+
+        The decision is a pure function of the game ID, so it is recomputed
+        on each call rather than remembered: nothing accumulates per game.
+        """
+        if not self.enabled:
+            return False
+        return zlib.crc32((game_id or "").encode()) / 0x100000000 < self.sample_rate
+
+    def span(self, game_id: Optional[str], name: str, **fields: Any):
+        """
+        Time a block of work.
+
+        Returns:
+            A context manager; call .set(**fields) on it to add fields
+        """
+        if not self.enabled or not self.sampled(game_id):
+            return NULL_SPAN
+        return Span(self, game_id, name, fields)
+
+    def event(self, game_id: Optional[str], name: str, **fields: Any) -> None:
+        """Record a point-in-time event."""
+        if not self.enabled or not self.sampled(game_id):
+            return
+        self._write(game_id, name, None, fields)
+
+    def _write(self, game_id: Optional[str], name: str, duration_us: Optional[float],
+               fields: Dict[str, Any]) -> None:
+        if self._handler is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes, backupCount=self.backups)
+            self._handler.setFormatter(logging.Formatter("%(message)s"))
+            self._logger.addHandler(self._handler)
+            self._logger.setLevel(logging.INFO)
+        duration = None if duration_us is None else round(duration_us, 1)
+        record = [round(time.time(), 6), game_id, name, duration, fields]
+        self._logger.info(json.dumps(record, separators=(",", ":"), default=str))
+
+
+# Shared tracer for the application
+tracer = Tracer()
@@ -0,0 +1,146 @@
+"""
+Pure betting state machine: (state, action) -> (new_state, events).
+
+step() applies one action to a HeadlessGame without touching the state it is
+given and returns the successor together with TransitionEvents describing
+everything that happened - the action itself, a betting round closing with
+its bets, each street dealt, the showdown and the chips won. There is no
+I/O, logging or awaiting anywhere on this path, so states and events can be
+computed in worker processes (both pickle) and benchmarked on their own;
+EventOrchestrator.dispatch() replays the events to clients and is the only
+place that waits for animations.
+
+This is the only betting transition there is: PokerGame.apply_action()
+steps a fork() of the live table (seat numbers equal to player list indices,
+player IDs carried into the events), writes the new state back and settles
+finished hands; PokerGame.process_action() then dispatches the events.
+
+Run ``python -m app.core.transitions`` for a throughput check.
+"""
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from app.core.cards import Card
+from app.core.game_events import GameEventType, PlayerBet, StreetCards, TransitionEvent
+from app.core.headless import HeadlessGame, make_random_policy
+from app.core.poker_game import PlayerAction
+
+_STREET_NAMES = {3: "FLOP", 4: "TURN", 5: "RIVER"}
+
+
+def step(state: HeadlessGame, action: PlayerAction,
+         amount: Optional[int] = None) -> Tuple[HeadlessGame, List[TransitionEvent]]:
+    """
+    Apply an action for the seat to act.
+
+    Args:
+        state: Current state (left unchanged)
+        action: The action taken
+        amount: For BET/RAISE, the player's total bet this round (raise-to)
+
+    Returns:
+        The new state and the events the action caused, in order
+
+    Raises:
+        ValueError: If the hand is over or the action is not legal
+    """
+    seat = state.current_seat
+    new = state.fork()
+    new.act(action, amount)
+
+    player_ids = new.player_ids
+    put_in = new.committed[seat] - state.committed[seat]
+    events = [TransitionEvent(
+        GameEventType.PLAYER_ACTION_PROCESSED,
+        player_id=player_ids[seat],
+        action=action,
+        amount=put_in,
+        street_bet=state.current_bets[seat] + put_in,
+        hand_bet=new.committed[seat],
+    )]
+
+    dealt = len(state.board)
+    if not new.hand_over and len(new.board) == dealt:
+        return new, events
+
+    # The action closed the betting round
+    bets = list(state.current_bets)
+    bets[seat] += put_in
+    events.append(TransitionEvent(
+        GameEventType.BETTING_ROUND_COMPLETED,
+        player_bets=[PlayerBet(player_ids[s], bet) for s, bet in enumerate(bets) if bet > 0],
+        total_pot=new.pot,
+    ))
+    for size in sorted(_STREET_NAMES):
+        if dealt < size <= len(new.board):
+            cards = [Card.from_id(card_id) for card_id in new.board[dealt:size]]
+            events.append(TransitionEvent(
+                GameEventType.STREET_DEALING_REQUIRED,
+                street_cards=StreetCards(_STREET_NAMES[size], cards),
+            ))
+            dealt = size
+
+    if new.hand_over:
+        in_hand = new._in_hand
+        contested = in_hand & (in_hand - 1) != 0
+        events.append(TransitionEvent(
+            GameEventType.SHOWDOWN_TRIGGERED if contested else GameEventType.EARLY_SHOWDOWN_TRIGGERED
+        ))
+        events.append(TransitionEvent(
+            GameEventType.HAND_COMPLETED,
+            winnings={player_ids[s]: won for s, won in enumerate(new.winnings) if won},
+        ))
+    return new, events
+
+
+def play_hands(seed: int, hands: int, players: int = 6) -> Tuple[int, int]:
+    """
+    Play hands through step() with the random policy (a process pool task).
+
+    Returns:
+        (transitions applied, events produced)
+    """
+    state = HeadlessGame([10000] * players, 50, 100, seed=seed)
+    policy = make_random_policy(seed)
+    transitions = produced = 0
+    for _ in range(hands):
+        if sum(chips > 0 for chips in state.chips) < 2:
+            state.chips = [10000] * players
+        state.start_hand()
+        while not state.hand_over:
+            action, amount = policy(state, state.current_seat)
+            state, events = step(state, action, amount)
+            transitions += 1
+            produced += len(events)
+    return transitions, produced
+
+
+def main() -> None:
+    """Measure transition throughput in-process and across a process pool."""
+    parser = argparse.ArgumentParser(description="Benchmark the pure betting state machine")
+    parser.add_argument("--hands", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    transitions, _ = play_hands(0, args.hands)
+    elapsed = time.perf_counter() - started
+    print(f"1 process: {transitions} transitions in {elapsed:.2f}s "
+          f"({transitions / elapsed:,.0f}/s, {elapsed * 1e6 / transitions:.1f} us each)")
+
+    per_worker = args.hands // args.workers
+    context = multiprocessing.get_context("spawn")
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=context) as pool:
+        results = list(pool.map(play_hands, range(args.workers), [per_worker] * args.workers))
+    elapsed = time.perf_counter() - started
+    transitions = sum(done for done, _ in results)
+    print(f"{args.workers} processes: {transitions} transitions in {elapsed:.2f}s "
+          f"({transitions / elapsed:,.0f}/s including pool start-up)")
+
+
+if __name__ == "__main__":
+    main()
@@ -532,6 +532,7 @@ class GameStateNotifier:
         Args:
             game_id: ID of the game
         """
+        import logging
         import time
         timestamp = time.time()
         message = {
@@ -989,9 +990,9 @@ class GameStateNotifier:
         # (hand_result data will include None for handId in that case)
         
         logging.info(f"Notifying hand result for game {game_id}, hand {game.current_hand_id}")
-        # Compute hand evaluations for human-readable descriptions
+        # Hand descriptions, evaluated once at showdown
         try:
-            evaluations = game.evaluate_hands()
+            evaluations = game.showdown_results()
         except Exception as e:
             logging.error(f"Error evaluating hands for hand result: {e}")
             evaluations = {}
@@ -1028,9 +1029,7 @@ class GameStateNotifier:
                 
                 # Add human-readable hand description
                 if winner in evaluations:
-                    rank, kickers = evaluations[winner]
-                    desc = game._format_hand_description(rank, kickers)
-                    winner_info["hand_rank"] = desc
+                    winner_info["hand_rank"] = evaluations[winner].description
                 # Include hole cards if available
                 if hasattr(winner, 'hand') and winner.hand:
                     winner_info["cards"] = [str(card) for card in winner.hand.cards]
@@ -1,6 +1,7 @@
 """
 Main entry point for the FastAPI application.
 """
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -30,6 +31,10 @@ from app.api.game import router as game_router
 from app.api.history_api import router as history_router
 from app.api.ai_connector import router as ai_router
 from app.api.setup import router as setup_router
+from app.api.equity_api import router as equity_router
+from app.core.equity import EquityCalculator
+from app.core.preflop import PreflopEquityTable
+from app.services.game_service import GameService
 from app.repositories.persistence import RepositoryPersistence, PersistenceScheduler
 from app.repositories.in_memory import (
     GameRepository, UserRepository, HandRepository, ActionHistoryRepository,
@@ -61,6 +66,13 @@ except ImportError as e:
     import traceback
     print(traceback.format_exc())
 
+# The LLM service only needs the ai package, not the memory system
+try:
+    from ai.llm_service import LLMService
+except ImportError as e:
+    LLMService = None
+    print(f"LLM service not available: {e}")
+
 # Repository persistence setup
 data_dir = os.environ.get("DATA_DIR", "./data")
 persistence = RepositoryPersistence(data_dir=data_dir)
@@ -97,6 +109,15 @@ async def lifespan(app: FastAPI):
             import traceback
             print(traceback.format_exc())
     
+    # One LLM service for the process: provider clients and their
+    # keep-alive connections are set up once, not per AI decision
+    if LLMService is not None:
+        try:
+            llm_service = LLMService.initialize(os.environ.get("LLM_CONFIG_PATH"))
+            print(f"LLM service initialized (default provider={llm_service.default_provider})")
+        except Exception as e:
+            print(f"Error initializing LLM service: {str(e)}")
+    
     # Create data directory if it doesn't exist
     if not os.path.exists(data_dir):
         os.makedirs(data_dir)
@@ -110,11 +131,23 @@ async def lifespan(app: FastAPI):
     scheduler.start()
     print("Persistence scheduler started")
     
+    # Memory-map the preflop equity table
+    if PreflopEquityTable.get_instance() is None:
+        print("Preflop equity table not built; preflop equity will be simulated")
+    
+    # Start equity engine worker processes
+    await asyncio.get_running_loop().run_in_executor(None, EquityCalculator.get_instance().start)
+    print("Equity engine started")
+    
     yield
     
     # Shutdown: Save all repositories and stop scheduler
     print("Shutting down Chip Swinger Championship Poker Trainer API...")
+    await GameService.get_instance().close_tables()
     scheduler.stop()
+    EquityCalculator.get_instance().shutdown()
+    if LLMService is not None:
+        LLMService.shutdown()
     print("Final data save completed")
 
 
@@ -150,6 +183,7 @@ app.include_router(game_router)
 app.include_router(history_router)
 app.include_router(ai_router)
 app.include_router(setup_router)
+app.include_router(equity_router)
 
 # Include Cash Game API router
 from app.api.cash_game import router as cash_game_router
@@ -0,0 +1,241 @@
+"""
+AI turn scheduling: one loop per table drives consecutive AI turns.
+
+When the player to act is an AI, the table's AITurnScheduler runs a loop:
+wait for the pacing delay, take the turn, then look again. The loop stops
+when a human is to act or the hand is waiting on nothing, so a run of AI
+players is a flat sequence of turns rather than a chain of nested calls.
+Starting the scheduler while its loop is running does nothing; the loop
+picks up whoever is to act next.
+
+Pacing is a policy (AI_PACING): "instant" acts at once, "fixed" waits
+AI_PACING_SECONDS before every turn and "human" varies the wait, thinking
+longer when facing a bet and on later streets. A turn is dropped if the
+table moved on while it waited, and cancel() stops pending turns when a
+hand is ended from outside the loop or the table closes.
+
+Decisions can be prefetched: once an action is applied, the next AI's
+information set (what it can see of the table) is fixed, so its decision
+can be started while clients animate the action and the pacing delay runs.
+The turn takes the prefetched decision only if the information set still
+matches; otherwise it is cancelled and the turn decides afresh.
+"""
+import asyncio
+import json
+import logging
+import random
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+
+from app.core.config import AI_PACING, AI_PACING_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# (player_id, anything identifying the hand and street); equal keys are the same turn
+Turn = Tuple[str, Hashable]
+
+
+def information_set(*parts: Any) -> str:
+    """A canonical key for what a player can see; equal keys mean the same decision."""
+    return json.dumps(parts, sort_keys=True, default=str)
+
+
+class PacingPolicy:
+    """How long an AI waits before acting. The base policy acts at once."""
+
+    name = "instant"
+
+    def delay(self, poker_game, player_id: str) -> float:
+        """Seconds to wait before the player's turn."""
+        return 0.0
+
+
+class FixedPacing(PacingPolicy):
+    """The same wait before every AI turn."""
+
+    name = "fixed"
+
+    def __init__(self, seconds: float = AI_PACING_SECONDS):
+        self.seconds = seconds
+
+    def delay(self, poker_game, player_id: str) -> float:
+        return self.seconds
+
+
+class HumanPacing(PacingPolicy):
+    """
+    Varied waits around a base, like a person thinking.
+
+    Decisions facing a bet take longer, and so do later streets.
+    """
+
+    name = "human"
+
+    def __init__(self, seconds: float = AI_PACING_SECONDS, rng: Optional[random.Random] = None):
+        self.seconds = seconds
+        self.rng = rng or random.Random()
+
+    def delay(self, poker_game, player_id: str) -> float:
+        player = next((p for p in poker_game.players if p.player_id == player_id), None)
+        wait = self.seconds * self.rng.uniform(0.6, 1.6)
+        if player is not None and poker_game.current_bet > player.current_bet:
+            wait += self.seconds * self.rng.uniform(0.0, 1.5)
+        wait += self.seconds * 0.2 * len(poker_game.community_cards) / 5
+        return wait
+
+
+_PACING = {policy.name: policy for policy in (PacingPolicy, FixedPacing, HumanPacing)}
+
+
+def make_pacing(name: str = AI_PACING, seconds: float = AI_PACING_SECONDS) -> PacingPolicy:
+    """
+    Build a pacing policy by name ("instant", "fixed" or "human").
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    policy = _PACING.get(name.lower())
+    if policy is None:
+        raise ValueError(f"Unknown AI pacing policy '{name}'; expected one of {sorted(_PACING)}")
+    return policy() if policy is PacingPolicy else policy(seconds)
+
+
+def _discard(decision: asyncio.Future) -> None:
+    """Cancel a decision nobody will await, retrieving any error it already raised."""
+    if decision.done():
+        if not decision.cancelled():
+            decision.exception()
+    else:
+        decision.cancel()
+
+
+class AITurnScheduler:
+    """
+    Drives the AI turns of one table, one at a time.
+
+    Args:
+        game_id: The table's game ID
+        next_turn: Returns the AI turn due now, or None if no AI is to act
+        take_turn: Takes one AI player's turn
+        on_idle: Called after a run of turns, when no AI is left to act
+        pacing: Pacing policy (see make_pacing)
+        poker_game: Returns the table's PokerGame, for the pacing policy
+        prefetch: Called before each turn's pacing wait to start its decision early
+    """
+
+    def __init__(self, game_id: str,
+                 next_turn: Callable[[], Optional[Turn]],
+                 take_turn: Callable[[str], Awaitable[None]],
+                 on_idle: Callable[[], Awaitable[None]],
+                 pacing: PacingPolicy,
+                 poker_game: Callable[[], object],
+                 prefetch: Optional[Callable[[], None]] = None):
+        self.game_id = game_id
+        self.pacing = pacing
+        self._next_turn = next_turn
+        self._take_turn = take_turn
+        self._on_idle = on_idle
+        self._poker_game = poker_game
+        self._prefetch_hook = prefetch
+        self._task: Optional[asyncio.Task] = None
+        # (player_id, information set, decision task)
+        self._prefetch: Optional[Tuple[str, str, asyncio.Task]] = None
+        self.turns_taken = 0
+        self.turns_dropped = 0
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> asyncio.Task:
+        """Start the loop unless it is already running; returns its task."""
+        if not self.running or self._task.get_loop() is not asyncio.get_running_loop():
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def run(self) -> None:
+        """
+        Start the loop (or join the running one) and wait until no AI is to act.
+
+        Cancelling the caller does not stop the table's turns.
+        """
+        task = self.start()
+        if task is asyncio.current_task():
+            return
+        try:
+            await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise
+
+    def cancel(self) -> None:
+        """Drop the pending turn, if any (hand ended elsewhere or table closing)."""
+        self.drop_prefetch()
+        if self.running and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def prefetch(self, player_id: str, key: str, decide: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Start deciding a player's turn ahead of time.
+
+        Does nothing if the same decision is already under way; a prefetch
+        for anything else is replaced.
+
+        Args:
+            player_id: The AI player to act next
+            key: The player's information set (see information_set)
+            decide: Makes the decision
+        """
+        if self._prefetch is not None and self._prefetch[:2] == (player_id, key):
+            return
+        self.drop_prefetch()
+        self._prefetch = (player_id, key, asyncio.ensure_future(decide()))
+
+    def take_prefetched(self, player_id: str, key: str) -> Optional[asyncio.Future]:
+        """
+        Hand over the prefetched decision if it was made from this information set.
+
+        Returns:
+            The decision's task to await, or None (and the stale prefetch is dropped)
+        """
+        if self._prefetch is None:
+            return None
+        prefetched, self._prefetch = self._prefetch, None
+        if prefetched[:2] == (player_id, key) and not prefetched[2].cancelled():
+            self.prefetch_hits += 1
+            return prefetched[2]
+        _discard(prefetched[2])
+        self.prefetch_misses += 1
+        return None
+
+    def drop_prefetch(self) -> None:
+        """Cancel the prefetched decision, if any."""
+        if self._prefetch is not None:
+            _discard(self._prefetch[2])
+            self._prefetch = None
+
+    async def _run(self) -> None:
+        took_turn = False
+        while (turn := self._next_turn()) is not None:
+            player_id = turn[0]
+            if self._prefetch_hook is not None:
+                self._prefetch_hook()
+            wait = self.pacing.delay(self._poker_game(), player_id)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                if self._next_turn() != turn:
+                    # Someone else moved the table on while this turn waited
+                    self.turns_dropped += 1
+                    continue
+            try:
+                await self._take_turn(player_id)
+            except Exception:
+                logger.exception("Table %s: AI turn for %s failed", self.game_id, player_id)
+            self.turns_taken += 1
+            took_turn = True
+            if self._next_turn() == turn:
+                logger.error("Table %s: AI turn for %s did not advance the game; stopping", self.game_id, player_id)
+                return
+        if took_turn:
+            await self._on_idle()
@@ -12,6 +12,8 @@ from app.core.cards import Deck
 from app.core.hand_evaluator import HandEvaluator
 from app.core.poker_game import PokerGame
 from app.core.poker_game import PlayerStatus as PokerPlayerStatus, BettingRound as PokerBettingRound
+from app.core.config import AI_PREFETCH
+from app.core.tracing import tracer
 from app.models.domain_models import (
     Game, Player, Hand, ActionHistory, GameType, GameStatus, 
     BettingRound, PlayerAction, PlayerStatus as DomainPlayerStatus, TournamentInfo, CashGameInfo,
@@ -22,6 +24,9 @@ from app.repositories.in_memory import (
     HandHistoryRepository, RepositoryFactory
 )
 from app.services.hand_history_service import HandHistoryRecorder
+from app.services.ai_turns import AITurnScheduler, Turn, information_set, make_pacing
+from app.services.table_actor import TableActor, TableCommand
+from app.sharding import new_game_id
 
 
 class GameService:
@@ -75,13 +80,137 @@ class GameService:
         # Define showdown delay constant
         self.SHOWDOWN_DELAY = 1.5  # seconds to show cards at showdown
         
-        # Add locks for game actions to prevent race conditions in production code
-        # but handle gracefully in test code
-        try:
-            self.game_locks: Dict[str, asyncio.Lock] = {}
-        except RuntimeError:
-            # For synchronous test environments that don't have an event loop
-            self.game_locks = {}
+        # One actor per live table runs its actions and other commands in order
+        self.table_actors: Dict[str, TableActor] = {}
+        
+        # One loop per table drives consecutive AI turns, paced by policy
+        self.ai_turn_schedulers: Dict[str, AITurnScheduler] = {}
+        self.ai_pacing = make_pacing()
+    
+    def _is_live(self, game_id: str) -> bool:
+        """Whether a game exists and has not ended (only live tables get actors)."""
+        game = self.game_repo.get(game_id)
+        if game is None:
+            return game_id in self.poker_games
+        return game.status != GameStatus.COMPLETED
+    
+    def table_actor(self, game_id: str) -> TableActor:
+        """
+        Get the actor that serializes commands for a table, creating it if needed.
+        
+        Args:
+            game_id: ID of the game
+            
+        Returns:
+            The table's TableActor
+            
+        Raises:
+            KeyError: If the game does not exist or has ended
+        """
+        actor = self.table_actors.get(game_id)
+        if actor is None:
+            if not self._is_live(game_id):
+                raise KeyError(f"Game {game_id} not found")
+            actor = self.table_actors[game_id] = TableActor(game_id)
+        return actor
+    
+    def table_metrics(self) -> List[Dict[str, Any]]:
+        """Queue depth and wait metrics for every table with an actor."""
+        return [actor.metrics() for actor in self.table_actors.values()]
+    
+    async def close_tables(self) -> None:
+        """Stop every table actor and pending AI turn (on shutdown)."""
+        for scheduler in self.ai_turn_schedulers.values():
+            scheduler.cancel()
+        self.ai_turn_schedulers.clear()
+        for actor in list(self.table_actors.values()):
+            await actor.stop()
+        self.table_actors.clear()
+    
+    def end_game(self, game_id: str) -> None:
+        """
+        Mark a game completed and release its table.
+        
+        The table's AI turn loop is cancelled, its actor retired (after the
+        command that is running, so a command may end its own game) and the
+        AI agents cached for its seats are dropped.
+        
+        Args:
+            game_id: ID of the game
+        """
+        game = self.game_repo.get(game_id)
+        if game and game.status != GameStatus.COMPLETED:
+            game.status = GameStatus.COMPLETED
+            self.game_repo.update(game)
+        scheduler = self.ai_turn_schedulers.pop(game_id, None)
+        if scheduler is not None:
+            scheduler.cancel()
+        actor = self.table_actors.pop(game_id, None)
+        if actor is not None:
+            actor.close()
+        self._evict_ai_agents(game_id)
+    
+    def _evict_ai_agents(self, game_id: str, player_id: Optional[str] = None) -> None:
+        """Drop the cached AI agent of a seat, or of every seat in a game."""
+        from app.core.config import MEMORY_SYSTEM_AVAILABLE
+        if MEMORY_SYSTEM_AVAILABLE:
+            try:
+                from ai.memory_integration import MemoryIntegration
+                MemoryIntegration.evict_agents(game_id, player_id)
+            except ImportError:
+                pass
+    
+    def ai_turns(self, game_id: str) -> AITurnScheduler:
+        """
+        Get the loop that drives a table's AI turns, creating it if needed.
+        
+        start() or run() it whenever an AI may be next to act; cancel() it
+        when the hand is ended or restarted from outside the loop.
+        
+        Args:
+            game_id: ID of the game
+            
+        Returns:
+            The table's AITurnScheduler
+            
+        Raises:
+            KeyError: If the game does not exist or has ended
+        """
+        scheduler = self.ai_turn_schedulers.get(game_id)
+        if scheduler is None:
+            if not self._is_live(game_id):
+                raise KeyError(f"Game {game_id} not found")
+            scheduler = self.ai_turn_schedulers[game_id] = AITurnScheduler(
+                game_id,
+                next_turn=lambda: self._next_ai_turn(game_id),
+                take_turn=lambda player_id: self._request_and_process_ai_action(game_id, player_id),
+                on_idle=lambda: self._request_human_action(game_id),
+                pacing=self.ai_pacing,
+                poker_game=lambda: self.poker_games.get(game_id),
+                prefetch=lambda: self.prefetch_ai_decision(game_id),
+            )
+        return scheduler
+    
+    def _next_ai_turn(self, game_id: str) -> Optional[Turn]:
+        """The AI turn due at a table: (player_id, (hand, street, actions so far)), or None."""
+        poker_game = self.poker_games.get(game_id)
+        game = self.game_repo.get(game_id)
+        if not poker_game or not game or not (0 <= poker_game.current_player_idx < len(poker_game.players)):
+            return None
+        player = poker_game.players[poker_game.current_player_idx]
+        if player.status != PokerPlayerStatus.ACTIVE or player.player_id not in poker_game.to_act:
+            return None
+        domain_player = next((p for p in game.players if p.id == player.player_id), None)
+        if not domain_player or domain_player.is_human:
+            return None
+        return player.player_id, (poker_game.hand_number, poker_game.current_round, len(poker_game.to_act))
+    
+    async def _request_human_action(self, game_id: str) -> None:
+        """Prompt the human to act once a run of AI turns hands over to them."""
+        poker_game = self.poker_games.get(game_id)
+        if poker_game and poker_game.to_act:
+            from app.core.websocket import game_notifier
+            await game_notifier.notify_action_request(game_id, poker_game)
     
     def create_game(
         self, 
@@ -101,7 +230,7 @@ class GameService:
             The created Game entity
         """
         game = Game(
-            id=str(uuid.uuid4()),
+            id=new_game_id(),
             type=game_type,
             status=GameStatus.WAITING,
             name=name or f"Game {game_type}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
@@ -502,6 +631,20 @@ class GameService:
         # Determine hand number
         hand_number = len(game.hand_history) + 1
         
+        # Tournament players who busted last hand are out for good, and the
+        # tournament is over once fewer than two players have chips left
+        if game.type == GameType.TOURNAMENT and hand_number > 1:
+            for player in game.players:
+                if player.status != DomainPlayerStatus.OUT and player.chips <= 0:
+                    player.status = DomainPlayerStatus.OUT
+                    if not player.is_human:
+                        self._evict_ai_agents(game.id, player.id)
+            if sum(1 for p in game.players if p.status != DomainPlayerStatus.OUT) < 2:
+                game.status = GameStatus.COMPLETED
+                self.game_repo.update(game)
+                self.end_game(game.id)
+                raise ValueError("Tournament is over")
+        
         # Determine dealer position
         dealer_position = 0
         if hand_number > 1:
@@ -724,6 +867,25 @@ class GameService:
         
         return hand
     
+    def _start_next_hand(self, game: Game) -> Optional[Hand]:
+        """
+        Start the hand after a finished one, unless that hand ended the tournament.
+        
+        Args:
+            game: The game to continue
+            
+        Returns:
+            The new Hand entity, or None if the game is over
+        """
+        try:
+            return self._start_new_hand(game)
+        except ValueError:
+            if game.status != GameStatus.COMPLETED:
+                raise
+            import logging
+            logging.info(f"Game {game.id} is over; no new hand")
+            return None
+        
     def advance_tournament_level(self, game_id: str) -> Game:
         """
         Advance to the next tournament level and update blinds.
@@ -909,295 +1071,259 @@ class GameService:
             ValueError: If the action is invalid
             KeyError: If the game or player doesn't exist
         """
-        import time # Added for logging
-        import logging # Added for explicit logging
-        import asyncio # Added for async sleep
-        # Using PokerBettingRound already imported at the top of the file
-        
-        start_time = time.time() # Added for logging
-        execution_id = f"{start_time:.6f}" # Added for logging
-        logging.info(f"[PROCESS-ACTION-{execution_id}] Starting for player {player_id}, action {action}, amount {amount}")
-
-        # Get or create a lock for this game
-        if game_id not in self.game_locks:
-            self.game_locks[game_id] = asyncio.Lock()
-        game_lock = self.game_locks[game_id]
-        
-        async with game_lock:
-            logging.info(f"[PROCESS-ACTION-{execution_id}] Lock acquired.")
-            game = self.game_repo.get(game_id)
-            if not game:
-                raise KeyError(f"Game {game_id} not found")
-                
-            if game.status != GameStatus.ACTIVE:
-                raise ValueError(f"Cannot process action for game with status {game.status}")
+        return await self.table_actor(game_id).submit(
+            TableCommand.ACTION,
+            lambda: self._apply_action(game_id, player_id, action, amount)
+        )
+    
+    async def _apply_action(
+        self,
+        game_id: str,
+        player_id: str,
+        action: PlayerAction,
+        amount: Optional[int]
+    ) -> Game:
+        """Apply a player action; runs on the table's actor (see _process_action_impl)."""
+        import logging
+        
+        game = self.game_repo.get(game_id)
+        if not game:
+            raise KeyError(f"Game {game_id} not found")
+            
+        if game.status != GameStatus.ACTIVE:
+            raise ValueError(f"Cannot process action for game with status {game.status}")
+            
+        if not game.current_hand:
+            raise ValueError("No active hand in the game")
+            
+        # Validate the player
+        player = next((p for p in game.players if p.id == player_id), None)
+        if not player:
+            raise KeyError(f"Player {player_id} not found in game {game_id}")
+            
+        logging.debug("Processing action: %s [seat %s] %s %s in %s",
+                      player.name, player.position, action, amount, game.current_hand.current_round)
+        
+        # Create action history record
+        action_history = ActionHistory(
+            game_id=game_id,
+            hand_id=game.current_hand.id,
+            player_id=player_id,
+            action=action,
+            amount=amount,
+            round=game.current_hand.current_round
+        )
+        
+        # Process the action in the poker game
+        if game_id in self.poker_games:
+            poker_game = self.poker_games[game_id]
+            
+            # Find the player in the poker game
+            poker_player = next((p for p in poker_game.players if p.player_id == player_id), None)
                 
-            if not game.current_hand:
-                raise ValueError("No active hand in the game")
+            if poker_player:
+                # Convert the domain action to poker game action
+                action_map = {
+                    PlayerAction.FOLD: 'FOLD',
+                    PlayerAction.CHECK: 'CHECK', 
+                    PlayerAction.CALL: 'CALL',
+                    PlayerAction.BET: 'BET',
+                    PlayerAction.RAISE: 'RAISE',
+                    PlayerAction.ALL_IN: 'ALL_IN'
+                }
                 
-            # Validate the player
-            player = next((p for p in game.players if p.id == player_id), None)
-            if not player:
-                raise KeyError(f"Player {player_id} not found in game {game_id}")
+                # Get the corresponding poker game action from the class, not the instance
+                from app.core.poker_game import PlayerAction as PokerPlayerAction
+                # Use BettingRound imported at the top of the method
+                # Use PokerPlayerStatus imported at the top of the file
+                poker_action = getattr(PokerPlayerAction, action_map[action])
                 
-            # Log the current action with position information
-            poker_game = self.poker_games.get(game_id)
-            if poker_game:
-                # Get the player position name
-                player_count = len(game.players)
-                position_name = ""
+                # Process the action; the table may still refuse it (e.g. a short raise)
+                if not await poker_game.process_action(poker_player, poker_action, amount):
+                    raise ValueError(f"Failed to process action {action.name}")
                 
-                if player.position == poker_game.button_position:
-                    position_name = "BTN (Dealer)"
-                elif player.position == (poker_game.button_position + 1) % player_count:
-                    position_name = "SB (Small Blind)"
-                elif player.position == (poker_game.button_position + 2) % player_count:
-                    position_name = "BB (Big Blind)"
-                elif player.position == (poker_game.button_position + 3) % player_count:
-                    position_name = "UTG (Under the Gun)"
-                elif player.position == (poker_game.button_position + 4) % player_count:
-                    position_name = "UTG+1"
-                elif player.position == (poker_game.button_position + 5) % player_count:
-                    position_name = "UTG+2"
-                elif player.position == (poker_game.button_position + 6) % player_count:
-                    position_name = "LJ (Lojack)"
-                elif player.position == (poker_game.button_position + 7) % player_count:
-                    position_name = "HJ (Hijack)"
-                elif player.position == (poker_game.button_position + 8) % player_count:
-                    position_name = "CO (Cutoff)"
-                    
-                logging.info(f"Processing action: {player.name} [{position_name} - Seat {player.position}] {action} {amount if amount else ''}")
-                logging.info(f"Current round: {game.current_hand.current_round}")
+                # Save the action in the action repository
+                self.action_repo.create(action_history)
                 
-                # Log who's next to act
-                if 0 <= poker_game.current_player_idx < len(poker_game.players):
-                    current_player = poker_game.players[poker_game.current_player_idx]
-                    active_players = [p for p in poker_game.players if p.status == PokerPlayerStatus.ACTIVE]
-                    to_act_players = [p.name for p in active_players if p.player_id in poker_game.to_act]
-                    
-                    logging.info(f"Active players: {[p.name for p in active_players]}")
-                    logging.info(f"Players still to act: {to_act_players}")
-                    logging.info(f"Next player to act: {current_player.name} (index {poker_game.current_player_idx})")
-            
-            # Create action history record
-            action_history = ActionHistory(
-                game_id=game_id,
-                hand_id=game.current_hand.id,
-                player_id=player_id,
-                action=action,
-                amount=amount,
-                round=game.current_hand.current_round
-            )
-            
-            # Save the action in the action repository
-            self.action_repo.create(action_history)
-            
-            # Add the action to the hand
-            game.current_hand.actions.append(action_history)
-            
-            # Process the action in the poker game
-            if game_id in self.poker_games:
-                poker_game = self.poker_games[game_id]
+                # Add the action to the hand
+                game.current_hand.actions.append(action_history)
+                self.prefetch_ai_decision(game_id)
                 
-                # Find the player in the poker game
-                poker_player = next((p for p in poker_game.players if p.player_id == player_id), None)
-                    
-                if poker_player:
-                    # Convert the domain action to poker game action
-                    action_map = {
-                        PlayerAction.FOLD: 'FOLD',
-                        PlayerAction.CHECK: 'CHECK', 
-                        PlayerAction.CALL: 'CALL',
-                        PlayerAction.BET: 'BET',
-                        PlayerAction.RAISE: 'RAISE',
-                        PlayerAction.ALL_IN: 'ALL_IN'
-                    }
-                    
-                    # Get the corresponding poker game action from the class, not the instance
-                    from app.core.poker_game import PlayerAction as PokerPlayerAction
-                    # Use BettingRound imported at the top of the method
-                    # Use PokerPlayerStatus imported at the top of the file
-                    poker_action = getattr(PokerPlayerAction, action_map[action])
-                    
-                    # Process the action
-                    await poker_game.process_action(poker_player, poker_action, amount)
-                    
-                    # ------------------------------------------------------------------
-                    # HAND COMPLETE – HANDLE SHOWDOWN SEQUENCE FOR **HUMAN** ACTION PATH
-                    # ------------------------------------------------------------------
-                    if poker_game.current_round == PokerBettingRound.SHOWDOWN:
-                        # Record end-of-hand timestamp on the domain model
-                        game.current_hand.ended_at = datetime.now()
+                # ------------------------------------------------------------------
+                # HAND COMPLETE – HANDLE SHOWDOWN SEQUENCE FOR **HUMAN** ACTION PATH
+                # ------------------------------------------------------------------
+                if poker_game.current_round == PokerBettingRound.SHOWDOWN:
+                    # Record end-of-hand timestamp on the domain model
+                    game.current_hand.ended_at = datetime.now()
 
-                        # Persist this hand to the running history list
-                        game.hand_history.append(game.current_hand)
+                    # Persist this hand to the running history list
+                    game.hand_history.append(game.current_hand)
 
-                        # Track hand-history id if one was generated
-                        if poker_game.current_hand_id:
-                            game.hand_history_ids.append(poker_game.current_hand_id)
+                    # Track hand-history id if one was generated
+                    if poker_game.current_hand_id:
+                        game.hand_history_ids.append(poker_game.current_hand_id)
 
-                        # ------------------------------------------------------------------
-                        # 1)  Broadcast any missing Turn / River board cards **with** the
-                        #     requested pauses so the frontend can stage the reveal and play
-                        #     sounds correctly.
-                        # ------------------------------------------------------------------
-                        try:
-                            from app.core.websocket import game_notifier
+                    # ------------------------------------------------------------------
+                    # 1)  Broadcast any missing Turn / River board cards **with** the
+                    #     requested pauses so the frontend can stage the reveal and play
+                    #     sounds correctly.
+                    # ------------------------------------------------------------------
+                    try:
+                        from app.core.websocket import game_notifier
 
-                            board = poker_game.community_cards  # List[Card]
+                        board = poker_game.community_cards  # List[Card]
 
-                            # If the board is incomplete (e.g. all-in pre-flop) we still
-                            # want the clients to see the full run-out.  We piggy-back on
-                            # notify_new_round so the frontend treats these like normal
-                            # round transitions.
-                            if len(board) == 3:
-                                # Only flop dealt – skip additional board animations but pause
-                                await asyncio.sleep(1.0)
-                            elif len(board) >= 4:
-                                # TURN update – reveal only the 4th card
+                        # If the board is incomplete (e.g. all-in pre-flop) we still
+                        # want the clients to see the full run-out.  We piggy-back on
+                        # notify_new_round so the frontend treats these like normal
+                        # round transitions.
+                        if len(board) == 3:
+                            # Only flop dealt – skip additional board animations but pause
+                            await asyncio.sleep(1.0)
+                        elif len(board) >= 4:
+                            # TURN update – reveal only the 4th card
+                            await game_notifier.notify_street_dealt(
+                                game_id,
+                                PokerBettingRound.TURN.name,
+                                [board[3]]
+                            )
+                            await asyncio.sleep(0.5)
+
+                            # RIVER update – reveal only the 5th card if available
+                            if len(board) >= 5:
                                 await game_notifier.notify_street_dealt(
                                     game_id,
-                                    PokerBettingRound.TURN.name,
-                                    [board[3]]
+                                    PokerBettingRound.RIVER.name,
+                                    [board[4]]
                                 )
-                                await asyncio.sleep(0.5)
-
-                                # RIVER update – reveal only the 5th card if available
-                                if len(board) >= 5:
-                                    await game_notifier.notify_street_dealt(
-                                        game_id,
-                                        PokerBettingRound.RIVER.name,
-                                        [board[4]]
-                                    )
-                            else:
-                                # Board somehow shorter than 4 – guard and pause
-                                await asyncio.sleep(1.0)
+                        else:
+                            # Board somehow shorter than 4 – guard and pause
+                            await asyncio.sleep(1.0)
 
-                        except Exception as e:
-                            logging.error(f"Error broadcasting showdown board cards: {e}")
+                    except Exception as e:
+                        logging.error(f"Error broadcasting showdown board cards: {e}")
 
-                        # ------------------------------------------------------------------
-                        # ------------------------------------------------------------------
-                        # 1) Collect the final street bets into the pot (frontend will animate)
-                        try:
-                            from app.core.websocket import game_notifier
-                            # Gather each player's current bet for this street
-                            player_bets = [{'player_id': p.player_id, 'amount': p.current_bet} for p in poker_game.players]
-                            # Total pot before distribution
-                            total_pot = sum(pot.amount for pot in poker_game.pots)
-                            await game_notifier.notify_round_bets_finalized(game_id, player_bets, total_pot)
-                        except Exception as e:
-                            logging.error(f"Error broadcasting round bets finalized: {e}")
-                        # End-of-Hand: Frontend-driven animation sequence via granular events
-                        # ------------------------------------------------------------------
-                        # 2) Reveal showdown hole cards
-                        try:
-                            player_hands = []
-                            for pp in poker_game.players:
-                                if hasattr(pp, 'hand') and pp.hand and pp.status != PokerPlayerStatus.FOLDED:
-                                    player_hands.append({
-                                        'player_id': pp.player_id,
-                                        'cards': [str(c) for c in pp.hand.cards]
-                                    })
-                            await game_notifier.notify_showdown_hands_revealed(game_id, player_hands)
-                        except Exception as e:
-                            logging.error(f"Error revealing showdown hands: {e}")
+                    # ------------------------------------------------------------------
+                    # ------------------------------------------------------------------
+                    # 1) Collect the final street bets into the pot (frontend will animate)
+                    try:
+                        from app.core.websocket import game_notifier
+                        # Gather each player's current bet for this street
+                        player_bets = [{'player_id': p.player_id, 'amount': p.current_bet} for p in poker_game.players]
+                        # Total pot before distribution
+                        total_pot = sum(pot.amount for pot in poker_game.pots)
+                        await game_notifier.notify_round_bets_finalized(game_id, player_bets, total_pot)
+                    except Exception as e:
+                        logging.error(f"Error broadcasting round bets finalized: {e}")
+                    # End-of-Hand: Frontend-driven animation sequence via granular events
+                    # ------------------------------------------------------------------
+                    # 2) Reveal showdown hole cards
+                    try:
+                        player_hands = []
+                        for pp in poker_game.players:
+                            if hasattr(pp, 'hand') and pp.hand and pp.status != PokerPlayerStatus.FOLDED:
+                                player_hands.append({
+                                    'player_id': pp.player_id,
+                                    'cards': [str(c) for c in pp.hand.cards]
+                                })
+                        await game_notifier.notify_showdown_hands_revealed(game_id, player_hands)
+                    except Exception as e:
+                        logging.error(f"Error revealing showdown hands: {e}")
 
-                        # 3) Announce pot winners for each pot
-                        pots_info = []
-                        try:
-                            for idx, pot in enumerate(poker_game.pots):
-                                pot_id = f"pot_{idx}"
-                                winners = poker_game.hand_winners.get(pot_id, [])
-                                amount = pot.amount
-                                share = amount // len(winners) if winners else 0
-                                winners_list = []
-                                for winner in winners:
-                                    # Hand rank description if available
-                                    hand_rank = ''
-                                    try:
-                                        rank_desc = poker_game._format_hand_description
-                                        if hasattr(winner, 'hand') and winner.hand:
-                                            # Evaluate if needed
-                                            hand_rank = rank_desc(*game.evaluate_hands().get(winner, ('', [])))
-                                    except Exception:
-                                        pass
-                                    winners_list.append({
-                                        'player_id': winner.player_id,
-                                        'hand_rank': hand_rank,
-                                        'share': share
-                                    })
-                                pots_info.append({
-                                    'pot_id': pot_id,
-                                    'amount': amount,
-                                    'winners': winners_list
+                    # 3) Announce pot winners for each pot
+                    pots_info = []
+                    try:
+                        for idx, pot in enumerate(poker_game.pots):
+                            pot_id = f"pot_{idx}"
+                            winners = poker_game.hand_winners.get(pot_id, [])
+                            amount = pot.amount
+                            share = amount // len(winners) if winners else 0
+                            winners_list = []
+                            for winner in winners:
+                                # Hand rank description if available
+                                hand_rank = ''
+                                try:
+                                    showdown_hand = poker_game.showdown_results().get(winner)
+                                    if showdown_hand:
+                                        hand_rank = showdown_hand.description
+                                except Exception:
+                                    pass
+                                winners_list.append({
+                                    'player_id': winner.player_id,
+                                    'hand_rank': hand_rank,
+                                    'share': share
                                 })
+                            pots_info.append({
+                                'pot_id': pot_id,
+                                'amount': amount,
+                                'winners': winners_list
+                            })
 
-                            # Zero pots so display resets before animations
-                            for pot in poker_game.pots:
-                                pot.amount = 0
+                        # Zero pots so display resets before animations
+                        for pot in poker_game.pots:
+                            pot.amount = 0
+
+                        await game_notifier.notify_pot_winners_determined(game_id, pots_info)
+                    except Exception as e:
+                        logging.error(f"Error announcing pot winners: {e}")
 
-                            await game_notifier.notify_pot_winners_determined(game_id, pots_info)
-                        except Exception as e:
-                            logging.error(f"Error announcing pot winners: {e}")
+                    # 4) Distribute chips to winners (update chip counts)
+                    # Wait for pot-to-winner chip animation (0.5s) and winner pulse (0.6s)
+                    await asyncio.sleep(1.1)
+                    try:
+                        # Update domain model chip counts from poker_game
+                        for p in game.players:
+                            pp = next((x for x in poker_game.players if x.player_id == p.id), None)
+                            if pp:
+                                p.chips = pp.chips
+                        self.game_repo.update(game)
+                        await game_notifier.notify_chips_distributed_to_winners(game_id, poker_game)
+                    except Exception as e:
+                        logging.error(f"Error distributing chips: {e}")
 
-                        # 4) Distribute chips to winners (update chip counts)
-                        # Wait for pot-to-winner chip animation (0.5s) and winner pulse (0.6s)
-                        await asyncio.sleep(1.1)
-                        try:
-                            # Update domain model chip counts from poker_game
-                            for p in game.players:
-                                pp = next((x for x in poker_game.players if x.player_id == p.id), None)
-                                if pp:
-                                    p.chips = pp.chips
-                            self.game_repo.update(game)
-                            await game_notifier.notify_chips_distributed_to_winners(game_id, poker_game)
-                        except Exception as e:
-                            logging.error(f"Error distributing chips: {e}")
+                    # 5) Pulse winner seat
+                    await asyncio.sleep(0.5)
+                    try:
+                        # Primary winner: first winner of main pot
+                        if pots_info and pots_info[0]['winners']:
+                            await game_notifier.notify_hand_visually_concluded(game_id)
+                    except Exception as e:
+                        logging.error(f"Error pulsing winner seat: {e}")
 
-                        # 5) Pulse winner seat
-                        await asyncio.sleep(0.5)
-                        try:
-                            # Primary winner: first winner of main pot
-                            if pots_info and pots_info[0]['winners']:
-                                await game_notifier.notify_hand_visually_concluded(game_id)
-                        except Exception as e:
-                            logging.error(f"Error pulsing winner seat: {e}")
+                    # 6) Pause before starting next hand
+                    # Pause before starting next hand (final pause ~1s)
+                    await asyncio.sleep(1.0)
 
-                        # 6) Pause before starting next hand
-                        # Pause before starting next hand (final pause ~1s)
-                        await asyncio.sleep(1.0)
+                    # 7) Start a fresh hand and notify clients of the new state
+                    logging.info("Starting new hand…")
+                    self._start_next_hand(game)
+                    self.game_repo.update(game)
+                    new_poker_game = self.poker_games.get(game_id)
+                    if new_poker_game:
+                        await game_notifier.notify_game_update(game_id, new_poker_game)
+                
+                # Update player states
+                for p in game.players:
+                    # Find corresponding poker player by ID instead of index for safety
+                    poker_p = next((pp for pp in poker_game.players if pp.player_id == p.id), None)
+                    if poker_p:
+                        # Update chips, status, etc.
+                        p.chips = poker_p.chips
+                        # Map poker game status to domain model status
+                        # Using the DomainPlayerStatus imported at the top of the file
+                        status_map = {
+                            PokerPlayerStatus.ACTIVE: DomainPlayerStatus.ACTIVE,
+                            PokerPlayerStatus.FOLDED: DomainPlayerStatus.FOLDED,
+                            PokerPlayerStatus.ALL_IN: DomainPlayerStatus.ALL_IN,
+                            PokerPlayerStatus.OUT: DomainPlayerStatus.OUT
+                        }
+                        p.status = status_map.get(poker_p.status, DomainPlayerStatus.ACTIVE)
+        
+        # Update the game
+        self.game_repo.update(game)
+        
+        return game
 
-                        # 7) Start a fresh hand and notify clients of the new state
-                        logging.info("Starting new hand…")
-                        self._start_new_hand(game)
-                        self.game_repo.update(game)
-                        new_poker_game = self.poker_games.get(game_id)
-                        if new_poker_game:
-                            await game_notifier.notify_game_update(game_id, new_poker_game)
-                    
-                    # Update player states
-                    for p in game.players:
-                        # Find corresponding poker player by ID instead of index for safety
-                        poker_p = next((pp for pp in poker_game.players if pp.player_id == p.id), None)
-                        if poker_p:
-                            # Update chips, status, etc.
-                            p.chips = poker_p.chips
-                            # Map poker game status to domain model status
-                            # Using the DomainPlayerStatus imported at the top of the file
-                            status_map = {
-                                PokerPlayerStatus.ACTIVE: DomainPlayerStatus.ACTIVE,
-                                PokerPlayerStatus.FOLDED: DomainPlayerStatus.FOLDED,
-                                PokerPlayerStatus.ALL_IN: DomainPlayerStatus.ALL_IN,
-                                PokerPlayerStatus.OUT: DomainPlayerStatus.OUT
-                            }
-                            p.status = status_map.get(poker_p.status, DomainPlayerStatus.ACTIVE)
-            
-            # Update the game
-            self.game_repo.update(game)
-            
-            return game
-    
     def get_hand_history(self, hand_id: str) -> Optional[HandHistory]:
         """
         Get detailed hand history by ID.
@@ -1254,9 +1380,173 @@ class GameService:
                 self._process_action_impl(game_id, player_id, action, amount)
             )
         
+    def _ai_decision_inputs(
+        self, game: Game, poker_game: PokerGame, player_id: str
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build what an AI player decides from: the game state as it sees it
+        (other players' cards hidden) and the game context.
+        
+        Args:
+            game: The domain game
+            poker_game: The table's PokerGame
+            player_id: ID of the AI player
+            
+        Returns:
+            (game_state_dict, context)
+        """
+        import logging
+        # Prepare game state for AI consumption (using utility function)
+        from app.core.utils import game_to_model
+        game_state = game_to_model(game.id, poker_game)
+        
+        # Create context with additional information
+        context = {
+            "game_type": "tournament" if game.type == GameType.TOURNAMENT else "cash",
+            "blinds": [game_state.small_blind, game_state.big_blind],
+            "ante": game_state.ante
+        }
+        
+        # Add tournament-specific context if applicable
+        if game.type == GameType.TOURNAMENT and game.tournament_info:
+            context["stage"] = game.tournament_info.stage.value
+            context["level"] = game.tournament_info.current_level
+            context["players_remaining"] = game.tournament_info.players_remaining
+            context["total_players"] = game.tournament_info.total_players
+        
+        # Convert game_state to dictionary for AI consumption
+        game_state_dict = game_state.dict()
+        # --- Compute accurate to_call for current player ---
+        try:
+            highest_total = max(
+                p['total_bet'] for p in game_state_dict['players']
+                if p['status'] in ("ACTIVE", "ALL_IN")
+            )
+            me = next(
+                p for p in game_state_dict['players'] if p['player_id'] == player_id
+            )
+            game_state_dict['to_call'] = max(0, highest_total - me.get('total_bet', 0))
+        except Exception as e:
+            logging.error(f"[AI-ACTION] Error computing to_call: {e}")
+            # Fallback to current_bet as to_call
+            game_state_dict['to_call'] = game_state_dict.get('current_bet', 0)
+        
+        # Filter sensitive information - only show this player's cards
+        for player_model in game_state_dict["players"]:
+            if player_model["player_id"] != player_id:
+                player_model["cards"] = None
+        
+        return game_state_dict, context
+    
+    async def _decide_ai_action(
+        self,
+        game_id: str,
+        player_id: str,
+        archetype: str,
+        game_state_dict: Dict[str, Any],
+        context: Dict[str, Any],
+        all_in_amount: int,
+        interactive: bool = True
+    ) -> Tuple[str, Optional[int], int]:
+        """
+        Ask an AI agent for its action, retrying unusable answers.
+        
+        Reads nothing but its arguments, so it can run ahead of the turn
+        (see prefetch_ai_decision).
+        
+        Args:
+            game_id: ID of the game, for fair queuing of LLM requests across tables
+            player_id: ID of the AI player
+            archetype: The player's archetype
+            game_state_dict: Game state as the player sees it
+            context: Game context
+            all_in_amount: The player's chips plus current bet (the all-in total)
+            interactive: Whether a human is at the table (queued ahead of AI-only tables)
+            
+        Returns:
+            (action type name, amount, attempts made); FOLD once every attempt failed
+        """
+        import logging
+        from ai.memory_integration import MemoryIntegration
+        from ai.agents.response_parser import AgentResponseParser
+        from ai.llm_service import llm_request_context
+        intelligence_level = "expert"  # Default intelligence level
+        max_retries = 3
+        for attempt in range(1, max_retries + 1):
+            try:
+                with llm_request_context(game_id, interactive=interactive):
+                    ai_decision = await MemoryIntegration.get_agent_decision(
+                        archetype=archetype,
+                        game_state=game_state_dict,
+                        context=context,
+                        player_id=player_id,
+                        use_memory=False,
+                        intelligence_level=intelligence_level,
+                        game_id=game_id
+                    )
+                action_str, amount, metadata = AgentResponseParser.parse_response(ai_decision)
+                # Handle null or zero amount for ALL_IN
+                if action_str.lower().replace('-', '_').replace(' ', '_') == 'all_in' and (amount is None or amount <= 0):
+                    logging.warning(f"[AI-ACTION] Corrected ALL_IN amount for player {player_id} from {amount} to {all_in_amount}")
+                    amount = all_in_amount
+                action_str, amount = AgentResponseParser.apply_game_rules(action_str, amount, game_state_dict)
+                normalized = action_str.lower().replace('-', '_').replace(' ', '_')
+                action_map = {
+                    'fold': 'FOLD', 'check': 'CHECK', 'call': 'CALL',
+                    'bet': 'BET', 'raise': 'RAISE', 'all_in': 'ALL_IN'
+                }
+                action_type = action_map.get(normalized)
+                if not action_type and 'all' in normalized and 'in' in normalized:
+                    action_type = 'ALL_IN'
+                if not action_type:
+                    raise ValueError(f"Invalid action type: {action_str}")
+                if action_type == 'ALL_IN':
+                    return action_type, amount or all_in_amount, attempt
+                return action_type, amount, attempt
+            except Exception as e:
+                logging.warning(f"[AI-ACTION] Attempt {attempt} for player {player_id} failed: {e}")
+        logging.error(f"[AI-ACTION] All {max_retries} attempts failed for player {player_id}. Defaulting to FOLD.")
+        return 'FOLD', None, max_retries
+    
+    def prefetch_ai_decision(self, game_id: str) -> None:
+        """
+        Start deciding the next AI turn now, while clients animate the last action.
+        
+        Call once an action has been applied: the next player's information
+        set is fixed from then on, so its decision can run during the
+        animation waits and pacing delay instead of after them. The turn uses
+        the result only if the player's view of the table is unchanged by
+        then; a prefetch for a state that moved on is cancelled.
+        
+        Args:
+            game_id: ID of the game
+        """
+        if not AI_PREFETCH:
+            return
+        scheduler = self.ai_turns(game_id)
+        turn = self._next_ai_turn(game_id)
+        if turn is None:
+            scheduler.drop_prefetch()
+            return
+        player_id = turn[0]
+        game = self.game_repo.get(game_id)
+        poker_game = self.poker_games[game_id]
+        domain_player = next(p for p in game.players if p.id == player_id)
+        poker_player = poker_game.players[poker_game.current_player_idx]
+        game_state_dict, context = self._ai_decision_inputs(game, poker_game, player_id)
+        scheduler.prefetch(
+            player_id,
+            information_set(game_state_dict, context),
+            lambda: self._decide_ai_action(
+                game_id, player_id, domain_player.archetype or "TAG", game_state_dict, context,
+                all_in_amount=poker_player.chips + poker_player.current_bet,
+                interactive=any(p.is_human for p in game.players)
+            ),
+        )
+        
     async def _request_and_process_ai_action(self, game_id: str, player_id: str):
         """
-        Request a decision from an AI player and process it in the game.
+        Take one AI player's turn: request a decision and process it in the game.
         
         This method will:
         1. Get the game and player information
@@ -1264,7 +1554,9 @@ class GameService:
         3. Request a decision from the appropriate AI agent
         4. Process the resulting action in the game
         5. Notify clients of the action and state changes
-        6. Automatically trigger the next AI player's action if applicable
+        
+        It does not go on to the next player; the table's AITurnScheduler
+        (see ai_turns()) calls it once per turn, with pacing in between.
         
         Args:
             game_id: ID of the game
@@ -1280,24 +1572,6 @@ class GameService:
         start_time = time.time()
         execution_id = f"{start_time:.6f}"
         
-        logging.info(f"[AI-ACTION-START-{execution_id}] Starting AI Action for Player {player_id} in Game {game_id}")
-        
-        # Add consistent 0.5s delay for ALL AI actions - reduced from 1.5s to make the timing better
-        # This delay is all we need - frontend no longer adds its own delay
-        await asyncio.sleep(0.5)
-        
-        logging.info(f"[AI-ACTION-{execution_id}] --- Starting AI Action for Player {player_id} in Game {game_id} ---")
-        
-        call_stack = []
-        import traceback
-        for frame in traceback.extract_stack():
-            if "_request_and_process_ai_action" in frame.name:
-                call_stack.append(frame.name)
-        if len(call_stack) > 1:
-            logging.info(f"[AI-ACTION-{execution_id}] AI action chain depth: {len(call_stack)} - This is a recursive call")
-        else:
-            logging.info(f"[AI-ACTION-{execution_id}] AI action chain depth: 1 - This is the first call in the chain")
-            
         # Import AI modules (using the global flag from config)
         from app.core.config import MEMORY_SYSTEM_AVAILABLE
         
@@ -1335,9 +1609,6 @@ class GameService:
         player_list_len = len(poker_game.players)
         target_player_id = player_id  # The player ID passed to the function
 
-        # Log values BEFORE the check
-        logging.info(f"[AI-ACTION-CHECK-{execution_id}] Checking turn: current_idx={current_idx}, player_list_len={player_list_len}, target_player_id={target_player_id}")
-        
         is_turn = False
         current_turn_player_id = "None"
         if 0 <= current_idx < player_list_len:
@@ -1354,133 +1625,31 @@ class GameService:
         elif poker_game.players[current_idx].player_id != target_player_id:
              logging.error(f"AI Action Aborted: It's not player {target_player_id}'s turn. Current turn is index {current_idx} (Player ID: {current_turn_player_id})")
              return
-        # If we pass all checks, log success
-        logging.info(f"[AI-ACTION-CHECK-{execution_id}] Turn validation passed for player {player_id}")
         # *** END CRITICAL CHECK ***
         
-        # Enhanced logging with position information
-        position_name = "Unknown"
-        if poker_game.button_position == poker_player.position:
-            position_name = "BTN (Dealer)"
-        elif (poker_game.button_position + 1) % len(active_poker_players) == poker_player.position:
-            position_name = "SB (Small Blind)"
-        elif (poker_game.button_position + 2) % len(active_poker_players) == poker_player.position:
-            position_name = "BB (Big Blind)"
-        elif (poker_game.button_position + 3) % len(active_poker_players) == poker_player.position:
-            position_name = "UTG (Under the Gun)"
-        
-        logging.info(f"AI Action: Player {domain_player.name} [{position_name} - Position {poker_player.position}] (Player ID: {player_id}), Archetype: {domain_player.archetype or 'Default'}")
-        logging.info(f"AI Action: Current Round: {poker_game.current_round.name}, Current Bet: {poker_game.current_bet}, To Act: {poker_game.to_act}")
-        
-        # Get archetype and intelligence level (with defaults)
-        archetype = domain_player.archetype or "TAG"  # Default to TAG if not specified
-        intelligence_level = "expert"  # Default intelligence level
+        tracer.event(game_id, "ai.turn", player=player_id, archetype=domain_player.archetype,
+                     round=poker_game.current_round.name, current_bet=poker_game.current_bet)
         
-        # Prepare game state for AI consumption (using utility function)
-        from app.core.utils import game_to_model
-        game_state = game_to_model(game_id, poker_game)
-        
-        # Create context with additional information
-        context = {
-            "game_type": "tournament" if game.type == GameType.TOURNAMENT else "cash",
-            "blinds": [game_state.small_blind, game_state.big_blind],
-            "ante": game_state.ante
-        }
-        
-        # Add tournament-specific context if applicable
-        if game.type == GameType.TOURNAMENT and game.tournament_info:
-            context["stage"] = game.tournament_info.stage.value
-            context["level"] = game.tournament_info.current_level
-            context["players_remaining"] = game.tournament_info.players_remaining
-            context["total_players"] = game.tournament_info.total_players
+        archetype = domain_player.archetype or "TAG"  # Default to TAG if not specified
+        game_state_dict, context = self._ai_decision_inputs(game, poker_game, player_id)
         
-        # Convert game_state to dictionary for AI consumption
-        game_state_dict = game_state.dict()
-        # --- Compute accurate to_call for current player ---
         try:
-            highest_total = max(
-                p['total_bet'] for p in game_state_dict['players']
-                if p['status'] in ("ACTIVE", "ALL_IN")
+            # Use the decision prefetched while clients animated the last action,
+            # if this player's view of the table has not changed since
+            prefetched = self.ai_turns(game_id).take_prefetched(
+                player_id, information_set(game_state_dict, context)
             )
-            me = next(
-                p for p in game_state_dict['players'] if p['player_id'] == player_id
-            )
-            game_state_dict['to_call'] = max(0, highest_total - me.get('total_bet', 0))
-        except Exception as e:
-            logging.error(f"[AI-ACTION] Error computing to_call: {e}")
-            # Fallback to current_bet as to_call
-            game_state_dict['to_call'] = game_state_dict.get('current_bet', 0)
-        
-        # Filter sensitive information - only show this player's cards
-        for player_model in game_state_dict["players"]:
-            if player_model["player_id"] != player_id:
-                player_model["cards"] = None
-        
-        try:
-            # Determine a smart default action based on game state
-            current_bet = game_state_dict.get("current_bet", 0)
-            if current_bet == 0:
-                action_type = "CHECK"  # Default to check if no bet to call
+            if prefetched is not None:
+                action_type, action_amount, attempts = await prefetched
             else:
-                # We'll decide between CALL and FOLD based on various factors below
-                action_type = "FOLD"
-            action_amount = None
-            
-            # AI decision with fallback retries
-            from ai.memory_integration import MemoryIntegration
-            from ai.agents.response_parser import AgentResponseParser
-            from app.core.poker_game import PlayerAction as PokerPlayerAction
-            max_retries = 3
-            final_action_type: str = None
-            final_action_amount = None
-            for attempt in range(1, max_retries + 1):
-                logging.info(f"[AI-ACTION-{execution_id}] Attempt {attempt}/{max_retries} for AI decision")
-                try:
-                    ai_decision = await MemoryIntegration.get_agent_decision(
-                        archetype=archetype,
-                        game_state=game_state_dict,
-                        context=context,
-                        player_id=player_id,
-                        use_memory=False,
-                        intelligence_level=intelligence_level
-                    )
-                    logging.info(f"[AI-ACTION-{execution_id}] Attempt {attempt}: Raw AI decision: {ai_decision}")
-                    action_str, amount, metadata = AgentResponseParser.parse_response(ai_decision)
-                    logging.info(f"[AI-ACTION-{execution_id}] Attempt {attempt}: Parsed action: {action_str}, amount: {amount}")
-                    # Handle null or zero amount for ALL_IN
-                    if action_str.lower().replace('-', '_').replace(' ', '_') == 'all_in' and (amount is None or amount <= 0):
-                        correct_amount = poker_player.chips + poker_player.current_bet
-                        logging.warning(f"[AI-ACTION-{execution_id}] Corrected ALL_IN amount for player {player_id} from {amount} to {correct_amount}")
-                        amount = correct_amount
-                    action_str, amount = AgentResponseParser.apply_game_rules(action_str, amount, game_state_dict)
-                    logging.info(f"[AI-ACTION-{execution_id}] Attempt {attempt}: Action after rules: {action_str}, amount: {amount}")
-                    normalized = action_str.lower().replace('-', '_').replace(' ', '_')
-                    action_map = {
-                        'fold': 'FOLD', 'check': 'CHECK', 'call': 'CALL',
-                        'bet': 'BET', 'raise': 'RAISE', 'all_in': 'ALL_IN'
-                    }
-                    action_type = action_map.get(normalized)
-                    if not action_type and 'all' in normalized and 'in' in normalized:
-                        action_type = 'ALL_IN'
-                    if not action_type:
-                        raise ValueError(f"Invalid action type: {action_str}")
-                    if action_type == 'ALL_IN':
-                        final_action_amount = amount or (poker_player.chips + poker_player.current_bet)
-                    else:
-                        final_action_amount = amount
-                    final_action_type = action_type
-                    break
-                except Exception as e:
-                    logging.warning(f"[AI-ACTION-{execution_id}] Attempt {attempt} failed: {e}")
-                    if attempt == max_retries:
-                        final_action_type = 'FOLD'
-                        final_action_amount = None
-                        logging.error(f"[AI-ACTION-{execution_id}] All {max_retries} attempts failed. Defaulting to FOLD.")
-            # Finalize action_type and action_amount
-            action_type = final_action_type
-            action_amount = final_action_amount
-            # Log the final chosen action for debugging
-            logging.info(f"[AI-ACTION-{execution_id}] Final chosen action for player {player_id}: {action_type} with amount {action_amount}")
+                action_type, action_amount, attempts = await self._decide_ai_action(
+                    game_id, player_id, archetype, game_state_dict, context,
+                    all_in_amount=poker_player.chips + poker_player.current_bet,
+                    interactive=any(p.is_human for p in game.players)
+                )
+            tracer.event(game_id, "ai.decision", player=player_id, action=action_type, amount=action_amount,
+                         attempts=attempts, prefetched=prefetched is not None,
+                         seconds=round(time.time() - start_time, 3))
             
             # Convert the action type string to the poker game action enum
             from app.core.poker_game import PlayerAction as PokerPlayerAction
@@ -1491,52 +1660,33 @@ class GameService:
                 poker_action = PokerPlayerAction.FOLD
                 action_amount = None
             
-            # Ensure only one AI action for this game is processed at a time by using a lock
-            if game_id not in self.game_locks:
-                self.game_locks[game_id] = asyncio.Lock()
-            game_lock = self.game_locks[game_id]
-            
-            # Get the lock before processing the action
-            logging.info(f"[AI-ACTION-{execution_id}] Acquiring game lock for processing action")
-            # Capture player's current bet to compute actual call size for 'CALL' actions
-            prev_player_bet = poker_player.current_bet
-            async with game_lock:
-                logging.info(f"[AI-ACTION-{execution_id}] Lock acquired - Processing {poker_action.name} {action_amount if action_amount is not None else ''} in PokerGame")
-                logging.info(f"[AI-ACTION-{execution_id}] Before process_action - to_act: {poker_game.to_act}")
-                success = await poker_game.process_action(poker_player, poker_action, action_amount)
-                logging.info(f"[AI-ACTION-{execution_id}] After process_action - to_act: {poker_game.to_act}")
-                logging.info(f"[AI-ACTION-{execution_id}] PokerGame process_action result: {success}")
+            async def apply_ai_action() -> Optional[bool]:
+                if (poker_game.current_player_idx >= len(poker_game.players)
+                        or poker_game.players[poker_game.current_player_idx] is not poker_player
+                        or player_id not in poker_game.to_act):
+                    # The table moved on while the decision was being made
+                    return None
+                if await poker_game.process_action(poker_player, poker_action, action_amount):
+                    return True
                 # If invalid, force a fold to advance game state
-                if not success:
-                    from app.core.poker_game import PlayerAction as PokerPlayerAction
-                    logging.error(f"[AI-ACTION-{execution_id}] Invalid AI action {poker_action.name} {action_amount}. Forcing FOLD to prevent stall.")
-                    # Force fold
-                    fold_action = PokerPlayerAction.FOLD
-                    await poker_game.process_action(poker_player, fold_action, None)
-                    # Notify forced fold
-                    from app.core.websocket import game_notifier
-                    await game_notifier.notify_player_action(
-                        game_id,
-                        player_id,
-                        fold_action.name,
-                        None,
-                        total_street_bet=None,
-                        total_hand_bet=None
-                    )
-                    # Update and notify game state
-                    self.game_repo.update(game)
-                    await game_notifier.notify_game_update(game_id, poker_game)
-                    return
-            # Compute actual amount for notify (especially CALL actions) and totals
-            # post_street_bet: total bet on current street after action
-            post_street_bet = poker_player.current_bet
-            # post_hand_bet: total bet this hand after action (used for all-ins)
-            post_hand_bet = poker_player.total_bet
-            if poker_action == PokerPlayerAction.CALL:
-                notify_amount = post_street_bet - prev_player_bet
-            else:
-                notify_amount = action_amount
-            
+                logging.error(f"[AI-ACTION-{execution_id}] Invalid AI action {poker_action.name} {action_amount}. Forcing FOLD to prevent stall.")
+                await poker_game.process_action(poker_player, PokerPlayerAction.FOLD, None)
+                return False
+            
+            # The table's actor runs the action after any commands already queued
+            success = await self.table_actor(game_id).submit(TableCommand.AI_ACTION, apply_ai_action)
+            if success is None:
+                logging.warning(f"[AI-ACTION-{execution_id}] Turn for {player_id} is no longer due; decision dropped")
+                return
+            # The next AI can start deciding while this action is shown
+            self.prefetch_ai_decision(game_id)
+            if not success:
+                # The forced fold went out with the table's events
+                from app.core.websocket import game_notifier
+                # Update and notify game state
+                self.game_repo.update(game)
+                await game_notifier.notify_game_update(game_id, poker_game)
+                return
             if success:
                 # Update domain player
                 domain_player.has_acted = True
@@ -1559,20 +1709,8 @@ class GameService:
                 if game.current_hand:
                     game.current_hand.actions.append(action_history)
                 
-                # Notify clients about the AI action, passing total bets for correct log phrasing
+                # The AI action and the highlight removal went out with the table's events
                 from app.core.websocket import game_notifier
-                await game_notifier.notify_player_action(
-                    game_id,
-                    player_id,
-                    action_type,
-                    notify_amount,
-                    total_street_bet=post_street_bet,
-                    # If the action is an all-in or a call that leaves player with zero chips, treat as all-in
-                    total_hand_bet=(post_hand_bet if (poker_action == PokerPlayerAction.ALL_IN or \
-                                                   (poker_action == PokerPlayerAction.CALL and poker_player.chips == 0))
-                                     else None),
-                )
-                await game_notifier.notify_turn_highlight_removed(game_id, player_id)
                 await game_notifier.notify_bet_input_reset(game_id, player_id)
                 
                 # Update game state in the repository
@@ -1700,101 +1838,15 @@ class GameService:
                     logging.info("AI Action: Starting new hand.")
                     poker_game.move_button()
                     logging.info(f"AI Action: Moved button to position {poker_game.button_position}")
-                    self._start_new_hand(game)
+                    self._start_next_hand(game)
                     self.game_repo.update(game)
                     new_poker_game = self.poker_games.get(game.id)
                     if new_poker_game:
+                        # The turn scheduler prompts whoever acts first in the new hand
                         logging.info("AI Action: Notifying clients about the *new* hand state.")
                         await game_notifier.notify_game_update(game_id, new_poker_game)
-                        # Trigger first player action in new hand
-                        if 0 <= new_poker_game.current_player_idx < len(new_poker_game.players):
-                            first = new_poker_game.players[new_poker_game.current_player_idx]
-                            first_domain = next((p for p in game.players if p.id == first.player_id), None)
-                            if first_domain and not first_domain.is_human:
-                                asyncio.create_task(self._request_and_process_ai_action(game_id, first.player_id))
-                            else:
-                                await game_notifier.notify_action_request(game_id, new_poker_game)
                     else:
                         logging.error("AI Action: Could not find poker game instance after starting new hand to notify clients.")
-                else:
-                    # FIXED: No longer need to explicitly advance the player here
-                    # Turn advancement is now handled directly within poker_game.process_action
-                    logging.info(f"[AI-ACTION-{execution_id}] Hand continues after AI action - turn already advanced internally")
-                    
-                    # Log current state for monitoring
-                    logging.info(f"[AI-ACTION-{execution_id}] Current player_idx: {poker_game.current_player_idx}")
-                    logging.info(f"[AI-ACTION-{execution_id}] Current to_act set: {poker_game.to_act}")
-                    if 0 <= poker_game.current_player_idx < len(poker_game.players):
-                        current_p = poker_game.players[poker_game.current_player_idx]
-                        logging.info(f"[AI-ACTION-{execution_id}] Current player is: {current_p.name}, in to_act: {current_p.player_id in poker_game.to_act}")
-                    
-                    # Now check the current player
-                    logging.info(f"[AI-ACTION-{execution_id}] Checking current player after AI action")
-                    
-                    # Get the next player using the newly advanced index
-                    if poker_game.current_player_idx < len(poker_game.players):
-                        next_player = poker_game.players[poker_game.current_player_idx]
-                        next_player_domain = next((p for p in game.players if p.id == next_player.player_id), None)
-
-                        # Log detailed next player info
-                        next_position_name = "Unknown"
-                        if poker_game.button_position == next_player.position:
-                            next_position_name = "BTN (Dealer)"
-                        elif (poker_game.button_position + 1) % len(active_poker_players) == next_player.position:
-                            next_position_name = "SB (Small Blind)"
-                        elif (poker_game.button_position + 2) % len(active_poker_players) == next_player.position:
-                            next_position_name = "BB (Big Blind)"
-                        elif (poker_game.button_position + 3) % len(active_poker_players) == next_player.position:
-                            next_position_name = "UTG (Under the Gun)"
-                        
-                        logging.info(f"[AI-ACTION-{execution_id}] Next player determined: {next_player.name} [{next_position_name} - Position {next_player.position}] (index {poker_game.current_player_idx})")
-                        logging.info(f"[AI-ACTION-{execution_id}] Next player status: {next_player.status}, in to_act: {next_player.player_id in poker_game.to_act}")
-                        logging.info(f"[AI-ACTION-{execution_id}] Active players: {len(active_poker_players)}")
-                        logging.info(f"[AI-ACTION-{execution_id}] to_act set content: {poker_game.to_act}")
-                        logging.info(f"[AI-ACTION-{execution_id}] All players position info: {[(p.name, p.position, (p.position - poker_game.button_position) % len(poker_game.players)) for p in poker_game.players]}")
-
-                        # Verify this player is active and needs to act
-                        if (next_player.status == PokerPlayerStatus.ACTIVE and
-                            next_player.player_id in poker_game.to_act and
-                            next_player_domain):
-
-                            if not next_player_domain.is_human:
-                                logging.info(f"[AI-ACTION-{execution_id}] Next player is AI ({next_player.name}). AWAITING next action (sequential execution).")
-                                # Maintain sequential execution (no create_task) to prevent race conditions
-                                # This ensures one AI player completes their action before the next one begins
-                                await self._request_and_process_ai_action(game_id, next_player.player_id)
-                            else:
-                                logging.info(f"[AI-ACTION-{execution_id}] Next player is Human ({next_player.name}). Sending action request.")
-                                await game_notifier.notify_action_request(game_id, poker_game)
-                        else:
-                            # Next in turn cannot act: look for any other eligible ACTIVE player in to_act
-                            logging.warning(
-                                f"[AI-ACTION-{execution_id}] Next player {next_player.name} cannot act "
-                                f"(Status: {next_player.status}, in to_act: {next_player.player_id in poker_game.to_act}). "
-                                "Searching for another eligible player."
-                            )
-                            # Try all remaining to_act players in seating order
-                            for pid in list(poker_game.to_act):
-                                alt = next((p for p in poker_game.players if p.player_id == pid), None)
-                                if alt and alt.status == PokerPlayerStatus.ACTIVE:
-                                    alt_domain = next((p for p in game.players if p.id == alt.player_id), None)
-                                    if alt_domain:
-                                        logging.info(
-                                            f"[AI-ACTION-{execution_id}] Found alternate player to act: {alt.name}"
-                                        )
-                                        # Schedule AI or human action for this player
-                                        if not alt_domain.is_human:
-                                            await self._request_and_process_ai_action(game_id, alt.player_id)
-                                        else:
-                                            await game_notifier.notify_action_request(game_id, poker_game)
-                                        return
-                            # No eligible players left: likely round or hand complete
-                            logging.info(
-                                f"[AI-ACTION-{execution_id}] No further eligible players to act; round or hand may have concluded."
-                            )
-                    else:
-                        logging.error(f"AI Action: Invalid current_player_idx after action: {poker_game.current_player_idx}")
-                        
             else: # process_action failed
                 logging.error(f"AI Action Failed: PokerGame.process_action returned False for player {player_id} action {poker_action.name}")
             
@@ -1847,20 +1899,8 @@ class GameService:
                         poker_action = PokerPlayerAction.FOLD
                         fallback_action_name = "FOLD"
                         await poker_game.process_action(poker_player, poker_action, None)
-                    # Compute totals for log
-                    fs_post_street = poker_player.current_bet
-                    fs_post_hand = poker_player.total_bet
-                    # Notify clients about fallback action
+                    # The fallback action went out with the table's events
                     from app.core.websocket import game_notifier
-                    await game_notifier.notify_player_action(
-                        game_id,
-                        player_id,
-                        fallback_action_name,
-                        None,
-                        total_street_bet=fs_post_street,
-                        total_hand_bet=(fs_post_hand if fallback_action_name.upper() in ["ALL_IN", "ALL-IN"] else None),
-                    )
-                    await game_notifier.notify_turn_highlight_removed(game_id, player_id)
                     await game_notifier.notify_bet_input_reset(game_id, player_id)
                     await game_notifier.notify_game_update(game_id, poker_game)
                 else:
@@ -1909,6 +1949,10 @@ class GameService:
         # Update game
         self.game_repo.update(game)
         
+        # Drop the player's cached AI agent, if any
+        if not player.is_human:
+            self._evict_ai_agents(game_id, player_id)
+        
         return chips
         
     def rebuy_player(self, game_id: str, player_id: str, amount: int) -> Player:
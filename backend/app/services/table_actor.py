@@ -0,0 +1,213 @@
+"""
+Per-table actors: each live table runs its commands one at a time, in order.
+
+Everything that changes a table - player actions from REST or WebSocket, AI
+actions, starting the next hand, players joining or leaving - is submitted to
+that table's TableActor instead of taking a lock. The actor is a single
+asyncio task draining a bounded queue, so commands never interleave, callers
+never contend for a lock, and a table that falls behind pushes back on its
+submitters (put() waits while the queue is full) rather than piling up
+coroutines. Queue depth, waits and counts are kept per table for metrics().
+
+A command submitted from inside a running command of the same table runs
+inline, since waiting on its own queue would deadlock the actor. When the
+table goes away, close() retires the actor - after the running command, if
+any - and cancels whatever is still queued.
+"""
+import asyncio
+import inspect
+import logging
+import time
+from enum import Enum, auto
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from app.core.config import TABLE_QUEUE_SIZE
+from app.core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+class TableCommand(Enum):
+    """Kinds of work a table actor runs (used for metrics and tracing)."""
+    ACTION = auto()
+    AI_ACTION = auto()
+    NEXT_HAND = auto()
+    JOIN = auto()
+    LEAVE = auto()
+    CHIPS = auto()
+
+
+CommandFn = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+class _Queued:
+    __slots__ = ("kind", "fn", "future", "enqueued")
+
+    def __init__(self, kind: TableCommand, fn: CommandFn, future: Optional[asyncio.Future]):
+        self.kind = kind
+        self.fn = fn
+        self.future = future
+        self.enqueued = time.perf_counter()
+
+
+class TableActor:
+    """
+    Serializes the commands of one table.
+
+    Attributes:
+        game_id: The table's game ID
+        max_queue: Commands that can wait before submitters are held back
+    """
+
+    def __init__(self, game_id: str, max_queue: int = TABLE_QUEUE_SIZE):
+        self.game_id = game_id
+        self.max_queue = max_queue
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running: Optional[TableCommand] = None
+        self._closed = False
+        self.processed = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def submit(self, kind: TableCommand, fn: CommandFn) -> Any:
+        """
+        Run a command on the table and wait for its result.
+
+        Args:
+            kind: What the command does
+            fn: Callable doing the work; may return an awaitable
+
+        Returns:
+            Whatever fn returned (awaited if needed); its exceptions propagate
+        """
+        if self._task is not None and asyncio.current_task() is self._task:
+            return await self._call(fn)
+        future = asyncio.get_running_loop().create_future()
+        await self._enqueue(_Queued(kind, fn, future))
+        return await future
+
+    async def post(self, kind: TableCommand, fn: CommandFn) -> None:
+        """
+        Queue a command without waiting for it to run.
+
+        For callers that must stay responsive, such as a WebSocket receive
+        loop that has to read the animation acknowledgements the running
+        command is waiting for. Errors are logged.
+        """
+        if self._task is not None and asyncio.current_task() is self._task:
+            await self._call(fn)
+            return
+        await self._enqueue(_Queued(kind, fn, None))
+
+    @property
+    def depth(self) -> int:
+        """Commands waiting to run."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, wait times (ms) and command counts for this table."""
+        return {
+            "game_id": self.game_id,
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "running": self._running.name if self._running else None,
+            "processed": self.processed,
+            "failed": self.failed,
+            "avg_wait_ms": round(self.total_wait * 1000 / self.processed, 3) if self.processed else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() was called; the actor takes no more commands."""
+        return self._closed
+
+    def close(self) -> None:
+        """
+        Retire the actor when its table ends or is removed.
+
+        A running command finishes first (so this is safe to call from one);
+        commands still queued are cancelled and later submissions raise
+        RuntimeError.
+        """
+        self._closed = True
+        task = self._task
+        if task is not None and not task.done() and self._running is None:
+            task.cancel()  # idle, waiting for the next command
+
+    async def stop(self) -> None:
+        """Stop the actor; queued commands that have not started are dropped."""
+        task, self._task = self._task, None
+        if task is None or task.done() or self._loop.is_closed():
+            return
+        task.cancel()
+        if self._loop is asyncio.get_running_loop():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _enqueue(self, command: _Queued) -> None:
+        if self._closed:
+            raise RuntimeError(f"Table {self.game_id} is closed")
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            # First command, or the previous event loop is gone (tests, sync callers)
+            self._loop = loop
+            self._queue = asyncio.Queue(self.max_queue)
+            self._task = loop.create_task(self._run())
+        await self._queue.put(command)
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+
+    async def _run(self) -> None:
+        queue = self._queue
+        try:
+            await self._drain(queue)
+        finally:
+            # Nothing will run what is left; release its submitters
+            while not queue.empty():
+                command = queue.get_nowait()
+                if command.future is not None and not command.future.done():
+                    command.future.cancel()
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        while not self._closed:
+            command = await queue.get()
+            if command.future is not None and command.future.done():
+                continue  # the submitter was cancelled while it waited
+            waited = time.perf_counter() - command.enqueued
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            self._running = command.kind
+            with tracer.span(self.game_id, "table.command", kind=command.kind.name,
+                             depth=queue.qsize(), wait_us=round(waited * 1e6)) as span:
+                try:
+                    result = await self._call(command.fn)
+                except asyncio.CancelledError:
+                    if command.future is not None and not command.future.done():
+                        command.future.cancel()
+                    raise
+                except Exception as e:
+                    self.failed += 1
+                    span.set(ok=False)
+                    if command.future is None:
+                        logger.exception("Table %s: %s command failed", self.game_id, command.kind.name)
+                    elif not command.future.done():
+                        command.future.set_exception(e)
+                else:
+                    if command.future is not None and not command.future.done():
+                        command.future.set_result(result)
+                finally:
+                    self.processed += 1
+                    self._running = None
+
+    @staticmethod
+    async def _call(fn: CommandFn) -> Any:
+        result = fn()
+        if inspect.isawaitable(result):
+            result = await result
+        return result
@@ -0,0 +1,525 @@
+"""
+Tournament simulation with rule-based archetype bots.
+
+Plays complete multi-table tournaments on the headless engine. Blind levels
+come from GameService.generate_tournament_blind_structure and the field from
+a TournamentInfo; every ArchetypeEnum member has a cheap rule-based stand-in
+(preflop thresholds on hand-class percentile, postflop rules on made-hand
+category), so a tournament takes a fraction of a second instead of thousands
+of LLM calls. Tournaments are sharded across a process pool and the results
+aggregated into finish positions and chip-EV per archetype.
+
+Run ``python -m app.services.tournament_simulator --tournaments 1000`` for a
+quick balance report.
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.core.hand_evaluator import CATEGORY_SHIFT, HandEvaluator, HandRank
+from app.core.headless import HeadlessGame
+from app.core.poker_game import BettingRound, PlayerAction
+from app.core.rng import GameRNG
+from app.core.preflop import COMBO_CLASSES, NUM_CLASSES, PreflopEquityTable, class_name, hand_class_of_ids
+from app.models.domain_models import ArchetypeEnum, BlindLevel, GameType, TournamentInfo
+
+# Hands dealt per minute of level time when converting durations to hands
+HANDS_PER_MINUTE = 1.0
+# Share of the field that finishes in the money for the standard payout
+PAID_FRACTION = 0.15
+# Blind growth per level once the generated structure runs out
+LEVEL_GROWTH = 1.5
+DEFAULT_TABLE_SIZE = 9
+
+
+@dataclass(frozen=True)
+class BotStyle:
+    """Decision thresholds for one archetype."""
+    play: float  # Share of starting hands played (0.25 = top 25%)
+    raise_: float  # Share of starting hands raised
+    aggression: float  # Probability of betting/raising a made hand
+    call_down: float  # Probability of calling a bet without a made hand
+    bluff: float  # Probability of betting with nothing
+    shove_bb: float = 10.0  # Stack (in big blinds) at which it plays push/fold
+    jitter: float = 0.0  # Random spread applied to the thresholds every hand
+
+
+ARCHETYPE_STYLES: Dict[ArchetypeEnum, BotStyle] = {
+    ArchetypeEnum.TAG: BotStyle(play=0.20, raise_=0.15, aggression=0.70, call_down=0.15, bluff=0.10),
+    ArchetypeEnum.LAG: BotStyle(play=0.35, raise_=0.28, aggression=0.75, call_down=0.25, bluff=0.25),
+    ArchetypeEnum.TIGHT_PASSIVE: BotStyle(play=0.15, raise_=0.05, aggression=0.25, call_down=0.20, bluff=0.02),
+    ArchetypeEnum.CALLING_STATION: BotStyle(play=0.50, raise_=0.05, aggression=0.20, call_down=0.70, bluff=0.03),
+    ArchetypeEnum.MANIAC: BotStyle(play=0.65, raise_=0.50, aggression=0.90, call_down=0.40, bluff=0.45),
+    ArchetypeEnum.BEGINNER: BotStyle(play=0.45, raise_=0.10, aggression=0.35, call_down=0.50, bluff=0.10,
+                                     shove_bb=5.0, jitter=0.3),
+    ArchetypeEnum.UNPREDICTABLE: BotStyle(play=0.35, raise_=0.20, aggression=0.55, call_down=0.35, bluff=0.25,
+                                          jitter=0.8),
+    ArchetypeEnum.ADAPTABLE: BotStyle(play=0.25, raise_=0.18, aggression=0.60, call_down=0.25, bluff=0.15,
+                                      jitter=0.2),
+    ArchetypeEnum.GTO: BotStyle(play=0.24, raise_=0.18, aggression=0.60, call_down=0.30, bluff=0.18),
+    ArchetypeEnum.SHORT_STACK: BotStyle(play=0.18, raise_=0.14, aggression=0.65, call_down=0.10, bluff=0.05,
+                                        shove_bb=20.0),
+    ArchetypeEnum.TRAPPY: BotStyle(play=0.25, raise_=0.08, aggression=0.30, call_down=0.35, bluff=0.05),
+    ArchetypeEnum.LOOSE_PASSIVE: BotStyle(play=0.45, raise_=0.08, aggression=0.25, call_down=0.45, bluff=0.05),
+}
+
+
+def _heuristic_strength(index: int) -> float:
+    """Rough starting-hand score used when no preflop table is built."""
+    name = class_name(index)
+    high, low = "23456789TJQKA".index(name[0]), "23456789TJQKA".index(name[1])
+    if high == low:
+        return 20.0 + 2 * high
+    return high * 1.5 + low + (2.0 if name.endswith("s") else 0.0) - min(high - low - 1, 4)
+
+
+def _class_percentiles() -> List[float]:
+    """Share of all combos at least as strong as each starting hand class."""
+    table = PreflopEquityTable.get_instance()
+    if table is not None:
+        strength = [float(table.versus_random(index, 1)[2]) for index in range(NUM_CLASSES)]
+    else:
+        strength = [_heuristic_strength(index) for index in range(NUM_CLASSES)]
+    combos = [0] * NUM_CLASSES
+    for index in COMBO_CLASSES.tolist():
+        combos[index] += 1
+    percentiles = [0.0] * NUM_CLASSES
+    covered = 0
+    for index in sorted(range(NUM_CLASSES), key=lambda i: strength[i], reverse=True):
+        covered += combos[index]
+        percentiles[index] = covered / len(COMBO_CLASSES)
+    return percentiles
+
+
+CLASS_PERCENTILES = _class_percentiles()
+_PAIR = HandRank.PAIR.value
+_TWO_PAIR = HandRank.TWO_PAIR.value
+
+
+def _board_category(board: Tuple[int, ...]) -> int:
+    """Hand category the board makes on its own (pairs only before the river)."""
+    if len(board) == 5:
+        return HandEvaluator.strength_of_ids(board) >> CATEGORY_SHIFT
+    return _PAIR if len({card_id >> 2 for card_id in board}) < len(board) else HandRank.HIGH_CARD.value
+
+
+class ArchetypeBot:
+    """Rule-based stand-in for an archetype, fast enough for bulk simulation."""
+
+    def __init__(self, archetype: ArchetypeEnum, rng: random.Random):
+        """
+        Initialize a bot.
+
+        Args:
+            archetype: Archetype to imitate
+            rng: Random stream shared by the tournament (keeps runs reproducible)
+        """
+        self.archetype = archetype
+        self.style = ARCHETYPE_STYLES[archetype]
+        self.rng = rng
+
+    def decide(self, game: HeadlessGame, seat: int) -> Tuple[PlayerAction, Optional[int]]:
+        """Pick an action for the seat to act (a headless Policy)."""
+        style = self.style
+        rng = self.rng
+        spread = 1.0 + style.jitter * (rng.random() * 2 - 1) if style.jitter else 1.0
+        to_call = game.current_bet - game.current_bets[seat]
+        stack = game.chips[seat]
+        big_blind = game.big_blind
+        passive = PlayerAction.CHECK if to_call <= 0 else PlayerAction.FOLD
+
+        if game.current_round is BettingRound.PREFLOP:
+            percentile = CLASS_PERCENTILES[hand_class_of_ids(*game.hole_cards[seat])]
+            if stack + game.current_bets[seat] <= style.shove_bb * big_blind:
+                # Push/fold: shove a slightly wider range than the normal raising range
+                return (PlayerAction.ALL_IN, None) if percentile <= style.play * spread else (passive, None)
+            if percentile <= style.raise_ * spread or rng.random() < style.bluff * 0.2:
+                target = 3 * big_blind if game.current_bet <= big_blind else 3 * game.current_bet
+                return self._raise(game, seat, target)
+            if percentile <= style.play * spread:
+                return (PlayerAction.CALL if to_call > 0 else PlayerAction.CHECK), None
+            return passive, None
+
+        board = tuple(game.board)
+        made = HandEvaluator.strength_of_ids(game.hole_cards[seat] + board) >> CATEGORY_SHIFT
+        on_board = _board_category(board)
+        improved = made > on_board and made >= _PAIR
+        pot = game.pot
+        roll = rng.random()
+        if to_call <= 0:
+            if (improved and roll < style.aggression * spread) or roll < style.bluff * spread:
+                return self._raise(game, seat, max(big_blind, pot * 2 // 3))
+            return PlayerAction.CHECK, None
+        if improved and made >= _TWO_PAIR:
+            if roll < style.aggression * spread:
+                return self._raise(game, seat, game.current_bet * 2 + pot // 2)
+            return PlayerAction.CALL, None
+        cheap = to_call * 4 <= pot
+        if improved and (cheap or roll < 0.5 + style.call_down * spread):
+            return PlayerAction.CALL, None
+        if roll < style.call_down * spread * (1.0 if cheap else 0.3):
+            return PlayerAction.CALL, None
+        return PlayerAction.FOLD, None
+
+    def _raise(self, game: HeadlessGame, seat: int, target: int) -> Tuple[PlayerAction, Optional[int]]:
+        """Bet or raise to target, clamped to the legal range."""
+        all_in_to = game.current_bets[seat] + game.chips[seat]
+        if game.current_bet == 0:
+            minimum = game.big_blind
+            action = PlayerAction.BET
+        else:
+            minimum = game.current_bet + game.min_raise
+            action = PlayerAction.RAISE
+        if all_in_to <= max(minimum, target):
+            if all_in_to <= game.current_bet:
+                return PlayerAction.CALL, None
+            return PlayerAction.ALL_IN, None
+        return action, max(minimum, target)
+
+
+@dataclass(frozen=True)
+class TournamentSpec:
+    """Picklable description of the tournament to simulate."""
+    starting_chips: int
+    levels: Tuple[Tuple[int, int, int], ...]  # (small blind, big blind, ante) per level
+    hands_per_level: int
+    field: Tuple[ArchetypeEnum, ...]  # Archetype of every entrant
+    table_size: int = DEFAULT_TABLE_SIZE
+
+    @property
+    def paid_places(self) -> int:
+        """Number of finishing positions in the money."""
+        return max(1, math.ceil(len(self.field) * PAID_FRACTION))
+
+    def level(self, index: int) -> Tuple[int, int, int]:
+        """Blinds for a level, growing past the end of the structure."""
+        if index < len(self.levels):
+            return self.levels[index]
+        small_blind, big_blind, ante = self.levels[-1]
+        growth = LEVEL_GROWTH ** (index - len(self.levels) + 1)
+        return int(small_blind * growth), int(big_blind * growth), int(ante * growth)
+
+
+@dataclass
+class ArchetypeStats:
+    """Accumulated results for one archetype."""
+    entries: int = 0
+    finish_total: int = 0
+    wins: int = 0
+    in_the_money: int = 0
+    hands: int = 0
+    net_big_blinds: float = 0.0
+    finishes: Dict[int, int] = field(default_factory=dict)
+
+    def merge(self, other: "ArchetypeStats") -> None:
+        """Add another set of results into this one."""
+        self.entries += other.entries
+        self.finish_total += other.finish_total
+        self.wins += other.wins
+        self.in_the_money += other.in_the_money
+        self.hands += other.hands
+        self.net_big_blinds += other.net_big_blinds
+        for place, count in other.finishes.items():
+            self.finishes[place] = self.finishes.get(place, 0) + count
+
+    def to_dict(self) -> Dict[str, float]:
+        """Summary figures for reports."""
+        entries = max(self.entries, 1)
+        return {
+            "entries": self.entries,
+            "average_finish": self.finish_total / entries,
+            "win_rate": self.wins / entries,
+            "itm_rate": self.in_the_money / entries,
+            "chip_ev_bb_per_100": 100 * self.net_big_blinds / max(self.hands, 1),
+        }
+
+
+@dataclass
+class SimulationReport:
+    """Aggregated results of many simulated tournaments."""
+    tournaments: int = 0
+    hands: int = 0
+    archetypes: Dict[str, ArchetypeStats] = field(default_factory=dict)
+
+    def merge(self, other: "SimulationReport") -> None:
+        """Add another report into this one."""
+        self.tournaments += other.tournaments
+        self.hands += other.hands
+        for name, stats in other.archetypes.items():
+            self.archetypes.setdefault(name, ArchetypeStats()).merge(stats)
+
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-friendly dict."""
+        return {
+            "tournaments": self.tournaments,
+            "hands": self.hands,
+            "archetypes": {name: stats.to_dict() for name, stats in sorted(self.archetypes.items())},
+        }
+
+
+class _Table:
+    """One table of a running tournament: entrant ids mapped onto a headless game."""
+
+    def __init__(self, entrants: List[int], chips: Dict[int, int], button: int, rng: random.Random):
+        self.entrants = entrants
+        self.game = HeadlessGame([chips[e] for e in entrants], 1, 2, button=button % len(entrants),
+                                 seed=rng.getrandbits(64))
+
+
+def play_tournament(spec: TournamentSpec, seed: Optional[int] = None) -> SimulationReport:
+    """
+    Play one tournament to completion.
+
+    Args:
+        spec: Tournament description
+        seed: Optional seed for the deal and the bots
+
+    Returns:
+        A single-tournament report
+    """
+    rng = random.Random(seed)
+    num_entrants = len(spec.field)
+    bots = [ArchetypeBot(archetype, rng).decide for archetype in spec.field]
+    chips = {entrant: spec.starting_chips for entrant in range(num_entrants)}
+    hands = [0] * num_entrants
+    net_big_blinds = [0.0] * num_entrants
+    finish: Dict[int, int] = {}
+
+    seating = list(range(num_entrants))
+    rng.shuffle(seating)
+    num_tables = math.ceil(num_entrants / spec.table_size)
+    tables = [_Table(seating[i::num_tables], chips, rng.randrange(spec.table_size), rng) for i in range(num_tables)]
+
+    rounds = 0
+    total_hands = 0
+    while len(chips) > 1:
+        small_blind, big_blind, ante = spec.level(rounds // spec.hands_per_level)
+        busted: List[Tuple[int, int]] = []
+        for table in tables:
+            game = table.game
+            game.small_blind, game.big_blind, game.ante = small_blind, big_blind, ante
+            entrants = table.entrants
+            starting = list(game.chips)
+            deltas = game.play_hand(lambda g, seat: bots[entrants[seat]](g, seat))
+            total_hands += 1
+            for seat, entrant in enumerate(entrants):
+                hands[entrant] += 1
+                net_big_blinds[entrant] += deltas[seat] / big_blind
+                chips[entrant] = game.chips[seat]
+                if game.chips[seat] == 0:
+                    busted.append((starting[seat], entrant))
+        rounds += 1
+
+        if busted:
+            # Players busting on the same round are ranked by their starting stacks
+            for _, entrant in sorted(busted):
+                finish[entrant] = len(chips)
+                del chips[entrant]
+            if len(chips) > 1:
+                tables = _rebalance(tables, chips, spec.table_size, rng)
+
+    for entrant in chips:
+        finish[entrant] = 1
+
+    report = SimulationReport(tournaments=1, hands=total_hands)
+    for entrant, archetype in enumerate(spec.field):
+        stats = report.archetypes.setdefault(archetype.value, ArchetypeStats())
+        place = finish[entrant]
+        stats.entries += 1
+        stats.finish_total += place
+        stats.wins += place == 1
+        stats.in_the_money += place <= spec.paid_places
+        stats.hands += hands[entrant]
+        stats.net_big_blinds += net_big_blinds[entrant]
+        stats.finishes[place] = stats.finishes.get(place, 0) + 1
+    return report
+
+
+def _rebalance(tables: List[_Table], chips: Dict[int, int], table_size: int,
+               rng: random.Random) -> List[_Table]:
+    """Drop busted players, break tables that are no longer needed and even out table sizes."""
+    seated = [[e for e in table.entrants if e in chips] for table in tables]
+    buttons = [table.game.button for table in tables]
+    changed = [len(s) != len(t.entrants) for s, t in zip(seated, tables)]
+    keep = list(range(len(tables)))
+
+    needed = math.ceil(len(chips) / table_size)
+    while len(keep) > needed:
+        broken = min(keep, key=lambda i: len(seated[i]))
+        keep.remove(broken)
+        for entrant in seated[broken]:
+            target = min(keep, key=lambda i: len(seated[i]))
+            seated[target].append(entrant)
+            changed[target] = True
+
+    while keep:
+        largest = max(keep, key=lambda i: len(seated[i]))
+        smallest = min(keep, key=lambda i: len(seated[i]))
+        if len(seated[largest]) - len(seated[smallest]) <= 1:
+            break
+        seated[smallest].append(seated[largest].pop(rng.randrange(len(seated[largest]))))
+        changed[largest] = changed[smallest] = True
+
+    balanced = []
+    for i in keep:
+        if changed[i]:
+            balanced.append(_Table(seated[i], chips, buttons[i], rng))
+        else:
+            balanced.append(tables[i])
+    return balanced
+
+
+def _play_batch(spec: TournamentSpec, seeds: Sequence[int]) -> SimulationReport:
+    """Play a batch of tournaments in one process."""
+    report = SimulationReport()
+    for seed in seeds:
+        report.merge(play_tournament(spec, seed))
+    return report
+
+
+def blind_structure_for(tournament: TournamentInfo, service=None) -> List[BlindLevel]:
+    """
+    Generate the blind levels the live game would use for a tournament.
+
+    Creates a scratch tournament through GameService, asks it for its blind
+    structure and deletes it again.
+
+    Args:
+        tournament: Tournament settings
+        service: Optional GameService (the singleton by default)
+
+    Returns:
+        The generated blind levels
+    """
+    if service is None:
+        from app.services.game_service import GameService
+        service = GameService.get_instance()
+    options = tournament.model_dump(include={
+        "tier", "stage", "payout_structure", "buy_in_amount", "level_duration", "starting_chips",
+        "total_players", "starting_big_blind", "starting_small_blind", "ante_enabled",
+        "ante_start_level", "rebuy_option", "rebuy_level_cutoff", "archetype_distribution",
+    })
+    game = service.create_game(GameType.TOURNAMENT, name="simulation", **options)
+    try:
+        return list(service.generate_tournament_blind_structure(game.id).tournament_info.blind_structure)
+    finally:
+        service.game_repo.delete(game.id)
+
+
+def field_for(tournament: TournamentInfo) -> Tuple[ArchetypeEnum, ...]:
+    """
+    Assign an archetype to every entrant.
+
+    archetype_distribution is read as relative weights per archetype value
+    (counts or percentages); an empty distribution cycles through every
+    archetype evenly.
+
+    Args:
+        tournament: Tournament settings
+
+    Returns:
+        One archetype per entrant
+    """
+    total = tournament.total_players
+    weights = {ArchetypeEnum(name): weight for name, weight in tournament.archetype_distribution.items() if weight > 0}
+    if not weights:
+        archetypes = list(ArchetypeEnum)
+        return tuple(archetypes[i % len(archetypes)] for i in range(total))
+
+    # Largest-remainder allocation of the seats
+    weight_sum = sum(weights.values())
+    quotas = {archetype: total * weight / weight_sum for archetype, weight in weights.items()}
+    counts = {archetype: int(quota) for archetype, quota in quotas.items()}
+    by_remainder = sorted(quotas, key=lambda a: quotas[a] - counts[a], reverse=True)
+    for archetype in by_remainder[:total - sum(counts.values())]:
+        counts[archetype] += 1
+    return tuple(archetype for archetype, count in counts.items() for _ in range(count))
+
+
+class TournamentSimulator:
+    """Runs many tournaments across a process pool and aggregates the results."""
+
+    def __init__(self, tournament: TournamentInfo, workers: Optional[int] = None,
+                 table_size: int = DEFAULT_TABLE_SIZE, hands_per_level: Optional[int] = None,
+                 blind_structure: Optional[List[BlindLevel]] = None):
+        """
+        Initialize the simulator.
+
+        Args:
+            tournament: Tournament settings (field size, stacks, archetype mix)
+            workers: Worker processes (defaults to the CPU count; 0 runs in-process)
+            table_size: Seats per table
+            hands_per_level: Hands per blind level (default: level_duration * HANDS_PER_MINUTE)
+            blind_structure: Blind levels to use instead of generating them
+        """
+        levels = blind_structure or tournament.blind_structure or blind_structure_for(tournament)
+        self.spec = TournamentSpec(
+            starting_chips=tournament.starting_chips,
+            levels=tuple((level.small_blind, level.big_blind, level.ante) for level in levels),
+            hands_per_level=hands_per_level or max(1, round(tournament.level_duration * HANDS_PER_MINUTE)),
+            field=field_for(tournament),
+            table_size=table_size,
+        )
+        self.workers = multiprocessing.cpu_count() if workers is None else workers
+
+    def run(self, tournaments: int, seed: Optional[int] = None) -> SimulationReport:
+        """
+        Simulate a number of tournaments.
+
+        Args:
+            tournaments: Number of tournaments to play
+            seed: Optional seed; each tournament gets its own derived seed
+
+        Returns:
+            Aggregated report
+        """
+        root = GameRNG("tournament-simulation", seed)
+        seeds = [stream.key for stream in root.spawn(tournaments)]
+        if self.workers <= 1 or tournaments < 2:
+            return _play_batch(self.spec, seeds)
+
+        batches = [seeds[i::self.workers * 4] for i in range(min(tournaments, self.workers * 4))]
+        report = SimulationReport()
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+            for partial in pool.map(_play_batch, [self.spec] * len(batches), batches):
+                report.merge(partial)
+        return report
+
+
+def main() -> None:
+    """Simulate tournaments from the command line and print the report."""
+    parser = argparse.ArgumentParser(description="Simulate tournaments with archetype bots")
+    parser.add_argument("--tournaments", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--tier", default="Local")
+    parser.add_argument("--starting-chips", type=int, default=50000)
+    parser.add_argument("--level-duration", type=int, default=15)
+    parser.add_argument("--ante", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    tournament = TournamentInfo(
+        tier=args.tier,
+        stage="Beginning",
+        buy_in_amount=100,
+        level_duration=args.level_duration,
+        starting_chips=args.starting_chips,
+        total_players=args.players,
+        starting_big_blind=100,
+        starting_small_blind=50,
+        ante_enabled=args.ante,
+        players_remaining=args.players,
+    )
+    report = TournamentSimulator(tournament, workers=args.workers).run(args.tournaments, seed=args.seed)
+    print(json.dumps(report.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,842 @@
+"""
+Table sharding across worker processes.
+
+Every live table belongs to exactly one worker process, the one its game ID
+hashes to (shard_for). A worker runs the ordinary application (app.main:app)
+behind a Unix socket, so each table's state, command queue and websocket
+broadcasts stay inside the process that owns it. The front-end, ShardRouter,
+is a thin ASGI app: it reads the game ID from the request path and relays the
+whole connection, HTTP or websocket, to the owning worker as a stream of
+length-prefixed ASGI messages; a game_id query parameter names the table
+when the path does not. Stateless requests that name no table (creating a
+game, setup, equity, AI decisions) go to the workers in turn. Table-less
+requests over state that every worker holds a share of are answered by all
+of them (see _SHARED_ROUTES): reads such as metrics, a player's hands and AI
+profiles are fanned out and merged, and changes to the AI memory system are
+applied on every worker. A player's stats across all tables cannot be merged
+from per-worker summaries, so that request is refused unless it names a game.
+The worker that creates a game draws an ID that hashes back to itself
+(new_game_id), so the front-end keeps no table map and any number of
+front-ends route the same way.
+
+    python -m app.sharding serve --workers 4 --port 8000
+    python -m app.sharding loadgen --workers 1,4 --tables 200 --seconds 10
+
+Worker i keeps its data in DATA_DIR/shard-i. Keep the worker count fixed for
+a data directory, since the hash decides which worker restores which table.
+Frames are pickled; the sockets live in a private temporary directory and
+only connect processes of the same user.
+
+This module imports nothing from the application at load time: workers set
+their SHARD_* and DATA_DIR environment before app.core.config is imported.
+"""
+import argparse
+import asyncio
+import importlib
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import re
+import shutil
+import signal
+import struct
+import tempfile
+import time
+import uuid
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+_UUID = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+# Table-scoped routes; player-scoped ones (/history/player, /ai) name no table
+_GAME_PATH = re.compile(
+    rf"^/(?:game/[\w-]+|ws/game|history/(?:game|hand)|cash-games)/(?P<game_id>{_UUID})(?:/|$)"
+)
+_GAME_ID = re.compile(rf"^{_UUID}$")
+_FRAME = struct.Struct(">I")
+# Scope keys that cross the socket; the rest (app, state, extensions) are process-local
+_SCOPE_KEYS = ("type", "asgi", "http_version", "method", "scheme", "path", "raw_path",
+               "root_path", "query_string", "headers", "client", "server", "subprotocols")
+_DISCONNECTS = ("http.disconnect", "websocket.disconnect")
+_START_TIMEOUT = 60.0  # seconds for every worker to import the app and listen
+_STOP_TIMEOUT = 30.0  # seconds for a worker to save its data after SIGTERM
+
+
+def shard_for(game_id: str, shards: int) -> int:
+    """Index of the worker that owns a game (stable across processes and restarts)."""
+    return zlib.crc32(game_id.encode()) % shards
+
+
+def new_game_id() -> str:
+    """
+    Draw an ID for a new game owned by this process.
+
+    Unsharded (SHARD_COUNT 1) this is a plain UUID4; in a worker, UUIDs are
+    drawn until one hashes to the worker's own shard.
+    """
+    from app.core import config
+
+    while True:
+        game_id = str(uuid.uuid4())
+        if config.SHARD_COUNT <= 1 or shard_for(game_id, config.SHARD_COUNT) == config.SHARD_INDEX:
+            return game_id
+
+
+def game_id_from_path(path: str) -> Optional[str]:
+    """The game ID a request path is scoped to, or None for table-less routes."""
+    match = _GAME_PATH.match(path)
+    return match.group("game_id") if match else None
+
+
+def game_id_from_request(path: str, query_string: bytes = b"") -> Optional[str]:
+    """The game ID a request is scoped to, by its path or else its game_id query parameter."""
+    game_id = game_id_from_path(path)
+    if game_id is None and query_string:
+        values = parse_qs(query_string.decode("latin-1")).get("game_id")
+        if values and _GAME_ID.match(values[0]):
+            game_id = values[0]
+    return game_id
+
+
+# Merging the JSON bodies of a fanned-out request: (bodies, query) -> merged body
+
+def _merge_lists(bodies: List[Any], query: Dict[str, List[str]]) -> Any:
+    return [item for body in bodies for item in body]
+
+
+def _merge_player_hands(bodies: List[Any], query: Dict[str, List[str]]) -> Any:
+    """Newest hands first across workers, cut to the request's limit."""
+    hands = sorted(_merge_lists(bodies, query), key=lambda hand: hand.get("timestamp_start") or "",
+                   reverse=True)
+    return hands[:int(query.get("limit", ["10"])[0])]
+
+
+def _merge_profiles(bodies: List[Any], query: Dict[str, List[str]]) -> Any:
+    """Each worker's loaded profiles, one per player."""
+    seen = set()
+    profiles = []
+    for profile in _merge_lists(bodies, query):
+        if profile.get("player_id") not in seen:
+            seen.add(profile.get("player_id"))
+            profiles.append(profile)
+    return profiles
+
+
+def _merge_counts(values: List[Any], key: str = "") -> Any:
+    """
+    Add up one metrics value across workers.
+
+    Dicts merge key by key and numbers are summed (every worker has its own
+    limits, so capacities add up too), except peak waits, which take the
+    maximum, and average waits, which are weighted by their request counts.
+    """
+    first = values[0]
+    if isinstance(first, dict):
+        keys = dict.fromkeys(name for value in values for name in value)
+        merged = {name: _merge_counts([value[name] for value in values if name in value], name)
+                  for name in keys}
+        if "avg_wait_ms" in merged and merged.get("requests"):
+            weighted = sum(value.get("avg_wait_ms", 0) * value.get("requests", 0) for value in values)
+            merged["avg_wait_ms"] = round(weighted / merged["requests"], 3)
+        return merged
+    if isinstance(first, (int, float)) and not isinstance(first, bool):
+        return max(values) if key.startswith("max_wait") else sum(values)
+    return first
+
+
+def _merge_llm_metrics(bodies: List[Any], query: Dict[str, List[str]]) -> Any:
+    return _merge_counts(bodies)
+
+
+_FAN_OUT = "fan_out"  # every worker answers; 200 bodies are merged
+_FIRST = "first"  # every worker is asked; the first 200 answer wins
+_BROADCAST = "broadcast"  # every worker applies the change
+_REFUSE = "refuse"  # no correct answer can be assembled from the workers
+
+# Table-less routes over state each worker holds a share of:
+# (method, path pattern, policy, merge function or refusal message)
+_SHARED_ROUTES: List[Tuple[str, "re.Pattern", str, Any]] = [
+    ("GET", re.compile(r"^/game/metrics/tables/?$"), _FAN_OUT, _merge_lists),
+    ("GET", re.compile(r"^/game/metrics/llm/?$"), _FAN_OUT, _merge_llm_metrics),
+    ("GET", re.compile(r"^/history/player/[^/]+/hands/?$"), _FAN_OUT, _merge_player_hands),
+    ("GET", re.compile(r"^/history/player/[^/]+/stats/?$"), _REFUSE,
+     "Player stats across all tables are not available with sharded tables; pass game_id"),
+    ("GET", re.compile(r"^/ai/profiles/?$"), _FAN_OUT, _merge_profiles),
+    ("GET", re.compile(r"^/ai/profiles/[^/]+/?$"), _FIRST, None),
+    ("POST", re.compile(r"^/ai/memory/(?:enable|disable)/?$"), _BROADCAST, None),
+    ("DELETE", re.compile(r"^/ai/memory/clear/?$"), _BROADCAST, None),
+    ("POST", re.compile(r"^/ai/process-hand-history/?$"), _BROADCAST, None),
+]
+
+
+def shared_route(method: str, path: str) -> Optional[Tuple[str, Any]]:
+    """(policy, merge function or message) for a table-less route over per-worker state."""
+    for route_method, pattern, policy, detail in _SHARED_ROUTES:
+        if method == route_method and pattern.match(path):
+            return policy, detail
+    return None
+
+
+def write_frame(writer: asyncio.StreamWriter, message: Message) -> None:
+    """Queue one length-prefixed message on a stream."""
+    data = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    writer.write(_FRAME.pack(len(data)) + data)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[Message]:
+    """Read one message, or None once the peer has closed the stream."""
+    try:
+        header = await reader.readexactly(_FRAME.size)
+        return pickle.loads(await reader.readexactly(_FRAME.unpack(header)[0]))
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+
+
+class _Lifespan:
+    """Drives an ASGI app's lifespan protocol (what a server does at start and stop)."""
+
+    def __init__(self, app):
+        self.app = app
+        self.state: Dict[str, Any] = {}
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def startup(self) -> None:
+        scope = {"type": "lifespan", "asgi": {"version": "3.0", "spec_version": "2.0"}, "state": self.state}
+        self._task = asyncio.create_task(self.app(scope, self._inbox.get, self._outbox.put))
+        await self._signal("startup")
+
+    async def shutdown(self) -> None:
+        if self._task is not None and not self._task.done():
+            await self._signal("shutdown")
+
+    async def _signal(self, phase: str) -> None:
+        await self._inbox.put({"type": f"lifespan.{phase}"})
+        reply = asyncio.ensure_future(self._outbox.get())
+        await asyncio.wait({reply, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        if not reply.done():
+            # The app does not take part in lifespan events
+            reply.cancel()
+            return
+        message = reply.result()
+        if message["type"] != f"lifespan.{phase}.complete":
+            raise RuntimeError(message.get("message") or f"Lifespan {phase} failed")
+
+
+class ShardWorker:
+    """
+    Serves an ASGI app to the front-end over a Unix socket.
+
+    Each connection carries one ASGI connection: the scope, then the client's
+    messages one way and the app's messages the other. The front-end closing
+    its end is a client disconnect.
+    """
+
+    def __init__(self, app, socket_path: str):
+        self.app = app
+        self.socket_path = socket_path
+        self._lifespan = _Lifespan(app)
+        self._connections = set()
+
+    async def serve(self) -> None:
+        """Start the app, serve until SIGTERM or SIGINT, then shut the app down."""
+        loop = asyncio.get_running_loop()
+        stopping = asyncio.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stopping.set)
+
+        await self._lifespan.startup()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        try:
+            await stopping.wait()
+        finally:
+            server.close()
+            for task in list(self._connections):
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._lifespan.shutdown()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            scope = await read_frame(reader)
+            if scope is not None:
+                await self._serve_connection(scope, reader, writer)
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _serve_connection(self, scope: Scope, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        scope["state"] = dict(self._lifespan.state)
+        if scope["type"] == "websocket":
+            disconnect = {"type": "websocket.disconnect", "code": 1006}
+        else:
+            disconnect = {"type": "http.disconnect"}
+        inbox: asyncio.Queue = asyncio.Queue()
+
+        async def pump() -> None:
+            while (message := await read_frame(reader)) is not None:
+                inbox.put_nowait(message)
+            inbox.put_nowait(disconnect)
+
+        async def receive() -> Message:
+            message = await inbox.get()
+            if message["type"] in _DISCONNECTS:
+                # Every later receive() sees the disconnect too
+                inbox.put_nowait(message)
+            return message
+
+        async def send(message: Message) -> None:
+            write_frame(writer, message)
+            await writer.drain()
+
+        pumping = asyncio.create_task(pump())
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            logger.exception("Unhandled error serving %s %s", scope["type"], scope.get("path"))
+        finally:
+            # Half-close and keep reading until the front-end closes: closing
+            # with unread client messages would reset the socket and drop the
+            # response before the front-end has read it
+            try:
+                writer.write_eof()
+                await asyncio.wait_for(pumping, _STOP_TIMEOUT)
+            except (OSError, asyncio.TimeoutError):
+                pumping.cancel()
+
+
+def _run_worker(app_path: str, index: int, shards: int, socket_path: str,
+                data_dir: str, log_level: str) -> None:
+    """Entry point of a worker process."""
+    os.environ.update(SHARD_INDEX=str(index), SHARD_COUNT=str(shards), DATA_DIR=data_dir)
+    logging.basicConfig(level=log_level)
+    module_name, _, attribute = app_path.partition(":")
+    app = getattr(importlib.import_module(module_name), attribute)
+    from app.core import config
+    config.SHARD_INDEX, config.SHARD_COUNT = index, shards
+    asyncio.run(ShardWorker(app, socket_path).serve())
+
+
+async def _send_json(send: Send, status: int, data: Any) -> None:
+    """Answer an HTTP request from the front-end itself."""
+    body = json.dumps(data).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _unavailable(scope: Scope, receive: Receive, send: Send) -> None:
+    """Answer a connection whose worker cannot be reached."""
+    if scope["type"] == "websocket":
+        await receive()
+        await send({"type": "websocket.close", "code": 1011})
+        return
+    await _send_json(send, 503, {"detail": "Table server unavailable"})
+
+
+async def _read_body(receive: Receive) -> bytes:
+    """The whole body of an HTTP request."""
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    return b"".join(chunks)
+
+
+# A worker's answer to one HTTP request: status, headers and body
+_Response = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+
+class ShardRouter:
+    """
+    ASGI front-end that relays each connection to the worker owning its table.
+
+    The workers are started and stopped with the router's own lifespan, so
+    any ASGI server (or TestClient) that runs lifespan events can serve it.
+
+    Args:
+        workers: Number of worker processes
+        app_path: "module:attribute" of the ASGI app the workers serve
+        data_dir: Base data directory (default DATA_DIR); worker i uses data_dir/shard-i
+        log_level: Logging level in the workers
+    """
+
+    def __init__(self, workers: int = 2, app_path: str = "app.main:app",
+                 data_dir: Optional[str] = None, log_level: str = "WARNING"):
+        if workers < 1:
+            raise ValueError("At least one worker is required")
+        self.workers = workers
+        self.app_path = app_path
+        self.data_dir = data_dir or os.environ.get("DATA_DIR", "./data")
+        self.log_level = log_level
+        self.processes: List[multiprocessing.Process] = []
+        self.relayed = [0] * workers  # connections relayed to each worker
+        self._socket_dir: Optional[str] = None
+        self._round_robin = itertools.cycle(range(workers))
+
+    def socket_path(self, index: int) -> str:
+        return os.path.join(self._socket_dir, f"shard-{index}.sock")
+
+    def route(self, path: str, query_string: bytes = b"") -> int:
+        """Worker index for a request path (and query)."""
+        game_id = game_id_from_request(path, query_string)
+        if game_id is None:
+            return next(self._round_robin)
+        return shard_for(game_id, self.workers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._run_lifespan(receive, send)
+            return
+        query_string = scope.get("query_string", b"")
+        if scope["type"] == "http" and game_id_from_request(scope["path"], query_string) is None:
+            shared = shared_route(scope["method"], scope["path"])
+            if shared is not None:
+                await self._serve_shared(scope, receive, send, *shared)
+                return
+        index = self.route(scope["path"], query_string)
+        self.relayed[index] += 1
+        await self._relay(index, scope, receive, send)
+
+    async def start(self) -> None:
+        """Spawn the workers and wait until every one is listening."""
+        self._socket_dir = tempfile.mkdtemp(prefix="cscpt-shards-")
+        context = multiprocessing.get_context("spawn")
+        for index in range(self.workers):
+            # Not daemonic: workers run their own equity process pools
+            process = context.Process(
+                target=_run_worker,
+                args=(self.app_path, index, self.workers, self.socket_path(index),
+                      os.path.join(self.data_dir, f"shard-{index}"), self.log_level),
+                name=f"shard-{index}",
+            )
+            process.start()
+            self.processes.append(process)
+
+        deadline = time.monotonic() + _START_TIMEOUT
+        for index, process in enumerate(self.processes):
+            while not await self._listening(index):
+                if not process.is_alive():
+                    raise RuntimeError(f"Shard worker {index} exited with code {process.exitcode}")
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Shard worker {index} did not start in {_START_TIMEOUT:.0f}s")
+                await asyncio.sleep(0.05)
+        logger.info("Started %d shard workers", self.workers)
+
+    async def _listening(self, index: int) -> bool:
+        # Probe with a connection: the socket file appears before listen()
+        try:
+            _, writer = await asyncio.open_unix_connection(self.socket_path(index))
+        except OSError:
+            return False
+        writer.close()
+        return True
+
+    async def stop(self) -> None:
+        """Ask the workers to save and exit, killing any that do not."""
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        loop = asyncio.get_running_loop()
+        for process in self.processes:
+            await loop.run_in_executor(None, process.join, _STOP_TIMEOUT)
+            if process.is_alive():
+                logger.warning("Shard worker %s did not stop; killing it", process.name)
+                process.kill()
+                await loop.run_in_executor(None, process.join)
+        self.processes = []
+        if self._socket_dir is not None:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+            self._socket_dir = None
+
+    async def _run_lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.start()
+                except Exception as e:
+                    await self.stop()
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _serve_shared(self, scope: Scope, receive: Receive, send: Send,
+                            policy: str, detail: Any) -> None:
+        """Answer a table-less request from every worker's share of the state."""
+        if policy == _REFUSE:
+            await _send_json(send, 501, {"detail": detail})
+            return
+        body = await _read_body(receive)
+        responses = await asyncio.gather(*(
+            self._exchange(index, scope, body) for index in range(self.workers)
+        ))
+        for index in range(self.workers):
+            self.relayed[index] += 1
+        ok = [response for response in responses if response is not None and response[0] == 200]
+        if policy == _FIRST:
+            chosen = ok[0] if ok else responses[0]
+        elif len(ok) < len(responses):
+            # A worker failed: pass its answer on rather than a partial result
+            chosen = next((r for r in responses if r is not None and r[0] != 200), None)
+        elif policy == _FAN_OUT:
+            query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+            await _send_json(send, 200, detail([json.loads(r[2]) for r in ok], query))
+            return
+        else:
+            chosen = ok[0]
+        if chosen is None:
+            await _unavailable(scope, receive, send)
+            return
+        status, headers, content = chosen
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": content})
+
+    async def _exchange(self, index: int, scope: Scope, body: bytes) -> Optional[_Response]:
+        """Send one HTTP request to a worker and read its whole answer (None if unreachable)."""
+        try:
+            reader, writer = await asyncio.open_unix_connection(self.socket_path(index))
+        except OSError:
+            logger.error("Shard worker %d is unavailable", index)
+            return None
+        try:
+            write_frame(writer, {key: scope[key] for key in _SCOPE_KEYS if key in scope})
+            write_frame(writer, {"type": "http.request", "body": body, "more_body": False})
+            await writer.drain()
+            status, headers, chunks = 0, [], []
+            while (message := await read_frame(reader)) is not None:
+                if message["type"] == "http.response.start":
+                    status, headers = message["status"], message.get("headers", [])
+                elif message["type"] == "http.response.body":
+                    chunks.append(message.get("body", b""))
+                    if not message.get("more_body"):
+                        break
+            return (status, headers, b"".join(chunks)) if status else None
+        except ConnectionError:
+            return None
+        finally:
+            writer.close()
+
+    async def _relay(self, index: int, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            reader, writer = await asyncio.open_unix_connection(self.socket_path(index))
+        except OSError:
+            logger.error("Shard worker %d is unavailable", index)
+            await _unavailable(scope, receive, send)
+            return
+        write_frame(writer, {key: scope[key] for key in _SCOPE_KEYS if key in scope})
+
+        async def forward() -> None:
+            try:
+                while True:
+                    message = await receive()
+                    write_frame(writer, message)
+                    await writer.drain()
+                    if message["type"] in _DISCONNECTS:
+                        return
+            except ConnectionError:
+                # The worker finished the connection first
+                pass
+
+        forwarding = asyncio.create_task(forward())
+        try:
+            while (message := await read_frame(reader)) is not None:
+                await send(message)
+        finally:
+            forwarding.cancel()
+            writer.close()
+
+
+# Load generator: emulated clients driving a router in-process over ASGI
+
+class _HttpClient:
+    """Issues single HTTP requests straight into an ASGI app."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method: str, path: str, query: str = "", body: Any = None) -> Tuple[int, bytes]:
+        scope = _client_scope("http", path, query)
+        scope["method"] = method
+        payload = b""
+        if body is not None:
+            payload = json.dumps(body).encode()
+            scope["headers"] = scope["headers"] + [(b"content-type", b"application/json")]
+        response = {"status": 0, "body": []}
+        finished = asyncio.Event()
+        sent = False
+
+        async def receive() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": payload, "more_body": False}
+            await finished.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["body"].append(message.get("body", b""))
+                if not message.get("more_body"):
+                    finished.set()
+
+        await self.app(scope, receive, send)
+        finished.set()
+        return response["status"], b"".join(response["body"])
+
+    async def json(self, method: str, path: str, query: str = "", body: Any = None) -> Any:
+        status, content = await self.request(method, path, query, body)
+        if status != 200:
+            raise RuntimeError(f"{method} {path} returned {status}: {content[:200]!r}")
+        return json.loads(content)
+
+
+class _WebSocketClient:
+    """A websocket connection straight into an ASGI app."""
+
+    def __init__(self, app, path: str, query: str = ""):
+        self._to_app: asyncio.Queue = asyncio.Queue()
+        self._from_app: asyncio.Queue = asyncio.Queue()
+        self._to_app.put_nowait({"type": "websocket.connect"})
+        scope = _client_scope("websocket", path, query)
+        scope["subprotocols"] = []
+        self._task = asyncio.create_task(app(scope, self._to_app.get, self._from_app.put))
+
+    async def accept(self) -> None:
+        message = await self._from_app.get()
+        if message["type"] != "websocket.accept":
+            raise ConnectionError(f"Websocket refused: {message}")
+
+    async def send_json(self, data: Any) -> None:
+        await self._to_app.put({"type": "websocket.receive", "text": json.dumps(data)})
+
+    async def receive_json(self) -> Any:
+        message = await self._from_app.get()
+        if message["type"] == "websocket.close":
+            raise ConnectionError(f"Websocket closed with code {message.get('code')}")
+        return json.loads(message.get("text") or message.get("bytes"))
+
+    async def close(self) -> None:
+        await self._to_app.put({"type": "websocket.disconnect", "code": 1000})
+        try:
+            await asyncio.wait_for(self._task, 10.0)
+        except (asyncio.TimeoutError, ConnectionError):
+            self._task.cancel()
+
+
+def _client_scope(kind: str, path: str, query: str) -> Scope:
+    return {
+        "type": kind,
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "scheme": "http" if kind == "http" else "ws",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"loadgen")],
+        "client": ("127.0.0.1", 0),
+        "server": ("loadgen", 80),
+    }
+
+
+async def _open_table(http: _HttpClient, players: int) -> Dict[str, Any]:
+    """Create a table, seat players and deal the first hand; returns the table's state."""
+    game_id = (await http.json("POST", "/game/create"))["game_id"]
+    for seat in range(players):
+        await http.json("POST", f"/game/join/{game_id}", f"player_name=Load{seat}&buy_in=1000")
+    return await http.json("POST", f"/game/start/{game_id}")
+
+
+# Messages a client answers with animation_done once it has drawn them
+_ANIMATED = {"round_bets_finalized", "street_dealt", "showdown_hands_revealed",
+             "pot_winners_determined", "chips_distributed", "hand_visually_concluded"}
+
+
+def _next_action(state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Check or call for the player to act; None once the hand is over."""
+    index = state["current_player_idx"]
+    if state["current_round"] == "SHOWDOWN" or not 0 <= index < len(state["players"]):
+        return None
+    player = state["players"][index]
+    action = "CHECK" if player["current_bet"] >= state["current_bet"] else "CALL"
+    return {"player_id": player["player_id"], "action": action}
+
+
+async def _drive_table(router: ShardRouter, http: _HttpClient, state: Dict[str, Any],
+                       until: float, latencies: Dict[str, List[float]]) -> None:
+    """
+    One emulated table: in turn asks it to rebroadcast its state over the
+    websocket (waiting for the pong), plays the next action of the hand
+    (dealing a new hand once it is over) and reads its hand history. Every
+    seated player has a websocket, as action requests go to the player's own
+    connection, and acknowledges animations as soon as they arrive, like a
+    client with nothing to draw.
+    """
+    game_id = state["game_id"]
+    sockets = []
+    for player in state["players"]:
+        socket = _WebSocketClient(router, f"/ws/game/{game_id}", f"player_id={player['player_id']}")
+        await socket.accept()
+        sockets.append(socket)
+    pongs: Dict[int, asyncio.Future] = {}
+
+    async def read(socket: _WebSocketClient) -> None:
+        while True:
+            message = await socket.receive_json()
+            kind = message.get("type")
+            if kind == "pong" and message.get("timestamp") in pongs:
+                pongs.pop(message["timestamp"]).set_result(None)
+            elif kind in _ANIMATED:
+                await socket.send_json({"type": "animation_done", "data": {"stepType": kind}})
+
+    readers = [asyncio.ensure_future(read(socket)) for socket in sockets]
+    sequence = 0
+    try:
+        while time.monotonic() < until:
+            sequence += 1
+            started = time.perf_counter()
+            if sequence % 3 == 1:
+                pong = pongs[sequence] = asyncio.get_running_loop().create_future()
+                await sockets[0].send_json({"type": "ping", "timestamp": sequence, "needsRefresh": True})
+                await asyncio.wait([pong, *readers], return_when=asyncio.FIRST_COMPLETED)
+                if not pong.done():
+                    # A reader stopped; raise its error
+                    next(reader for reader in readers if reader.done()).result()
+                latencies["ws_refresh"].append(time.perf_counter() - started)
+            elif sequence % 3 == 2:
+                move = _next_action(state)
+                if move is None:
+                    state = await http.json("POST", f"/game/next-hand/{game_id}")
+                else:
+                    result = await http.json("POST", f"/game/action/{game_id}", body=move)
+                    if not result["success"]:
+                        raise RuntimeError(f"Action on {game_id} was refused: {result['message']}")
+                    state = result["game_state"]
+                latencies["http_action"].append(time.perf_counter() - started)
+            else:
+                status, _ = await http.request("GET", f"/history/game/{game_id}")
+                if status != 200:
+                    raise RuntimeError(f"History request for {game_id} returned {status}")
+                latencies["http_history"].append(time.perf_counter() - started)
+    finally:
+        for reader in readers:
+            reader.cancel()
+        for socket in sockets:
+            await socket.close()
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+async def run_load(workers: int, tables: int, seconds: float, players: int = 2,
+                   data_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Start a router with its workers, open tables and drive them for a while.
+
+    Returns:
+        Throughput, per-operation latency percentiles and tables per worker
+    """
+    router = ShardRouter(workers, data_dir=data_dir, log_level="ERROR")
+    await router.start()
+    try:
+        http = _HttpClient(router)
+        states = await asyncio.gather(*(_open_table(http, players) for _ in range(tables)))
+        game_ids = [state["game_id"] for state in states]
+        latencies: Dict[str, List[float]] = {"ws_refresh": [], "http_action": [], "http_history": []}
+        started = time.monotonic()
+        await asyncio.gather(*(
+            _drive_table(router, http, state, started + seconds, latencies) for state in states
+        ))
+        elapsed = time.monotonic() - started
+    finally:
+        await router.stop()
+
+    per_worker = [0] * workers
+    for game_id in game_ids:
+        per_worker[shard_for(game_id, workers)] += 1
+    operations = sum(len(values) for values in latencies.values())
+    return {
+        "workers": workers,
+        "tables": tables,
+        "operations": operations,
+        "ops_per_second": operations / elapsed,
+        "latency_ms": {
+            name: {"p50": _percentile(values, 0.5) * 1000, "p99": _percentile(values, 0.99) * 1000}
+            for name, values in latencies.items()
+        },
+        "tables_per_worker": per_worker,
+    }
+
+
+def main() -> None:
+    """Serve the sharded front-end, or load-test it on this machine."""
+    parser = argparse.ArgumentParser(description="Shard tables across worker processes")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Run the routing front-end and its workers")
+    serve.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    serve.add_argument("--host", default="0.0.0.0")
+    serve.add_argument("--port", type=int, default=8000)
+
+    load = commands.add_parser("loadgen", help="Drive emulated tables through the front-end")
+    load.add_argument("--workers", default=f"1,{multiprocessing.cpu_count()}",
+                      help="Comma-separated worker counts to compare")
+    load.add_argument("--tables", type=int, default=100)
+    load.add_argument("--players", type=int, default=2)
+    load.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        import uvicorn
+
+        logging.basicConfig(level=logging.INFO)
+        uvicorn.run(ShardRouter(args.workers), host=args.host, port=args.port, lifespan="on")
+        return
+
+    with tempfile.TemporaryDirectory(prefix="cscpt-loadgen-") as data_dir:
+        for workers in (int(count) for count in args.workers.split(",")):
+            result = asyncio.run(run_load(workers, args.tables, args.seconds, args.players,
+                                          os.path.join(data_dir, f"run-{workers}")))
+            latency = result["latency_ms"]
+            print(f"{workers} worker(s), {args.tables} tables: {result['ops_per_second']:,.0f} ops/s; "
+                  f"ws refresh p50 {latency['ws_refresh']['p50']:.1f} ms p99 {latency['ws_refresh']['p99']:.1f} ms; "
+                  f"action p50 {latency['http_action']['p50']:.1f} ms p99 {latency['http_action']['p99']:.1f} ms; "
+                  f"http p50 {latency['http_history']['p50']:.1f} ms p99 {latency['http_history']['p99']:.1f} ms; "
+                  f"tables per worker {result['tables_per_worker']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Tests for the equity API endpoint.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.equity_api import get_equity_calculator
+from app.core.equity import EquityCalculator
+
+
+@pytest.fixture
+def test_client():
+    """Create a test client backed by a small in-process calculator."""
+    calculator = EquityCalculator(workers=0, time_budget=1.0, max_samples=5000, use_preflop_table=False)
+    app.dependency_overrides[get_equity_calculator] = lambda: calculator
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_equity_calculator, None)
+
+
+def test_calculate_equity(test_client):
+    """The endpoint returns win/tie/equity with a confidence interval."""
+    response = test_client.post("/equity", json={"hero_cards": "AsAd", "opponents": 1, "seed": 1})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["samples"] == 5000
+    assert 0.8 < data["equity"] < 0.9
+    assert data["confidence_low"] <= data["equity"] <= data["confidence_high"]
+
+
+def test_calculate_equity_with_range(test_client):
+    """Opponent ranges are given as lists of two-card combos."""
+    response = test_client.post(
+        "/equity",
+        json={"hero_cards": "AhKh", "board": "Qh Jh Th 2c 3d", "opponent_ranges": [["AsAc", "KsKc"]]},
+    )
+    assert response.status_code == 200
+    assert response.json()["equity"] == 1.0
+
+
+def test_invalid_cards_return_400(test_client):
+    """Unparseable or duplicate cards are a client error."""
+    assert test_client.post("/equity", json={"hero_cards": "AsXx"}).status_code == 400
+    assert test_client.post("/equity", json={"hero_cards": "AsAs"}).status_code == 400
+    assert test_client.post("/equity", json={"hero_cards": "AsKs", "opponent_ranges": [["Qd"]]}).status_code == 400
+
+
+def test_calculate_equity_with_range_notation(test_client):
+    """Opponent ranges may also use range notation, including weights."""
+    response = test_client.post(
+        "/equity", json={"hero_cards": "AsAd", "opponent_ranges": ["KK, QQ:0.5"], "seed": 2}
+    )
+    assert response.status_code == 200
+    assert 0.77 < response.json()["equity"] < 0.86
+    assert test_client.post("/equity", json={"hero_cards": "AsAd", "opponent_ranges": ["ZZ"]}).status_code == 400
@@ -10,6 +10,7 @@ import uuid
 
 from app.main import app
 from app.services.game_service import GameService
+from app.services.table_actor import TableActor
 from app.core.poker_game import PokerGame, PlayerStatus, BettingRound
 from app.models.domain_models import (
     Game, Player, PlayerAction, GameStatus, GameType, PlayerStatus,
@@ -37,6 +38,8 @@ def mock_service():
     
     # Create a mock service
     mock_service = MagicMock(spec=GameService)
+    # Routes submit their work to the table's actor; run it on a real one
+    mock_service.table_actor.side_effect = TableActor
     
     # Set it as the singleton instance
     GameService._set_instance_for_testing(mock_service)
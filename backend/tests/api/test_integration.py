@@ -105,4 +105,39 @@ def test_history_api():
     
     # Test player stats endpoint - may be empty for new players
     response = client.get(f"/history/player/{player1_id}/stats")
-    assert response.status_code in [200, 404]  # 404 is acceptable if no stats yet
\ No newline at end of file
+    assert response.status_code in [200, 404]  # 404 is acceptable if no stats yet
+
+
+def test_action_is_applied_once():
+    """A REST action is applied to the table exactly once."""
+    game_id = client.post("/game/create?small_blind=5&big_blind=10").json()["game_id"]
+    client.post(f"/game/join/{game_id}?player_name=Player%201&buy_in=1000")
+    client.post(f"/game/join/{game_id}?player_name=Player%202&buy_in=1000")
+    client.post(f"/game/start/{game_id}")
+    
+    from app.services.game_service import GameService
+    service = GameService.get_instance()
+    poker_game = service.poker_games[game_id]
+    player = poker_game.players[poker_game.current_player_idx]
+    chips = player.chips
+    
+    response = client.post(
+        f"/game/action/{game_id}",
+        json={"player_id": player.player_id, "action": "RAISE", "amount": 25}
+    )
+    assert response.json()["success"]
+    
+    # The small blind raised to 30 once, not twice
+    assert player.chips == chips - 25
+    assert poker_game.current_bet == 30
+    assert poker_game.current_round.name == "PREFLOP"
+    assert len(service.get_game(game_id).current_hand.actions) == 1
+    
+    # An action the table refuses is reported and not recorded
+    opponent = poker_game.players[poker_game.current_player_idx]
+    response = client.post(
+        f"/game/action/{game_id}",
+        json={"player_id": opponent.player_id, "action": "RAISE", "amount": 1}
+    )
+    assert not response.json()["success"]
+    assert len(service.get_game(game_id).current_hand.actions) == 1
@@ -0,0 +1,176 @@
+"""
+Tests for the per-table AI turn scheduler and pacing policies.
+"""
+import asyncio
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.poker_game import PlayerAction
+from app.services.ai_turns import (
+    AITurnScheduler, FixedPacing, HumanPacing, PacingPolicy, information_set, make_pacing
+)
+from app.services.game_service import GameService
+
+
+class FakeTable:
+    """A queue of AI turns; taking a turn moves to the next one."""
+
+    def __init__(self, players):
+        self.turns = [(player, (1, "PREFLOP", len(players) - i)) for i, player in enumerate(players)]
+        self.taken = []
+        self.idle = 0
+
+    def next_turn(self):
+        return self.turns[0] if self.turns else None
+
+    async def take_turn(self, player_id):
+        self.taken.append(player_id)
+        self.turns.pop(0)
+
+    async def on_idle(self):
+        self.idle += 1
+
+    def scheduler(self, pacing=None):
+        return AITurnScheduler("t", self.next_turn, self.take_turn, self.on_idle,
+                               pacing or PacingPolicy(), lambda: None)
+
+
+def test_runs_consecutive_turns_in_one_loop():
+    table = FakeTable(["a", "b", "c"])
+
+    async def main():
+        scheduler = table.scheduler()
+        # Starting it again while it runs joins the same loop
+        await asyncio.gather(scheduler.run(), scheduler.run())
+        return scheduler
+
+    scheduler = asyncio.run(main())
+    assert table.taken == ["a", "b", "c"]
+    assert table.idle == 1 and scheduler.turns_taken == 3
+
+
+def test_cancel_drops_the_pending_turn():
+    table = FakeTable(["a", "b"])
+
+    async def main():
+        scheduler = table.scheduler(FixedPacing(10.0))
+        task = scheduler.start()
+        await asyncio.sleep(0)
+        scheduler.cancel()
+        await scheduler.run()  # a cancelled loop is simply restarted
+        return task
+
+    task = asyncio.run(main())
+    assert task.cancelled()
+
+
+def test_turn_is_dropped_if_the_table_moves_on_while_waiting():
+    table = FakeTable(["a", "b"])
+
+    async def main():
+        scheduler = table.scheduler(FixedPacing(0.01))
+        task = scheduler.start()
+        await asyncio.sleep(0)
+        table.turns.pop(0)  # "a" acted some other way during the wait
+        await task
+        return scheduler
+
+    scheduler = asyncio.run(main())
+    assert table.taken == ["b"] and scheduler.turns_dropped == 1
+
+
+def test_stops_if_a_turn_does_not_advance():
+    table = FakeTable(["a"])
+    table.take_turn = AsyncMock()
+    asyncio.run(table.scheduler().run())
+    assert table.take_turn.await_count == 1 and table.idle == 0
+
+
+def test_pacing_policies():
+    assert make_pacing("instant").delay(None, "a") == 0
+    assert make_pacing("fixed", 0.3).delay(None, "a") == 0.3
+    with pytest.raises(ValueError):
+        make_pacing("sleepy")
+
+    me = SimpleNamespace(player_id="a", current_bet=0)
+    checked_to = SimpleNamespace(players=[me], current_bet=0, community_cards=[])
+    facing_bet = SimpleNamespace(players=[me], current_bet=20, community_cards=[])
+    for seed in range(20):
+        quiet = HumanPacing(1.0, random.Random(seed)).delay(checked_to, "a")
+        assert 0.6 <= quiet <= 1.6
+        assert HumanPacing(1.0, random.Random(seed)).delay(facing_bet, "a") >= quiet
+
+
+def test_service_drives_ai_players_until_a_human_acts(monkeypatch):
+    """AI turns run back to back, then the human is asked to act."""
+    for name in ("notify_player_action", "notify_turn_highlight_removed", "notify_bet_input_reset",
+                 "notify_game_update", "notify_action_request"):
+        monkeypatch.setattr(f"app.core.websocket.game_notifier.{name}", AsyncMock())
+    from app.core.websocket import game_notifier
+
+    GameService._reset_instance_for_testing()
+    service = GameService.get_instance()
+    service.ai_pacing = PacingPolicy()
+    game = service.create_cash_game(name="Turns")
+    _, human = service.add_player(game_id=game.id, name="Human", is_human=True, position=0)
+    for seat in range(1, 4):
+        service.add_player(game_id=game.id, name=f"AI {seat}", is_human=False, archetype="LAG", position=seat)
+    service.start_game(game.id)
+    poker_game = service.poker_games[game.id]
+
+    async def main():
+        if poker_game.players[poker_game.current_player_idx].player_id == human.id:
+            await poker_game.process_action(poker_game.players[poker_game.current_player_idx], PlayerAction.CALL)
+        await service.ai_turns(game.id).run()
+
+    asyncio.run(main())
+    assert poker_game.players[poker_game.current_player_idx].player_id == human.id
+    assert service.ai_turns(game.id).turns_taken >= 1
+    game_notifier.notify_action_request.assert_awaited_once()
+    asyncio.run(service.close_tables())
+    GameService._reset_instance_for_testing()
+
+
+def test_prefetched_decision_is_used_only_for_the_same_information_set():
+    async def main():
+        scheduler = FakeTable(["a"]).scheduler()
+        decided = []
+
+        async def decide():
+            decided.append(1)
+            return ("CALL", 20, 1)
+
+        key = information_set({"pot": 30, "to_call": 20}, {"game_type": "cash"})
+        scheduler.prefetch("a", key, decide)
+        scheduler.prefetch("a", key, decide)  # already under way
+        hit = await scheduler.take_prefetched("a", information_set({"to_call": 20, "pot": 30}, {"game_type": "cash"}))
+
+        scheduler.prefetch("a", key, decide)
+        stale = scheduler._prefetch[2]
+        miss = scheduler.take_prefetched("a", information_set({"pot": 60, "to_call": 40}, {"game_type": "cash"}))
+        await asyncio.sleep(0)
+
+        never = asyncio.Event()
+        scheduler.prefetch("b", key, never.wait)
+        pending = scheduler._prefetch[2]
+        scheduler.cancel()
+        await asyncio.sleep(0)
+        return scheduler, hit, miss, stale, pending, decided
+
+    scheduler, hit, miss, stale, pending, decided = asyncio.run(main())
+    assert hit == ("CALL", 20, 1) and miss is None
+    assert stale.done() and pending.cancelled() and scheduler._prefetch is None
+    assert (scheduler.prefetch_hits, scheduler.prefetch_misses) == (1, 1)
+    assert len(decided) == 1
+
+
+def test_scheduler_prefetches_before_the_pacing_wait():
+    table = FakeTable(["a", "b"])
+    prefetched = []
+    scheduler = AITurnScheduler("t", table.next_turn, table.take_turn, table.on_idle, FixedPacing(0.01),
+                                lambda: None, prefetch=lambda: prefetched.append(list(table.taken)))
+    asyncio.run(scheduler.run())
+    assert prefetched == [[], ["a"]]
@@ -494,4 +494,55 @@ class TestGameService:
         assert history.game_id == game.id
         assert history.hand_number == 1
         assert len(history.players) >= 2
-        assert history.timestamp_start is not None
\ No newline at end of file
+        assert history.timestamp_start is not None
+
+    def test_tournament_end_releases_the_table(self, game_service):
+        """Once one player has all the chips the game ends and its table is released."""
+        game = game_service.create_game(game_type=GameType.TOURNAMENT, name="Heads Up")
+        _, hero = game_service.add_player(game_id=game.id, name="Hero", is_human=True)
+        _, villain = game_service.add_player(game_id=game.id, name="Villain", is_human=False)
+        game = game_service.start_game_sync(game.id)
+        game_service.table_actor(game.id)
+        game_service.ai_turns(game.id)
+
+        # Villain busts in the first hand
+        game.hand_history.append(game.current_hand)
+        for player in game.players:
+            player.chips = 20000 if player.id == hero.id else 0
+        for poker_player in game_service.poker_games[game.id].players:
+            poker_player.chips = 20000 if poker_player.player_id == hero.id else 0
+
+        assert game_service._start_next_hand(game) is None
+        assert game.status == GameStatus.COMPLETED
+        assert game.id not in game_service.table_actors
+        assert game.id not in game_service.ai_turn_schedulers
+        with pytest.raises(KeyError):
+            game_service.table_actor(game.id)
+
+    def test_eliminated_and_finished_ai_agents_are_evicted(self, game_service, monkeypatch):
+        """A busted AI's agent is dropped at once, the rest when the tournament ends."""
+        evicted = []
+        monkeypatch.setattr(game_service, "_evict_ai_agents",
+                            lambda game_id, player_id=None: evicted.append((game_id, player_id)))
+        game = game_service.create_game(game_type=GameType.TOURNAMENT, name="Three Way")
+        _, hero = game_service.add_player(game_id=game.id, name="Hero", is_human=True)
+        _, first = game_service.add_player(game_id=game.id, name="First Out", is_human=False)
+        _, second = game_service.add_player(game_id=game.id, name="Second Out", is_human=False)
+        game = game_service.start_game_sync(game.id)
+
+        def bust(player_id, winner_chips):
+            game.hand_history.append(game.current_hand)
+            chips = {player_id: 0, hero.id: winner_chips}
+            for p in game.players:
+                p.chips = chips.get(p.id, p.chips)
+            for p in game_service.poker_games[game.id].players:
+                p.chips = chips.get(p.player_id, p.chips)
+
+        bust(first.id, 30000)
+        assert game_service._start_next_hand(game) is not None
+        assert evicted == [(game.id, first.id)]
+        assert next(p for p in game.players if p.id == first.id).status == PlayerStatus.OUT
+
+        bust(second.id, 60000)
+        assert game_service._start_next_hand(game) is None
+        assert evicted == [(game.id, first.id), (game.id, second.id), (game.id, None)]
@@ -0,0 +1,170 @@
+"""
+Tests for per-table command actors.
+"""
+import asyncio
+
+import pytest
+
+from app.models.domain_models import GameStatus
+from app.services.game_service import GameService
+from app.services.table_actor import TableActor, TableCommand
+
+
+def test_commands_run_one_at_a_time_in_order():
+    """Commands never interleave, even when each one awaits."""
+    log = []
+
+    async def command(name):
+        log.append(("start", name))
+        await asyncio.sleep(0)
+        log.append(("end", name))
+        return name
+
+    async def main():
+        actor = TableActor("t")
+        results = await asyncio.gather(*(
+            actor.submit(TableCommand.ACTION, lambda name=name: command(name)) for name in range(5)
+        ))
+        await actor.stop()
+        return results
+
+    assert asyncio.run(main()) == list(range(5))
+    assert log == [(step, name) for name in range(5) for step in ("start", "end")]
+
+
+def test_errors_reach_the_submitter_and_the_actor_carries_on():
+    def fail():
+        raise ValueError("bad action")
+
+    async def main():
+        actor = TableActor("t")
+        with pytest.raises(ValueError):
+            await actor.submit(TableCommand.ACTION, fail)
+        assert await actor.submit(TableCommand.ACTION, lambda: 42) == 42
+        metrics = actor.metrics()
+        await actor.stop()
+        return metrics
+
+    metrics = asyncio.run(main())
+    assert (metrics["processed"], metrics["failed"], metrics["depth"]) == (2, 1, 0)
+
+
+def test_full_queue_holds_submitters_back():
+    """With the queue full, a further submitter waits until the actor catches up."""
+    async def main():
+        actor = TableActor("t", max_queue=1)
+        release = asyncio.Event()
+        running = asyncio.create_task(actor.submit(TableCommand.ACTION, release.wait))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(actor.submit(TableCommand.ACTION, lambda: "queued"))
+        await asyncio.sleep(0)
+        blocked = asyncio.create_task(actor.submit(TableCommand.ACTION, lambda: "blocked"))
+        await asyncio.sleep(0.01)
+        assert actor.depth == 1 and actor.metrics()["running"] == "ACTION"
+        assert not blocked.done()
+        release.set()
+        assert await asyncio.gather(running, queued, blocked) == [True, "queued", "blocked"]
+        assert actor.metrics()["max_depth"] == 1
+        await actor.stop()
+
+    asyncio.run(main())
+
+
+def test_nested_submit_runs_inline():
+    """A command can submit to its own table without deadlocking."""
+    async def main():
+        actor = TableActor("t")
+
+        async def outer():
+            return await actor.submit(TableCommand.NEXT_HAND, lambda: "inner") + "+outer"
+
+        result = await asyncio.wait_for(actor.submit(TableCommand.ACTION, outer), 1)
+        await actor.stop()
+        return result
+
+    assert asyncio.run(main()) == "inner+outer"
+
+
+def test_posted_commands_run_in_order():
+    log = []
+
+    async def main():
+        actor = TableActor("t")
+        for i in range(3):
+            await actor.post(TableCommand.NEXT_HAND, lambda i=i: log.append(i))
+        await actor.submit(TableCommand.ACTION, lambda: log.append("done"))
+        await actor.stop()
+
+    asyncio.run(main())
+    assert log == [0, 1, 2, "done"]
+
+
+def test_actor_survives_a_new_event_loop():
+    """Sync callers and tests run each call on a fresh loop; the actor follows."""
+    actor = TableActor("t")
+    assert asyncio.run(actor.submit(TableCommand.JOIN, lambda: 1)) == 1
+    assert asyncio.run(actor.submit(TableCommand.LEAVE, lambda: 2)) == 2
+    assert actor.metrics()["processed"] == 2
+
+
+def test_close_lets_the_running_command_finish():
+    """A command can close its own actor; queued commands are cancelled."""
+    async def main():
+        actor = TableActor("t")
+        release = asyncio.Event()
+
+        async def last():
+            await release.wait()
+            actor.close()
+            return "last"
+
+        running = asyncio.create_task(actor.submit(TableCommand.ACTION, last))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(actor.submit(TableCommand.ACTION, lambda: "never"))
+        await asyncio.sleep(0)
+        release.set()
+        assert await running == "last"
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        with pytest.raises(RuntimeError):
+            await actor.submit(TableCommand.ACTION, lambda: "late")
+        assert actor.closed and actor._task.done()
+
+    asyncio.run(main())
+
+
+def test_service_keeps_one_actor_per_table():
+    GameService._reset_instance_for_testing()
+    service = GameService.get_instance()
+    table_a = service.create_cash_game(name="A").id
+    table_b = service.create_cash_game(name="B").id
+    assert service.table_actor(table_a) is service.table_actor(table_a)
+    assert service.table_actor(table_a) is not service.table_actor(table_b)
+    ids = {metrics["game_id"] for metrics in service.table_metrics()}
+    assert ids == {table_a, table_b}
+    asyncio.run(service.close_tables())
+    assert service.table_metrics() == []
+    GameService._reset_instance_for_testing()
+
+
+def test_unknown_and_ended_games_get_no_actor():
+    """Bogus IDs create nothing, and ending a game releases its actor and AI loop."""
+    GameService._reset_instance_for_testing()
+    service = GameService.get_instance()
+    with pytest.raises(KeyError):
+        service.table_actor("no-such-game")
+    with pytest.raises(KeyError):
+        service.ai_turns("no-such-game")
+    assert service.table_actors == {} and service.ai_turn_schedulers == {}
+
+    game_id = service.create_cash_game(name="Ends").id
+    actor = service.table_actor(game_id)
+    assert asyncio.run(actor.submit(TableCommand.JOIN, lambda: 1)) == 1
+    service.ai_turns(game_id)
+    service.end_game(game_id)
+    assert service.get_game(game_id).status == GameStatus.COMPLETED
+    assert actor.closed
+    assert service.table_actors == {} and service.ai_turn_schedulers == {}
+    with pytest.raises(KeyError):
+        service.table_actor(game_id)
+    GameService._reset_instance_for_testing()
@@ -0,0 +1,78 @@
+"""
+Tests for the tournament simulator.
+"""
+import pytest
+from app.models.domain_models import ArchetypeEnum, TournamentInfo
+from app.repositories.in_memory import RepositoryFactory
+from app.services.game_service import GameService
+from app.services.tournament_simulator import (
+    ARCHETYPE_STYLES, TournamentSimulator, blind_structure_for, field_for, play_tournament
+)
+
+
+def make_info(**overrides):
+    """Small tournament settings for fast runs."""
+    settings = dict(
+        tier="Local", stage="Beginning", buy_in_amount=100, level_duration=10, starting_chips=5000,
+        total_players=20, starting_big_blind=100, starting_small_blind=50, players_remaining=20,
+    )
+    settings.update(overrides)
+    return TournamentInfo(**settings)
+
+
+@pytest.fixture
+def service():
+    """Fresh game service and repositories."""
+    GameService._reset_instance_for_testing()
+    RepositoryFactory._reset_instance_for_testing()
+    yield GameService.get_instance()
+    GameService._reset_instance_for_testing()
+    RepositoryFactory._reset_instance_for_testing()
+
+
+def test_every_archetype_has_a_bot():
+    """Each archetype has a rule-based stand-in."""
+    assert set(ARCHETYPE_STYLES) == set(ArchetypeEnum)
+
+
+def test_blind_structure_comes_from_game_service(service):
+    """Blind levels match the live generator and the scratch game is removed."""
+    levels = blind_structure_for(make_info(), service)
+    assert levels[0].small_blind == 50 and levels[0].big_blind == 100
+    assert all(b.big_blind >= a.big_blind for a, b in zip(levels, levels[1:]))
+    assert service.game_repo.list() == []
+
+
+def test_field_follows_distribution():
+    """Archetype weights are allocated proportionally over the field."""
+    field = field_for(make_info(total_players=10, archetype_distribution={"TAG": 3, "Maniac": 1, "GTO": 1}))
+    assert len(field) == 10
+    assert field.count(ArchetypeEnum.TAG) == 6
+    assert field.count(ArchetypeEnum.MANIAC) == 2
+    even = field_for(make_info(total_players=24))
+    assert all(even.count(archetype) == 2 for archetype in ArchetypeEnum)
+
+
+def test_tournament_ranks_every_entrant(service):
+    """A tournament produces each finishing position exactly once and repeats with a seed."""
+    simulator = TournamentSimulator(make_info(), workers=0, blind_structure=blind_structure_for(make_info(), service))
+    report = play_tournament(simulator.spec, seed=5)
+    places = sorted(place for stats in report.archetypes.values()
+                    for place, count in stats.finishes.items() for _ in range(count))
+    assert places == list(range(1, 21))
+    assert sum(stats.wins for stats in report.archetypes.values()) == 1
+    assert play_tournament(simulator.spec, seed=5).to_dict() == report.to_dict()
+
+
+def test_simulator_aggregates(service):
+    """Reports merge across tournaments and worker processes."""
+    levels = blind_structure_for(make_info(), service)
+    serial = TournamentSimulator(make_info(), workers=0, blind_structure=levels).run(6, seed=1)
+    pooled = TournamentSimulator(make_info(), workers=2, blind_structure=levels).run(6, seed=1)
+    assert serial.tournaments == pooled.tournaments == 6
+    assert serial.hands == pooled.hands
+    assert sum(stats.entries for stats in serial.archetypes.values()) == 120
+    for name, stats in serial.archetypes.items():
+        assert stats.finishes == pooled.archetypes[name].finishes
+        assert stats.to_dict()["chip_ev_bb_per_100"] == pytest.approx(
+            pooled.archetypes[name].to_dict()["chip_ev_bb_per_100"])
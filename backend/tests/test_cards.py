@@ -1,8 +1,13 @@
 """
 Tests for the card representation and deck management.
 """
+import copy
+import pickle
+
 import pytest
-from app.core.cards import Card, Suit, Rank, Deck, Hand
+from app.core.cards import (
+    Card, Suit, Rank, Deck, Hand, FULL_DECK, NUM_CARDS, parse_cards, rank_index, suit_index
+)
 
 
 def test_card_creation():
@@ -137,4 +142,74 @@ def test_hand_string_representation():
     ]
     hand = Hand(cards)
     
-    assert str(hand) == "KH AH"  # Should be sorted by rank
\ No newline at end of file
+    assert str(hand) == "KH AH"  # Should be sorted by rank
+
+def test_cards_are_interned():
+    """Test that constructing the same card twice returns one shared instance."""
+    card1 = Card(Rank.ACE, Suit.HEARTS)
+    card2 = Card(Rank.ACE, Suit.HEARTS)
+    
+    assert card1 is card2
+    assert hash(card1) == card1.id
+
+
+def test_card_ids():
+    """Test the integer encoding of cards."""
+    assert Card(Rank.TWO, Suit.CLUBS).id == 0
+    assert Card(Rank.ACE, Suit.SPADES).id == NUM_CARDS - 1
+    
+    ids = {Card(rank, suit).id for rank in Rank for suit in Suit}
+    assert ids == set(range(NUM_CARDS))
+    
+    card = Card(Rank.QUEEN, Suit.DIAMONDS)
+    assert rank_index(card.id) == Rank.QUEEN.value - 2
+    assert suit_index(card.id) == Suit.DIAMONDS.value - 1
+    assert Card.from_id(card.id) is card
+
+
+def test_card_is_immutable():
+    """Test that shared card instances cannot be modified."""
+    card = Card(Rank.ACE, Suit.HEARTS)
+    
+    with pytest.raises(AttributeError):
+        card.rank = Rank.KING
+
+
+def test_card_pickle_and_copy_preserve_identity():
+    """Test that pickling and copying return the interned instance."""
+    card = Card(Rank.TEN, Suit.CLUBS)
+    
+    assert pickle.loads(pickle.dumps(card)) is card
+    assert copy.deepcopy(card) is card
+
+
+def test_deck_reset_reuses_card_instances():
+    """Test that resetting a deck does not create new card objects."""
+    deck = Deck()
+    first_cards = list(deck.cards)
+    deck.shuffle()
+    deck.draw()
+    deck.reset()
+    
+    assert deck.cards == first_cards
+    assert all(a is b for a, b in zip(deck.cards, first_cards))
+
+
+def test_card_from_str():
+    """Cards parse from short notation in either case, with T or 10 for tens."""
+    assert Card.from_str("AH") is Card(Rank.ACE, Suit.HEARTS)
+    assert Card.from_str("as") is Card(Rank.ACE, Suit.SPADES)
+    assert Card.from_str("Td") is Card.from_str("10D")
+    for card in FULL_DECK:
+        assert Card.from_str(str(card)) is card
+    with pytest.raises(ValueError):
+        Card.from_str("1S")
+
+
+def test_parse_cards():
+    """Runs of cards parse with or without separators."""
+    assert parse_cards("AsKd") == [Card.from_str("AS"), Card.from_str("KD")]
+    assert parse_cards("10h 9h, 8h") == [Card.from_str("10H"), Card.from_str("9H"), Card.from_str("8H")]
+    assert parse_cards("") == []
+    with pytest.raises(ValueError):
+        parse_cards("AsXd")
@@ -0,0 +1,160 @@
+"""
+Tests for the Monte Carlo equity engine.
+"""
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from app.core.cards import parse_cards
+from app.core.equity import EquityCalculator
+
+
+@pytest.fixture
+def calculator():
+    """In-process sampling calculator with a sample cap so results are reproducible."""
+    return EquityCalculator(workers=0, time_budget=10.0, max_samples=40000, use_preflop_table=False)
+
+
+def test_aces_against_random_hand(calculator):
+    """Pocket aces win about 85% heads-up against a random hand."""
+    result = calculator.calculate(parse_cards("AsAd"), seed=1)
+    assert result.samples == 40000
+    assert 0.83 < result.equity < 0.87
+    assert result.confidence_low < result.equity < result.confidence_high
+
+
+def test_equity_drops_with_more_opponents(calculator):
+    """Equity falls as more random opponents join the hand."""
+    heads_up = calculator.calculate(parse_cards("AsAd"), seed=2)
+    four_way = calculator.calculate(parse_cards("AsAd"), opponents=4, seed=2)
+    assert four_way.equity < heads_up.equity
+    assert 0.52 < four_way.equity < 0.60
+
+
+def test_explicit_opponent_range(calculator):
+    """AKs is a small underdog against queens."""
+    queens = [tuple(parse_cards("QhQd"))]
+    result = calculator.calculate(parse_cards("AsKs"), opponent_ranges=[queens], seed=3)
+    assert 0.43 < result.equity < 0.49
+
+
+def test_complete_board_is_exact(calculator):
+    """With the board out and a known opponent the result is enumerated."""
+    result = calculator.calculate(
+        parse_cards("AhKh"),
+        parse_cards("QhJhTh2c3d"),
+        opponent_ranges=[[tuple(parse_cards("AsAc"))]],
+        seed=4,
+    )
+    assert result.exact
+    assert result.samples == 1
+    assert result.win == 1.0
+    assert result.equity == result.confidence_low == result.confidence_high == 1.0
+
+
+def test_split_pot_counts_as_tie(calculator):
+    """A royal flush on board splits the pot every time."""
+    result = calculator.calculate(parse_cards("2c7d"), parse_cards("AhKhQhJhTh"), seed=5)
+    assert result.tie == 1.0
+    assert result.equity == 0.5
+
+
+def test_small_spots_are_enumerated(calculator):
+    """Turn spots against one random hand are enumerated and agree with sampling."""
+    exact = calculator.calculate(parse_cards("AsKd"), parse_cards("QhJh2c3d"))
+    assert exact.exact
+    assert exact.samples == 46 * 990  # rivers times opponent holdings
+
+    sampler = EquityCalculator(workers=0, time_budget=10.0, max_samples=40000, exact_limit=0)
+    sampled = sampler.calculate(parse_cards("AsKd"), parse_cards("QhJh2c3d"), seed=9)
+    assert not sampled.exact
+    assert abs(sampled.equity - exact.equity) < 0.01
+
+
+def test_enumeration_with_ranges(calculator):
+    """Ranged opponents are enumerated over every live combo."""
+    result = calculator.calculate(
+        parse_cards("9s8s"),
+        parse_cards("7s6d2c"),
+        opponent_ranges=[[tuple(parse_cards("AhAd")), tuple(parse_cards("KcKh"))]],
+    )
+    assert result.exact
+    assert result.samples == 2 * 990
+    assert 0.35 < result.equity < 0.39
+
+
+def test_exact_results_are_cached_by_suit_isomorphism(calculator):
+    """Spots that differ only by suit labels, hero order or board order share a cache entry."""
+    first = calculator.calculate(parse_cards("AsKd"), parse_cards("QhJh2c3d"))
+    relabelled = calculator.calculate(parse_cards("KcAh"), parse_cards("3cQdJd2s"))
+    assert relabelled is first
+    different = calculator.calculate(parse_cards("AsKs"), parse_cards("QhJh2c3d"))
+    assert different is not first
+
+
+
+def test_cache_is_shared_across_threads():
+    """Concurrent exact calculations keep the LRU cache consistent and bounded."""
+    calculator = EquityCalculator(workers=0, cache_size=4, use_preflop_table=False)
+    hands = ["AsKd", "QcQd", "7h6h", "2c2d", "JsTs", "9c8d"]
+    spots = [(hand, "Ah9d5c3s") for hand in hands] * 20
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda spot: calculator.calculate(*map(parse_cards, spot)), spots))
+    for result, (hand, board) in zip(results, spots):
+        assert result == calculator.calculate(parse_cards(hand), parse_cards(board))
+    assert len(calculator._cache) == 4
+
+def test_seed_is_reproducible(calculator):
+    """The same seed gives the same estimate."""
+    first = calculator.calculate(parse_cards("9s8s"), parse_cards("7s6d2c"), opponents=2, seed=6)
+    second = calculator.calculate(parse_cards("9s8s"), parse_cards("7s6d2c"), opponents=2, seed=6)
+    assert first == second
+
+
+def test_time_budget_limits_sampling():
+    """A tiny time budget stops after the first batch."""
+    calculator = EquityCalculator(workers=0, time_budget=0.0, max_samples=10 ** 7, use_preflop_table=False)
+    result = calculator.calculate(parse_cards("AsAd"))
+    assert 0 < result.samples < 10 ** 7
+
+
+def test_invalid_spots_raise(calculator):
+    """Duplicate cards, bad hero hands and dead ranges are rejected."""
+    with pytest.raises(ValueError):
+        calculator.calculate(parse_cards("AsAs"))
+    with pytest.raises(ValueError):
+        calculator.calculate(parse_cards("As"))
+    with pytest.raises(ValueError):
+        calculator.calculate(parse_cards("AsKs"), opponent_ranges=[[tuple(parse_cards("AsQd"))]])
+    with pytest.raises(ValueError):
+        calculator.calculate(parse_cards("AsKs"), opponents=0)
+
+
+def test_calculate_async(calculator):
+    """calculate_async returns the same result as calculate."""
+    expected = calculator.calculate(parse_cards("JcJd"), seed=7)
+    assert asyncio.run(calculator.calculate_async(parse_cards("JcJd"), seed=7)) == expected
+
+
+def test_process_pool_matches_in_process_estimate():
+    """Splitting the work across worker processes gives a consistent estimate."""
+    calculator = EquityCalculator(workers=2, time_budget=10.0, max_samples=20000, use_preflop_table=False)
+    try:
+        result = calculator.calculate(parse_cards("AsAd"), seed=8)
+    finally:
+        calculator.shutdown()
+    assert result.samples == 20000
+    assert 0.83 < result.equity < 0.87
+
+
+def test_shutdown_cancels_pending_samples():
+    """Shutdown cancels queued sampling itself, as cancel_futures needs Python 3.9."""
+    calculator = EquityCalculator(workers=1)
+    pool = calculator._pool = MagicMock()
+    pending = Future()
+    calculator._pending.add(pending)
+    calculator.shutdown()
+    assert pending.cancelled()
+    pool.shutdown.assert_called_once_with(wait=False)
+    assert calculator._pool is None
@@ -1,9 +1,13 @@
 """
 Tests for the poker hand evaluator.
 """
+import random
+from itertools import combinations
+
+import numpy as np
 import pytest
-from app.core.cards import Card, Suit, Rank, Hand
-from app.core.hand_evaluator import HandEvaluator, HandRank
+from app.core.cards import Card, Suit, Rank, Hand, FULL_DECK
+from app.core.hand_evaluator import HandEvaluator, HandRank, pack_strength
 
 
 def test_high_card():
@@ -199,4 +203,152 @@ def test_low_ace_straight():
     rank, kickers = HandEvaluator.evaluate(cards)
     
     assert rank == HandRank.STRAIGHT
-    assert kickers[0] == 5  # Five high straight
\ No newline at end of file
+    assert kickers[0] == 5  # Five high straight
+
+def test_strength_orders_hands():
+    """Test that a better hand always has a larger strength."""
+    straight = HandEvaluator.strength({
+        Card(Rank.TEN, Suit.HEARTS),
+        Card(Rank.NINE, Suit.DIAMONDS),
+        Card(Rank.EIGHT, Suit.SPADES),
+        Card(Rank.SEVEN, Suit.CLUBS),
+        Card(Rank.SIX, Suit.HEARTS)
+    })
+    wheel = HandEvaluator.strength({
+        Card(Rank.ACE, Suit.HEARTS),
+        Card(Rank.TWO, Suit.DIAMONDS),
+        Card(Rank.THREE, Suit.CLUBS),
+        Card(Rank.FOUR, Suit.SPADES),
+        Card(Rank.FIVE, Suit.HEARTS)
+    })
+    trips = HandEvaluator.strength({
+        Card(Rank.ACE, Suit.HEARTS),
+        Card(Rank.ACE, Suit.DIAMONDS),
+        Card(Rank.ACE, Suit.SPADES),
+        Card(Rank.KING, Suit.CLUBS),
+        Card(Rank.NINE, Suit.HEARTS)
+    })
+    
+    assert straight > wheel > trips
+
+
+def test_strength_ties_ignore_suits():
+    """Test that identical ranks in different suits tie."""
+    hand1 = HandEvaluator.strength({
+        Card(Rank.ACE, Suit.HEARTS),
+        Card(Rank.KING, Suit.DIAMONDS),
+        Card(Rank.QUEEN, Suit.SPADES),
+        Card(Rank.NINE, Suit.CLUBS),
+        Card(Rank.SEVEN, Suit.HEARTS)
+    })
+    hand2 = HandEvaluator.strength({
+        Card(Rank.ACE, Suit.CLUBS),
+        Card(Rank.KING, Suit.HEARTS),
+        Card(Rank.QUEEN, Suit.DIAMONDS),
+        Card(Rank.NINE, Suit.SPADES),
+        Card(Rank.SEVEN, Suit.CLUBS)
+    })
+    
+    assert hand1 == hand2
+
+
+def test_two_trips_make_full_house():
+    """Test that two sets of trips in seven cards are a full house."""
+    cards = {
+        Card(Rank.ACE, Suit.HEARTS),
+        Card(Rank.ACE, Suit.DIAMONDS),
+        Card(Rank.ACE, Suit.CLUBS),
+        Card(Rank.TWO, Suit.CLUBS),
+        Card(Rank.TWO, Suit.SPADES),
+        Card(Rank.TWO, Suit.DIAMONDS),
+        Card(Rank.FOUR, Suit.DIAMONDS)
+    }
+    
+    rank, kickers = HandEvaluator.evaluate(cards)
+    
+    assert rank == HandRank.FULL_HOUSE
+    assert kickers == [14, 2]
+
+
+def test_three_pairs_use_best_kicker():
+    """Test that the third pair can play as the two-pair kicker."""
+    cards = {
+        Card(Rank.ACE, Suit.HEARTS),
+        Card(Rank.ACE, Suit.CLUBS),
+        Card(Rank.KING, Suit.CLUBS),
+        Card(Rank.KING, Suit.SPADES),
+        Card(Rank.SIX, Suit.CLUBS),
+        Card(Rank.SIX, Suit.SPADES),
+        Card(Rank.TWO, Suit.SPADES)
+    }
+    
+    rank, kickers = HandEvaluator.evaluate(cards)
+    
+    assert rank == HandRank.TWO_PAIR
+    assert kickers == [14, 13, 6]
+
+
+def test_describe_round_trips_packed_strength():
+    """Test that describe() unpacks what pack_strength() stores."""
+    strength = pack_strength(HandRank.PAIR, [9, 14, 12, 3])
+    
+    assert HandEvaluator.describe(strength) == (HandRank.PAIR, [9, 14, 12, 3])
+
+
+def test_seven_card_strength_matches_best_five():
+    """Test seven-card lookups against the best of all 21 five-card subsets."""
+    rng = random.Random(7)
+    for _ in range(500):
+        cards = rng.sample(FULL_DECK, 7)
+        best = max(HandEvaluator.strength(combo) for combo in combinations(cards, 5))
+        assert HandEvaluator.strength(cards) == best
+
+
+def test_strength_of_ids_rejects_wrong_card_count():
+    """Test that only 5-7 cards can be scored."""
+    with pytest.raises(ValueError):
+        HandEvaluator.strength_of_ids([0, 1, 2, 3])
+    with pytest.raises(ValueError):
+        HandEvaluator.strength_of_ids(list(range(8)))
+
+
+def test_evaluate_batch_matches_single_hand_strength():
+    """Test the vectorized evaluator against the scalar lookup."""
+    rng = np.random.default_rng(11)
+    hands = np.argsort(rng.random((2000, 52)), axis=1)[:, :7].astype(np.uint8)
+    
+    strengths = HandEvaluator.evaluate_batch(hands)
+    
+    assert strengths.shape == (2000,)
+    for row, strength in zip(hands.tolist(), strengths.tolist()):
+        assert strength == HandEvaluator.strength_of_ids(row)
+
+
+def test_evaluate_batch_accepts_five_and_six_cards():
+    """Test batch evaluation of hands shorter than seven cards."""
+    royal = [Card(rank, Suit.SPADES).id for rank in (Rank.ACE, Rank.KING, Rank.QUEEN, Rank.JACK, Rank.TEN)]
+    hands = np.array([royal, royal[:4] + [Card(Rank.TWO, Suit.CLUBS).id]])
+    
+    strengths = HandEvaluator.evaluate_batch(hands)
+    
+    assert HandEvaluator.describe(int(strengths[0]))[0] == HandRank.ROYAL_FLUSH
+    assert HandEvaluator.describe(int(strengths[1]))[0] == HandRank.HIGH_CARD
+    assert HandEvaluator.evaluate_batch(np.array([royal + [0]])).tolist() == [strengths[0]]
+
+
+def test_evaluate_batch_rejects_bad_shapes():
+    """Test that batch input must be a 2-D array of 5-7 card ids."""
+    with pytest.raises(ValueError):
+        HandEvaluator.evaluate_batch(np.zeros((3, 4), dtype=np.int64))
+    with pytest.raises(ValueError):
+        HandEvaluator.evaluate_batch(np.zeros(7, dtype=np.int64))
+
+
+def test_best_five_makes_the_hand_strength():
+    """Test that best_five picks five of the cards with the full hand's strength."""
+    rng = random.Random(13)
+    for _ in range(300):
+        card_ids = rng.sample(range(52), 7)
+        five = HandEvaluator.best_five(card_ids)
+        assert len(five) == 5 and set(five) <= set(card_ids)
+        assert HandEvaluator.strength_of_ids(five) == HandEvaluator.strength_of_ids(card_ids)
@@ -278,11 +278,16 @@ class TestHandHistory(unittest.TestCase):
         run_action(game, player3, PlayerAction.ALL_IN, 100)
         run_action(game, player1, PlayerAction.CALL, 80)
         
-        # All players have acted, so betting round should end and we should get to showdown
-        # (since player3 is all-in and there's no more betting to do)
+        # Player3 is all-in, but the two players with chips left play on
+        self.assertEqual(game.current_round.name, "FLOP")
         
-        # Verify the round advanced to showdown
+        # Player2 moves all-in on the flop and player1 calls it off
+        run_action(game, player2, PlayerAction.ALL_IN)
+        run_action(game, player1, PlayerAction.CALL)
+        
+        # Nobody can bet any more, so the board runs out to showdown
         self.assertEqual(game.current_round.name, "SHOWDOWN")
+        self.assertEqual(len(game.community_cards), 5)
         
         # Get hand history after hand is complete
         hand_history = self.hand_history_repo.get(hand_id)
@@ -303,7 +308,8 @@ class TestHandHistory(unittest.TestCase):
         self.assertGreaterEqual(len(hand_history.pot_results), 2)
         
         # Verify total pot matches expected contributions
-        expected_pot = (3 * 5) + 10 + 20 + 40 + 100 + 80  # ante + SB + BB + initial raise + all-in + call
+        expected_pot = sum(player.total_bet for player in game.players)  # every chip at the table
+        self.assertEqual(expected_pot, 2100)
         total_pot = sum(pot.amount for pot in hand_history.pot_results)
         self.assertEqual(total_pot, expected_pot)
         
@@ -0,0 +1,193 @@
+"""
+Tests for the headless simulation engine.
+"""
+import asyncio
+import copy
+import random
+
+import pytest
+from app.core.cards import Card
+from app.core.headless import HeadlessGame, make_random_policy
+from app.core.poker_game import BettingRound, PlayerAction, PlayerStatus, PokerGame
+
+
+def ids(text):
+    """Card ids from a string such as 'AsKd'."""
+    return tuple(Card.from_str(text[i:i + 2]).id for i in range(0, len(text), 2))
+
+
+def test_chips_are_conserved():
+    """Random play never creates or destroys chips."""
+    game = HeadlessGame([1000] * 6, 5, 10, ante=1, seed=1)
+    policy = make_random_policy(1, aggression=0.4)
+    for _ in range(2000):
+        if sum(chips > 0 for chips in game.chips) < 2:
+            break
+        deltas = game.play_hand(policy)
+        assert sum(deltas) == 0
+        assert sum(game.chips) == 6000
+        assert all(chips >= 0 for chips in game.chips)
+
+
+def test_seeded_games_repeat():
+    """The same seeds replay the same hands."""
+    results = []
+    for _ in range(2):
+        game = HeadlessGame([500] * 4, 5, 10, seed=7)
+        policy = make_random_policy(7)
+        results.append([game.play_hand(policy) for _ in range(50)])
+    assert results[0] == results[1]
+
+
+def test_preflop_order_three_handed():
+    """Button moves each hand; blinds follow it and the button acts first three-handed."""
+    game = HeadlessGame([1000] * 3, 5, 10, button=0, seed=2)
+    game.start_hand()
+    assert game.button == 0
+    assert game.current_bets == [0, 5, 10]
+    assert game.current_seat == 0
+    game.act(PlayerAction.CALL)
+    game.act(PlayerAction.CALL)
+    assert game.current_seat == 2  # BB option
+    game.act(PlayerAction.CHECK)
+    assert game.current_round == BettingRound.FLOP
+    assert len(game.board) == 3
+    assert game.current_seat == 1  # first active seat after the button
+
+
+def test_heads_up_blinds():
+    """Heads-up the button posts the small blind, acts first preflop and last after."""
+    game = HeadlessGame([1000, 1000], 5, 10, button=1, seed=3)
+    game.start_hand()
+    assert game.current_bets == [10, 5]
+    assert game.current_seat == 1
+    game.act(PlayerAction.CALL)
+    game.act(PlayerAction.CHECK)
+    assert game.current_round == BettingRound.FLOP
+    assert game.current_seat == 0
+
+
+def test_fold_awards_pot():
+    """The last player standing wins everything without a showdown."""
+    game = HeadlessGame([1000] * 3, 5, 10, seed=4)
+    game.start_hand()
+    game.act(PlayerAction.RAISE, 30)
+    game.act(PlayerAction.FOLD)
+    assert game.act(PlayerAction.FOLD)
+    assert game.chips == [1015, 995, 990]
+    assert game.winnings[0] == 45
+
+
+def test_illegal_actions_raise():
+    """Checking into a bet or under-raising is rejected."""
+    game = HeadlessGame([1000] * 3, 5, 10, seed=5)
+    game.start_hand()
+    with pytest.raises(ValueError):
+        game.act(PlayerAction.CHECK)
+    with pytest.raises(ValueError):
+        game.act(PlayerAction.RAISE, 15)
+    with pytest.raises(ValueError):
+        game.act(PlayerAction.BET, 20)
+    assert (PlayerAction.RAISE, 20, 1000) in game.legal_actions()
+
+
+def test_side_pots():
+    """A short all-in only wins the main pot; the side pot goes to the best covering hand."""
+    game = HeadlessGame([100, 1000, 1000], 5, 10, button=0, seed=6)
+    game.start_hand()
+    game.hole_cards = [ids("AsAd"), ids("KsKd"), ids("QsQd")]
+    game._runout = list(ids("2c3h7d8cJh"))
+    game.act(PlayerAction.ALL_IN)
+    game.act(PlayerAction.RAISE, 300)
+    game.act(PlayerAction.CALL)
+    while not game.hand_over:
+        game.act(PlayerAction.CHECK)
+    assert game.status[0] == PlayerStatus.ALL_IN
+    assert game.winnings == [300, 400, 0]
+    assert game.chips == [300, 1100, 700]
+
+
+def test_split_pot_odd_chip():
+    """Tied hands split the pot, the odd chip going to the seat nearest the button."""
+    game = HeadlessGame([1000] * 3, 5, 10, ante=1, button=0, seed=8)
+    game.start_hand()
+    game.hole_cards = [ids("2c3d"), ids("4c5d"), ids("4h5s")]
+    game._runout = list(ids("AsKsQsJsTs"))
+    game.act(PlayerAction.FOLD)
+    game.act(PlayerAction.CALL)
+    game.act(PlayerAction.CHECK)
+    while not game.hand_over:
+        game.act(PlayerAction.CHECK)
+    assert game.winnings == [0, 12, 11]
+
+
+def headless_state(game):
+    return (game.chips, game.status, game.current_bets, game.committed, game.winnings, game.board,
+            game.current_round, game.current_bet, game.min_raise, game.to_act, game.current_seat,
+            game.hand_over)
+
+
+def test_apply_and_undo_walk_the_tree():
+    """Undoing every applied action returns the table to the node it started from."""
+    rng = random.Random(3)
+    game = HeadlessGame([800] * 5, 5, 10, ante=1, seed=3)
+    for _ in range(30):
+        game.start_hand()
+        root = copy.deepcopy(headless_state(game))
+        depth = 0
+        for _ in range(40):
+            if game.hand_over:
+                game.undo()
+                depth -= 1
+                continue
+            if depth and rng.random() < 0.3:
+                game.undo()
+                depth -= 1
+                continue
+            action, low, _ = rng.choice(game.legal_actions())
+            game.apply(action, low or None)
+            depth += 1
+        for _ in range(depth):
+            game.undo()
+        assert headless_state(game) == root
+        with pytest.raises(ValueError):
+            game.undo()
+        while not game.hand_over:
+            game.act(PlayerAction.CALL)
+
+
+def test_fork_is_independent():
+    """Playing a fork to the end leaves the original untouched."""
+    game = HeadlessGame([1000] * 4, 5, 10, seed=4)
+    game.start_hand()
+    before = copy.deepcopy(headless_state(game))
+    clone = game.fork()
+    while not clone.hand_over:
+        clone.act(PlayerAction.ALL_IN if clone.chips[clone.current_seat] else PlayerAction.CHECK)
+    assert headless_state(game) == before
+    assert sum(clone.chips) == 4000
+
+
+def test_fork_of_live_game_plays_like_it():
+    """A PokerGame fork reaches the same results as the live table."""
+    rng = random.Random(9)
+    for hand in range(15):
+        game = PokerGame(small_blind=5, big_blind=10)
+        for i in range(4):
+            game.add_player(f"p{i}", f"Player {i}", rng.randint(500, 1500))
+        game.start_hand()
+        table = game.fork()
+        assert table.current_seat == game.current_player_idx
+        while not table.hand_over:
+            player = game.players[game.current_player_idx]
+            assert table.current_seat == game.current_player_idx
+            action = rng.choice([PlayerAction.FOLD, PlayerAction.CALL, PlayerAction.CALL, PlayerAction.CHECK])
+            if action is PlayerAction.CHECK and table.to_call(table.current_seat):
+                action = PlayerAction.CALL
+            if action is PlayerAction.FOLD and not table.to_call(table.current_seat):
+                action = PlayerAction.CHECK
+            table.act(action)
+            asyncio.run(game.process_action(player, action))
+            if not table.hand_over:
+                assert [p.chips for p in game.players] == table.chips
+        assert [p.chips for p in game.players] == table.chips
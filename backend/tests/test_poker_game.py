@@ -22,6 +22,16 @@ def run_action(game: PokerGame, player: Player, action: PlayerAction, amount=Non
     return asyncio.run(game.process_action(player, action, amount))
 
 
+def play_street(game: PokerGame, betting_round: BettingRound, bet: int):
+    """Have the first player to act bet and everyone else call until the street ends."""
+    while game.current_round == betting_round:
+        player = game.players[game.current_player_idx]
+        if game.current_bet == 0:
+            run_action(game, player, PlayerAction.BET, bet)
+        else:
+            run_action(game, player, PlayerAction.CALL)
+
+
 def setup_test_game(num_players=4, starting_chips=1000):
     """Set up a test game with a specific number of players."""
     game = PokerGame(small_blind=10, big_blind=20)
@@ -155,8 +165,11 @@ def test_all_in_from_ante():
     assert game.players[3].chips == 0
     assert game.players[3].status == PlayerStatus.ALL_IN
 
-    # Check the pot amount: SB(10) + BB(20) + (3*15) + 10 = 85
-    assert game.pots[0].amount == 85
+    # Check the pot amount: SB(10) + BB(20) + (3*15) + 10 = 85, of which
+    # UTG can only win the 4 * 10 they matched
+    assert sum(pot.amount for pot in game.pots) == 85
+    assert game.pots[0].amount == 40
+    assert "p3" not in game.pots[1].eligible_players
 
     # Check other players still have expected chips
     assert game.players[0].chips == 985  # Button paid 15 ante
@@ -184,8 +197,9 @@ def test_multiple_all_ins_from_ante():
     assert game.players[3].chips == 0
     assert game.players[3].status == PlayerStatus.ALL_IN
 
-    # Check the pot amount: SB(10) + BB(18) + Button ante(25) + SB ante(5) + BB ante(0) + UTG ante(12) = 70
-    assert game.pots[0].amount == 70
+    # Check the pot amount: SB(10) + BB(18) + Button ante(25) + SB ante(5) + BB ante(0) + UTG ante(12) = 70,
+    # already split at each all-in: 4 * 12 + 3 * 3 + 2 * 3 + 7
+    assert [pot.amount for pot in game.pots] == [48, 9, 6, 7]
 
     # Verify button player's chips
     assert game.players[0].chips == 975  # Button paid full 25 ante
@@ -529,13 +543,21 @@ def test_all_in_and_side_pots():
     player0 = game.players[0]
     run_action(game, player0, PlayerAction.CALL)  # Player 0 calls
 
+    # Everyone matched player1's all-in exactly, so there is only a main pot
+    # of 800 (200 * 4 players) so far
+    assert game.current_round == BettingRound.FLOP
+    assert len(game.pots) == 1
+    assert game.pots[0].amount == 800
+
+    # The other three bet 100 each on the flop, which goes to a side pot
+    play_street(game, BettingRound.FLOP, 100)
+
     # Verify side pot creation
     assert len(game.pots) == 2
-
-    # Main pot should have 800 (200 * 4 players)
-    # Side pot should have 100 ((100-20)*3 players, since player1 is all-in for 200)
     main_pot = game.pots[0]
     side_pot = game.pots[1]
+    assert main_pot.amount == 800
+    assert side_pot.amount == 300
 
     # Check eligibility - only players who contributed extra are eligible for side pot
     assert len(main_pot.eligible_players) == 4  # All players eligible for main pot
@@ -705,8 +727,14 @@ def test_partial_raise_with_insufficient_chips():
     # Verify min raise was not reset (since all-in wasn't a full raise)
     assert game.min_raise == 20
 
-    # Check pot amounts and side pots
+    # Everyone called the all-in exactly: a 180 main pot (45 * 4 players)
+    assert len(game.pots) == 1
+    assert game.pots[0].amount == 180
+
+    # Flop betting between the other three goes to a side pot
+    play_street(game, BettingRound.FLOP, 20)
     assert len(game.pots) == 2
+    assert game.pots[1].amount == 60
 
     # Check that p3 is eligible for the main pot but not the side pot
     assert p3.player_id in game.pots[0].eligible_players
@@ -880,6 +908,42 @@ def test_kicker_plays_with_paired_board():
     assert game.hand_winners.get("pot_0") == [p1]
 
 
+def test_showdown_evaluates_each_hand_once(monkeypatch):
+    """Showdown results are computed once and reused by later readers."""
+    game = PokerGame(small_blind=10, big_blind=20)
+    p0 = game.add_player("p0", "Player 0", 1000)
+    p1 = game.add_player("p1", "Player 1", 1000)
+    p0.hand.cards = {Card(Rank.ACE, Suit.HEARTS), Card(Rank.NINE, Suit.DIAMONDS)}
+    p1.hand.cards = {Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.CLUBS)}
+    game.community_cards = [
+        Card(Rank.TEN, Suit.CLUBS),
+        Card(Rank.TEN, Suit.HEARTS),
+        Card(Rank.SEVEN, Suit.SPADES),
+        Card(Rank.TWO, Suit.HEARTS),
+        Card(Rank.THREE, Suit.DIAMONDS),
+    ]
+    game.current_round = BettingRound.RIVER
+    for player in game.players:
+        player.total_bet = 100
+        player.chips -= 100
+        game.pots[0].eligible_players.add(player.player_id)
+    game.pots[0].amount = 200
+
+    game._handle_showdown()
+    results = game.showdown_results()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("hand evaluated again")
+    monkeypatch.setattr(game, "evaluate_hand_strengths", fail)
+    assert game.showdown_results() is results
+    assert results[p1].description == game._format_hand_description(results[p1].rank, results[p1].kickers)
+    assert set(results[p1].best_five) == {
+        Card(Rank.ACE, Suit.SPADES), Card(Rank.KING, Suit.CLUBS), Card(Rank.TEN, Suit.CLUBS),
+        Card(Rank.TEN, Suit.HEARTS), Card(Rank.SEVEN, Suit.SPADES),
+    }
+    assert game.hand_winners["pot_0"] == [p1]
+
+
 def test_full_board_plays_no_hole_cards():
     """Test when all five community cards make the best hand (no hole cards used)."""
     game = PokerGame(small_blind=10, big_blind=20)
@@ -1044,22 +1108,18 @@ async def test_round_bets_finalized_notification(monkeypatch):
 
     game.start_hand()
 
-    game.to_act = set()
-
     mock_notify = AsyncMock()
     monkeypatch.setattr(
         "app.core.websocket.game_notifier.notify_round_bets_finalized", mock_notify
     )
-    monkeypatch.setattr(
-        "app.core.websocket.game_notifier.wait_for_animation", AsyncMock()
-    )
-    monkeypatch.setattr(
-        "app.core.websocket.game_notifier.notify_action_request", AsyncMock()
-    )
+    for name in ("wait_for_animation", "notify_action_request", "notify_player_action",
+                 "notify_turn_highlight_removed", "notify_street_dealt"):
+        monkeypatch.setattr(f"app.core.websocket.game_notifier.{name}", AsyncMock())
 
-    await game._end_betting_round()
-
-    await asyncio.sleep(0.1)
+    # The small blind completes and the big blind checks to close preflop
+    assert await game.process_action(game.players[game.current_player_idx], PlayerAction.CALL)
+    mock_notify.assert_not_called()
+    assert await game.process_action(game.players[game.current_player_idx], PlayerAction.CHECK)
 
     mock_notify.assert_called_once()
     args = mock_notify.call_args[0]
@@ -1071,7 +1131,7 @@ async def test_round_bets_finalized_notification(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_new_round_notification(monkeypatch):
-    """Ensure notify_new_round is called when advancing rounds."""
+    """Ensure the new street is dealt to clients and its first player asked to act."""
     game = PokerGame(small_blind=5, big_blind=10, game_id="test_game")
 
     game.add_player("p1", "Player 1", 100)
@@ -1079,30 +1139,29 @@ async def test_new_round_notification(monkeypatch):
 
     game.start_hand()
 
-    game.to_act = set()
-
     mock_notify = AsyncMock()
+    mock_request = AsyncMock()
     monkeypatch.setattr(
-        "app.core.websocket.game_notifier.notify_new_round",
+        "app.core.websocket.game_notifier.notify_street_dealt",
         mock_notify,
     )
     monkeypatch.setattr(
-        "app.core.websocket.game_notifier.wait_for_animation", AsyncMock()
+        "app.core.websocket.game_notifier.notify_action_request", mock_request
     )
-    monkeypatch.setattr(
-        "app.core.websocket.game_notifier.notify_action_request", AsyncMock()
-    )
-
-    await game._end_betting_round()
+    for name in ("wait_for_animation", "notify_player_action",
+                 "notify_turn_highlight_removed", "notify_round_bets_finalized"):
+        monkeypatch.setattr(f"app.core.websocket.game_notifier.{name}", AsyncMock())
 
-    await asyncio.sleep(0.1)
+    assert await game.process_action(game.players[game.current_player_idx], PlayerAction.CALL)
+    assert await game.process_action(game.players[game.current_player_idx], PlayerAction.CHECK)
 
     mock_notify.assert_called_once()
     args = mock_notify.call_args[0]
     assert args[0] == "test_game"
     assert args[1] == "FLOP"
-    assert isinstance(args[2], list)
-    assert args[3] is False
+    assert args[2] == game.community_cards
+    assert len(args[2]) == 3
+    mock_request.assert_called_once_with("test_game", game)
 
 
 def test_partial_all_in_with_remaining_active_players():
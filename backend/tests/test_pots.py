@@ -0,0 +1,116 @@
+"""
+Tests for the incremental pot ledger.
+"""
+import random
+
+from app.core.pots import PotLedger
+
+
+def reference_pots(totals, all_in, folded):
+    """Pots built from scratch: one layer per distinct all-in total."""
+    caps = sorted({totals[pid] for pid in all_in}) + [max(totals.values())]
+    pots, floor = [], 0
+    for cap in caps:
+        if cap <= floor:
+            continue
+        amount = sum(min(total, cap) - floor for total in totals.values() if total > floor)
+        eligible = {pid for pid, total in totals.items() if total > floor and pid not in folded}
+        pots.append((amount, eligible))
+        floor = cap
+    return pots
+
+
+def current_pots(ledger):
+    """Non-empty pots as (amount, eligible) pairs."""
+    return [(pot.amount, pot.eligible_players) for pot in ledger.pots if pot.amount]
+
+
+def random_hand(rng, players, check=None):
+    """Play random contributions, all-ins and folds into a ledger, checking it after each action."""
+    ledger = PotLedger()
+    stacks = {pid: rng.randint(1, 400) for pid in players}
+    totals = {pid: 0 for pid in players}
+    all_in, folded = set(), set()
+    for _ in range(rng.randint(1, 40)):
+        pid = rng.choice(players)
+        if pid in all_in or pid in folded:
+            continue
+        roll = rng.random()
+        if roll < 0.1 and len(folded) < len(players) - 1:
+            folded.add(pid)
+            ledger.fold(pid)
+        else:
+            amount = min(stacks[pid], rng.choice([1, 5, 10, 25, 100, stacks[pid]]))
+            stacks[pid] -= amount
+            totals[pid] += amount
+            if stacks[pid] == 0:
+                all_in.add(pid)
+            ledger.add(pid, amount, all_in=stacks[pid] == 0)
+        assert ledger.total == sum(pot.amount for pot in ledger.layers) == sum(totals.values())
+        if check is not None:
+            check(ledger, {p: t for p, t in totals.items() if t > 0}, all_in, folded)
+    return ledger, {pid: t for pid, t in totals.items() if t > 0}, all_in, folded
+
+
+def test_matches_rebuild_after_every_action():
+    """After each bet, all-in or fold the pots equal a from-scratch layering of the totals."""
+    def check(ledger, totals, all_in, folded):
+        if totals:
+            expected = reference_pots(totals, all_in, folded)
+            assert current_pots(ledger) == [pot for pot in expected if pot[0]]
+
+    rng = random.Random(11)
+    for _ in range(3000):
+        players = [f"p{i}" for i in range(rng.randint(2, 9))]
+        random_hand(rng, players, check)
+
+
+def test_pot_invariants():
+    """Pots are named in order, nest their eligibility and only the top may be empty."""
+    rng = random.Random(12)
+    for _ in range(3000):
+        players = [f"p{i}" for i in range(rng.randint(2, 9))]
+        ledger, totals, all_in, folded = random_hand(rng, players)
+        pots = ledger.pots
+        assert pots[0].name == "Main Pot"
+        for index, pot in enumerate(pots[1:], start=1):
+            assert pot.name == f"Side Pot {index}"
+            assert pot.amount > 0
+            assert pot.eligible_players <= pots[index - 1].eligible_players
+            # An all-in player is never eligible above their own total
+            assert not pot.eligible_players & {pid for pid in all_in if totals[pid] <= ledger.caps[index - 1]}
+        assert not any(pot.eligible_players & folded for pot in pots)
+        assert sum(pot.amount for pot in pots) == sum(totals.values())
+
+
+def test_pots_are_split_at_the_all_in():
+    """An all-in splits the pot at once, mid-round, not when the round ends."""
+    ledger = PotLedger()
+    pots = ledger.pots
+    ledger.add("a", 100)
+    ledger.add("b", 40, all_in=True)
+    assert [(pot.amount, pot.eligible_players) for pot in pots] == [(80, {"a", "b"}), (60, {"a"})]
+    ledger.add("c", 100)
+    assert ledger.pots is pots
+    assert [(pot.name, pot.amount) for pot in pots] == [("Main Pot", 120), ("Side Pot 1", 120)]
+    assert pots[1].eligible_players == {"a", "c"}
+    # The side pot keeps growing on later streets
+    ledger.add("a", 50)
+    ledger.add("c", 50)
+    assert pots[1].amount == 220
+
+
+def test_from_contributions_and_dead_chips():
+    """Rebuilding from totals keeps folded chips in play and dead chips in the main pot."""
+    ledger = PotLedger.from_contributions([
+        ("a", 250, True, False),
+        ("b", 250, False, False),
+        ("c", 10, False, True),
+        ("d", 400, False, False),
+    ])
+    assert [pot.amount for pot in ledger.pots] == [760, 150]
+    assert ledger.pots[0].eligible_players == {"a", "b", "d"}
+    assert ledger.pots[1].eligible_players == {"d"}
+    ledger.add_dead(25)
+    assert ledger.pots[0].amount == 785
+    assert ledger.total == 935
@@ -0,0 +1,84 @@
+"""
+Tests for the precomputed preflop equity table.
+"""
+import numpy as np
+import pytest
+from app.core.cards import parse_cards
+from app.core.equity import EquityCalculator
+from app.core.preflop import (
+    COMBO_CLASSES, EQUITY, NUM_CLASSES, PreflopEquityTable, TABLE_SHAPE,
+    build_table, class_index, class_name, hand_class,
+)
+
+
+@pytest.fixture(scope="module")
+def small_table(tmp_path_factory):
+    """A quickly built low-precision table saved to disk."""
+    path = tmp_path_factory.mktemp("preflop") / "preflop_equity.npy"
+    np.save(path, build_table(boards=40, seed=1))
+    return PreflopEquityTable(str(path))
+
+
+def test_class_names_round_trip():
+    """Every class index maps to a name and back."""
+    assert [class_name(i) for i in (0, 1, 13, 168)] == ["AA", "AKs", "AKo", "22"]
+    assert all(class_index(class_name(i)) == i for i in range(NUM_CLASSES))
+    assert class_index("kao") == class_index("AKo")
+    for bad in ("AAs", "AK", "AKx", "1A"):
+        with pytest.raises(ValueError):
+            class_index(bad)
+
+
+def test_combo_counts_per_class():
+    """Pairs have 6 combos, suited hands 4 and offsuit hands 12."""
+    counts = np.bincount(COMBO_CLASSES, minlength=NUM_CLASSES)
+    assert counts[class_index("QQ")] == 6
+    assert counts[class_index("T9s")] == 4
+    assert counts[class_index("T9o")] == 12
+    assert hand_class(*parse_cards("KdAd")) == class_index("AKs")
+
+
+def test_built_table_is_memory_mapped_and_consistent(small_table):
+    """Heads-up entries are zero-sum and the file is mapped, not copied."""
+    table = small_table.table
+    assert isinstance(table, np.memmap)
+    assert table.shape == TABLE_SHAPE
+    heads_up = np.asarray(table[:, :NUM_CLASSES, EQUITY])
+    np.testing.assert_allclose(heads_up + heads_up.T, 1.0, atol=1e-5)
+    assert small_table.heads_up(class_index("AA"), class_index("72o"))[EQUITY] > 0.8
+    aces = [small_table.versus_random(class_index("AA"), n)[EQUITY] for n in (1, 3, 6)]
+    assert aces == sorted(aces, reverse=True)
+    with pytest.raises(ValueError):
+        small_table.versus_random(0, 10)
+
+
+def test_calculator_answers_preflop_from_table(small_table, monkeypatch):
+    """Preflop spots against random hands or a whole class use the table."""
+    monkeypatch.setattr(PreflopEquityTable, "get_instance", classmethod(lambda cls: small_table))
+    calculator = EquityCalculator(workers=0)
+
+    result = calculator.calculate(parse_cards("AsAd"), opponents=3)
+    assert result.equity == pytest.approx(float(small_table.versus_random(0, 3)[EQUITY]))
+
+    queens = [tuple(parse_cards(c)) for c in ("QhQd", "QhQc", "QhQs", "QdQc", "QdQs", "QcQs")]
+    result = calculator.calculate(parse_cards("AsKs"), opponent_ranges=[queens])
+    expected = small_table.heads_up(class_index("AKs"), class_index("QQ"))[EQUITY]
+    assert result.equity == pytest.approx(float(expected))
+
+    # A partial class is not in the table and is simulated instead
+    result = calculator.calculate(parse_cards("AsKs"), opponent_ranges=[queens[:2]], max_samples=2000)
+    assert result.samples == 2000
+
+
+def test_shipped_table_matches_known_equities():
+    """The table shipped with the app agrees with well-known matchups."""
+    table = PreflopEquityTable.get_instance()
+    if table is None:
+        pytest.skip("preflop equity table has not been built")
+    assert table.heads_up(class_index("AA"), class_index("KK"))[EQUITY] == pytest.approx(0.82, abs=0.01)
+    assert table.heads_up(class_index("AKs"), class_index("QQ"))[EQUITY] == pytest.approx(0.46, abs=0.01)
+    assert table.versus_random(class_index("AA"), 1)[EQUITY] == pytest.approx(0.852, abs=0.01)
+    assert table.versus_random(class_index("72o"), 1)[EQUITY] == pytest.approx(0.346, abs=0.01)
+    # Multiway columns are simulated, so card removal between opponents counts
+    assert table.versus_random(class_index("AA"), 4)[EQUITY] == pytest.approx(0.560, abs=0.005)
+    assert table.versus_random(class_index("AA"), 8)[EQUITY] == pytest.approx(0.346, abs=0.005)
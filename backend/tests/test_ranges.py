@@ -0,0 +1,73 @@
+"""
+Tests for hand range parsing and range algebra.
+"""
+import pytest
+from app.core.cards import parse_cards
+from app.core.equity import EquityCalculator
+from app.core.ranges import NUM_COMBOS, Range, parse_range
+
+
+def test_parse_counts():
+    """Shorthand tokens expand to the expected number of combos."""
+    assert len(parse_range("AA")) == 6
+    assert len(parse_range("AKs")) == 4
+    assert len(parse_range("AKo")) == 12
+    assert len(parse_range("AK")) == 16
+    assert len(parse_range("22+")) == 78
+    assert len(parse_range("A2s+")) == 48
+    assert len(parse_range("KTo+")) == 36
+    assert len(parse_range("22+, A2s+, KTo+")) == 162
+    assert len(parse_range("77-99")) == 18
+    assert len(parse_range("A2s-A5s")) == 16
+    assert len(parse_range("AsKs")) == 1
+
+
+def test_parse_is_order_insensitive():
+    """Class names may be written low rank first or in lower case."""
+    assert parse_range("KAs") == parse_range("AKs")
+    assert parse_range("ako") == parse_range("AKo")
+
+
+def test_weights():
+    """A ':w' suffix sets a partial weight; later tokens override earlier ones."""
+    hand_range = parse_range("QQ+:0.5, AA")
+    assert hand_range.combo_count() == pytest.approx(6 + 12 * 0.5)
+    assert len(hand_range) == 18
+
+
+def test_invalid_tokens():
+    """Malformed tokens and weights raise ValueError."""
+    for text in ("AAs", "XY", "A2s-K5s", "AA:1.5", "AsAs", "AKx"):
+        with pytest.raises(ValueError):
+            parse_range(text)
+
+
+def test_set_operations():
+    """Union, intersection and difference work combo by combo."""
+    pairs = parse_range("TT+")
+    broadways = parse_range("QQ+, AK")
+    assert len(pairs | broadways) == 30 + 16
+    assert len(pairs & broadways) == 18
+    assert len(pairs - broadways) == 12
+    assert len(Range.full()) == NUM_COMBOS
+
+
+def test_without_removes_blocked_combos():
+    """Known cards remove every combo that holds them."""
+    aces = parse_range("AA").without(parse_cards("As"))
+    assert len(aces) == 3
+    assert tuple(parse_cards("AhAd")) in aces
+    assert tuple(parse_cards("AsAd")) not in aces
+
+
+def test_class_weights_round_trip():
+    """Class weights rebuild the same range."""
+    hand_range = parse_range("22+, AKs:0.25")
+    assert Range.from_classes(hand_range.class_weights()) == hand_range
+
+
+def test_range_vs_range():
+    """Range-vs-range equity matches the known aces versus kings number."""
+    calculator = EquityCalculator(workers=0, time_budget=10.0, max_samples=40000, use_preflop_table=False)
+    result = calculator.range_vs_range(parse_range("AA"), [parse_range("KK")], seed=7)
+    assert 0.80 < result.equity < 0.84
@@ -0,0 +1,116 @@
+"""
+Tests for the seat ring and its use for turn order.
+"""
+import asyncio
+import copy
+import random
+
+from app.core.poker_game import PokerGame, PlayerAction, PlayerStatus
+from app.core.seats import next_bit, popcount
+
+
+def masks_from_scratch(game):
+    """Status and to-act masks recomputed from the players."""
+    status = {}
+    for seat, player in enumerate(game.players):
+        status[player.status] = status.get(player.status, 0) | (1 << seat)
+    to_act = sum(1 << seat for seat, p in enumerate(game.players) if p.player_id in game.to_act)
+    return status, to_act
+
+
+def test_next_bit_wraps():
+    """The search starts after the given bit and wraps to the lowest one."""
+    assert next_bit(0b10110, 1) == 2
+    assert next_bit(0b10110, 2) == 4
+    assert next_bit(0b10110, 4) == 1
+    assert next_bit(0b10110, -1) == 1
+    assert next_bit(0b00100, 2) == 2
+    assert next_bit(0, 3) == -1
+
+
+def test_popcount():
+    """Set bits are counted without relying on int.bit_count."""
+    assert popcount(0) == 0
+    assert popcount(0b10110) == 3
+    assert popcount((1 << 9) - 1) == 9
+
+
+def test_masks_follow_random_play():
+    """Masks stay equal to the statuses and to_act set through whole hands."""
+    rng = random.Random(5)
+    game = PokerGame(small_blind=5, big_blind=10)
+    for i in range(6):
+        game.add_player(f"p{i}", f"Player {i}", rng.randint(3000, 5000))
+    for _ in range(40):
+        game.start_hand()
+        for _ in range(200):
+            ring = game.seats
+            status, to_act = masks_from_scratch(game)
+            assert {k: v for k, v in ring.status_masks.items() if v} == status
+            assert ring.to_act == to_act
+            if game.current_round.name == "SHOWDOWN" or not game.to_act:
+                break
+            player = game.players[game.current_player_idx]
+            # Deep stacks and no shoves keep the hands out of the all-in runout
+            actions = [a for a in game.get_valid_actions(player) if a[0] != PlayerAction.ALL_IN]
+            action, low, high = rng.choice(actions)
+            amount = low if action in (PlayerAction.BET, PlayerAction.RAISE) else None
+            asyncio.run(game.process_action(player, action, amount))
+        game.move_button()
+
+
+def test_blinds_skip_busted_seat():
+    """A busted player between the button and the blinds is skipped."""
+    game = PokerGame(small_blind=10, big_blind=20)
+    for i in range(5):
+        game.add_player(f"p{i}", f"Player {i}", 1000)
+    game.players[1].chips = 0  # The seat after the button is out
+    game.start_hand()
+    assert game.players[1].status == PlayerStatus.OUT
+    assert game.players[2].is_small_blind
+    assert game.players[3].is_big_blind
+    assert game.current_player_idx == 4
+    assert game.players[1].player_id not in game.to_act
+
+
+def test_move_button_skips_out_players():
+    """The button moves to the next dealt-in seat and wraps around."""
+    game = PokerGame(small_blind=10, big_blind=20)
+    for i in range(4):
+        game.add_player(f"p{i}", f"Player {i}", 1000)
+    game.start_hand()
+    game.players[1].status = PlayerStatus.OUT
+    game.button_position = 0
+    game.move_button()
+    assert game.button_position == 2
+    game.button_position = 3
+    game.move_button()
+    assert game.button_position == 0
+
+
+def test_players_joining_and_leaving_reindex():
+    """Adding or removing players re-indexes the ring before it is used."""
+    game = PokerGame(small_blind=10, big_blind=20)
+    for i in range(3):
+        game.add_player(f"p{i}", f"Player {i}", 1000)
+    game.start_hand()
+    game.add_player_mid_game("p3", "Player 3", 1000)
+    game.remove_player("p1")
+    game.to_act = {p.player_id for p in game.players}
+    status, to_act = masks_from_scratch(game)
+    assert {k: v for k, v in game.seats.status_masks.items() if v} == status
+    assert game.seats.to_act == to_act
+
+
+def test_deepcopy_keeps_ring_in_sync():
+    """A deep-copied game gets its own ring, still driven by its to_act set."""
+    game = PokerGame(small_blind=10, big_blind=20)
+    for i in range(4):
+        game.add_player(f"p{i}", f"Player {i}", 1000)
+    game.start_hand()
+    clone = copy.deepcopy(game)
+    assert clone.seats is not game.seats
+    assert clone.seats.to_act == game.seats.to_act
+    clone.to_act.discard(clone.players[game.current_player_idx].player_id)
+    assert clone.seats.to_act == masks_from_scratch(clone)[1]
+    assert game.seats.to_act == masks_from_scratch(game)[1] != clone.seats.to_act
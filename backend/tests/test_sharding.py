@@ -0,0 +1,138 @@
+"""
+Tests for sharding tables across worker processes.
+"""
+import os
+import uuid
+
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+
+from app.core import config
+from app.sharding import (
+    ShardRouter, _merge_llm_metrics, game_id_from_path, game_id_from_request, new_game_id, shard_for,
+)
+
+# Served by the worker processes in the end-to-end tests
+shard_app = FastAPI()
+memory_enabled = False
+
+
+@shard_app.post("/game/create")
+async def create_game():
+    return {"game_id": new_game_id(), "shard": config.SHARD_INDEX}
+
+
+@shard_app.get("/history/game/{game_id}")
+async def game_owner(game_id: str):
+    return {"shard": config.SHARD_INDEX, "pid": os.getpid()}
+
+
+@shard_app.get("/game/metrics/tables")
+async def table_metrics():
+    return [{"shard": config.SHARD_INDEX, "memory": memory_enabled}]
+
+
+@shard_app.post("/ai/memory/enable")
+async def enable_memory():
+    global memory_enabled
+    memory_enabled = True
+    return {"status": "success"}
+
+
+@shard_app.websocket("/ws/game/{game_id}")
+async def game_socket(websocket: WebSocket, game_id: str):
+    await websocket.accept()
+    message = await websocket.receive_json()
+    await websocket.send_json({"shard": config.SHARD_INDEX, "echo": message})
+    await websocket.close()
+
+
+def test_shard_for_is_stable_and_balanced():
+    assert shard_for("3f2b1c9e-0000-4000-8000-000000000000", 4) == shard_for(
+        "3f2b1c9e-0000-4000-8000-000000000000", 4)
+    counts = [0] * 4
+    for _ in range(4000):
+        counts[shard_for(str(uuid.uuid4()), 4)] += 1
+    assert min(counts) > 800
+
+
+def test_new_game_id_lands_on_own_shard(monkeypatch):
+    monkeypatch.setattr(config, "SHARD_COUNT", 4)
+    monkeypatch.setattr(config, "SHARD_INDEX", 2)
+    assert all(shard_for(new_game_id(), 4) == 2 for _ in range(50))
+    monkeypatch.setattr(config, "SHARD_COUNT", 1)
+    assert uuid.UUID(new_game_id()).version == 4
+
+
+def test_routes_by_game_id_in_path():
+    game_id = str(uuid.uuid4())
+    for path in (f"/game/action/{game_id}", f"/game/join/{game_id}", f"/ws/game/{game_id}",
+                 f"/history/game/{game_id}", f"/history/hand/{game_id}/{uuid.uuid4()}",
+                 f"/cash-games/{game_id}/players"):
+        assert game_id_from_path(path) == game_id
+    for path in ("/game/create", "/setup/game", f"/history/player/{game_id}/stats",
+                 f"/ai/players/{game_id}", "/game/metrics/tables"):
+        assert game_id_from_path(path) is None
+
+    router = ShardRouter(3)
+    assert {router.route("/game/create") for _ in range(3)} == {0, 1, 2}
+    assert router.route(f"/ws/game/{game_id}") == shard_for(game_id, 3)
+
+    # A game_id query parameter names the table too
+    query = f"game_id={game_id}&limit=5".encode()
+    assert game_id_from_request("/history/player/p1/stats", query) == game_id
+    assert game_id_from_request("/history/player/p1/stats", b"game_id=nope") is None
+    assert router.route("/history/player/p1/hands", query) == shard_for(game_id, 3)
+
+
+def test_merged_llm_metrics():
+    """Counts add up across workers; peak waits take the max and averages are weighted."""
+    worker = {"gemini": {"in_flight": 1, "waits": {"high": {
+        "requests": 1, "queued": 0, "avg_wait_ms": 10.0, "max_wait_ms": 10.0}}}}
+    other = {"gemini": {"in_flight": 2, "waits": {"high": {
+        "requests": 3, "queued": 1, "avg_wait_ms": 2.0, "max_wait_ms": 4.0}}}}
+    assert _merge_llm_metrics([worker, other], {}) == {"gemini": {"in_flight": 3, "waits": {"high": {
+        "requests": 4, "queued": 1, "avg_wait_ms": 4.0, "max_wait_ms": 10.0}}}}
+
+
+def test_router_relays_to_owning_worker(tmp_path):
+    """Games created through the front-end are served by the worker that made them."""
+    router = ShardRouter(2, app_path="tests.test_sharding:shard_app", data_dir=str(tmp_path))
+    with TestClient(router) as client:
+        created = [client.post("/game/create").json() for _ in range(4)]
+        assert {game["shard"] for game in created} == {0, 1}
+        pids = {}
+        for game in created:
+            owner = client.get(f"/history/game/{game['game_id']}").json()
+            assert owner["shard"] == game["shard"] == shard_for(game["game_id"], 2)
+            pids[owner["shard"]] = owner["pid"]
+        assert len(set(pids.values())) == 2 and os.getpid() not in pids.values()
+
+        with client.websocket_connect(f"/ws/game/{created[0]['game_id']}") as websocket:
+            websocket.send_json({"type": "ping"})
+            assert websocket.receive_json() == {"shard": created[0]["shard"], "echo": {"type": "ping"}}
+        assert sum(router.relayed) == 9
+
+        # A dead worker's tables are answered by the front-end
+        lost = next(game for game in created if game["shard"] == 1)
+        router.processes[1].kill()
+        router.processes[1].join()
+        response = client.get(f"/history/game/{lost['game_id']}")
+        assert response.status_code == 503
+    assert router.processes == []
+
+
+def test_router_answers_table_less_routes_from_every_worker(tmp_path):
+    """Per-worker state is merged on reads and changed everywhere on writes."""
+    router = ShardRouter(2, app_path="tests.test_sharding:shard_app", data_dir=str(tmp_path))
+    with TestClient(router) as client:
+        tables = client.get("/game/metrics/tables").json()
+        assert tables == [{"shard": 0, "memory": False}, {"shard": 1, "memory": False}]
+
+        assert client.post("/ai/memory/enable").json() == {"status": "success"}
+        assert all(table["memory"] for table in client.get("/game/metrics/tables").json())
+        assert router.relayed == [3, 3]
+
+        response = client.get("/history/player/p1/stats")
+        assert response.status_code == 501
+        assert "game_id" in response.json()["detail"]
@@ -463,5 +463,42 @@ def test_all_in_player_wins_main_pot():
     assert main_pot_winner == [p1]
 
 
+def test_pot_of_folded_players_goes_to_contenders():
+    """A side pot whose eligible players all folded is awarded, not lost."""
+    game = PokerGame(small_blind=10, big_blind=20)
+    p0 = game.add_player("p0", "Player 0", 1000)
+    p1 = game.add_player("p1", "Player 1", 1000)
+    p2 = game.add_player("p2", "Player 2", 1000)
+    
+    # p0 is all-in for 100 and p1 called, while p2 put in 300 and folded
+    for player, bet, status in [(p0, 100, PlayerStatus.ALL_IN),
+                                (p1, 100, PlayerStatus.ACTIVE),
+                                (p2, 300, PlayerStatus.FOLDED)]:
+        player.total_bet = bet
+        player.chips = 0 if status == PlayerStatus.ALL_IN else 1000 - bet
+        player.status = status
+    chips_before = sum(p.chips for p in game.players) + 500
+    
+    p0.hand.cards = {Card(Rank.ACE, Suit.HEARTS), Card(Rank.ACE, Suit.DIAMONDS)}
+    p1.hand.cards = {Card(Rank.TEN, Suit.HEARTS), Card(Rank.TEN, Suit.DIAMONDS)}
+    p2.hand.cards = {Card(Rank.KING, Suit.SPADES), Card(Rank.KING, Suit.CLUBS)}
+    game.community_cards = [
+        Card(Rank.TWO, Suit.CLUBS),
+        Card(Rank.SEVEN, Suit.SPADES),
+        Card(Rank.NINE, Suit.HEARTS),
+        Card(Rank.JACK, Suit.CLUBS),
+        Card(Rank.FOUR, Suit.DIAMONDS)
+    ]
+    game.pots = [Pot(amount=500, name="Main Pot")]
+    game.current_round = BettingRound.RIVER
+    
+    game._handle_showdown()
+    
+    # The 200 only p2 could win is not dropped; p0 holds the best hand
+    assert [pot.eligible_players for pot in game.pots] == [{"p0", "p1"}, set()]
+    assert sum(p.chips for p in game.players) == chips_before
+    assert p0.chips == 500
+
+
 if __name__ == "__main__":
     pytest.main(["-v", "test_side_pots.py"])
\ No newline at end of file
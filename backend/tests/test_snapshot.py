@@ -0,0 +1,108 @@
+"""
+Tests for binary snapshots of live games.
+"""
+import asyncio
+import random
+
+import pytest
+
+from app.core.poker_game import PokerGame, PlayerAction
+
+
+def state(game):
+    """Everything a snapshot must preserve, in comparable form."""
+    ledger = game.pot_ledger
+    return {
+        "players": [
+            (p.player_id, p.name, p.chips, p.position, p.status, p.current_bet, p.total_bet,
+             p.is_small_blind, p.is_big_blind, sorted(str(c) for c in p.hand.cards))
+            for p in game.players
+        ],
+        "board": [str(c) for c in game.community_cards],
+        "deck": [str(c) for c in game.deck.cards],
+        "to_act": set(game.to_act),
+        "turn": (game.current_player_idx, game.last_aggressor_idx, game.current_round),
+        "betting": (game.current_bet, game.min_raise, game.button_position, game.hand_number),
+        "pots": [(p.name, p.amount, set(p.eligible_players)) for p in game.pots],
+        "ledger": (dict(ledger.contributions), set(ledger.folded), list(ledger.caps), ledger.total),
+        "seed": game.rng.seed,
+    }
+
+
+def live_masks(ring):
+    """Non-empty status masks of a seat ring."""
+    return {status: mask for status, mask in ring.status_masks.items() if mask}
+
+
+def play_random(game, rng, steps):
+    """Take random non-all-in actions for the player to act."""
+    for _ in range(steps):
+        if game.current_round.name == "SHOWDOWN" or not game.to_act:
+            return
+        player = game.players[game.current_player_idx]
+        actions = [a for a in game.get_valid_actions(player) if a[0] != PlayerAction.ALL_IN]
+        action, low, _ = rng.choice(actions)
+        amount = low if action in (PlayerAction.BET, PlayerAction.RAISE) else None
+        asyncio.run(game.process_action(player, action, amount))
+
+
+def new_game(seed):
+    game = PokerGame(small_blind=5, big_blind=10, ante=1)
+    rng = random.Random(seed)
+    for i in range(6):
+        game.add_player(f"p{i}", f"Player {i}", rng.randint(3000, 5000))
+    game.start_hand()
+    return game
+
+
+def test_round_trip_mid_hand():
+    """A restored game matches the original field for field."""
+    rng = random.Random(1)
+    for seed in range(20):
+        game = new_game(seed)
+        play_random(game, rng, rng.randint(0, 12))
+        blob = game.snapshot()
+        assert len(blob) < 1024
+        restored = PokerGame.restore(blob)
+        assert state(restored) == state(game)
+        assert restored.pots is restored.pot_ledger.pots
+        assert live_masks(restored.seats) == live_masks(game.seats)
+        assert restored.seats.to_act == game.seats.to_act
+
+
+def test_restored_game_plays_on_identically():
+    """The same actions lead both copies to the same state, including later deals."""
+    for seed in range(10):
+        game = new_game(seed)
+        play_random(game, random.Random(seed), 5)
+        restored = PokerGame.restore(game.snapshot())
+        play_random(game, random.Random(100 + seed), 40)
+        play_random(restored, random.Random(100 + seed), 40)
+        assert state(restored) == state(game)
+
+        for copy in (game, restored):
+            copy.move_button()
+            copy.start_hand()
+        assert state(restored) == state(game)
+
+
+def test_side_pots_survive_round_trip():
+    """Collected layers and pending all-in caps are restored."""
+    game = PokerGame(small_blind=10, big_blind=20)
+    game.add_player("a", "A", 1000)
+    game.add_player("b", "B", 150)
+    game.add_player("c", "C", 1000)
+    game.start_hand()
+    for _ in range(3):
+        player = game.players[game.current_player_idx]
+        if player.player_id == "b":
+            asyncio.run(game.process_action(player, PlayerAction.ALL_IN))
+        else:
+            asyncio.run(game.process_action(player, PlayerAction.CALL))
+    restored = PokerGame.restore(game.snapshot())
+    assert state(restored) == state(game)
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        PokerGame.restore(b"not a snapshot")
@@ -0,0 +1,93 @@
+"""
+Tests for sampled structured tracing.
+"""
+import asyncio
+import json
+
+import pytest
+
+from app.core.poker_game import PlayerAction, PokerGame
+from app.core.tracing import NULL_SPAN, Tracer, tracer
+
+
+def read_records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_disabled_tracer_writes_nothing(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    off = Tracer(0, str(path))
+    assert off.span("g", "action") is NULL_SPAN
+    with off.span("g", "action") as span:
+        span.set(ok=True)
+    off.event("g", "action.rejected", reason="x")
+    assert not path.exists()
+
+
+def test_spans_and_events_are_written(tmp_path):
+    path = tmp_path / "trace" / "trace.jsonl"
+    on = Tracer(1.0, str(path))
+    with on.span("g1", "action", player="p1") as span:
+        span.set(ok=True)
+    on.event("g1", "action.rejected", reason="below_min_raise", amount=5)
+    with pytest.raises(RuntimeError):
+        with on.span("g1", "action"):
+            raise RuntimeError("boom")
+    on.close()
+
+    (_, game_id, name, duration, fields), event, failed = read_records(path)
+    assert (game_id, name, fields) == ("g1", "action", {"player": "p1", "ok": True})
+    assert duration >= 0
+    assert event[2:] == ["action.rejected", None, {"reason": "below_min_raise", "amount": 5}]
+    assert failed[4] == {"error": "RuntimeError"}
+
+
+def test_sampling_is_stable_per_game(tmp_path):
+    half = Tracer(0.5, str(tmp_path / "trace.jsonl"))
+    games = [f"game-{i}" for i in range(400)]
+    decisions = [half.sampled(game_id) for game_id in games]
+    assert 120 < sum(decisions) < 280
+    half.configure(0.5)
+    assert [half.sampled(game_id) for game_id in games] == decisions
+    # The decision depends only on the ID, so another tracer agrees with it
+    other = Tracer(0.5, str(tmp_path / "other.jsonl"))
+    assert [other.sampled(game_id) for game_id in games] == decisions
+    half.configure(0)
+    assert not any(half.sampled(game_id) for game_id in games)
+
+
+def test_trace_file_rotates(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    on = Tracer(1.0, str(path), max_bytes=500, backups=2)
+    for i in range(100):
+        on.event("g", "tick", i=i)
+    on.close()
+    assert path.stat().st_size <= 500
+    assert (tmp_path / "trace.jsonl.1").exists() and (tmp_path / "trace.jsonl.2").exists()
+    assert not (tmp_path / "trace.jsonl.3").exists()
+
+
+def test_process_action_is_traced(tmp_path):
+    """Accepted and rejected actions show up in the trace of a sampled game."""
+    path = tmp_path / "trace.jsonl"
+    default_path = tracer.path
+    tracer.configure(1.0, path=str(path))
+    try:
+        game = PokerGame(small_blind=5, big_blind=10)
+        for i in range(3):
+            game.add_player(f"p{i}", f"Player {i}", 1000)
+        game.start_hand()
+        player = game.players[game.current_player_idx]
+        assert not asyncio.run(game.process_action(player, PlayerAction.RAISE, 11))
+        assert asyncio.run(game.process_action(player, PlayerAction.CALL))
+    finally:
+        tracer.configure(0, path=default_path)
+
+    records = read_records(path)
+    assert records[0][2:4] == ["hand.start", None]
+    assert records[0][4]["dealt"] == 3
+    rejected = [r for r in records if r[2] == "action.rejected"]
+    actions = [r for r in records if r[2] == "action"]
+    assert rejected[0][4]["reason"] == "below_min_raise"
+    assert [(r[4]["action"], r[4]["ok"]) for r in actions] == [("RAISE", False), ("CALL", True)]
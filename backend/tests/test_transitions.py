@@ -0,0 +1,116 @@
+"""
+Tests for the pure betting state machine and its event dispatch.
+"""
+import asyncio
+import copy
+import pickle
+from unittest.mock import AsyncMock
+
+from app.core.event_orchestrator import event_orchestrator
+from app.core.game_events import GameEventType
+from app.core.headless import HeadlessGame, make_random_policy
+from app.core.poker_game import PlayerAction, PokerGame
+from app.core.transitions import step
+
+
+def types(events):
+    return [event.type for event in events]
+
+
+def plain_state(state):
+    """A state's fields, minus the shared RNG (which has no equality)."""
+    return {name: value for name, value in copy.deepcopy(state.__dict__).items() if name != "rng"}
+
+
+def test_step_leaves_the_state_alone():
+    """The input state is unchanged and the new state matches act()."""
+    state = HeadlessGame([1000] * 4, 5, 10, seed=1)
+    state.start_hand()
+    before = plain_state(state)
+    new, events = step(state, PlayerAction.RAISE, 40)
+    assert plain_state(state) == before
+    state.act(PlayerAction.RAISE, 40)
+    assert new.chips == state.chips and new.to_act == state.to_act
+    assert types(events) == [GameEventType.PLAYER_ACTION_PROCESSED]
+    assert events[0].amount == 40 and events[0].street_bet == 40
+
+
+def test_all_in_runout_events():
+    """Closing the action all-in deals every street, then shows down and pays out."""
+    state = HeadlessGame([500, 500], 5, 10, seed=2, player_ids=["a", "b"])
+    state.start_hand()
+    state, _ = step(state, PlayerAction.ALL_IN)
+    state, events = step(state, PlayerAction.CALL)
+    assert types(events) == [
+        GameEventType.PLAYER_ACTION_PROCESSED,
+        GameEventType.BETTING_ROUND_COMPLETED,
+        GameEventType.STREET_DEALING_REQUIRED,
+        GameEventType.STREET_DEALING_REQUIRED,
+        GameEventType.STREET_DEALING_REQUIRED,
+        GameEventType.SHOWDOWN_TRIGGERED,
+        GameEventType.HAND_COMPLETED,
+    ]
+    assert [(bet.player_id, bet.amount) for bet in events[1].player_bets] == [("a", 500), ("b", 500)]
+    assert events[1].total_pot == 1000
+    assert [event.street_cards.street_name for event in events[2:5]] == ["FLOP", "TURN", "RIVER"]
+    assert sum(len(event.street_cards.cards) for event in events[2:5]) == 5
+    assert sum(events[-1].winnings.values()) == 1000
+
+
+def test_fold_ends_hand_early():
+    state = HeadlessGame([500, 500], 5, 10, seed=3)
+    state.start_hand()
+    state, events = step(state, PlayerAction.FOLD)
+    assert types(events)[-2:] == [GameEventType.EARLY_SHOWDOWN_TRIGGERED, GameEventType.HAND_COMPLETED]
+    assert events[-1].winnings == {"1": 15}
+
+
+def test_random_hands_conserve_chips_and_pickle():
+    """Random play through step() conserves chips; states and events pickle."""
+    state = HeadlessGame([1000] * 6, 5, 10, ante=1, seed=4)
+    policy = make_random_policy(4, aggression=0.4)
+    for _ in range(200):
+        if sum(chips > 0 for chips in state.chips) < 2:
+            break
+        state.start_hand()
+        while not state.hand_over:
+            state, events = step(state, *policy(state, state.current_seat))
+            assert sum(state.chips) + state.pot * (not state.hand_over) == 6000
+        assert sum(state.chips) == 6000
+    state, events = pickle.loads(pickle.dumps((state, events)))
+    assert events[0].type == GameEventType.PLAYER_ACTION_PROCESSED
+
+
+def test_fork_of_live_game_uses_player_ids():
+    game = PokerGame(small_blind=5, big_blind=10)
+    for i in range(3):
+        game.add_player(f"p{i}", f"Player {i}", 1000)
+    game.start_hand()
+    _, events = step(game.fork(), PlayerAction.CALL)
+    assert events[0].player_id == game.players[game.current_player_idx].player_id
+
+
+def test_orchestrator_dispatches_events_in_order(monkeypatch):
+    """Each event becomes its notification, with animations awaited in between."""
+    calls = []
+    for name in ("notify_player_action", "notify_turn_highlight_removed", "notify_round_bets_finalized",
+                 "notify_street_dealt", "notify_showdown_transition", "wait_for_animation"):
+        mock = AsyncMock(side_effect=lambda *args, name=name, **kwargs: calls.append((name, args[1:2])))
+        monkeypatch.setattr(f"app.core.websocket.game_notifier.{name}", mock)
+
+    state = HeadlessGame([500, 500], 5, 10, seed=5, player_ids=["a", "b"])
+    state.start_hand()
+    state, _ = step(state, PlayerAction.ALL_IN)
+    state, events = step(state, PlayerAction.CALL)
+    asyncio.run(event_orchestrator.dispatch("g", events))
+
+    assert [name for name, _ in calls] == [
+        "notify_player_action", "notify_turn_highlight_removed",
+        "notify_round_bets_finalized", "wait_for_animation",
+        "notify_street_dealt", "wait_for_animation",
+        "notify_street_dealt", "wait_for_animation",
+        "notify_street_dealt", "wait_for_animation",
+        "notify_showdown_transition",
+    ]
+    assert calls[1] == ("notify_turn_highlight_removed", ("b",))
+    assert calls[5] == ("wait_for_animation", ("street_dealt_flop",))